@@ -24,7 +24,9 @@ from .routes.parcel_workflow import router as parcel_workflow_router
 from .routes.pilot_requests import router as pilot_requests_router
 from .routes.run_options import router as run_options_router
 from .routes.runs import router as runs_router
+from .services.gcp_clients import gcp_clients
 from .services.logging import configure_json_logging
+from .services.outbound_http import shared_outbound_http
 from .services.run_options import (
     SUPPORTED_BASELINE_YEARS,
     SUPPORTED_IMAGERY_YEARS,
@@ -81,7 +83,9 @@ def _prewarm_read_caches(settings: Settings) -> None:
         from .routes.parcel_intel import get_registry
         from .services.gcs_artifacts import GcsArtifacts
 
-        get_registry().index(GcsArtifacts(bucket=settings.bucket))
+        get_registry().index(
+            GcsArtifacts(bucket=settings.bucket, client=gcp_clients(settings).storage())
+        )
         log.info("prewarmed parcel-intel manifest", extra={"stage": "startup"})
     except Exception:  # pragma: no cover - warm-up is best-effort
         log.warning("parcel-intel prewarm failed", exc_info=True, extra={"stage": "startup"})
@@ -93,8 +97,22 @@ async def lifespan(app: FastAPI):
     app.state.settings = settings
     configure_json_logging(service_name="citylens-engine-api")
     logging.getLogger(__name__).info("validated settings", extra={"stage": "startup"})
+    # One Firestore and one Storage client per process, shared by every
+    # request dependency. Built here so credential discovery and channel
+    # setup happen before traffic; a failure still surfaces on first use.
+    clients = gcp_clients(settings)
+    app.state.gcp_clients = clients
+    try:
+        clients.firestore()
+        clients.storage()
+    except Exception:  # pragma: no cover - construction retries on first use
+        logging.getLogger(__name__).warning(
+            "GCP client construction failed", exc_info=True, extra={"stage": "startup"}
+        )
     _prewarm_read_caches(settings)
     yield
+    await shared_outbound_http().aclose()
+    clients.close()
 
 
 app = FastAPI(
@@ -3,7 +3,7 @@ from __future__ import annotations
 import math
 import re
 from datetime import date, datetime, timedelta
-from typing import Any, Literal, Optional
+from typing import Annotated, Any, Literal, Optional
 from urllib.parse import urlsplit
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
@@ -1264,6 +1264,9 @@ class ParcelIntelMapResponse(BaseModel):
     returned_count: int = Field(ge=0)
     available_count: int = Field(ge=0)
     inventory_complete: bool
+    # `[min_lng, min_lat, max_lng, max_lat]` when the request was limited to
+    # a bbox or XYZ tile; null for the citywide feed.
+    bbox: Optional[list[float]] = None
 
 
 class ParcelIntelSweepResponse(BaseModel):
@@ -2502,6 +2505,44 @@ class ParcelAddressResolveResponse(BaseModel):
         return self
 
 
+class ParcelAddressBatchResolveRequest(BaseModel):
+    """Private address batch; raw values are never returned or persisted."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    schema_version: Literal["citylens/parcel-address-batch-resolve-request@v1"] = (
+        "citylens/parcel-address-batch-resolve-request@v1"
+    )
+    addresses: list[str] = Field(min_length=1, max_length=5_000)
+
+    @field_validator("addresses")
+    @classmethod
+    def bound_each_address(cls, value: list[str]) -> list[str]:
+        if any(len(address) > 200 for address in value):
+            raise ValueError("each address must be at most 200 characters")
+        return value
+
+
+class ParcelAddressBatchResolveItem(BaseModel):
+    """One NDJSON line, keyed by input position instead of the address."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    index: int = Field(ge=0)
+    status: Literal["resolved", "error"]
+    result: Optional[ParcelAddressResolveResponse] = None
+    error_status: Optional[int] = None
+    error_detail: Optional[str] = Field(default=None, max_length=200)
+
+    @model_validator(mode="after")
+    def validate_status_contract(self) -> "ParcelAddressBatchResolveItem":
+        if (self.status == "resolved") != (self.result is not None):
+            raise ValueError("result must be present exactly when resolved")
+        if (self.status == "error") != (self.error_status is not None):
+            raise ValueError("error_status must be present exactly on error")
+        return self
+
+
 class ParcelOfficialLinks(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -2572,6 +2613,55 @@ class ParcelOfficialDossierResponse(BaseModel):
     interpretation: str = Field(min_length=1, max_length=1200)
 
 
+class ParcelBatchRequest(BaseModel):
+    """Authenticated batch of explicitly named tax lots."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    schema_version: Literal["citylens/parcel-batch-request@v1"] = (
+        "citylens/parcel-batch-request@v1"
+    )
+    bbls: list[Annotated[str, Field(pattern=r"^[1-5][0-9]{9}$")]] = Field(
+        min_length=1, max_length=200
+    )
+
+    @field_validator("bbls")
+    @classmethod
+    def validate_bbls(cls, value: list[str]) -> list[str]:
+        if len(set(value)) != len(value):
+            raise PydanticCustomError("duplicate_bbls", "bbls must not repeat")
+        return value
+
+
+class ParcelBatchItem(BaseModel):
+    """One requested lot; each half carries its single-parcel payload or a miss."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    bbl: str = Field(pattern=r"^[1-5][0-9]{9}$")
+    dossier_status: Literal["found", "not_found"]
+    dossier: Optional[ParcelOfficialDossierResponse] = None
+    parcel_status: Literal["found", "not_found"]
+    parcel: Optional[ParcelIntelParcelResponse] = None
+
+    @model_validator(mode="after")
+    def validate_status_contract(self) -> "ParcelBatchItem":
+        if (self.dossier_status == "found") != (self.dossier is not None):
+            raise ValueError("dossier must be present exactly when found")
+        if (self.parcel_status == "found") != (self.parcel is not None):
+            raise ValueError("parcel must be present exactly when found")
+        return self
+
+
+class ParcelBatchResponse(BaseModel):
+    """Per-lot dossiers and parcel rows, in request order."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    schema_version: Literal["citylens/parcel-batch@v1"] = "citylens/parcel-batch@v1"
+    items: list[ParcelBatchItem] = Field(max_length=200)
+
+
 class ParcelComparableSale(BaseModel):
     """One explainably selected official tax-lot sale."""
 
@@ -5,9 +5,10 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel, Field
 
-from ..services.auth import require_auth
+from ..services.auth import principal_cache, require_auth
 from ..services.auth_context import AuthContext
 from ..services.firestore_store import FirestoreStore
+from ..services.gcp_clients import gcp_clients
 from ..services.settings import Settings, get_settings
 
 router = APIRouter(tags=["api-keys"])
@@ -21,6 +22,7 @@ def _store(settings: Settings) -> FirestoreStore:
         auth_identities_collection=settings.auth_identities_collection,
         usage_months_collection=settings.usage_months_collection,
         api_keys_index_collection=settings.api_keys_index_collection,
+        client=gcp_clients(settings).firestore(),
     )
 
 
@@ -106,4 +108,7 @@ def revoke_api_key(
         # Could be: not the user's key, already revoked, or never existed.
         # Don't leak the difference.
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    # The revoked key may be cached as a principal on this instance; other
+    # instances stop accepting it once their entry's TTL lapses.
+    principal_cache(settings).invalidate_user(auth.app_user_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -14,6 +14,7 @@ from ..models.schemas import DemoRunFeatured, RunResponse
 from ..services.artifact_contract import artifact_media_type
 from ..services.demo_registry import DemoRegistry
 from ..services.firestore_store import FirestoreStore
+from ..services.gcp_clients import gcp_clients
 from ..services.gcs_artifacts import GcsArtifacts
 from ..services.rate_limit import demo_rate_limit
 from ..services.run_presenter import build_run_response
@@ -77,11 +78,14 @@ def get_store(settings: Settings = Depends(get_settings)) -> FirestoreStore:
         project_id=settings.project_id,
         runs_collection=settings.runs_collection,
         users_collection=settings.users_collection,
+        client=gcp_clients(settings).firestore(),
     )
 
 
 def get_gcs(settings: Settings = Depends(get_settings)) -> GcsArtifacts:
-    return GcsArtifacts(bucket=settings.bucket)
+    return GcsArtifacts(
+        bucket=settings.bucket, client=gcp_clients(settings).storage()
+    )
 
 
 def _demo_artifact_proxy_path(*, run_id: str, artifact_name: str) -> str:
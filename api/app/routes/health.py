@@ -6,9 +6,18 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, Response
 
 from ..services.firestore_store import FirestoreStore
+from ..services.gcp_clients import gcp_clients
 from ..services.gcs_artifacts import GcsArtifacts
+from ..services.parcel_address_resolver import ParcelAddressResolver
+from ..services.parcel_official_dossier import ParcelOfficialDossierStore
 from ..services.settings import Settings, get_settings
-from .parcel_intel import ParcelIntelRegistry, get_gcs, get_registry
+from .parcel_intel import (
+    ParcelIntelRegistry,
+    get_address_resolver,
+    get_gcs,
+    get_official_dossiers,
+    get_registry,
+)
 
 log = logging.getLogger(__name__)
 
@@ -29,6 +38,7 @@ def get_store(settings: Settings = Depends(get_settings)) -> FirestoreStore:
         auth_identities_collection=settings.auth_identities_collection,
         usage_months_collection=settings.usage_months_collection,
         api_keys_index_collection=settings.api_keys_index_collection,
+        client=gcp_clients(settings).firestore(),
     )
 
 
@@ -38,12 +48,19 @@ def health_ready(
     store: FirestoreStore = Depends(get_store),
     gcs: GcsArtifacts = Depends(get_gcs),
     registry: ParcelIntelRegistry = Depends(get_registry),
+    resolver: ParcelAddressResolver = Depends(get_address_resolver),
+    dossiers: ParcelOfficialDossierStore = Depends(get_official_dossiers),
+    settings: Settings = Depends(get_settings),
 ) -> dict:
     """Deep readiness probe.
 
     - Firestore unreachable → 503 (the API cannot serve authed traffic).
     - Parcel-intel data missing/invalid/stale → still 200, reported via
       flags (the run pipeline works without it; it's degraded, not down).
+    - ``shard_prefetch`` reports any warm-up of a newly published resolver
+      or dossier generation that is holding back its cutover.
+    - ``gcp_clients`` counts Firestore/Storage client constructions in this
+      process; anything above one each means clients are being rebuilt.
     """
     firestore_ok = True
     try:
@@ -91,4 +108,11 @@ def health_ready(
         "ok": firestore_ok,
         "firestore": firestore_ok,
         "parcel_intel": parcel_intel,
+        "manifest_cache": registry.manifest_cache.stats(),
+        "decision_audit_cache": registry.decision_audit_stats(),
+        "gcp_clients": gcp_clients(settings).stats(),
+        "shard_prefetch": {
+            "resolver": resolver.prefetch.stats(),
+            "official_dossiers": dossiers.prefetch.stats(),
+        },
     }
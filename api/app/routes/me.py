@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends
 from ..services.auth import require_auth
 from ..services.auth_context import AuthContext
 from ..services.firestore_store import FirestoreStore
+from ..services.gcp_clients import gcp_clients
 from ..services.quotas import get_quota_state
 from ..services.settings import Settings, get_settings
 
@@ -18,6 +19,7 @@ def _store(settings: Settings) -> FirestoreStore:
         users_collection=settings.users_collection,
         auth_identities_collection=settings.auth_identities_collection,
         usage_months_collection=settings.usage_months_collection,
+        client=gcp_clients(settings).firestore(),
     )
 
 
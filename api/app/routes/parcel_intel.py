@@ -18,8 +18,20 @@ Access tiers:
 
 Caching strategy:
 - Process-level: a module-level registry caches parsed JSONL keyed on
-  `manifest.artifact_generation` (or legacy `generated_at`). Immutable
+  `manifest.artifact_generation` (or legacy `generated_at`). Borough rows
+  are validated once per generation into an immutable, BBL-indexed row
+  store, so sweeps are slices and detail reads are O(1). Immutable
   generation paths prevent mixed-feed reads during a publish.
+- Map viewports: `/map?bbox=` and `/map?tile=z/x/y` query a lat/lng grid
+  index built once per generation over the map rows, applying the same
+  tiering as the citywide feed. `/tiles/{z}/{x}/{y}.mvt` encodes the same
+  rows as vector tiles with separate anonymous/authenticated attribute
+  sets, kept in a generation-keyed LRU.
+- Response bodies: the stripped anonymous projections (top rows per
+  borough, capped citywide map) are built once per generation. Sweep and
+  map bodies for both tiers are serialized and gzip-compressed once per
+  generation and query, with a strong content ETag, so repeat requests cost
+  neither serialization nor compression and `If-None-Match` gets a 304.
 - Edge: anonymous responses keep Cache-Control headers tuned for
   ~10-minute revalidation since the sweep cadence is monthly.
   Authenticated sweep responses are `private, no-store` — the full feed
@@ -28,21 +40,38 @@ Caching strategy:
 
 from __future__ import annotations
 
-import hashlib
 import json
 import logging
 import re
 import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Path,
+    Query,
+    Response,
+)
+from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
 
 from ..models.schemas import (
+    ParcelAddressBatchResolveItem,
+    ParcelAddressBatchResolveRequest,
     ParcelAddressCandidate,
     ParcelAddressResolveRequest,
     ParcelAddressResolveResponse,
+    ParcelBatchItem,
+    ParcelBatchRequest,
+    ParcelBatchResponse,
+    ParcelDecisionAudit,
     ParcelIntelBorough,
     ParcelIntelIndex,
     ParcelIntelMapResponse,
@@ -58,25 +87,49 @@ from ..models.schemas import (
     ParcelScreeningLedgerRow,
     ParcelScreeningStatusResponse,
 )
+from ..services.artifact_manifest_cache import ArtifactManifestCache
 from ..services.auth import (
     maybe_parcel_read_auth,
     require_auth,
     require_parcel_read_auth,
 )
 from ..services.auth_context import AuthContext
+from ..services.gcp_clients import gcp_clients
 from ..services.gcs_artifacts import GcsArtifacts
-from ..services.parcel_address_resolver import ParcelAddressResolver
+from ..services.jsonl_stream import (
+    ArtifactIntegrityError,
+    VerifiedJsonlStream,
+    loads_line,
+)
+from ..services.parcel_address_resolver import (
+    ParcelAddressResolver,
+    ResolvedAddress,
+)
 from ..services.parcel_decision_audit import build_parcel_decision_audit
+from ..services.parcel_intel_rows import ParcelRowIndex
+from ..services.parcel_mvt import MVT_MEDIA_TYPE, encode_point_layer, tile_pixel
 from ..services.parcel_official_dossier import (
     ACRIS_DATASET_IDS,
     PLUTO_DATASET_ID,
+    OfficialParcelDossier,
     ParcelOfficialDossierStore,
 )
 from ..services.parcel_sales_comparables import (
     ParcelSalesComparableService,
+    sales_cache_dir_from_env,
+    sales_prewarm_top_from_env,
+)
+from ..services.parcel_spatial_index import BBox, ParcelGridIndex, tile_bbox
+from ..services.prepared_json import PreparedJson
+from ..services.rate_limit import (
+    demo_rate_limit,
+    enforce_token_bucket,
+    parcel_tile_rate_limit,
 )
-from ..services.rate_limit import demo_rate_limit, enforce_token_bucket
 from ..services.settings import Settings, get_settings
+from ..services.shard_disk_cache import ShardDiskCache
+from ..services.shard_prefetch import shard_prefetch_top_from_env
+from ..services.single_flight import SingleFlight
 
 log = logging.getLogger(__name__)
 
@@ -91,6 +144,9 @@ _SWEEP_CACHE = "public, s-maxage=600, stale-while-revalidate=300"
 _SWEEP_CACHE_AUTHED = "private, no-store"
 _MAP_CACHE = "public, s-maxage=600, stale-while-revalidate=300"
 _MAP_CACHE_AUTHED = "private, no-store"
+# Anonymous tiles requested with the active `generation` are immutable: a
+# republish changes the generation and therefore the URL.
+_TILE_CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
 
 # Anonymous preview cap: unauthenticated callers get at most this many
 # rows per borough (silently clamped, not an error).
@@ -101,6 +157,56 @@ _ANON_TOP_CAP = 25
 # so explicit CSV exports and legacy recovery cannot silently truncate a
 # borough.
 _PUBLISHED_INVENTORY_LIMIT = 5_000
+# Pre-serialized response bodies kept per access scope. The map echoes
+# `requested_top_per_borough`, so each distinct value is its own body; the
+# authenticated full inventory is megabytes per body, so keep only a few.
+_BODY_CACHE_LIMITS = {"public_preview": 128, "authenticated_full": 8}
+# Encoded vector tiles kept across both tiers (most are a few KB).
+_MAX_CACHED_TILES = 2048
+# Decision audits keyed by (generation, BBL, premium access). Hot parcels
+# and alert refreshes revisit the same few thousand leads.
+_MAX_CACHED_AUDITS = 4096
+# Points within this many tile pixels outside the edge are also encoded so
+# symbols straddling a tile boundary are not clipped.
+_TILE_BUFFER_PX = 64
+_TILE_LAYER = "parcels"
+# Vector-tile attribute sets per tier. Anonymous tiles never carry premium
+# keys at all, not even as nulls.
+_TILE_PUBLIC_FIELDS = (
+    "bbl",
+    "address",
+    "borough",
+    "score_calibrated",
+    "priority_rank",
+    "priority_tier",
+    "acquisition_rank",
+    "citywide_rank",
+    "acquisition_status",
+    "opportunity_category",
+    "lot_area_sqft",
+    "unused_floor_area_sqft",
+    "far_utilization_pct",
+    "zoning_district_1",
+)
+_TILE_AUTHENTICATED_FIELDS = _TILE_PUBLIC_FIELDS + (
+    "last_sale_price",
+    "last_sale_year",
+    "years_held",
+    "owner_name",
+    "owner_entity_type",
+    "owner_portfolio_id",
+    "owner_portfolio_lot_count",
+    "recent_change",
+    "tax_lien_sale_year",
+    "critical_violation_count",
+    "floodplain_1pct",
+    "environmental_review_required",
+    "mandatory_inclusionary_housing",
+    "nearest_transit_station_name",
+    "nearest_transit_station_distance_m",
+    "nearest_transit_routes",
+    "transit_access_tier",
+)
 
 # Data older than this is flagged stale on the index (the sweep cadence
 # is monthly; 45 days means a missed retrain/publish cycle).
@@ -162,33 +268,94 @@ _SCREENING_LEDGER_FIELDS = (
 )
 
 
+def _access_scope(authenticated: bool) -> str:
+    return "authenticated_full" if authenticated else "public_preview"
+
+
+def _empty_body_caches() -> dict[
+    str, OrderedDict[tuple[Any, ...], tuple[PreparedJson, int, int]]
+]:
+    return {scope: OrderedDict() for scope in _BODY_CACHE_LIMITS}
+
+
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
 def get_gcs(settings: Settings = Depends(get_settings)) -> GcsArtifacts:
-    return GcsArtifacts(bucket=settings.bucket)
+    return GcsArtifacts(
+        bucket=settings.bucket, client=gcp_clients(settings).storage()
+    )
+
+
+def _artifact_chunks(gcs: GcsArtifacts, object_name: str) -> Iterable[bytes]:
+    """Stream when the client supports it; fall back to one whole-object read."""
+    open_chunks = getattr(gcs, "open_chunks", None)
+    if callable(open_chunks):
+        return open_chunks(object_name=object_name)
+    payload, _ = gcs.download_bytes(object_name=object_name)
+    return (payload,)
 
 
 class ParcelIntelRegistry:
     """Process-level cache of parsed parcel-intel JSONL + manifest.
 
-    Threadsafe via a single lock — cold-fill races just redundantly
-    fetch from GCS, no correctness impact. Invalidation key is
+    Threadsafe via a single lock. Cold fills are coalesced per
+    ``(generation, leaf)`` so a burst after a publish downloads, verifies
+    and parses each artifact once while the other requests wait on that
+    result (or its error). Invalidation key is
     ``manifest.artifact_generation`` (falling back to `generated_at` for
     legacy feeds): when the publisher commits a new pointer, we lazily reload
-    that generation on next access.
+    that generation on next access. ``manifest.json`` itself is read through
+    an ``ArtifactManifestCache`` so the hot path skips GCS inside its TTL.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        manifest_cache: ArtifactManifestCache | None = None,
+        on_new_generation: (
+            Callable[[ParcelIntelRegistry, GcsArtifacts], None] | None
+        ) = None,
+    ) -> None:
         self._lock = threading.Lock()
+        self.manifest_cache = manifest_cache or ArtifactManifestCache()
+        # Called outside the lock whenever a new generation is adopted; it
+        # must return quickly (start a thread for any real work).
+        self.on_new_generation = on_new_generation
+        self._fills = SingleFlight()
         self._manifest: dict[str, Any] | None = None
+        self._manifest_payload: bytes | None = None
         self._manifest_cache_key: str | None = None
-        self._rows_by_borough: dict[tuple[str, str], list[dict]] = {}
+        self._rows_by_borough: dict[
+            tuple[str, str], ParcelRowIndex[ParcelIntelRow]
+        ] = {}
         self._map_rows: dict[str, list[ParcelIntelMapRow]] = {}
         self._screening_rows: dict[
             str, dict[str, ParcelScreeningLedgerRow]
         ] = {}
+        # Anonymous preview projections and serialized response bodies
+        # (body, returned_count, available_count) per access scope. Both are
+        # derived from the caches above and dropped with them.
+        self._public_sweep_rows: dict[
+            tuple[str, str], tuple[ParcelIntelRow, ...]
+        ] = {}
+        self._public_map_rows: dict[str, tuple[ParcelIntelMapRow, ...]] = {}
+        self._bodies = _empty_body_caches()
+        self._map_indexes: dict[str, ParcelGridIndex[ParcelIntelMapRow]] = {}
+        self._tiles: OrderedDict[tuple[str, str, int, int, int], bytes] = (
+            OrderedDict()
+        )
+        # Workflow-alert inputs: map rows by BBL, plus per-BBL derived
+        # values keyed by (generation, kind) and filled only for the BBLs
+        # a request asks for.
+        self._map_by_bbl: dict[str, dict[str, ParcelIntelMapRow]] = {}
+        self._bbl_memos: dict[tuple[str, str], dict[str, Any]] = {}
+        self._audits: OrderedDict[tuple[str, str, bool], ParcelDecisionAudit] = (
+            OrderedDict()
+        )
+        # Lifetime counters; they survive generation changes.
+        self._audit_counters = {"hits": 0, "misses": 0, "evictions": 0}
 
     def _gcs_object_name(self, leaf: str) -> str:
         return f"{_GCS_PREFIX}/{leaf}"
@@ -314,49 +481,75 @@ class ParcelIntelRegistry:
                     detail="Parcel intelligence manifest is invalid",
                 )
 
-    def _download_artifact(
+    def _artifact_lines(
         self,
         gcs: GcsArtifacts,
         manifest: dict[str, Any],
         leaf: str,
-    ) -> tuple[bytes, int | None]:
+    ) -> tuple[Iterator[bytes], int | None]:
+        """Open an artifact as a stream of JSONL lines.
+
+        Raises ``FileNotFoundError`` eagerly. For atomic feeds the size and
+        SHA-256 are verified while streaming and a mismatch surfaces as a 503
+        from the final iteration, so callers must finish the loop before they
+        cache anything they parsed.
+        """
         metadata = self._atomic_artifact_metadata(manifest, leaf)
         object_name = (
             metadata["object_name"]
             if metadata is not None
             else self._gcs_object_name(leaf)
         )
-        payload, _ = gcs.download_bytes(object_name=object_name)
+        chunks = _artifact_chunks(gcs, object_name)
         if metadata is None:
-            return payload, None
-        actual_sha = hashlib.sha256(payload).hexdigest()
-        if (
-            len(payload) != metadata["size_bytes"]
-            or actual_sha != metadata["sha256"]
-        ):
+            return iter(VerifiedJsonlStream(chunks)), None
+        return (
+            self._verified_lines(chunks, object_name, metadata),
+            metadata["row_count"],
+        )
+
+    @staticmethod
+    def _verified_lines(
+        chunks: Iterable[bytes],
+        object_name: str,
+        metadata: dict[str, Any],
+    ) -> Iterator[bytes]:
+        stream = VerifiedJsonlStream(
+            chunks,
+            expected_size=metadata["size_bytes"],
+            expected_sha256=metadata["sha256"],
+        )
+        try:
+            yield from stream
+        except ArtifactIntegrityError as exc:
             log.error(
                 "parcel-intel artifact integrity mismatch: object=%s "
                 "expected_size=%s actual_size=%s expected_sha=%s actual_sha=%s",
                 object_name,
-                metadata["size_bytes"],
-                len(payload),
-                metadata["sha256"],
-                actual_sha,
+                exc.expected_size,
+                exc.actual_size,
+                exc.expected_sha256,
+                exc.actual_sha256,
             )
             raise HTTPException(
                 status_code=503,
                 detail="Parcel intelligence artifact integrity check failed",
-            )
-        return payload, metadata["row_count"]
+            ) from exc
 
     def _refresh_manifest(self, gcs: GcsArtifacts) -> dict[str, Any]:
         try:
-            payload, _ = gcs.download_bytes(object_name=self._gcs_object_name("manifest.json"))
+            payload, _ = self.manifest_cache.download_bytes(
+                gcs, object_name=self._gcs_object_name("manifest.json")
+            )
         except FileNotFoundError as exc:
             raise HTTPException(
                 status_code=503,
                 detail="Parcel intelligence data has not been published yet.",
             ) from exc
+        with self._lock:
+            if payload is self._manifest_payload and self._manifest is not None:
+                # Same cached body as last time: already parsed and validated.
+                return self._manifest
         try:
             manifest = json.loads(payload.decode("utf-8"))
         except (json.JSONDecodeError, UnicodeDecodeError) as exc:
@@ -377,13 +570,25 @@ class ParcelIntelRegistry:
         self._validate_publication_manifest(manifest)
         with self._lock:
             new_key = self._cache_key(manifest)
-            if new_key != self._manifest_cache_key:
+            adopted = new_key != self._manifest_cache_key
+            if adopted:
                 # Drop borough caches; they'll lazy-reload on next read.
                 self._rows_by_borough = {}
                 self._map_rows = {}
                 self._screening_rows = {}
+                self._public_sweep_rows = {}
+                self._public_map_rows = {}
+                self._bodies = _empty_body_caches()
+                self._map_indexes = {}
+                self._tiles = OrderedDict()
+                self._map_by_bbl = {}
+                self._bbl_memos = {}
+                self._audits = OrderedDict()
                 self._manifest_cache_key = new_key
             self._manifest = manifest
+            self._manifest_payload = payload
+        if adopted and self.on_new_generation is not None:
+            self.on_new_generation(self, gcs)
         return manifest
 
     def index(self, gcs: GcsArtifacts) -> ParcelIntelIndex:
@@ -542,7 +747,7 @@ class ParcelIntelRegistry:
 
     def borough(
         self, gcs: GcsArtifacts, slug: str
-    ) -> tuple[list[ParcelIntelRow], dict[str, Any] | None]:
+    ) -> tuple[ParcelRowIndex[ParcelIntelRow], dict[str, Any] | None]:
         if slug not in _BOROUGH_SLUGS:
             raise HTTPException(status_code=404, detail="Unknown borough")
         manifest = self._refresh_manifest(gcs)
@@ -552,64 +757,79 @@ class ParcelIntelRegistry:
         with self._lock:
             cached = self._rows_by_borough.get(cache_id)
         if cached is None:
-            try:
-                payload, expected_rows = self._download_artifact(
-                    gcs, manifest, f"{slug}.jsonl"
-                )
-            except FileNotFoundError as exc:
-                if self._atomic_artifact_metadata(
-                    manifest, f"{slug}.jsonl"
-                ) is not None:
-                    raise HTTPException(
-                        status_code=503,
-                        detail="Parcel intelligence referenced artifact is missing",
-                    ) from exc
-                raise HTTPException(
-                    status_code=404, detail=f"No data published for {slug}"
-                ) from exc
-            cached = []
-            bad_lines = 0
-            for line in payload.decode("utf-8", errors="replace").splitlines():
-                if not line.strip():
-                    continue
-                try:
-                    parsed = json.loads(line)
-                except json.JSONDecodeError:
-                    bad_lines += 1
-                    continue
-                if not isinstance(parsed, dict):
-                    bad_lines += 1
-                    continue
-                cached.append(parsed)
-            if bad_lines:
-                log.warning(
-                    "parcel-intel %s.jsonl: skipped %d unparseable line(s); "
-                    "serving the remaining %d",
-                    slug,
-                    bad_lines,
-                    len(cached),
-                )
-            if expected_rows is not None and (
-                bad_lines or len(cached) != expected_rows
-            ):
-                log.error(
-                    "parcel-intel atomic artifact row-count mismatch: "
-                    "slug=%s expected=%d parsed=%d bad_lines=%d",
-                    slug,
-                    expected_rows,
-                    len(cached),
-                    bad_lines,
-                )
+
+            def _fill() -> ParcelRowIndex[ParcelIntelRow]:
+                with self._lock:
+                    filled = self._rows_by_borough.get(cache_id)
+                if filled is None:
+                    filled = self._load_borough(gcs, manifest, slug)
+                    with self._lock:
+                        self._rows_by_borough[cache_id] = filled
+                return filled
+
+            cached = self._fills.do((cache_key, f"{slug}.jsonl"), _fill)
+        return cached, manifest
+
+    def _load_borough(
+        self, gcs: GcsArtifacts, manifest: dict[str, Any], slug: str
+    ) -> ParcelRowIndex[ParcelIntelRow]:
+        """Download, parse and validate one borough exactly once per generation."""
+        try:
+            lines, expected_rows = self._artifact_lines(
+                gcs, manifest, f"{slug}.jsonl"
+            )
+        except FileNotFoundError as exc:
+            if self._atomic_artifact_metadata(
+                manifest, f"{slug}.jsonl"
+            ) is not None:
                 raise HTTPException(
                     status_code=503,
-                    detail="Parcel intelligence artifact row-count check failed",
-                )
-            with self._lock:
-                self._rows_by_borough[cache_id] = cached
+                    detail="Parcel intelligence referenced artifact is missing",
+                ) from exc
+            raise HTTPException(
+                status_code=404, detail=f"No data published for {slug}"
+            ) from exc
+        parsed_rows: list[dict[str, Any]] = []
+        bad_lines = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                parsed = loads_line(line)
+            except json.JSONDecodeError:
+                bad_lines += 1
+                continue
+            if not isinstance(parsed, dict):
+                bad_lines += 1
+                continue
+            parsed_rows.append(parsed)
+        if bad_lines:
+            log.warning(
+                "parcel-intel %s.jsonl: skipped %d unparseable line(s); "
+                "serving the remaining %d",
+                slug,
+                bad_lines,
+                len(parsed_rows),
+            )
+        if expected_rows is not None and (
+            bad_lines or len(parsed_rows) != expected_rows
+        ):
+            log.error(
+                "parcel-intel atomic artifact row-count mismatch: "
+                "slug=%s expected=%d parsed=%d bad_lines=%d",
+                slug,
+                expected_rows,
+                len(parsed_rows),
+                bad_lines,
+            )
+            raise HTTPException(
+                status_code=503,
+                detail="Parcel intelligence artifact row-count check failed",
+            )
 
         rows: list[ParcelIntelRow] = []
         bad_rows = 0
-        for r in cached:
+        for r in parsed_rows:
             try:
                 rows.append(ParcelIntelRow(**r))
             except ValidationError as exc:
@@ -621,9 +841,7 @@ class ParcelIntelRegistry:
                     exc,
                 )
         if bad_rows:
-            if self._atomic_artifact_metadata(
-                manifest, f"{slug}.jsonl"
-            ) is not None:
+            if expected_rows is not None:
                 raise HTTPException(
                     status_code=503,
                     detail="Parcel intelligence artifact schema check failed",
@@ -635,7 +853,65 @@ class ParcelIntelRegistry:
                 bad_rows,
                 len(rows),
             )
-        return rows, manifest
+        return ParcelRowIndex(rows)
+
+    def _load_map(
+        self, gcs: GcsArtifacts, manifest: dict[str, Any]
+    ) -> list[ParcelIntelMapRow]:
+        try:
+            lines, expected_rows = self._artifact_lines(
+                gcs, manifest, "map.jsonl"
+            )
+        except FileNotFoundError as exc:
+            raise HTTPException(
+                status_code=503,
+                detail=(
+                    "Compact parcel map has not been published yet; "
+                    "re-run the parcel publisher."
+                ),
+            ) from exc
+        validated: list[ParcelIntelMapRow] = []
+        bad_lines = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                parsed = loads_line(line)
+            except json.JSONDecodeError:
+                bad_lines += 1
+                continue
+            if not isinstance(parsed, dict):
+                bad_lines += 1
+                continue
+            try:
+                validated.append(ParcelIntelMapRow(**parsed))
+            except ValidationError as exc:
+                bad_lines += 1
+                log.warning(
+                    "parcel-intel map: skipping invalid row (bbl=%s): %s",
+                    parsed.get("bbl"),
+                    exc,
+                )
+        if bad_lines:
+            log.warning(
+                "parcel-intel map.jsonl: skipped %d invalid line(s)",
+                bad_lines,
+            )
+        if expected_rows is not None and (
+            bad_lines or len(validated) != expected_rows
+        ):
+            log.error(
+                "parcel-intel atomic map row-count mismatch: "
+                "expected=%d parsed=%d bad_lines=%d",
+                expected_rows,
+                len(validated),
+                bad_lines,
+            )
+            raise HTTPException(
+                status_code=503,
+                detail="Parcel intelligence artifact row-count check failed",
+            )
+        return validated
 
     def citywide_map(
         self, gcs: GcsArtifacts
@@ -646,65 +922,72 @@ class ParcelIntelRegistry:
         with self._lock:
             cached = self._map_rows.get(cache_key)
         if cached is None:
-            try:
-                payload, expected_rows = self._download_artifact(
-                    gcs, manifest, "map.jsonl"
-                )
-            except FileNotFoundError as exc:
-                raise HTTPException(
-                    status_code=503,
-                    detail=(
-                        "Compact parcel map has not been published yet; "
-                        "re-run the parcel publisher."
-                    ),
-                ) from exc
-            validated: list[ParcelIntelMapRow] = []
-            bad_lines = 0
-            for line in payload.decode("utf-8", errors="replace").splitlines():
-                if not line.strip():
-                    continue
-                try:
-                    parsed = json.loads(line)
-                except json.JSONDecodeError:
-                    bad_lines += 1
-                    continue
-                if not isinstance(parsed, dict):
-                    bad_lines += 1
-                    continue
-                try:
-                    validated.append(ParcelIntelMapRow(**parsed))
-                except ValidationError as exc:
-                    bad_lines += 1
-                    log.warning(
-                        "parcel-intel map: skipping invalid row (bbl=%s): %s",
-                        parsed.get("bbl"),
-                        exc,
-                    )
-            if bad_lines:
-                log.warning(
-                    "parcel-intel map.jsonl: skipped %d invalid line(s)",
-                    bad_lines,
-                )
-            if expected_rows is not None and (
-                bad_lines or len(validated) != expected_rows
-            ):
-                log.error(
-                    "parcel-intel atomic map row-count mismatch: "
-                    "expected=%d parsed=%d bad_lines=%d",
-                    expected_rows,
-                    len(validated),
-                    bad_lines,
-                )
-                raise HTTPException(
-                    status_code=503,
-                    detail="Parcel intelligence artifact row-count check failed",
-                )
-            with self._lock:
-                self._map_rows[cache_key] = validated
-            cached = validated
+
+            def _fill() -> list[ParcelIntelMapRow]:
+                with self._lock:
+                    filled = self._map_rows.get(cache_key)
+                if filled is None:
+                    filled = self._load_map(gcs, manifest)
+                    with self._lock:
+                        self._map_rows[cache_key] = filled
+                return filled
+
+            cached = self._fills.do((cache_key, "map.jsonl"), _fill)
 
         return cached, manifest
 
+    def _load_screening_ledger(
+        self, gcs: GcsArtifacts, manifest: dict[str, Any]
+    ) -> dict[str, ParcelScreeningLedgerRow]:
+        try:
+            lines, expected_rows = self._artifact_lines(
+                gcs,
+                manifest,
+                "screening-ledger.jsonl",
+            )
+        except FileNotFoundError as exc:
+            raise HTTPException(
+                status_code=503,
+                detail=(
+                    "Parcel intelligence screening ledger is missing"
+                ),
+            ) from exc
+        parsed_rows: dict[str, ParcelScreeningLedgerRow] = {}
+        bad_lines = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                raw = loads_line(line)
+                row = ParcelScreeningLedgerRow.model_validate(raw)
+            except (json.JSONDecodeError, ValidationError):
+                bad_lines += 1
+                continue
+            if row.bbl in parsed_rows:
+                bad_lines += 1
+                continue
+            parsed_rows[row.bbl] = row
+        if (
+            bad_lines
+            or expected_rows is None
+            or len(parsed_rows) != expected_rows
+        ):
+            log.error(
+                "parcel-intel screening ledger validation failed: "
+                "expected=%s parsed=%d bad_lines=%d",
+                expected_rows,
+                len(parsed_rows),
+                bad_lines,
+            )
+            raise HTTPException(
+                status_code=503,
+                detail=(
+                    "Parcel intelligence screening ledger validation "
+                    "failed"
+                ),
+            )
+        return parsed_rows
+
     def screening_ledger(
         self,
         gcs: GcsArtifacts,
@@ -720,60 +1003,405 @@ class ParcelIntelRegistry:
         with self._lock:
             cached = self._screening_rows.get(cache_key)
         if cached is None:
-            try:
-                payload, expected_rows = self._download_artifact(
-                    gcs,
-                    manifest,
-                    "screening-ledger.jsonl",
-                )
-            except FileNotFoundError as exc:
-                raise HTTPException(
-                    status_code=503,
-                    detail=(
-                        "Parcel intelligence screening ledger is missing"
-                    ),
-                ) from exc
-            parsed_rows: dict[str, ParcelScreeningLedgerRow] = {}
-            bad_lines = 0
-            for line in payload.decode(
-                "utf-8", errors="replace"
-            ).splitlines():
-                if not line.strip():
-                    continue
-                try:
-                    raw = json.loads(line)
-                    row = ParcelScreeningLedgerRow.model_validate(raw)
-                except (json.JSONDecodeError, ValidationError):
-                    bad_lines += 1
-                    continue
-                if row.bbl in parsed_rows:
-                    bad_lines += 1
-                    continue
-                parsed_rows[row.bbl] = row
-            if (
-                bad_lines
-                or expected_rows is None
-                or len(parsed_rows) != expected_rows
-            ):
-                log.error(
-                    "parcel-intel screening ledger validation failed: "
-                    "expected=%s parsed=%d bad_lines=%d",
-                    expected_rows,
-                    len(parsed_rows),
-                    bad_lines,
-                )
-                raise HTTPException(
-                    status_code=503,
-                    detail=(
-                        "Parcel intelligence screening ledger validation "
-                        "failed"
-                    ),
+
+            def _fill() -> dict[str, ParcelScreeningLedgerRow]:
+                with self._lock:
+                    filled = self._screening_rows.get(cache_key)
+                if filled is None:
+                    filled = self._load_screening_ledger(gcs, manifest)
+                    with self._lock:
+                        self._screening_rows[cache_key] = filled
+                return filled
+
+            cached = self._fills.do((cache_key, "screening-ledger.jsonl"), _fill)
+        return cached, manifest
+
+    def _prepared_body(
+        self,
+        scope: str,
+        body_key: tuple[Any, ...],
+        build: Callable[[], tuple[PreparedJson, int, int]],
+    ) -> tuple[PreparedJson, int, int]:
+        """Serve a cached response body for ``scope``, building it at most once."""
+        with self._lock:
+            bodies = self._bodies[scope]
+            cached = bodies.get(body_key)
+            if cached is not None:
+                bodies.move_to_end(body_key)
+                return cached
+
+        def _fill() -> tuple[PreparedJson, int, int]:
+            with self._lock:
+                filled = self._bodies[scope].get(body_key)
+            if filled is not None:
+                return filled
+            filled = build()
+            with self._lock:
+                bodies = self._bodies[scope]
+                bodies[body_key] = filled
+                bodies.move_to_end(body_key)
+                while len(bodies) > _BODY_CACHE_LIMITS[scope]:
+                    bodies.popitem(last=False)
+            return filled
+
+        return self._fills.do((scope, *body_key), _fill)
+
+    def _public_sweep_projection(
+        self,
+        cache_key: str,
+        slug: str,
+        rows: ParcelRowIndex[ParcelIntelRow],
+    ) -> tuple[ParcelIntelRow, ...]:
+        with self._lock:
+            stripped = self._public_sweep_rows.get((cache_key, slug))
+        if stripped is None:
+            stripped = tuple(
+                _strip_premium_fields(row) for row in rows.head(_ANON_TOP_CAP)
+            )
+            with self._lock:
+                self._public_sweep_rows[(cache_key, slug)] = stripped
+        return stripped
+
+    def _public_map_projection(
+        self, cache_key: str, rows: list[ParcelIntelMapRow]
+    ) -> tuple[ParcelIntelMapRow, ...]:
+        with self._lock:
+            stripped = self._public_map_rows.get(cache_key)
+        if stripped is None:
+            stripped = tuple(
+                _strip_map_premium_fields(row)
+                for row in _cap_per_borough(rows, _ANON_TOP_CAP)
+            )
+            with self._lock:
+                self._public_map_rows[cache_key] = stripped
+        return stripped
+
+    def sweep_body(
+        self,
+        gcs: GcsArtifacts,
+        slug: str,
+        top: int,
+        *,
+        authenticated: bool,
+    ) -> PreparedJson:
+        """Serialized sweep for one borough and access scope."""
+        rows, manifest = self.borough(gcs, slug)
+        cache_key = self._cache_key(manifest)
+        if authenticated:
+            # The body does not echo `top`, so every value past the end of
+            # the borough shares one body.
+            count = min(top, len(rows))
+            selected: Iterable[ParcelIntelRow] = rows.head(count)
+        else:
+            count = min(top, _ANON_TOP_CAP)
+            selected = self._public_sweep_projection(
+                cache_key, slug, rows
+            )[:count]
+
+        def _build() -> tuple[PreparedJson, int, int]:
+            response = _sweep_response(slug, list(selected), manifest)
+            return PreparedJson.from_model(response), count, len(rows)
+
+        prepared, _, _ = self._prepared_body(
+            _access_scope(authenticated),
+            (cache_key, "sweep", slug, count),
+            _build,
+        )
+        return prepared
+
+    def map_body(
+        self,
+        gcs: GcsArtifacts,
+        top_per_borough: int,
+        *,
+        authenticated: bool,
+    ) -> tuple[PreparedJson, int, int]:
+        """Serialized citywide map plus its returned/available counts."""
+        rows, manifest = self.citywide_map(gcs)
+        cache_key = self._cache_key(manifest)
+
+        def _build() -> tuple[PreparedJson, int, int]:
+            if authenticated:
+                # Authenticated citywide access means the complete published
+                # inventory. The publication policy may intentionally emit
+                # more than 1,000 rows in one borough, so applying the legacy
+                # per-borough cap here would silently truncate a verified
+                # 5,000-row generation.
+                selected = list(rows)
+            else:
+                selected = _cap_per_borough(
+                    self._public_map_projection(cache_key, rows),
+                    min(top_per_borough, _ANON_TOP_CAP),
                 )
+            response = _map_response(
+                selected,
+                manifest,
+                authenticated=authenticated,
+                requested_top_per_borough=top_per_borough,
+                available_count=len(rows),
+            )
+            return PreparedJson.from_model(response), len(selected), len(rows)
+
+        return self._prepared_body(
+            _access_scope(authenticated),
+            (cache_key, "map", top_per_borough),
+            _build,
+        )
+
+    def map_index(
+        self, gcs: GcsArtifacts
+    ) -> tuple[ParcelGridIndex[ParcelIntelMapRow], dict[str, Any]]:
+        """Spatial grid over the citywide map, built once per generation."""
+        rows, manifest = self.citywide_map(gcs)
+        cache_key = self._cache_key(manifest)
+        with self._lock:
+            cached = self._map_indexes.get(cache_key)
+        if cached is None:
+
+            def _fill() -> ParcelGridIndex[ParcelIntelMapRow]:
+                with self._lock:
+                    filled = self._map_indexes.get(cache_key)
+                if filled is None:
+                    filled = ParcelGridIndex(rows)
+                    with self._lock:
+                        self._map_indexes[cache_key] = filled
+                return filled
+
+            cached = self._fills.do((cache_key, "map-index"), _fill)
+        return cached, manifest
+
+    def map_window(
+        self,
+        gcs: GcsArtifacts,
+        bbox: BBox,
+        top_per_borough: int,
+        *,
+        authenticated: bool,
+    ) -> tuple[list[ParcelIntelMapRow], int, dict[str, Any]]:
+        """Map rows inside ``bbox`` for one access tier.
+
+        Returns ``(rows, available_count, manifest)``. Anonymous callers see
+        only the public preview rows that fall in the box, and the available
+        count stays the citywide total: per-box counts of the full inventory
+        would let repeated small boxes locate unpublished leads.
+        """
+        index, manifest = self.map_index(gcs)
+        if authenticated:
+            selected = index.query(bbox)
+            return selected, len(selected), manifest
+        rows, _ = self.citywide_map(gcs)
+        preview = _cap_per_borough(
+            self._public_map_projection(self._cache_key(manifest), rows),
+            min(top_per_borough, _ANON_TOP_CAP),
+        )
+        selected = [
+            row
+            for row in preview
+            if row.lat is not None
+            and row.lng is not None
+            and bbox.contains(row.lng, row.lat)
+        ]
+        return selected, len(rows), manifest
+
+    def tile(
+        self,
+        gcs: GcsArtifacts,
+        z: int,
+        x: int,
+        y: int,
+        *,
+        authenticated: bool,
+    ) -> tuple[bytes, dict[str, Any]]:
+        """Encoded MVT tile for one tier; raises ``ValueError`` for bad z/x/y."""
+        bounds = tile_bbox(z, x, y)
+        _, manifest = self.map_index(gcs)
+        tile_key = (self._cache_key(manifest), _access_scope(authenticated), z, x, y)
+        with self._lock:
+            cached = self._tiles.get(tile_key)
+            if cached is not None:
+                self._tiles.move_to_end(tile_key)
+                return cached, manifest
+
+        def _fill() -> bytes:
+            with self._lock:
+                filled = self._tiles.get(tile_key)
+            if filled is not None:
+                return filled
+            pad_lng = (bounds.max_lng - bounds.min_lng) * _TILE_BUFFER_PX / 4096
+            pad_lat = (bounds.max_lat - bounds.min_lat) * _TILE_BUFFER_PX / 4096
+            window = BBox(
+                bounds.min_lng - pad_lng,
+                bounds.min_lat - pad_lat,
+                bounds.max_lng + pad_lng,
+                bounds.max_lat + pad_lat,
+            )
+            rows, _, _ = self.map_window(
+                gcs, window, _ANON_TOP_CAP, authenticated=authenticated
+            )
+            fields = (
+                _TILE_AUTHENTICATED_FIELDS
+                if authenticated
+                else _TILE_PUBLIC_FIELDS
+            )
+            filled = encode_point_layer(
+                _TILE_LAYER,
+                (
+                    (
+                        int(row.bbl) if row.bbl.isdigit() else None,
+                        tile_pixel(row.lng, row.lat, z, x, y),  # type: ignore[arg-type]
+                        {field: getattr(row, field) for field in fields},
+                    )
+                    for row in rows
+                ),
+            )
             with self._lock:
-                self._screening_rows[cache_key] = parsed_rows
-            cached = parsed_rows
+                self._tiles[tile_key] = filled
+                self._tiles.move_to_end(tile_key)
+                while len(self._tiles) > _MAX_CACHED_TILES:
+                    self._tiles.popitem(last=False)
+            return filled
+
+        return self._fills.do(("tile", *tile_key), _fill), manifest
+
+    def _map_lookup(
+        self, gcs: GcsArtifacts
+    ) -> tuple[dict[str, ParcelIntelMapRow], dict[str, Any]]:
+        rows, manifest = self.citywide_map(gcs)
+        cache_key = self._cache_key(manifest)
+        with self._lock:
+            cached = self._map_by_bbl.get(cache_key)
+        if cached is None:
+
+            def _fill() -> dict[str, ParcelIntelMapRow]:
+                with self._lock:
+                    filled = self._map_by_bbl.get(cache_key)
+                if filled is None:
+                    filled = {row.bbl: row for row in rows}
+                    with self._lock:
+                        self._map_by_bbl[cache_key] = filled
+                return filled
+
+            cached = self._fills.do((cache_key, "map-by-bbl"), _fill)
         return cached, manifest
 
+    def _per_bbl(
+        self,
+        gcs: GcsArtifacts,
+        kind: str,
+        bbls: Iterable[str],
+        build: Callable[[ParcelIntelMapRow, dict[str, Any]], Any],
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Memoized ``build`` results for ``bbls`` in the current map.
+
+        BBLs outside the map, and those ``build`` maps to ``None``, are
+        omitted from the result.
+        """
+        lookup, manifest = self._map_lookup(gcs)
+        memo_key = (self._cache_key(manifest), kind)
+        wanted = {bbl for bbl in bbls if bbl in lookup}
+        with self._lock:
+            memo = self._bbl_memos.get(memo_key, {})
+            found = {bbl: memo[bbl] for bbl in wanted if bbl in memo}
+        missing = wanted - found.keys()
+        if missing:
+            built = {bbl: build(lookup[bbl], manifest) for bbl in missing}
+            with self._lock:
+                self._bbl_memos.setdefault(memo_key, {}).update(built)
+            found.update(built)
+        return (
+            {bbl: value for bbl, value in found.items() if value is not None},
+            manifest,
+        )
+
+    def map_rows_by_bbl(
+        self, gcs: GcsArtifacts, bbls: Iterable[str]
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, Any]]:
+        """Current map rows as dicts for ``bbls``; absent BBLs are omitted.
+
+        Dumps are memoized per generation and shared across requests, so
+        callers must treat them as read-only.
+        """
+        return self._per_bbl(
+            gcs, "map-row", bbls, lambda row, _manifest: row.model_dump()
+        )
+
+    def decision_audit_checks(
+        self, gcs: GcsArtifacts, bbls: Iterable[str]
+    ) -> tuple[dict[str, dict[str, dict[str, Any]]], dict[str, Any]]:
+        """Premium decision-audit checks by key for ``bbls`` in the map.
+
+        Checks come from the full borough row, matching the audit that
+        evidence reviews were recorded against.
+        """
+
+        def _checks(
+            row: ParcelIntelMapRow, manifest: dict[str, Any]
+        ) -> dict[str, dict[str, Any]] | None:
+            slug = _BBL_BOROUGH.get(row.bbl[:1])
+            if slug is None:
+                return None
+            rows, _ = self.borough(gcs, slug)
+            full_row = rows.get(row.bbl)
+            if full_row is None:
+                return None
+            audit = self.decision_audit(full_row, manifest, premium_access=True)
+            return {check.key: check.model_dump() for check in audit.checks}
+
+        return self._per_bbl(gcs, "audit-checks", bbls, _checks)
+
+    def decision_audit(
+        self,
+        row: ParcelIntelRow,
+        manifest: dict[str, Any] | None,
+        *,
+        premium_access: bool,
+    ) -> ParcelDecisionAudit:
+        """Memoized ``build_parcel_decision_audit`` for a registry row.
+
+        The audit depends only on the row, the manifest and the access
+        tier, and a row is fixed for a generation, so entries are keyed by
+        (generation, BBL, tier) in a bounded LRU dropped on republish.
+        ``row`` must come from this registry (stripped for anonymous
+        callers); audits are shared across requests and must not be
+        mutated.
+        """
+        if not isinstance(manifest, dict):
+            return build_parcel_decision_audit(
+                row, manifest, premium_access=premium_access
+            )
+        key = (self._cache_key(manifest), row.bbl, premium_access)
+        with self._lock:
+            cached = self._audits.get(key)
+            if cached is not None:
+                self._audits.move_to_end(key)
+                self._audit_counters["hits"] += 1
+                return cached
+            self._audit_counters["misses"] += 1
+        audit = build_parcel_decision_audit(
+            row, manifest, premium_access=premium_access
+        )
+        with self._lock:
+            self._audits[key] = audit
+            self._audits.move_to_end(key)
+            while len(self._audits) > _MAX_CACHED_AUDITS:
+                self._audits.popitem(last=False)
+                self._audit_counters["evictions"] += 1
+        return audit
+
+    def decision_audit_stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._audit_counters["hits"] + self._audit_counters["misses"]
+            return {
+                "entries": len(self._audits),
+                "max_entries": _MAX_CACHED_AUDITS,
+                **self._audit_counters,
+                "hit_rate": (
+                    round(self._audit_counters["hits"] / lookups, 4)
+                    if lookups
+                    else None
+                ),
+            }
+
     def parcel(
         self, gcs: GcsArtifacts, bbl: str
     ) -> tuple[ParcelIntelRow, dict[str, Any] | None]:
@@ -782,16 +1410,85 @@ class ParcelIntelRegistry:
         if len(bbl) != 10 or not bbl.isdigit() or slug is None:
             raise HTTPException(status_code=404, detail="Unknown parcel")
         rows, manifest = self.borough(gcs, slug)
-        for row in rows:
-            if row.bbl == bbl:
-                return row, manifest
-        raise HTTPException(status_code=404, detail="Parcel not found")
+        row = rows.get(bbl)
+        if row is None:
+            raise HTTPException(status_code=404, detail="Parcel not found")
+        return row, manifest
+
+    def parcels(
+        self, gcs: GcsArtifacts, bbls: Iterable[str]
+    ) -> tuple[dict[str, ParcelIntelRow], dict[str, Any] | None]:
+        """Resolve full parcel records, loading each borough once.
+
+        BBLs that are malformed, absent from the feed, or in a borough the
+        feed does not publish are omitted; other load failures propagate.
+        """
+        by_borough: dict[str, list[str]] = {}
+        for bbl in bbls:
+            slug = _BBL_BOROUGH.get(bbl[:1])
+            if len(bbl) == 10 and bbl.isdigit() and slug is not None:
+                by_borough.setdefault(slug, []).append(bbl)
+        found: dict[str, ParcelIntelRow] = {}
+        manifest = None
+        for slug, borough_bbls in by_borough.items():
+            try:
+                rows, manifest = self.borough(gcs, slug)
+            except HTTPException as exc:
+                if exc.status_code != 404:
+                    raise
+                continue
+            for bbl in borough_bbls:
+                row = rows.get(bbl)
+                if row is not None:
+                    found[bbl] = row
+        return found, manifest
+
+
+_MANIFEST_CACHE = ArtifactManifestCache()
+# Optional local-disk tier shared by the resolver and dossier shard LRUs.
+_SHARD_DISK_CACHE = ShardDiskCache.from_env()
+_SALES_PREWARM_TOP = sales_prewarm_top_from_env()
+# Opt-in: hot resolver/dossier shards loaded before a new generation serves.
+_SHARD_PREFETCH_TOP = shard_prefetch_top_from_env()
+
 
+def _prewarm_sales_comparables(
+    registry: ParcelIntelRegistry, gcs: GcsArtifacts
+) -> None:
+    """Warm the sales windows of a new generation's top-ranked lots."""
 
-_REGISTRY = ParcelIntelRegistry()
-_ADDRESS_RESOLVER = ParcelAddressResolver()
-_OFFICIAL_DOSSIERS = ParcelOfficialDossierStore()
-_SALES_COMPARABLES = ParcelSalesComparableService()
+    def _run() -> None:
+        try:
+            rows, _ = registry.citywide_map(gcs)
+            warmed = _SALES_COMPARABLES.prewarm(
+                [row.bbl for row in rows[:_SALES_PREWARM_TOP]]
+            )
+            log.info("prewarmed %d sales comparable windows", warmed)
+        except Exception:
+            log.warning("sales comparable prewarm failed", exc_info=True)
+
+    threading.Thread(target=_run, name="sales-prewarm", daemon=True).start()
+
+
+_REGISTRY = ParcelIntelRegistry(
+    manifest_cache=_MANIFEST_CACHE,
+    on_new_generation=(
+        _prewarm_sales_comparables if _SALES_PREWARM_TOP > 0 else None
+    ),
+)
+_ADDRESS_RESOLVER = ParcelAddressResolver(
+    manifest_cache=_MANIFEST_CACHE,
+    disk_cache=_SHARD_DISK_CACHE,
+    prefetch_top=_SHARD_PREFETCH_TOP,
+)
+_OFFICIAL_DOSSIERS = ParcelOfficialDossierStore(
+    manifest_cache=_MANIFEST_CACHE,
+    disk_cache=_SHARD_DISK_CACHE,
+    prefetch_top=_SHARD_PREFETCH_TOP,
+)
+_SALES_COMPARABLES = ParcelSalesComparableService(
+    cache_dir=sales_cache_dir_from_env()
+)
 
 
 def get_registry() -> ParcelIntelRegistry:
@@ -1004,6 +1701,128 @@ def _strip_map_premium_fields(row: ParcelIntelMapRow) -> ParcelIntelMapRow:
     )
 
 
+def _cap_per_borough(
+    rows: Iterable[ParcelIntelMapRow], cap: int
+) -> list[ParcelIntelMapRow]:
+    """Keep at most ``cap`` rows per borough, preserving published order."""
+    counts: dict[str, int] = {}
+    selected: list[ParcelIntelMapRow] = []
+    for row in rows:
+        count = counts.get(row.borough, 0)
+        if count >= cap:
+            continue
+        counts[row.borough] = count + 1
+        selected.append(row)
+    return selected
+
+
+def _map_response(
+    selected: list[ParcelIntelMapRow],
+    manifest: dict[str, Any],
+    *,
+    authenticated: bool,
+    requested_top_per_borough: int,
+    available_count: int,
+    bbox: BBox | None = None,
+) -> ParcelIntelMapResponse:
+    return ParcelIntelMapResponse(
+        rows=selected,
+        generated_at=_parse_iso(manifest.get("generated_at")),
+        feed_generation=(
+            manifest.get("artifact_generation")
+            if isinstance(manifest.get("artifact_generation"), str)
+            else None
+        ),
+        access_scope=_access_scope(authenticated),
+        requested_top_per_borough=requested_top_per_borough,
+        returned_count=len(selected),
+        available_count=available_count,
+        inventory_complete=len(selected) == available_count,
+        bbox=list(bbox) if bbox is not None else None,
+    )
+
+
+def _sweep_response(
+    borough: str,
+    rows: list[ParcelIntelRow],
+    manifest: dict[str, Any],
+) -> ParcelIntelSweepResponse:
+    return ParcelIntelSweepResponse(
+        borough=borough,
+        rows=rows,
+        generated_at=_parse_iso(manifest.get("generated_at")),
+        model_metadata=manifest.get("model_metadata") or {},
+        data_sources=manifest.get("data_sources") or {},
+        quality_gate=manifest.get("quality_gate") or {},
+        generation_diff=manifest.get("generation_diff") or {},
+        inference_replay=manifest.get("inference_replay") or {},
+    )
+
+
+def _prepared_response(
+    prepared: PreparedJson,
+    *,
+    if_none_match: str | None,
+    accept_encoding: str | None,
+    headers: dict[str, str],
+) -> Response:
+    """Serve cached bytes, or a bodiless 304 when the client already has them.
+
+    Pre-compressed variants carry ``Content-Encoding`` so GZipMiddleware
+    passes them through instead of compressing the body again.
+    """
+    body, coding = prepared.negotiate(accept_encoding)
+    headers = {**headers, "ETag": prepared.etag_for(coding)}
+    if prepared.encoded:
+        headers["Vary"] = f"{headers['Vary']}, Accept-Encoding"
+    if prepared.not_modified(if_none_match):
+        return Response(status_code=304, headers=headers)
+    if coding is not None:
+        headers["Content-Encoding"] = coding
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+def _requested_window(
+    bbox: str | None, tile: str | None
+) -> BBox | None:
+    """Parse the optional `bbox` / `tile` map filters; 422 on bad input."""
+    if bbox is not None and tile is not None:
+        raise HTTPException(
+            status_code=422, detail="Use either bbox or tile, not both"
+        )
+    if tile is not None:
+        z, x, y = (int(part) for part in tile.split("/"))
+        try:
+            return tile_bbox(z, x, y)
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+    if bbox is None:
+        return None
+    try:
+        min_lng, min_lat, max_lng, max_lat = (
+            float(part) for part in bbox.split(",")
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=422,
+            detail="bbox must be min_lng,min_lat,max_lng,max_lat",
+        ) from exc
+    window = BBox(min_lng, min_lat, max_lng, max_lat)
+    if not (
+        -180.0 <= min_lng <= max_lng <= 180.0
+        and -90.0 <= min_lat <= max_lat <= 90.0
+    ):
+        raise HTTPException(
+            status_code=422,
+            detail="bbox must be ordered WGS84 min/max coordinates",
+        )
+    return window
+
+
 @router.get("/parcel-intel/index", response_model=ParcelIntelIndex)
 def parcel_intel_index(
     response: Response,
@@ -1140,6 +1959,69 @@ def parcel_intel_resolve_address(
         refill_per_second=0.1,
     )
     resolved = resolver.resolve(gcs, input.address)
+    response.headers["Cache-Control"] = _SWEEP_CACHE_AUTHED
+    response.headers["Vary"] = "Authorization, X-API-Key"
+    return _address_resolve_response(resolved)
+
+
+@router.post(
+    "/parcel-intel/resolve-address/batch",
+    response_class=StreamingResponse,
+)
+def parcel_intel_resolve_address_batch(
+    input: ParcelAddressBatchResolveRequest,
+    auth: AuthContext = Depends(require_auth),
+    gcs: GcsArtifacts = Depends(get_gcs),
+    resolver: ParcelAddressResolver = Depends(get_address_resolver),
+) -> StreamingResponse:
+    """Resolve up to 5,000 addresses, streamed as NDJSON in input order.
+
+    Each line is a ``ParcelAddressBatchResolveItem`` carrying either the
+    single-address response or that input's error. Lines are keyed by input
+    index, so submitted addresses are never echoed back.
+    """
+
+    # Same per-address refill as the single route (0.1/s), so sustained
+    # address throughput matches single calls; the burst fits one full
+    # batch, and a second large batch waits for the budget to refill.
+    enforce_token_bucket(
+        key=f"parcel-address-resolver-batch:{auth.app_user_id}",
+        capacity=5_000,
+        refill_per_second=0.1,
+        cost=len(input.addresses),
+    )
+    results = resolver.resolve_many(gcs, input.addresses)
+
+    def _lines() -> Iterator[bytes]:
+        for index, result in enumerate(results):
+            if isinstance(result, HTTPException):
+                item = ParcelAddressBatchResolveItem(
+                    index=index,
+                    status="error",
+                    error_status=result.status_code,
+                    error_detail=str(result.detail),
+                )
+            else:
+                item = ParcelAddressBatchResolveItem(
+                    index=index,
+                    status="resolved",
+                    result=_address_resolve_response(result),
+                )
+            yield item.model_dump_json().encode("utf-8") + b"\n"
+
+    return StreamingResponse(
+        _lines(),
+        media_type="application/x-ndjson",
+        headers={
+            "Cache-Control": _SWEEP_CACHE_AUTHED,
+            "Vary": "Authorization, X-API-Key",
+        },
+    )
+
+
+def _address_resolve_response(
+    resolved: ResolvedAddress,
+) -> ParcelAddressResolveResponse:
     if resolved.candidate_count == 0:
         match_status = "not_found"
         interpretation = (
@@ -1161,8 +2043,6 @@ def parcel_intel_resolve_address(
             f"street address to {resolved.candidate_count} tax lots. CityLens "
             "did not choose one automatically; select the intended BBL."
         )
-    response.headers["Cache-Control"] = _SWEEP_CACHE_AUTHED
-    response.headers["Vary"] = "Authorization, X-API-Key"
     return ParcelAddressResolveResponse(
         match_status=match_status,
         candidate_count=resolved.candidate_count,
@@ -1202,25 +2082,9 @@ def _owner_source_status(
     return "unavailable"
 
 
-@router.get(
-    "/parcel-intel/official-parcel/{bbl}",
-    response_model=ParcelOfficialDossierResponse,
-)
-def parcel_intel_official_parcel(
-    bbl: str,
-    response: Response,
-    auth: AuthContext = Depends(require_parcel_read_auth),
-    gcs: GcsArtifacts = Depends(get_gcs),
-    dossiers: ParcelOfficialDossierStore = Depends(get_official_dossiers),
+def _official_dossier_response(
+    bbl: str, dossier: OfficialParcelDossier
 ) -> ParcelOfficialDossierResponse:
-    """Return source-specific official facts for one authenticated tax lot."""
-
-    enforce_token_bucket(
-        key=f"parcel-official-dossier:{auth.app_user_id}",
-        capacity=30,
-        refill_per_second=0.25,
-    )
-    dossier = dossiers.get(gcs, bbl)
     row = dossier.row
     borough_number = int(bbl[0])
     block = int(bbl[1:6])
@@ -1230,10 +2094,6 @@ def parcel_intel_official_parcel(
         if row["sd"]
         else None
     )
-    response.headers["Cache-Control"] = _SWEEP_CACHE_AUTHED
-    response.headers["Vary"] = (
-        "Authorization, X-API-Key, X-CityLens-Parcel-Smoke-Key"
-    )
     return ParcelOfficialDossierResponse(
         bbl=bbl,
         borough=dossier.borough,
@@ -1296,11 +2156,37 @@ def parcel_intel_official_parcel(
     )
 
 
+@router.get(
+    "/parcel-intel/official-parcel/{bbl}",
+    response_model=ParcelOfficialDossierResponse,
+)
+def parcel_intel_official_parcel(
+    bbl: str,
+    response: Response,
+    auth: AuthContext = Depends(require_parcel_read_auth),
+    gcs: GcsArtifacts = Depends(get_gcs),
+    dossiers: ParcelOfficialDossierStore = Depends(get_official_dossiers),
+) -> ParcelOfficialDossierResponse:
+    """Return source-specific official facts for one authenticated tax lot."""
+
+    enforce_token_bucket(
+        key=f"parcel-official-dossier:{auth.app_user_id}",
+        capacity=30,
+        refill_per_second=0.25,
+    )
+    dossier = dossiers.get(gcs, bbl)
+    response.headers["Cache-Control"] = _SWEEP_CACHE_AUTHED
+    response.headers["Vary"] = (
+        "Authorization, X-API-Key, X-CityLens-Parcel-Smoke-Key"
+    )
+    return _official_dossier_response(bbl, dossier)
+
+
 @router.get(
     "/parcel-intel/official-parcel/{bbl}/sales-comparables",
     response_model=ParcelSalesComparablesResponse,
 )
-def parcel_intel_sales_comparables(
+async def parcel_intel_sales_comparables(
     bbl: str,
     response: Response,
     auth: AuthContext = Depends(require_parcel_read_auth),
@@ -1310,20 +2196,24 @@ def parcel_intel_sales_comparables(
         get_sales_comparables
     ),
 ) -> ParcelSalesComparablesResponse:
-    """Screen recent official DOF sales near one authenticated tax lot."""
+    """Screen recent official DOF sales near one authenticated tax lot.
+
+    Async so that waiting on OpenData does not hold a threadpool worker;
+    only the dossier shard lookup, which may read GCS, runs in the pool.
+    """
 
     enforce_token_bucket(
         key=f"parcel-sales-comparables:{auth.app_user_id}",
         capacity=12,
         refill_per_second=0.1,
     )
-    dossier = dossiers.get(gcs, bbl)
+    dossier = await run_in_threadpool(dossiers.get, gcs, bbl)
     response.headers["Cache-Control"] = _SWEEP_CACHE_AUTHED
     response.headers["Vary"] = (
         "Authorization, X-API-Key, X-CityLens-Parcel-Smoke-Key"
     )
     return ParcelSalesComparablesResponse.model_validate(
-        comparables.get(bbl, dossier_row=dossier.row)
+        await comparables.aget(bbl, dossier_row=dossier.row)
     )
 
 
@@ -1340,58 +2230,119 @@ def parcel_intel_map(
             "return the complete published inventory."
         ),
     ),
+    bbox: Optional[str] = Query(
+        None,
+        description=(
+            "Only return rows inside `min_lng,min_lat,max_lng,max_lat` "
+            "(WGS84). Mutually exclusive with `tile`."
+        ),
+    ),
+    tile: Optional[str] = Query(
+        None,
+        pattern=r"^[0-9]{1,2}/[0-9]{1,7}/[0-9]{1,7}$",
+        description="Only return rows inside XYZ web-map tile `z/x/y`.",
+    ),
     auth: Optional[AuthContext] = Depends(maybe_parcel_read_auth),
     _rate_limit: None = Depends(demo_rate_limit),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    accept_encoding: str | None = Header(default=None, alias="Accept-Encoding"),
     gcs: GcsArtifacts = Depends(get_gcs),
     registry: ParcelIntelRegistry = Depends(get_registry),
-) -> ParcelIntelMapResponse:
-    rows, manifest = registry.citywide_map(gcs)
-    if auth is not None:
-        # Authenticated citywide access means the complete published
-        # inventory. The publication policy may intentionally emit more than
-        # 1,000 rows in one borough, so applying the legacy per-borough cap
-        # here would silently truncate a verified 5,000-row generation.
-        selected = list(rows)
-    else:
-        cap = min(top_per_borough, _ANON_TOP_CAP)
-        counts: dict[str, int] = {}
-        selected = []
-        for row in rows:
-            count = counts.get(row.borough, 0)
-            if count >= cap:
-                continue
-            counts[row.borough] = count + 1
-            selected.append(_strip_map_premium_fields(row))
-    response.headers["Cache-Control"] = (
-        _MAP_CACHE_AUTHED if auth is not None else _MAP_CACHE
-    )
-    # The same endpoint has a cacheable public representation and a private
-    # authenticated representation. Without this variance declaration, a
-    # browser or intermediary can reuse the 25-per-borough preview after the
-    # user signs in and make 125 rows look like the full inventory.
-    response.headers["Vary"] = (
-        "Authorization, X-API-Key, X-CityLens-Parcel-Smoke-Key"
+) -> ParcelIntelMapResponse | Response:
+    authenticated = auth is not None
+    window = _requested_window(bbox, tile)
+    headers = {
+        "Cache-Control": _MAP_CACHE_AUTHED if authenticated else _MAP_CACHE,
+        # The same endpoint has a cacheable public representation and a
+        # private authenticated representation. Without this variance
+        # declaration, a browser or intermediary can reuse the
+        # 25-per-borough preview after the user signs in and make 125 rows
+        # look like the full inventory.
+        "Vary": "Authorization, X-API-Key, X-CityLens-Parcel-Smoke-Key",
+        "X-CityLens-Inventory-Scope": _access_scope(authenticated),
+    }
+    if window is not None:
+        # Viewport reads are small and arbitrary, so they are serialized per
+        # request rather than added to the per-generation body cache.
+        selected, available, manifest = registry.map_window(
+            gcs, window, top_per_borough, authenticated=authenticated
+        )
+        response.headers.update(headers)
+        response.headers["X-CityLens-Inventory-Count"] = str(len(selected))
+        response.headers["X-CityLens-Inventory-Available"] = str(available)
+        return _map_response(
+            selected,
+            manifest,
+            authenticated=authenticated,
+            requested_top_per_borough=top_per_borough,
+            available_count=available,
+            bbox=window,
+        )
+    prepared, returned, available = registry.map_body(
+        gcs, top_per_borough, authenticated=authenticated
     )
-    response.headers["X-CityLens-Inventory-Scope"] = (
-        "authenticated_full" if auth is not None else "public_preview"
+    return _prepared_response(
+        prepared,
+        if_none_match=if_none_match,
+        accept_encoding=accept_encoding,
+        headers={
+            **headers,
+            "X-CityLens-Inventory-Count": str(returned),
+            "X-CityLens-Inventory-Available": str(available),
+        },
     )
-    response.headers["X-CityLens-Inventory-Count"] = str(len(selected))
-    response.headers["X-CityLens-Inventory-Available"] = str(len(rows))
-    return ParcelIntelMapResponse(
-        rows=selected,
-        generated_at=_parse_iso((manifest or {}).get("generated_at")),
-        feed_generation=(
-            manifest.get("artifact_generation")
-            if isinstance(manifest.get("artifact_generation"), str)
-            else None
-        ),
-        access_scope=(
-            "authenticated_full" if auth is not None else "public_preview"
+
+
+@router.get(
+    "/parcel-intel/tiles/{z}/{x}/{y}.mvt",
+    response_class=Response,
+    responses={200: {"content": {MVT_MEDIA_TYPE: {}}}},
+)
+def parcel_intel_tile(
+    z: int = Path(..., ge=0, le=22),
+    x: int = Path(..., ge=0),
+    y: int = Path(..., ge=0),
+    generation: Optional[str] = Query(
+        None,
+        description=(
+            "Active `feed_generation` from the index. Anonymous tiles "
+            "requested with it are served as immutable; a stale value is "
+            "a 404 so clients refetch the index."
         ),
-        requested_top_per_borough=top_per_borough,
-        returned_count=len(selected),
-        available_count=len(rows),
-        inventory_complete=len(selected) == len(rows),
+    ),
+    auth: Optional[AuthContext] = Depends(maybe_parcel_read_auth),
+    _rate_limit: None = Depends(parcel_tile_rate_limit),
+    gcs: GcsArtifacts = Depends(get_gcs),
+    registry: ParcelIntelRegistry = Depends(get_registry),
+) -> Response:
+    """Citywide map rows as a Mapbox Vector Tile point layer (`parcels`)."""
+
+    authenticated = auth is not None
+    try:
+        body, manifest = registry.tile(
+            gcs, z, x, y, authenticated=authenticated
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail="Unknown tile") from exc
+    active_generation = manifest.get("artifact_generation")
+    if generation is not None and generation != active_generation:
+        raise HTTPException(
+            status_code=404, detail="Tile generation is not current"
+        )
+    if authenticated:
+        cache_control = _MAP_CACHE_AUTHED
+    elif generation is not None:
+        cache_control = _TILE_CACHE_IMMUTABLE
+    else:
+        cache_control = _MAP_CACHE
+    return Response(
+        content=body,
+        media_type=MVT_MEDIA_TYPE,
+        headers={
+            "Cache-Control": cache_control,
+            "Vary": "Authorization, X-API-Key, X-CityLens-Parcel-Smoke-Key",
+            "X-CityLens-Inventory-Scope": _access_scope(authenticated),
+        },
     )
 
 
@@ -1420,19 +2371,85 @@ def parcel_intel_parcel(
     response.headers["Vary"] = (
         "Authorization, X-API-Key, X-CityLens-Parcel-Smoke-Key"
     )
+    return _parcel_response(
+        registry, served_row, manifest, premium_access=auth is not None
+    )
+
+
+def _parcel_response(
+    registry: ParcelIntelRegistry,
+    row: ParcelIntelRow,
+    manifest: dict[str, Any] | None,
+    *,
+    premium_access: bool,
+) -> ParcelIntelParcelResponse:
     return ParcelIntelParcelResponse(
-        **served_row.model_dump(),
-        decision_audit=build_parcel_decision_audit(
-            served_row,
+        **row.model_dump(),
+        decision_audit=registry.decision_audit(
+            row,
             manifest,
-            premium_access=auth is not None,
+            premium_access=premium_access,
         ),
     )
 
 
+@router.post("/parcel-intel/parcels/batch", response_model=ParcelBatchResponse)
+def parcel_intel_parcels_batch(
+    input: ParcelBatchRequest,
+    response: Response,
+    auth: AuthContext = Depends(require_parcel_read_auth),
+    gcs: GcsArtifacts = Depends(get_gcs),
+    registry: ParcelIntelRegistry = Depends(get_registry),
+    dossiers: ParcelOfficialDossierStore = Depends(get_official_dossiers),
+) -> ParcelBatchResponse:
+    """Return official dossiers and parcel rows for up to 200 named lots.
+
+    Each item carries exactly what the authenticated single-parcel routes
+    would return for that BBL, or a per-item ``not_found``. Dossier shards
+    and borough feeds are each loaded once per batch. The rate limit is
+    charged per lot, not per request.
+    """
+
+    # Same per-lot refill as the single dossier route (0.25/s), so sustained
+    # lot throughput matches single calls; the burst fits one full batch.
+    enforce_token_bucket(
+        key=f"parcel-batch:{auth.app_user_id}",
+        capacity=200,
+        refill_per_second=0.25,
+        cost=len(input.bbls),
+    )
+    found_dossiers = dossiers.get_many(gcs, input.bbls)
+    rows, manifest = registry.parcels(gcs, input.bbls)
+    items = []
+    for bbl in input.bbls:
+        dossier = found_dossiers.get(bbl)
+        row = rows.get(bbl)
+        items.append(
+            ParcelBatchItem(
+                bbl=bbl,
+                dossier_status="found" if dossier is not None else "not_found",
+                dossier=(
+                    _official_dossier_response(bbl, dossier)
+                    if dossier is not None
+                    else None
+                ),
+                parcel_status="found" if row is not None else "not_found",
+                parcel=(
+                    _parcel_response(registry, row, manifest, premium_access=True)
+                    if row is not None
+                    else None
+                ),
+            )
+        )
+    response.headers["Cache-Control"] = _SWEEP_CACHE_AUTHED
+    response.headers["Vary"] = (
+        "Authorization, X-API-Key, X-CityLens-Parcel-Smoke-Key"
+    )
+    return ParcelBatchResponse(items=items)
+
+
 @router.get("/parcel-intel/sweep", response_model=ParcelIntelSweepResponse)
 def parcel_intel_sweep(
-    response: Response,
     borough: str = Query(..., description="One of manhattan/brooklyn/queens/bronx/staten_island"),
     top: int = Query(
         20,
@@ -1446,30 +2463,22 @@ def parcel_intel_sweep(
     ),
     auth: Optional[AuthContext] = Depends(maybe_parcel_read_auth),
     _rate_limit: None = Depends(demo_rate_limit),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    accept_encoding: str | None = Header(default=None, alias="Accept-Encoding"),
     gcs: GcsArtifacts = Depends(get_gcs),
     registry: ParcelIntelRegistry = Depends(get_registry),
-) -> ParcelIntelSweepResponse:
-    rows, manifest = registry.borough(gcs, borough)
-
-    if auth is None:
-        # Anonymous preview tier: clamp row count + strip premium fields.
-        rows = [_strip_premium_fields(r) for r in rows[: min(top, _ANON_TOP_CAP)]]
-        response.headers["Cache-Control"] = _SWEEP_CACHE
-    else:
-        rows = rows[:top]
-        response.headers["Cache-Control"] = _SWEEP_CACHE_AUTHED
-    response.headers["Vary"] = (
-        "Authorization, X-API-Key, X-CityLens-Parcel-Smoke-Key"
-    )
-
-    generated_at = _parse_iso((manifest or {}).get("generated_at"))
-    return ParcelIntelSweepResponse(
-        borough=borough,
-        rows=rows,
-        generated_at=generated_at,
-        model_metadata=(manifest or {}).get("model_metadata") or {},
-        data_sources=(manifest or {}).get("data_sources") or {},
-        quality_gate=(manifest or {}).get("quality_gate") or {},
-        generation_diff=(manifest or {}).get("generation_diff") or {},
-        inference_replay=(manifest or {}).get("inference_replay") or {},
+) -> Response:
+    # Anonymous preview tier is clamped and premium-stripped; both tiers are
+    # served from bodies serialized once per generation.
+    authenticated = auth is not None
+    return _prepared_response(
+        registry.sweep_body(gcs, borough, top, authenticated=authenticated),
+        if_none_match=if_none_match,
+        accept_encoding=accept_encoding,
+        headers={
+            "Cache-Control": (
+                _SWEEP_CACHE_AUTHED if authenticated else _SWEEP_CACHE
+            ),
+            "Vary": "Authorization, X-API-Key, X-CityLens-Parcel-Smoke-Key",
+        },
     )
@@ -36,8 +36,8 @@ from ..services.firestore_store import (
     FirestoreStore,
     StaleSavedSearchSnapshot,
 )
+from ..services.gcp_clients import gcp_clients
 from ..services.gcs_artifacts import GcsArtifacts
-from ..services.parcel_decision_audit import build_parcel_decision_audit
 from ..services.parcel_workflow_actions import (
     build_workflow_actions,
     normalize_workflow_action_payload,
@@ -78,6 +78,7 @@ def get_store(settings: Settings = Depends(get_settings)) -> FirestoreStore:
         parcel_evidence_issues_collection=(
             settings.parcel_evidence_issues_collection
         ),
+        client=gcp_clients(settings).firestore(),
     )
 
 
@@ -190,45 +191,38 @@ def workflow_alerts(
     registry: ParcelIntelRegistry = Depends(get_registry),
 ) -> dict:
     items = store.list_parcel_workflow(app_user_id=auth.app_user_id)
-    rows, manifest = registry.citywide_map(gcs)
-    screening_rows, _ = registry.screening_ledger(
-        gcs,
-        manifest=manifest,
-    )
-    reviewed_bbls = {
+    active = [item for item in items if item.get("archived_at") is None]
+    watched_bbls = {
         str(item.get("bbl") or "")
-        for item in items
-        if item.get("archived_at") is None
-        and isinstance(item.get("evidence_reviews"), dict)
-        and bool(item.get("evidence_reviews"))
+        for item in active
+        if item.get("watching") is True
     }
-    current_evidence_checks: dict[str, dict[str, dict]] = {}
-    if reviewed_bbls:
-        for row in rows:
-            if row.bbl not in reviewed_bbls:
-                continue
-            audit = build_parcel_decision_audit(
-                row,
-                manifest,
-                premium_access=True,
-            )
-            current_evidence_checks[row.bbl] = {
-                check.key: check.model_dump()
-                for check in audit.checks
-            }
-    watched_bbls = {
+    reviewed_bbls = {
         str(item.get("bbl") or "")
-        for item in items
-        if item.get("watching") is True and item.get("archived_at") is None
+        for item in active
+        if isinstance(item.get("evidence_reviews"), dict)
+        and bool(item.get("evidence_reviews"))
     }
+    # Alerts only look at the user's own leads, so resolve just those BBLs
+    # from the registry's per-generation lookups.
+    current_rows, manifest = registry.map_rows_by_bbl(
+        gcs, {str(item.get("bbl") or "") for item in active}
+    )
+    current_evidence_checks, _ = registry.decision_audit_checks(
+        gcs, reviewed_bbls
+    )
+    screening_rows, _ = registry.screening_ledger(
+        gcs,
+        manifest=manifest,
+    )
     generated_at = (manifest or {}).get("generated_at")
     return build_workflow_alerts(
         items,
-        [row.model_dump() for row in rows],
+        current_rows,
         screening_rows={
-            bbl: row.model_dump()
-            for bbl, row in screening_rows.items()
-            if bbl in watched_bbls
+            bbl: screening_rows[bbl].model_dump()
+            for bbl in watched_bbls
+            if bbl in screening_rows
         },
         data_sources=(manifest or {}).get("data_sources") or {},
         current_evidence_checks=current_evidence_checks,
@@ -415,7 +409,7 @@ def review_workflow_evidence(
         )
 
     row, manifest = registry.parcel(gcs, bbl)
-    audit = build_parcel_decision_audit(
+    audit = registry.decision_audit(
         row,
         manifest,
         premium_access=True,
@@ -503,7 +497,7 @@ def submit_workflow_evidence_issue(
         )
 
     row, manifest = registry.parcel(gcs, bbl)
-    audit = build_parcel_decision_audit(
+    audit = registry.decision_audit(
         row,
         manifest,
         premium_access=True,
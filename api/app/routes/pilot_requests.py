@@ -25,6 +25,7 @@ from ..models.schemas import (
 from ..services.auth import require_auth
 from ..services.auth_context import AuthContext
 from ..services.firestore_store import FirestoreStore, utcnow
+from ..services.gcp_clients import gcp_clients
 from ..services.rate_limit import pilot_request_rate_limit
 from ..services.settings import Settings, get_settings
 
@@ -42,6 +43,7 @@ def get_store(settings: Settings = Depends(get_settings)) -> FirestoreStore:
         usage_months_collection=settings.usage_months_collection,
         api_keys_index_collection=settings.api_keys_index_collection,
         pilot_requests_collection=settings.pilot_requests_collection,
+        client=gcp_clients(settings).firestore(),
     )
 
 
@@ -9,6 +9,7 @@ from ..services.auth import require_auth
 from ..services.auth_context import AuthContext
 from ..services.core_adapter import CitylensRequest
 from ..services.firestore_store import FirestoreStore
+from ..services.gcp_clients import gcp_clients
 from ..services.gcs_artifacts import GcsArtifacts
 from ..services.job_trigger import CloudRunJobTrigger
 from ..services.quotas import (
@@ -32,6 +33,7 @@ def get_store(settings: Settings = Depends(get_settings)) -> FirestoreStore:
         users_collection=settings.users_collection,
         auth_identities_collection=settings.auth_identities_collection,
         usage_months_collection=settings.usage_months_collection,
+        client=gcp_clients(settings).firestore(),
     )
 
 
@@ -42,7 +44,9 @@ def get_job_trigger(settings: Settings = Depends(get_settings)) -> CloudRunJobTr
 
 
 def get_gcs(settings: Settings = Depends(get_settings)) -> GcsArtifacts:
-    return GcsArtifacts(bucket=settings.bucket)
+    return GcsArtifacts(
+        bucket=settings.bucket, client=gcp_clients(settings).storage()
+    )
 
 
 @router.post("/runs", response_model=RunResponse)
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+_DEFAULT_TTL_SECONDS = 30.0
+
+
+def _ttl_from_env() -> float:
+    raw = os.getenv("CITYLENS_PARCEL_MANIFEST_TTL_SECONDS")
+    if raw is None or raw.strip() == "":
+        return _DEFAULT_TTL_SECONDS
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return _DEFAULT_TTL_SECONDS
+
+
+@dataclass
+class _Entry:
+    body: bytes
+    content_type: str | None
+    generation: str
+    checked_at: float
+    revalidating: bool = False
+
+
+class ArtifactManifestCache:
+    """TTL cache for small GCS pointer objects such as ``manifest.json``.
+
+    A cached body is served without touching GCS for ``ttl_seconds``. After
+    that it is still served for one more TTL window while a background
+    revalidation asks GCS for the object's generation (one metadata request)
+    and only re-downloads the body when the generation changed. Entries older
+    than two TTLs are revalidated inline so a wedged background refresh can
+    never pin an old publication.
+
+    Only GCS clients that expose ``object_generation`` and
+    ``download_bytes_with_generation`` are cached; anything else (including
+    the in-memory fakes used by tests) passes straight through to
+    ``download_bytes`` so every read sees the latest object.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float | None = None,
+        background: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = _ttl_from_env() if ttl_seconds is None else ttl_seconds
+        self._background = background
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], _Entry] = {}
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "stale_hits": 0,
+            "revalidated_unchanged": 0,
+            "revalidated_changed": 0,
+            "revalidate_errors": 0,
+            "bypassed": 0,
+        }
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "ttl_seconds": self._ttl_seconds,
+                "entries": len(self._entries),
+                **self._counters,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+
+    def download_bytes(
+        self, gcs: Any, *, object_name: str
+    ) -> tuple[bytes, str | None]:
+        probe = getattr(gcs, "object_generation", None)
+        fetch = getattr(gcs, "download_bytes_with_generation", None)
+        bucket = getattr(gcs, "bucket_name", None)
+        if (
+            self._ttl_seconds <= 0
+            or not callable(probe)
+            or not callable(fetch)
+            or not isinstance(bucket, str)
+        ):
+            self._count("bypassed")
+            return gcs.download_bytes(object_name=object_name)
+
+        key = (bucket, object_name)
+        now = self._clock()
+        action = "fill"
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = now - entry.checked_at
+                if age < self._ttl_seconds:
+                    self._counters["hits"] += 1
+                    return entry.body, entry.content_type
+                action = "revalidate"
+                if self._background and age < 2 * self._ttl_seconds:
+                    self._counters["stale_hits"] += 1
+                    action = "serve"
+                    if not entry.revalidating:
+                        entry.revalidating = True
+                        action = "schedule"
+                    body, content_type = entry.body, entry.content_type
+
+        if action == "fill":
+            return self._fill(gcs, key, counter="misses")
+        if action == "revalidate":
+            return self._revalidate(gcs, key)
+        if action == "schedule":
+            threading.Thread(
+                target=self._revalidate_quietly,
+                args=(gcs, key),
+                name="manifest-revalidate",
+                daemon=True,
+            ).start()
+        return body, content_type
+
+    def _fill(
+        self, gcs: Any, key: tuple[str, str], *, counter: str
+    ) -> tuple[bytes, str | None]:
+        try:
+            body, content_type, generation = gcs.download_bytes_with_generation(
+                object_name=key[1]
+            )
+        except FileNotFoundError:
+            with self._lock:
+                self._entries.pop(key, None)
+            raise
+        with self._lock:
+            self._entries[key] = _Entry(
+                body=body,
+                content_type=content_type,
+                generation=generation,
+                checked_at=self._clock(),
+            )
+            self._counters[counter] += 1
+        return body, content_type
+
+    def _revalidate(
+        self, gcs: Any, key: tuple[str, str]
+    ) -> tuple[bytes, str | None]:
+        with self._lock:
+            entry = self._entries.get(key)
+        generation = gcs.object_generation(object_name=key[1])
+        if entry is not None and generation is not None and generation == entry.generation:
+            with self._lock:
+                entry.checked_at = self._clock()
+                entry.revalidating = False
+                self._counters["revalidated_unchanged"] += 1
+            return entry.body, entry.content_type
+        return self._fill(gcs, key, counter="revalidated_changed")
+
+    def _revalidate_quietly(self, gcs: Any, key: tuple[str, str]) -> None:
+        try:
+            self._revalidate(gcs, key)
+        except Exception:
+            self._count("revalidate_errors")
+            log.warning(
+                "manifest revalidation failed for gs://%s/%s",
+                key[0],
+                key[1],
+                exc_info=True,
+            )
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.revalidating = False
@@ -10,11 +10,13 @@ from fastapi import Depends, Header, HTTPException
 
 from .auth_context import AuthContext
 from .firestore_store import FirestoreStore, is_user_api_key
+from .gcp_clients import gcp_clients
 from .oidc_verifier import (
     AuthVerificationError,
     MockVerifier,
     OIDCVerifier,
 )
+from .principal_cache import PrincipalCache
 from .settings import Settings, get_settings
 
 logger = logging.getLogger(__name__)
@@ -32,6 +34,27 @@ def _store_factory(settings: Settings) -> FirestoreStore:
         auth_identities_collection=settings.auth_identities_collection,
         usage_months_collection=settings.usage_months_collection,
         api_keys_index_collection=settings.api_keys_index_collection,
+        client=gcp_clients(settings).firestore(),
+    )
+
+
+@lru_cache(maxsize=4)
+def _principal_cache_cached(
+    ttl_seconds: int, max_entries: int, login_write_interval_seconds: int
+) -> PrincipalCache:
+    return PrincipalCache(
+        ttl_seconds=ttl_seconds,
+        max_entries=max_entries,
+        login_write_interval_seconds=login_write_interval_seconds,
+    )
+
+
+def principal_cache(settings: Settings) -> PrincipalCache:
+    """The process-wide principal cache for these settings."""
+    return _principal_cache_cached(
+        settings.principal_cache_ttl_seconds,
+        settings.principal_cache_max_entries,
+        settings.login_write_interval_seconds,
     )
 
 
@@ -112,6 +135,11 @@ def require_auth(
     if bearer_token and is_user_api_key(bearer_token):
         if not settings.allow_user_api_keys:
             raise HTTPException(status_code=401, detail="User API keys are not enabled")
+        cache = principal_cache(settings)
+        cache_key = ("user_api_key", sha256_hex(bearer_token))
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
         store = _store_factory(settings)
         owner_id = store.get_user_id_for_api_key(bearer_token)
         if not owner_id:
@@ -123,7 +151,7 @@ def require_auth(
             raise HTTPException(status_code=401, detail="Invalid API key")
         plan_type = str(user_doc.get("plan_type") or "free")
         is_admin = bool(user_doc.get("is_admin"))
-        return AuthContext(
+        ctx = AuthContext(
             app_user_id=str(user_doc.get("user_id") or owner_id),
             auth_provider="user_api_key",
             auth_subject=owner_id,
@@ -132,6 +160,8 @@ def require_auth(
             is_admin=is_admin,
             plan_type=plan_type,
         )
+        cache.put(cache_key, ctx)
+        return ctx
 
     if bearer_token:
         verifier = _get_verifier(settings)
@@ -153,6 +183,14 @@ def require_auth(
         email_verified = bool(claims.get("email_verified") or claims.get("emailVerified") or False)
         is_admin_override = _admin_for_oidc(claims, settings)
 
+        # Every claim that feeds the user document is part of the key, so a
+        # changed email or admin grant resolves (and writes) afresh.
+        cache = principal_cache(settings)
+        cache_key = ("oidc", provider, subject, email, email_verified, is_admin_override)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        record_login = cache.login_due(cache_key)
         store = _store_factory(settings)
         user_doc = store.get_or_create_user_by_identity(
             provider=provider,
@@ -160,10 +198,11 @@ def require_auth(
             email=email,
             email_verified=email_verified,
             is_admin_override=is_admin_override,
+            record_login=record_login,
         )
         plan_type = str(user_doc.get("plan_type") or ("admin" if is_admin_override else "free"))
         is_admin = bool(user_doc.get("is_admin") or is_admin_override)
-        return AuthContext(
+        ctx = AuthContext(
             app_user_id=str(user_doc["user_id"]),
             auth_provider=provider,
             auth_subject=subject,
@@ -172,12 +211,19 @@ def require_auth(
             is_admin=is_admin,
             plan_type=plan_type,
         )
+        cache.put(cache_key, ctx, login_recorded=record_login)
+        return ctx
 
     if x_api_key and settings.allow_admin_api_keys and _check_admin_api_key(x_api_key, settings):
         api_key_hash = sha256_hex(x_api_key)
+        cache = principal_cache(settings)
+        cache_key = ("admin_api_key", api_key_hash)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
         store = _store_factory(settings)
         user_doc = store.get_admin_user_for_api_key(api_key_hash)
-        return AuthContext(
+        ctx = AuthContext(
             app_user_id=str(user_doc["user_id"]),
             auth_provider="admin_api_key",
             auth_subject=api_key_hash,
@@ -186,6 +232,8 @@ def require_auth(
             is_admin=True,
             plan_type="admin",
         )
+        cache.put(cache_key, ctx)
+        return ctx
 
     if authorization or x_api_key:
         raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -338,18 +338,22 @@ class FirestoreStore:
         email: Optional[str],
         email_verified: bool,
         is_admin_override: bool,
+        record_login: bool = True,
     ) -> dict[str, Any]:
+        """Resolve (creating on first sight) the app user for an identity.
+
+        With ``record_login=False`` an existing user whose stored email,
+        verification, and admin fields already match is returned after the
+        two reads, without rewriting ``last_login_at`` or the identity.
+        """
         ident_id = identity_id_for(provider, subject)
 
         def _op() -> dict[str, Any]:
             now = utcnow()
             ident_ref = self.client.collection(self.auth_identities_collection).document(ident_id)
             ident_snap = ident_ref.get()
-            if ident_snap.exists:
-                ident_doc = ident_snap.to_dict() or {}
-                app_user_id = str(ident_doc.get("app_user_id") or "")
-            else:
-                app_user_id = ""
+            ident_doc = (ident_snap.to_dict() or {}) if ident_snap.exists else {}
+            app_user_id = str(ident_doc.get("app_user_id") or "")
 
             if not app_user_id:
                 app_user_id = uuid.uuid4().hex
@@ -389,6 +393,17 @@ class FirestoreStore:
                 if is_admin_override:
                     patch["is_admin"] = True
                     patch["plan_type"] = "admin"
+                unchanged = (
+                    ident_doc.get("email") == email
+                    and ident_doc.get("email_verified") == bool(email_verified)
+                    and all(
+                        user_doc.get(field) == value
+                        for field, value in patch.items()
+                        if field not in ("last_login_at", "updated_at")
+                    )
+                )
+                if unchanged and not record_login:
+                    return user_doc
                 user_ref.set(patch, merge=True)
                 user_doc = {**user_doc, **patch}
 
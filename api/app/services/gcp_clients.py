@@ -0,0 +1,105 @@
+"""Process-wide Firestore and Cloud Storage clients.
+
+Request dependencies used to build a new ``firestore.Client`` and
+``storage.Client`` per request, repeating credential discovery, gRPC channel
+setup, and TLS handshakes each time. ``GcpClients`` builds each client once
+per process and hands the same one to every ``FirestoreStore`` and
+``GcsArtifacts``. Firestore multiplexes concurrent calls over its single
+gRPC channel. The Storage client's HTTP pool is sized with
+``CITYLENS_GCS_HTTP_POOL_SIZE`` so request threads do not churn connections.
+The FastAPI lifespan builds both clients at startup and closes them at
+shutdown. ``stats`` counts client constructions, which should stay at one
+each per process.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+from google.cloud import firestore, storage
+from requests.adapters import HTTPAdapter
+
+from .settings import Settings
+
+log = logging.getLogger(__name__)
+
+
+def _storage_client(project_id: str, pool_size: int) -> storage.Client:
+    client = storage.Client(project=project_id)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    # `_http` is the client's AuthorizedSession; the default adapter keeps
+    # only ten connections per host.
+    client._http.mount("https://", adapter)
+    return client
+
+
+class GcpClients:
+    def __init__(
+        self,
+        *,
+        project_id: str,
+        gcs_pool_size: int = 40,
+        firestore_factory: Callable[[], Any] | None = None,
+        storage_factory: Callable[[], Any] | None = None,
+    ) -> None:
+        self._gcs_pool_size = gcs_pool_size
+        self._firestore_factory = firestore_factory or (
+            lambda: firestore.Client(project=project_id)
+        )
+        self._storage_factory = storage_factory or (
+            lambda: _storage_client(project_id, gcs_pool_size)
+        )
+        self._lock = threading.Lock()
+        self._firestore: Any = None
+        self._storage: Any = None
+        self._constructed = {"firestore": 0, "storage": 0}
+
+    def firestore(self) -> firestore.Client:
+        with self._lock:
+            if self._firestore is None:
+                self._firestore = self._firestore_factory()
+                self._constructed["firestore"] += 1
+                log.info("constructed Firestore client", extra={"stage": "clients"})
+            return self._firestore
+
+    def storage(self) -> storage.Client:
+        with self._lock:
+            if self._storage is None:
+                self._storage = self._storage_factory()
+                self._constructed["storage"] += 1
+                log.info("constructed Storage client", extra={"stage": "clients"})
+            return self._storage
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "firestore_constructed": self._constructed["firestore"],
+                "storage_constructed": self._constructed["storage"],
+                "gcs_pool_size": self._gcs_pool_size,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            clients = [self._firestore, self._storage]
+            self._firestore = self._storage = None
+        for client in clients:
+            close = getattr(client, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception:  # pragma: no cover - shutdown is best-effort
+                    log.warning("closing a GCP client failed", exc_info=True)
+
+
+@lru_cache(maxsize=4)
+def _gcp_clients_cached(project_id: str, gcs_pool_size: int) -> GcpClients:
+    return GcpClients(project_id=project_id, gcs_pool_size=gcs_pool_size)
+
+
+def gcp_clients(settings: Settings) -> GcpClients:
+    """The process-wide clients for this project."""
+    return _gcp_clients_cached(settings.project_id, settings.gcs_http_pool_size)
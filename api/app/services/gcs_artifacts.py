@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import timedelta
 from urllib.request import Request as UrlRequest
 from urllib.request import urlopen
 
 import google.auth
+from google.api_core import exceptions as gexc
 from google.auth import impersonated_credentials
 from google.auth.transport.requests import Request
 from google.cloud import storage
 
+from .jsonl_stream import DEFAULT_CHUNK_SIZE
 from .retry import retry_transient
 
 _METADATA_SA_EMAIL_URL = (
@@ -32,6 +35,12 @@ def _service_account_email_from_credentials(credentials: object) -> str | None:
     return _metadata_service_account_email()
 
 
+def _read_chunks(blob: storage.Blob, chunk_size: int) -> Iterator[bytes]:
+    with blob.open("rb", chunk_size=chunk_size) as reader:
+        while chunk := reader.read(chunk_size):
+            yield chunk
+
+
 class GcsArtifacts:
     def __init__(self, *, bucket: str, client: storage.Client | None = None) -> None:
         self.client = client or storage.Client()
@@ -48,6 +57,54 @@ class GcsArtifacts:
 
         return retry_transient(_op)
 
+    def object_generation(self, *, object_name: str) -> str | None:
+        """Return the live object generation with a single metadata request."""
+
+        def _op() -> str | None:
+            blob = self.client.bucket(self.bucket_name).get_blob(object_name)
+            if blob is None or blob.generation is None:
+                return None
+            return str(blob.generation)
+
+        return retry_transient(_op)
+
+    def download_bytes_with_generation(
+        self, *, object_name: str
+    ) -> tuple[bytes, str | None, str]:
+        """Download an object pinned to the generation its metadata reported."""
+
+        def _op() -> tuple[bytes, str | None, str]:
+            blob = self.client.bucket(self.bucket_name).get_blob(object_name)
+            if blob is None:
+                raise FileNotFoundError(object_name)
+            try:
+                # ``get_blob`` populated ``generation``, so the media request
+                # reads exactly that revision even if a publish lands mid-read.
+                body = blob.download_as_bytes()
+            except gexc.NotFound as exc:
+                raise FileNotFoundError(object_name) from exc
+            return body, blob.content_type, str(blob.generation)
+
+        return retry_transient(_op)
+
+    def open_chunks(
+        self, *, object_name: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Stream an object in ``chunk_size`` pieces instead of one buffer.
+
+        The metadata lookup happens here, so a missing object raises
+        ``FileNotFoundError`` before the caller starts iterating. Reads are
+        pinned to the generation that lookup saw.
+        """
+
+        def _op() -> storage.Blob:
+            blob = self.client.bucket(self.bucket_name).get_blob(object_name)
+            if blob is None:
+                raise FileNotFoundError(object_name)
+            return blob
+
+        return _read_chunks(retry_transient(_op), chunk_size)
+
     def signed_url(self, *, object_name: str, ttl_seconds: int) -> str:
         def _op() -> str:
             bucket = self.client.bucket(self.bucket_name)
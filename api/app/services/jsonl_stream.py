@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+try:  # Optional fast path; stdlib json stays the reference behavior.
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the deployment image
+    _orjson = None
+
+try:
+    import msgspec as _msgspec
+except ImportError:  # pragma: no cover - depends on the deployment image
+    _msgspec = None
+
+if _orjson is not None:
+    JSON_BACKEND = "orjson"
+    _fast_loads = _orjson.loads
+    _FAST_ERRORS: tuple[type[Exception], ...] = (_orjson.JSONDecodeError,)
+elif _msgspec is not None:  # pragma: no cover - depends on the deployment image
+    JSON_BACKEND = "msgspec"
+    _fast_loads = _msgspec.json.decode
+    _FAST_ERRORS = (_msgspec.DecodeError,)
+else:  # pragma: no cover - depends on the deployment image
+    JSON_BACKEND = "json"
+    _fast_loads = None
+    _FAST_ERRORS = ()
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class ArtifactIntegrityError(ValueError):
+    """Streamed bytes did not match the manifest's size or SHA-256."""
+
+    def __init__(
+        self,
+        *,
+        expected_size: int | None,
+        actual_size: int,
+        expected_sha256: str | None,
+        actual_sha256: str | None,
+    ) -> None:
+        super().__init__("artifact integrity mismatch")
+        self.expected_size = expected_size
+        self.actual_size = actual_size
+        self.expected_sha256 = expected_sha256
+        self.actual_sha256 = actual_sha256
+
+
+def loads_line(line: bytes) -> Any:
+    """Parse one JSONL record with the fastest available backend.
+
+    Anything the fast backend rejects is re-parsed with the stdlib exactly as
+    the whole-buffer reader did (``errors="replace"`` decoding, NaN literals),
+    so a backend swap never turns a previously valid line into a bad one.
+    Raises ``json.JSONDecodeError`` for lines the stdlib rejects too.
+    """
+
+    if _fast_loads is not None:
+        try:
+            return _fast_loads(line)
+        except _FAST_ERRORS:
+            pass
+    return json.loads(line.decode("utf-8", errors="replace"))
+
+
+class VerifiedJsonlStream:
+    """Split streamed chunks into JSONL lines while hashing them.
+
+    Lines are yielded as ``bytes`` without the trailing newline, so the full
+    text is never materialized. Size is enforced as chunks arrive, and the
+    SHA-256 is checked once the source is exhausted: ``ArtifactIntegrityError``
+    is raised from the final ``next()``, so callers that only publish their
+    parsed result after the loop finishes never publish unverified data.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        *,
+        expected_size: int | None = None,
+        expected_sha256: str | None = None,
+    ) -> None:
+        self._chunks = chunks
+        self._expected_size = expected_size
+        self._expected_sha256 = expected_sha256
+        self.size = 0
+        self.sha256: str | None = None
+
+    def _mismatch(self, actual_sha256: str | None) -> ArtifactIntegrityError:
+        return ArtifactIntegrityError(
+            expected_size=self._expected_size,
+            actual_size=self.size,
+            expected_sha256=self._expected_sha256,
+            actual_sha256=actual_sha256,
+        )
+
+    def __iter__(self) -> Iterator[bytes]:
+        digest = hashlib.sha256()
+        pending = b""
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+            self.size += len(chunk)
+            if self._expected_size is not None and self.size > self._expected_size:
+                raise self._mismatch(None)
+            digest.update(chunk)
+            buffer = pending + chunk if pending else chunk
+            start = 0
+            while True:
+                end = buffer.find(b"\n", start)
+                if end < 0:
+                    break
+                yield buffer[start:end]
+                start = end + 1
+            pending = buffer[start:]
+        if pending:
+            yield pending
+        self.sha256 = digest.hexdigest()
+        if (
+            self._expected_size is not None and self.size != self._expected_size
+        ) or (
+            self._expected_sha256 is not None and self.sha256 != self._expected_sha256
+        ):
+            raise self._mismatch(self.sha256)
@@ -8,12 +8,40 @@ from typing import Any, Optional
 import httpx
 import jwt
 from jwt import PyJWKClient
+from jwt.exceptions import PyJWKClientConnectionError
+
+from .outbound_http import OutboundHttp, shared_outbound_http
 
 
 class AuthVerificationError(Exception):
     pass
 
 
+class _PooledJWKClient(PyJWKClient):
+    """``PyJWKClient`` that fetches the JWKS through the shared outbound pool.
+
+    The stock client opens a fresh urllib connection per fetch; this one
+    reuses pooled connections and fails fast while the issuer is degraded.
+    """
+
+    def __init__(self, uri: str, *, http: OutboundHttp) -> None:
+        super().__init__(uri)
+        self._http = http
+
+    def fetch_data(self) -> Any:
+        try:
+            response = self._http.get(self.uri, headers=self.headers, timeout=5.0)
+            response.raise_for_status()
+            jwk_set = response.json()
+        except (httpx.HTTPError, ValueError) as exc:
+            raise PyJWKClientConnectionError(
+                f'Fail to fetch data from the url, err: "{exc}"'
+            ) from exc
+        if self.jwk_set_cache is not None:
+            self.jwk_set_cache.put(jwk_set)
+        return jwk_set
+
+
 class OIDCVerifier:
     def __init__(
         self,
@@ -22,7 +50,7 @@ class OIDCVerifier:
         issuer: Optional[str],
         audience: Optional[str],
         cache_ttl_seconds: int = 600,
-        http_client: Optional[httpx.Client] = None,
+        http: Optional[OutboundHttp] = None,
     ) -> None:
         if not jwks_url:
             raise RuntimeError("OIDCVerifier requires a JWKS URL")
@@ -30,8 +58,9 @@ class OIDCVerifier:
         self._issuer = issuer
         self._audience = audience
         self._cache_ttl = cache_ttl_seconds
-        self._jwks_client = PyJWKClient(jwks_url)
-        self._http = http_client or httpx.Client(timeout=5.0)
+        self._jwks_client = _PooledJWKClient(
+            jwks_url, http=http or shared_outbound_http()
+        )
         self._jwks_cache: Optional[dict[str, Any]] = None
         self._jwks_fetched_at: float = 0.0
 
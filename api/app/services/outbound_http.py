@@ -0,0 +1,285 @@
+"""Shared, pooled HTTP for the API's calls to third-party services.
+
+One sync and one async ``httpx`` client serve every upstream, so connections
+are kept alive (and multiplexed over HTTP/2 where the upstream offers it)
+across requests and services instead of per service instance. Each upstream
+host gets a concurrency limit and a circuit breaker: after consecutive
+transport failures or 5xx/429 responses the host fails fast with
+``UpstreamUnavailable`` until a probe after the cool-down succeeds.
+
+``UpstreamUnavailable`` and the limit's ``httpx.PoolTimeout`` are
+``httpx.TransportError`` subclasses, so callers that already map
+``httpx.HTTPError`` to their own 503 need no extra handling.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from typing import Any
+
+import httpx
+
+DEFAULT_TIMEOUT = httpx.Timeout(6.0)
+DEFAULT_USER_AGENT = "CityLens API/1.0"
+
+
+class UpstreamUnavailable(httpx.TransportError):
+    """Raised without a network call while a host's circuit is open."""
+
+
+def _healthy(response: httpx.Response) -> bool:
+    return response.status_code < 500 and response.status_code != 429
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for one upstream host.
+
+    ``closed`` lets every call through. ``failure_threshold`` consecutive
+    failures open it; after ``reset_after`` seconds one caller is let
+    through as a ``half_open`` probe, whose outcome closes or re-opens it.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_after: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_after = reset_after
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._probing or self._clock() - self._opened_at >= self._reset_after:
+                return "half_open"
+            return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or self._clock() - self._opened_at < self._reset_after:
+                return False
+            self._probing = True
+            return True
+
+    def settle(self, ok: bool | None) -> None:
+        """Record a call's outcome; ``None`` means it ended without one."""
+        with self._lock:
+            if ok is None:
+                self._probing = False
+            elif ok:
+                self._failures = 0
+                self._opened_at = None
+                self._probing = False
+            else:
+                self._failures += 1
+                if self._probing or self._failures >= self._failure_threshold:
+                    self._opened_at = self._clock()
+                self._probing = False
+
+
+class _Host:
+    __slots__ = ("async_limit", "breaker", "limit", "rejected")
+
+    def __init__(self, max_concurrent: int, breaker: CircuitBreaker) -> None:
+        self.breaker = breaker
+        self.limit = threading.BoundedSemaphore(max_concurrent)
+        # Created on first async use, inside the serving event loop.
+        self.async_limit: asyncio.Semaphore | None = None
+        self.rejected = 0
+
+
+class OutboundHttp:
+    """Pooled sync/async GET with per-host limits and circuit breakers.
+
+    ``max_per_host`` bounds concurrent requests to one host from threads
+    and, separately, from coroutines; a caller that cannot start within the
+    pool timeout gets ``httpx.PoolTimeout``. ``transport`` replaces the
+    network for both clients (``httpx.MockTransport`` serves either).
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+        max_connections: int = 64,
+        max_keepalive_connections: int = 32,
+        max_per_host: int = 16,
+        failure_threshold: int = 5,
+        reset_after: float = 30.0,
+        transport: httpx.BaseTransport | httpx.AsyncBaseTransport | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._timeout = timeout
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=30.0,
+        )
+        self._max_per_host = max_per_host
+        self._failure_threshold = failure_threshold
+        self._reset_after = reset_after
+        self._transport = transport
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hosts: dict[str, _Host] = {}
+        self._client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+
+    def _options(self) -> dict[str, Any]:
+        return {
+            "timeout": self._timeout,
+            "limits": self._limits,
+            # ``h2`` is locked with the API (``httpx[http2]``); hosts that do
+            # not negotiate HTTP/2 over ALPN stay on HTTP/1.1.
+            "http2": True,
+            "headers": {"User-Agent": DEFAULT_USER_AGENT},
+        }
+
+    @property
+    def client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    transport=self._transport,  # type: ignore[arg-type]
+                    **self._options(),
+                )
+            return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        with self._lock:
+            if self._async_client is None:
+                self._async_client = httpx.AsyncClient(
+                    transport=self._transport,  # type: ignore[arg-type]
+                    **self._options(),
+                )
+            return self._async_client
+
+    def _host(self, url: str) -> tuple[str, _Host]:
+        name = httpx.URL(url).host
+        with self._lock:
+            host = self._hosts.get(name)
+            if host is None:
+                host = _Host(
+                    self._max_per_host,
+                    CircuitBreaker(
+                        failure_threshold=self._failure_threshold,
+                        reset_after=self._reset_after,
+                        clock=self._clock,
+                    ),
+                )
+                self._hosts[name] = host
+            return name, host
+
+    def _admit(self, name: str, host: _Host) -> None:
+        if not host.breaker.allow():
+            with self._lock:
+                host.rejected += 1
+            raise UpstreamUnavailable(f"{name} is failing; circuit open")
+
+    def get(
+        self,
+        url: str,
+        *,
+        params: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: httpx.Timeout | float | None = None,
+    ) -> httpx.Response:
+        name, host = self._host(url)
+        self._admit(name, host)
+        ok: bool | None = None
+        try:
+            if not host.limit.acquire(timeout=self._timeout.pool):
+                raise httpx.PoolTimeout(f"{name} concurrency limit reached")
+            try:
+                response = self.client.get(
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+                )
+            except httpx.TransportError:
+                ok = False
+                raise
+            finally:
+                host.limit.release()
+            ok = _healthy(response)
+            return response
+        finally:
+            host.breaker.settle(ok)
+
+    async def aget(
+        self,
+        url: str,
+        *,
+        params: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: httpx.Timeout | float | None = None,
+    ) -> httpx.Response:
+        name, host = self._host(url)
+        self._admit(name, host)
+        ok: bool | None = None
+        try:
+            if host.async_limit is None:
+                host.async_limit = asyncio.Semaphore(self._max_per_host)
+            limit = host.async_limit
+            try:
+                await asyncio.wait_for(limit.acquire(), self._timeout.pool)
+            except TimeoutError:
+                raise httpx.PoolTimeout(f"{name} concurrency limit reached") from None
+            try:
+                response = await self.async_client.get(
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+                )
+            except httpx.TransportError:
+                ok = False
+                raise
+            finally:
+                limit.release()
+            ok = _healthy(response)
+            return response
+        finally:
+            host.breaker.settle(ok)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            hosts = dict(self._hosts)
+        return {
+            "hosts": {
+                name: {"state": host.breaker.state, "rejected": host.rejected}
+                for name, host in sorted(hosts.items())
+            },
+        }
+
+    async def aclose(self) -> None:
+        with self._lock:
+            client, self._client = self._client, None
+            async_client, self._async_client = self._async_client, None
+        if client is not None:
+            client.close()
+        if async_client is not None:
+            await async_client.aclose()
+
+
+@lru_cache(maxsize=1)
+def shared_outbound_http() -> OutboundHttp:
+    """The process-wide pool used by services that are not handed one."""
+    return OutboundHttp()
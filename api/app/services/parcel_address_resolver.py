@@ -2,27 +2,40 @@ from __future__ import annotations
 
 import hashlib
 import json
+import logging
 import re
 import threading
-from collections import OrderedDict
+from collections import Counter, OrderedDict
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Literal
 
 from fastapi import HTTPException
 
+from .artifact_manifest_cache import ArtifactManifestCache
 from .gcs_artifacts import GcsArtifacts
+from .shard_disk_cache import ShardDiskCache, shard_tier_stats
+from .shard_prefetch import GenerationPrefetch
+from .single_flight import SingleFlight
+
+log = logging.getLogger(__name__)
 
 RESOLVER_PREFIX = "parcel-intel/resolver/v1"
 RESOLVER_SCHEMA = "citylens-parcel-resolver/address-index@v1"
 PUBLICATION_SCHEMA = "citylens-parcel-resolver/atomic-publication@v1"
 NORMALIZATION_SCHEMA = "citylens/address-normalization@v1"
 MAX_RETURNED_CANDIDATES = 20
+# Concurrent shard loads per batch; each is one GCS read plus a parse.
+_BATCH_SHARD_WORKERS = 8
+_INCOMPLETE_ADDRESS = "Enter a complete NYC street address with a house number"
 _GENERATION_RE = re.compile(
     r"^[0-9]{8}T[0-9]{12}Z-[0-9a-f]{12}$"
 )
 _SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
 _BBL_RE = re.compile(r"^[1-5][0-9]{9}$")
+_DISK_NAMESPACE = "resolver"
 _UNIT_RE = re.compile(
     r"\s+(?:(?:APT\.?|APARTMENT|UNIT|SUITE|STE\.?|FLOOR|FL\.?)"
     r"(?:\s+|\s*#\s*)|#\s*)[A-Z0-9-]+\s*$",
@@ -111,6 +124,17 @@ class ResolvedAddress:
     source_retrieved_at: datetime
 
 
+def _encode_bbls(bbls: tuple[str, ...]) -> bytes:
+    return "".join(bbls).encode("ascii")
+
+
+def _decode_bbls(raw: bytes) -> tuple[str, ...]:
+    return tuple(
+        raw[index : index + 10].decode("ascii")
+        for index in range(0, len(raw), 10)
+    )
+
+
 def _strip_ordinal(token: str) -> str:
     match = _ORDINAL_RE.fullmatch(token)
     return match.group(1) if match else token
@@ -178,15 +202,54 @@ def normalize_resolver_address(value: str) -> NormalizedAddress:
 
 
 class ParcelAddressResolver:
-    """Integrity-checked, generation-aware LRU for hash-sharded addresses."""
+    """Integrity-checked, generation-aware LRU for hash-sharded addresses.
+
+    With a ``disk_cache``, verified shards evicted from the in-process LRU
+    are re-opened from local disk instead of re-downloaded from GCS.
+    """
 
-    def __init__(self, *, max_cached_shards: int = 32) -> None:
+    def __init__(
+        self,
+        *,
+        max_cached_shards: int = 32,
+        manifest_cache: ArtifactManifestCache | None = None,
+        disk_cache: ShardDiskCache | None = None,
+        prefetch_top: int = 0,
+    ) -> None:
         self._max_cached_shards = max_cached_shards
         self._lock = threading.Lock()
+        self.manifest_cache = manifest_cache or ArtifactManifestCache()
+        self.disk_cache = disk_cache
+        self._fills = SingleFlight()
+        self._manifest: tuple[bytes, dict[str, Any]] | None = None
+        # A validated newer manifest waiting for its prefetch to finish.
+        self._pending: tuple[bytes, dict[str, Any]] | None = None
+        # Shard accesses since start, ranking what to prefetch. The prefetch
+        # is capped at half the LRU so the serving generation stays warm.
+        self._shard_accesses: Counter[str] = Counter()
+        self.prefetch = GenerationPrefetch(
+            "resolver", top=min(prefetch_top, max_cached_shards // 2)
+        )
         self._shards: OrderedDict[
             tuple[str, str],
-            dict[str, tuple[str, ...]],
+            Mapping[str, tuple[str, ...]],
         ] = OrderedDict()
+        self._counters = {
+            "memory_hits": 0,
+            "memory_misses": 0,
+            "disk_hits": 0,
+            "disk_misses": 0,
+            "remote_fetches": 0,
+        }
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return shard_tier_stats(
+                self._counters,
+                cached_shards=len(self._shards),
+                max_cached_shards=self._max_cached_shards,
+                disk_cache=self.disk_cache,
+            )
 
     @staticmethod
     def _unavailable(detail: str = "Parcel address resolver is unavailable"):
@@ -194,8 +257,8 @@ class ParcelAddressResolver:
 
     def _load_manifest(self, gcs: GcsArtifacts) -> dict[str, Any]:
         try:
-            body, content_type = gcs.download_bytes(
-                object_name=f"{RESOLVER_PREFIX}/manifest.json"
+            body, content_type = self.manifest_cache.download_bytes(
+                gcs, object_name=f"{RESOLVER_PREFIX}/manifest.json"
             )
         except FileNotFoundError as exc:
             raise self._unavailable(
@@ -203,6 +266,13 @@ class ParcelAddressResolver:
             ) from exc
         if content_type not in {None, "application/json"}:
             raise self._unavailable()
+        with self._lock:
+            parsed = self._manifest
+            pending = self._pending
+        if parsed is not None and parsed[0] is body:
+            return parsed[1]
+        if pending is not None and pending[0] is body:
+            return self._adopt(gcs, parsed, pending)
         try:
             manifest = json.loads(body)
         except (json.JSONDecodeError, UnicodeDecodeError) as exc:
@@ -237,8 +307,46 @@ class ParcelAddressResolver:
         )
         if not valid:
             raise self._unavailable()
+        return self._adopt(gcs, parsed, (body, manifest))
+
+    def _adopt(
+        self,
+        gcs: GcsArtifacts,
+        current: tuple[bytes, dict[str, Any]] | None,
+        candidate: tuple[bytes, dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Serve ``candidate`` unless its hot shards are still prefetching."""
+        manifest = candidate[1]
+        serving = current[1]["artifact_generation"] if current is not None else None
+        if self.disk_cache is not None and serving is not None:
+            # Both generations write shards while the new one prefetches.
+            self.disk_cache.retain(
+                _DISK_NAMESPACE, [serving, manifest["artifact_generation"]]
+            )
+        ready = self.prefetch.cutover(
+            serving,
+            manifest["artifact_generation"],
+            hottest=lambda: self._hottest_shards(manifest),
+            load=lambda shard: self._load_shard(
+                gcs, manifest, shard, record=False
+            ),
+        )
+        with self._lock:
+            if not ready and current is not None:
+                self._pending = candidate
+                return current[1]
+            self._manifest = candidate
+            self._pending = None
+        if self.disk_cache is not None:
+            # Cutover: the previous generation's disk shards are collected.
+            self.disk_cache.retain(_DISK_NAMESPACE, [manifest["artifact_generation"]])
         return manifest
 
+    def _hottest_shards(self, manifest: dict[str, Any]) -> list[str]:
+        with self._lock:
+            ranked = self._shard_accesses.most_common()
+        return [shard for shard, _ in ranked if shard in manifest["artifacts"]]
+
     def _artifact_metadata(
         self,
         manifest: dict[str, Any],
@@ -275,18 +383,73 @@ class ParcelAddressResolver:
         gcs: GcsArtifacts,
         manifest: dict[str, Any],
         shard: str,
-    ) -> dict[str, tuple[str, ...]]:
+        *,
+        record: bool = True,
+    ) -> Mapping[str, tuple[str, ...]]:
         generation = manifest["artifact_generation"]
         cache_key = (generation, shard)
         with self._lock:
+            if record:
+                self._shard_accesses[shard] += 1
             cached = self._shards.get(cache_key)
             if cached is not None:
                 self._shards.move_to_end(cache_key)
+                self._counters["memory_hits"] += 1
                 return cached
 
         metadata = self._artifact_metadata(manifest, shard)
         if metadata is None:
             return {}
+
+        def _fill() -> Mapping[str, tuple[str, ...]]:
+            with self._lock:
+                filled = self._shards.get(cache_key)
+            if filled is not None:
+                return filled
+            parsed = self._disk_or_fetch(gcs, generation, shard, metadata)
+            with self._lock:
+                self._shards[cache_key] = parsed
+                self._shards.move_to_end(cache_key)
+                while len(self._shards) > self._max_cached_shards:
+                    self._shards.popitem(last=False)
+            return parsed
+
+        return self._fills.do(cache_key, _fill)
+
+    def _disk_or_fetch(
+        self,
+        gcs: GcsArtifacts,
+        generation: str,
+        shard: str,
+        metadata: dict[str, Any],
+    ) -> Mapping[str, tuple[str, ...]]:
+        with self._lock:
+            self._counters["memory_misses"] += 1
+        disk_key = (_DISK_NAMESPACE, generation, shard, metadata["sha256"])
+        if self.disk_cache is not None:
+            mapped = self.disk_cache.load(*disk_key, _decode_bbls)
+            with self._lock:
+                self._counters[
+                    "disk_hits" if mapped is not None else "disk_misses"
+                ] += 1
+            if mapped is not None:
+                return mapped
+        parsed = self._fetch_shard(gcs, shard, metadata)
+        with self._lock:
+            self._counters["remote_fetches"] += 1
+        if self.disk_cache is not None:
+            self.disk_cache.store(
+                *disk_key,
+                {key: _encode_bbls(bbls) for key, bbls in parsed.items()},
+            )
+        return parsed
+
+    def _fetch_shard(
+        self,
+        gcs: GcsArtifacts,
+        shard: str,
+        metadata: dict[str, Any],
+    ) -> dict[str, tuple[str, ...]]:
         try:
             body, content_type = gcs.download_bytes(
                 object_name=metadata["object_name"]
@@ -345,16 +508,10 @@ class ParcelAddressResolver:
             raise self._unavailable(
                 "Parcel address resolver failed its row-count check"
             )
-        parsed = {
+        return {
             address_hash: tuple(sorted(bbls))
             for address_hash, bbls in grouped.items()
         }
-        with self._lock:
-            self._shards[cache_key] = parsed
-            self._shards.move_to_end(cache_key)
-            while len(self._shards) > self._max_cached_shards:
-                self._shards.popitem(last=False)
-        return parsed
 
     @staticmethod
     def _source_receipt(
@@ -396,34 +553,113 @@ class ParcelAddressResolver:
     ) -> ResolvedAddress:
         normalized = normalize_resolver_address(address)
         if not normalized.value:
-            raise HTTPException(
-                status_code=422,
-                detail="Enter a complete NYC street address with a house number",
-            )
-        address_hash = hashlib.sha256(
-            normalized.value.encode("utf-8")
-        ).hexdigest()
+            raise HTTPException(status_code=422, detail=_INCOMPLETE_ADDRESS)
+        address_hash = _address_hash(normalized)
         manifest = self._load_manifest(gcs)
         shard_rows = self._load_shard(gcs, manifest, address_hash[:2])
-        all_bbls = shard_rows.get(address_hash, ())
-        candidates = tuple(
-            ResolvedAddressCandidate(
-                bbl=bbl,
-                borough=_BBL_BOROUGH[bbl[0]],
-            )
-            for bbl in all_bbls[:MAX_RETURNED_CANDIDATES]
+        return _resolved(
+            normalized,
+            shard_rows.get(address_hash, ()),
+            manifest,
+            self._source_receipt(manifest),
         )
-        source_name, dataset_id, source_retrieved_at = (
-            self._source_receipt(manifest)
+
+    def resolve_many(
+        self,
+        gcs: GcsArtifacts,
+        addresses: Sequence[str],
+        *,
+        max_workers: int = _BATCH_SHARD_WORKERS,
+    ) -> Iterator[ResolvedAddress | HTTPException]:
+        """Resolve ``addresses`` against one manifest, yielding in input order.
+
+        Every input is normalized and hashed up front, then each needed shard
+        is loaded once, concurrently. A result is yielded as soon as its
+        shard is ready. An input that does not normalize yields a 422 and a
+        shard that fails its checks yields its 503 for each input it holds.
+        Any other shard load error is logged and also yields a 503 per input,
+        so a stream already under way is never cut short; only a manifest
+        failure raises, and it does so before this returns.
+        """
+        manifest = self._load_manifest(gcs)
+        receipt = self._source_receipt(manifest)
+        prepared = [
+            (normalized, _address_hash(normalized) if normalized.value else None)
+            for normalized in map(normalize_resolver_address, addresses)
+        ]
+        shards = sorted(
+            {address_hash[:2] for _, address_hash in prepared if address_hash}
         )
-        return ResolvedAddress(
-            candidates=candidates,
-            candidate_count=len(all_bbls),
-            truncated=len(all_bbls) > len(candidates),
-            unit_removed=normalized.unit_removed,
-            locality_removed=normalized.locality_removed,
-            generation=manifest["artifact_generation"],
-            source_name=source_name,
-            source_dataset_id=dataset_id,
-            source_retrieved_at=source_retrieved_at,
+
+        def _results() -> Iterator[ResolvedAddress | HTTPException]:
+            pool = ThreadPoolExecutor(
+                max_workers=max(1, min(max_workers, len(shards))),
+                thread_name_prefix="resolver-shard",
+            )
+            failed: set[str] = set()
+            try:
+                loads = {
+                    shard: pool.submit(self._load_shard, gcs, manifest, shard)
+                    for shard in shards
+                }
+                for normalized, address_hash in prepared:
+                    if address_hash is None:
+                        yield HTTPException(
+                            status_code=422, detail=_INCOMPLETE_ADDRESS
+                        )
+                        continue
+                    shard = address_hash[:2]
+                    try:
+                        shard_rows = loads[shard].result()
+                    except HTTPException as exc:
+                        yield exc
+                        continue
+                    except Exception:
+                        if shard not in failed:
+                            failed.add(shard)
+                            log.warning(
+                                "resolver shard %s failed to load", shard, exc_info=True
+                            )
+                        yield self._unavailable()
+                        continue
+                    yield _resolved(
+                        normalized,
+                        shard_rows.get(address_hash, ()),
+                        manifest,
+                        receipt,
+                    )
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        return _results()
+
+
+def _address_hash(normalized: NormalizedAddress) -> str:
+    return hashlib.sha256(normalized.value.encode("utf-8")).hexdigest()
+
+
+def _resolved(
+    normalized: NormalizedAddress,
+    all_bbls: Sequence[str],
+    manifest: dict[str, Any],
+    receipt: tuple[str, str, datetime],
+) -> ResolvedAddress:
+    candidates = tuple(
+        ResolvedAddressCandidate(
+            bbl=bbl,
+            borough=_BBL_BOROUGH[bbl[0]],
         )
+        for bbl in all_bbls[:MAX_RETURNED_CANDIDATES]
+    )
+    source_name, dataset_id, source_retrieved_at = receipt
+    return ResolvedAddress(
+        candidates=candidates,
+        candidate_count=len(all_bbls),
+        truncated=len(all_bbls) > len(candidates),
+        unit_removed=normalized.unit_removed,
+        locality_removed=normalized.locality_removed,
+        generation=manifest["artifact_generation"],
+        source_name=source_name,
+        source_dataset_id=dataset_id,
+        source_retrieved_at=source_retrieved_at,
+    )
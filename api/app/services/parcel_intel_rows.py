@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Generic, Protocol, TypeVar, overload
+
+
+class _HasBbl(Protocol):
+    bbl: str
+
+
+RowT = TypeVar("RowT", bound=_HasBbl)
+
+
+class ParcelRowIndex(Generic[RowT]):
+    """Immutable, already-validated rows for one published generation.
+
+    Rows keep their published (rank) order so sweeps are plain slices, and a
+    BBL → offset table makes single-parcel lookups O(1). Instances are built
+    once per generation and shared across requests; callers must treat the
+    rows as read-only and use ``model_copy`` for per-request projections.
+    """
+
+    __slots__ = ("_offsets", "_rows")
+
+    def __init__(self, rows: Iterable[RowT]) -> None:
+        self._rows: tuple[RowT, ...] = tuple(rows)
+        offsets: dict[str, int] = {}
+        for offset, row in enumerate(self._rows):
+            # Match the historical linear scan: the first published row wins.
+            offsets.setdefault(row.bbl, offset)
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[RowT]:
+        return iter(self._rows)
+
+    @overload
+    def __getitem__(self, item: int) -> RowT: ...
+
+    @overload
+    def __getitem__(self, item: slice) -> tuple[RowT, ...]: ...
+
+    def __getitem__(self, item: int | slice) -> RowT | tuple[RowT, ...]:
+        return self._rows[item]
+
+    def __contains__(self, bbl: object) -> bool:
+        return bbl in self._offsets
+
+    @property
+    def rows(self) -> tuple[RowT, ...]:
+        return self._rows
+
+    def get(self, bbl: str) -> RowT | None:
+        offset = self._offsets.get(bbl)
+        return None if offset is None else self._rows[offset]
+
+    def head(self, count: int) -> tuple[RowT, ...]:
+        return self._rows[: max(0, count)]
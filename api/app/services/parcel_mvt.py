@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import math
+import struct
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+# Mapbox Vector Tile 2.1 point layers, written straight to the protobuf wire
+# format. Parcel tiles only carry points, so a full geometry library is not
+# needed to produce them.
+MVT_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+DEFAULT_EXTENT = 4096
+
+_VARINT = 0
+_FIXED64 = 1
+_LENGTH = 2
+
+_POINT = 1
+_MOVE_TO_ONE = (1 & 0x7) | (1 << 3)
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _zigzag(value: int) -> int:
+    return (value << 1) ^ (value >> 63)
+
+
+def _key(field: int, wire_type: int) -> bytes:
+    return _varint((field << 3) | wire_type)
+
+
+def _length_delimited(field: int, payload: bytes) -> bytes:
+    return _key(field, _LENGTH) + _varint(len(payload)) + payload
+
+
+def _packed(field: int, values: Iterable[int]) -> bytes:
+    return _length_delimited(field, b"".join(_varint(v) for v in values))
+
+
+def _encode_value(value: Any) -> bytes:
+    if isinstance(value, bool):
+        return _key(7, _VARINT) + _varint(int(value))
+    if isinstance(value, int):
+        return _key(6, _VARINT) + _varint(_zigzag(value) & 0xFFFFFFFFFFFFFFFF)
+    if isinstance(value, float):
+        return _key(3, _FIXED64) + struct.pack("<d", value)
+    return _length_delimited(1, str(value).encode("utf-8"))
+
+
+def tile_pixel(
+    lng: float, lat: float, z: int, x: int, y: int, extent: int = DEFAULT_EXTENT
+) -> tuple[int, int]:
+    """Project WGS84 to integer tile coordinates (web mercator, y down)."""
+    scale = (1 << z) * extent
+    world_x = (lng + 180.0) / 360.0 * scale
+    world_y = (
+        (1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * scale
+    )
+    return round(world_x - x * extent), round(world_y - y * extent)
+
+
+def encode_point_layer(
+    name: str,
+    features: Iterable[tuple[int | None, tuple[int, int], Mapping[str, Any]]],
+    *,
+    extent: int = DEFAULT_EXTENT,
+) -> bytes:
+    """Encode one point layer as a complete tile.
+
+    ``features`` yields ``(id, (px, py), properties)`` in tile coordinates.
+    ``None`` property values are omitted; list values are joined with ", ".
+    An empty feature list encodes an empty tile.
+    """
+    keys: dict[str, int] = {}
+    values: dict[tuple[type, Any], int] = {}
+    encoded_features: list[bytes] = []
+    for feature_id, (px, py), properties in features:
+        tags: list[int] = []
+        for key, value in properties.items():
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple)):
+                value = ", ".join(str(item) for item in value)
+            key_index = keys.setdefault(key, len(keys))
+            value_index = values.setdefault((type(value), value), len(values))
+            tags.extend((key_index, value_index))
+        body = b""
+        if feature_id is not None:
+            body += _key(1, _VARINT) + _varint(feature_id)
+        body += _packed(2, tags)
+        body += _key(3, _VARINT) + _varint(_POINT)
+        body += _packed(4, (_MOVE_TO_ONE, _zigzag(px), _zigzag(py)))
+        encoded_features.append(_length_delimited(2, body))
+    if not encoded_features:
+        return b""
+    layer = _key(15, _VARINT) + _varint(2)
+    layer += _length_delimited(1, name.encode("utf-8"))
+    layer += b"".join(encoded_features)
+    layer += b"".join(_length_delimited(3, key.encode("utf-8")) for key in keys)
+    layer += b"".join(
+        _length_delimited(4, _encode_value(value)) for _, value in values
+    )
+    layer += _key(5, _VARINT) + _varint(extent)
+    return _length_delimited(3, layer)
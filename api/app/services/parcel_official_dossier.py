@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+import bisect
 import gzip
 import hashlib
 import json
 import math
 import re
 import threading
-from collections import OrderedDict
+from array import array
+from collections import Counter, OrderedDict
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Literal
 
 from fastapi import HTTPException
 
+from .artifact_manifest_cache import ArtifactManifestCache
 from .gcs_artifacts import GcsArtifacts
+from .shard_disk_cache import ShardDiskCache, shard_tier_stats
+from .shard_prefetch import GenerationPrefetch
+from .single_flight import SingleFlight
 
 DOSSIER_PREFIX = "parcel-intel/dossiers/v1"
 DOSSIER_SCHEMA = "citylens-parcel-dossier/tax-lot-index@v1"
@@ -59,6 +66,13 @@ _GENERATION_RE = re.compile(
 )
 _SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
 _BBL_RE = re.compile(r"^[1-5][0-9]{9}$")
+_DISK_NAMESPACE = "dossier"
+_STRING_FIELDS = frozenset(
+    {"a", "po", "ao", "sd", "lu", "bc", "z1", "z2", "ek", "en"}
+)
+# Type tags for scalar columns; values are stored as doubles, which hold
+# every validated integer (< 2**53) exactly.
+_NULL, _BOOL, _INT, _FLOAT = 0, 1, 2, 3
 _BOROUGHS: dict[
     str,
     Literal[
@@ -134,6 +148,134 @@ def _optional_number(
     )
 
 
+def _encode_row(row: dict[str, Any]) -> bytes:
+    # Positional ROW_FIELDS order keeps the on-disk rows compact.
+    return json.dumps(
+        [row[field] for field in ROW_FIELDS], separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _decode_row(raw: bytes) -> dict[str, Any]:
+    return dict(zip(ROW_FIELDS, json.loads(raw)))
+
+
+class _StringColumn:
+    """Dictionary-encoded strings: one UTF-8 blob plus per-row codes."""
+
+    __slots__ = ("_blob", "_codes", "_offsets")
+
+    def __init__(self, values: list[str | None]) -> None:
+        table: dict[str, int] = {}
+        blob = bytearray()
+        offsets = array("I", [0])
+        codes = array("I")
+        for value in values:
+            if value is None:
+                codes.append(0)
+                continue
+            code = table.get(value)
+            if code is None:
+                blob += value.encode("utf-8")
+                offsets.append(len(blob))
+                code = table[value] = len(table) + 1
+            codes.append(code)
+        self._blob = bytes(blob)
+        self._offsets = offsets
+        self._codes = codes
+
+    def __getitem__(self, index: int) -> str | None:
+        code = self._codes[index]
+        if not code:
+            return None
+        return self._blob[
+            self._offsets[code - 1] : self._offsets[code]
+        ].decode("utf-8")
+
+
+class _ScalarColumn:
+    """Numbers and booleans as doubles with a one-byte type tag per row."""
+
+    __slots__ = ("_tags", "_values")
+
+    def __init__(self, values: list[Any]) -> None:
+        self._values = array("d", (0.0 if v is None else float(v) for v in values))
+        self._tags = bytes(
+            _NULL
+            if value is None
+            else _BOOL
+            if isinstance(value, bool)
+            else _INT
+            if isinstance(value, int)
+            else _FLOAT
+            for value in values
+        )
+
+    def __getitem__(self, index: int) -> Any:
+        tag = self._tags[index]
+        if tag == _NULL:
+            return None
+        value = self._values[index]
+        if tag == _BOOL:
+            return bool(value)
+        if tag == _INT:
+            return int(value)
+        return value
+
+
+class CompactDossierShard(Mapping[str, dict[str, Any]]):
+    """Read-only, column-oriented dossier shard.
+
+    BBLs are a sorted ``array('q')`` searched with bisect. String fields are
+    dictionary-encoded per column and scalar fields are packed doubles with
+    type tags, so a shard costs a few dozen Python objects instead of one
+    dict (and its values) per lot. Row dicts are built only on lookup and
+    round-trip the validated rows exactly.
+    """
+
+    __slots__ = ("_bbls", "_columns")
+
+    def __init__(self, rows: Mapping[str, dict[str, Any]]) -> None:
+        bbls = sorted(rows)
+        self._bbls = array("q", (int(bbl) for bbl in bbls))
+        self._columns = tuple(
+            (
+                _StringColumn if field in _STRING_FIELDS else _ScalarColumn
+            )([rows[bbl][field] for bbl in bbls])
+            for field in ROW_FIELDS[1:]
+        )
+
+    def _index(self, bbl: str) -> int:
+        if len(bbl) != 10 or not bbl.isdigit():
+            raise KeyError(bbl)
+        key = int(bbl)
+        index = bisect.bisect_left(self._bbls, key)
+        if index == len(self._bbls) or self._bbls[index] != key:
+            raise KeyError(bbl)
+        return index
+
+    def __getitem__(self, bbl: str) -> dict[str, Any]:
+        index = self._index(bbl)
+        row = {"b": bbl}
+        for field, column in zip(ROW_FIELDS[1:], self._columns):
+            row[field] = column[index]
+        return row
+
+    def __contains__(self, bbl: object) -> bool:
+        if not isinstance(bbl, str):
+            return False
+        try:
+            self._index(bbl)
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._bbls)
+
+    def __iter__(self) -> Iterator[str]:
+        return (f"{key:010d}" for key in self._bbls)
+
+
 def _validate_row(row: Any, shard: str) -> dict[str, Any]:
     if not isinstance(row, dict) or set(row) != set(ROW_FIELDS):
         raise ValueError("invalid dossier row shape")
@@ -185,20 +327,59 @@ def _validate_row(row: Any, shard: str) -> dict[str, Any]:
 
 
 class ParcelOfficialDossierStore:
-    """Generation-aware, integrity-checked private BBL dossier reader."""
+    """Generation-aware, integrity-checked private BBL dossier reader.
+
+    With a ``disk_cache``, verified shards evicted from the in-process LRU
+    are re-opened from local disk instead of re-downloaded and re-parsed.
+    """
 
-    def __init__(self, *, max_cached_shards: int = 16) -> None:
+    def __init__(
+        self,
+        *,
+        max_cached_shards: int = 256,
+        manifest_cache: ArtifactManifestCache | None = None,
+        disk_cache: ShardDiskCache | None = None,
+        prefetch_top: int = 0,
+    ) -> None:
         self._max_cached_shards = max_cached_shards
         self._lock = threading.Lock()
+        self.manifest_cache = manifest_cache or ArtifactManifestCache()
+        self.disk_cache = disk_cache
+        self._fills = SingleFlight()
+        self._manifest: tuple[bytes, dict[str, Any]] | None = None
+        # A validated newer manifest waiting for its prefetch to finish.
+        self._pending: tuple[bytes, dict[str, Any]] | None = None
+        # Shard accesses since start, ranking what to prefetch. The prefetch
+        # is capped at half the LRU so the serving generation stays warm.
+        self._shard_accesses: Counter[str] = Counter()
+        self.prefetch = GenerationPrefetch(
+            "official-dossier", top=min(prefetch_top, max_cached_shards // 2)
+        )
         self._shards: OrderedDict[
             tuple[str, str],
-            dict[str, dict[str, Any]],
+            Mapping[str, dict[str, Any]],
         ] = OrderedDict()
+        self._counters = {
+            "memory_hits": 0,
+            "memory_misses": 0,
+            "disk_hits": 0,
+            "disk_misses": 0,
+            "remote_fetches": 0,
+        }
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return shard_tier_stats(
+                self._counters,
+                cached_shards=len(self._shards),
+                max_cached_shards=self._max_cached_shards,
+                disk_cache=self.disk_cache,
+            )
 
     def _load_manifest(self, gcs: GcsArtifacts) -> dict[str, Any]:
         try:
-            body, content_type = gcs.download_bytes(
-                object_name=f"{DOSSIER_PREFIX}/manifest.json"
+            body, content_type = self.manifest_cache.download_bytes(
+                gcs, object_name=f"{DOSSIER_PREFIX}/manifest.json"
             )
         except FileNotFoundError as exc:
             raise _unavailable(
@@ -206,6 +387,13 @@ class ParcelOfficialDossierStore:
             ) from exc
         if content_type not in {None, "application/json"}:
             raise _unavailable()
+        with self._lock:
+            parsed = self._manifest
+            pending = self._pending
+        if parsed is not None and parsed[0] is body:
+            return parsed[1]
+        if pending is not None and pending[0] is body:
+            return self._adopt(gcs, parsed, pending)
         try:
             manifest = json.loads(body)
         except (json.JSONDecodeError, UnicodeDecodeError) as exc:
@@ -267,8 +455,46 @@ class ParcelOfficialDossierStore:
             _parse_datetime(acris["feature_source_updated_at"])
         except ValueError as exc:
             raise _unavailable() from exc
+        return self._adopt(gcs, parsed, (body, manifest))
+
+    def _adopt(
+        self,
+        gcs: GcsArtifacts,
+        current: tuple[bytes, dict[str, Any]] | None,
+        candidate: tuple[bytes, dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Serve ``candidate`` unless its hot shards are still prefetching."""
+        manifest = candidate[1]
+        serving = current[1]["artifact_generation"] if current is not None else None
+        if self.disk_cache is not None and serving is not None:
+            # Both generations write shards while the new one prefetches.
+            self.disk_cache.retain(
+                _DISK_NAMESPACE, [serving, manifest["artifact_generation"]]
+            )
+        ready = self.prefetch.cutover(
+            serving,
+            manifest["artifact_generation"],
+            hottest=lambda: self._hottest_shards(manifest),
+            load=lambda shard: self._load_shard(
+                gcs, manifest, shard, record=False
+            ),
+        )
+        with self._lock:
+            if not ready and current is not None:
+                self._pending = candidate
+                return current[1]
+            self._manifest = candidate
+            self._pending = None
+        if self.disk_cache is not None:
+            # Cutover: the previous generation's disk shards are collected.
+            self.disk_cache.retain(_DISK_NAMESPACE, [manifest["artifact_generation"]])
         return manifest
 
+    def _hottest_shards(self, manifest: dict[str, Any]) -> list[str]:
+        with self._lock:
+            ranked = self._shard_accesses.most_common()
+        return [shard for shard, _ in ranked if shard in manifest["artifacts"]]
+
     def _artifact(
         self,
         manifest: dict[str, Any],
@@ -310,16 +536,71 @@ class ParcelOfficialDossierStore:
         gcs: GcsArtifacts,
         manifest: dict[str, Any],
         shard: str,
-    ) -> dict[str, dict[str, Any]]:
+        *,
+        record: bool = True,
+    ) -> Mapping[str, dict[str, Any]]:
         generation = manifest["artifact_generation"]
         cache_key = (generation, shard)
         with self._lock:
+            if record:
+                self._shard_accesses[shard] += 1
             cached = self._shards.get(cache_key)
             if cached is not None:
                 self._shards.move_to_end(cache_key)
+                self._counters["memory_hits"] += 1
                 return cached
 
         metadata = self._artifact(manifest, shard)
+
+        def _fill() -> Mapping[str, dict[str, Any]]:
+            with self._lock:
+                filled = self._shards.get(cache_key)
+            if filled is not None:
+                return filled
+            parsed = self._disk_or_fetch(gcs, generation, shard, metadata)
+            with self._lock:
+                self._shards[cache_key] = parsed
+                self._shards.move_to_end(cache_key)
+                while len(self._shards) > self._max_cached_shards:
+                    self._shards.popitem(last=False)
+            return parsed
+
+        return self._fills.do(cache_key, _fill)
+
+    def _disk_or_fetch(
+        self,
+        gcs: GcsArtifacts,
+        generation: str,
+        shard: str,
+        metadata: dict[str, Any],
+    ) -> Mapping[str, dict[str, Any]]:
+        with self._lock:
+            self._counters["memory_misses"] += 1
+        disk_key = (_DISK_NAMESPACE, generation, shard, metadata["sha256"])
+        if self.disk_cache is not None:
+            mapped = self.disk_cache.load(*disk_key, _decode_row)
+            with self._lock:
+                self._counters[
+                    "disk_hits" if mapped is not None else "disk_misses"
+                ] += 1
+            if mapped is not None:
+                return mapped
+        parsed = self._fetch_shard(gcs, shard, metadata)
+        with self._lock:
+            self._counters["remote_fetches"] += 1
+        if self.disk_cache is not None:
+            self.disk_cache.store(
+                *disk_key,
+                {bbl: _encode_row(row) for bbl, row in parsed.items()},
+            )
+        return CompactDossierShard(parsed)
+
+    def _fetch_shard(
+        self,
+        gcs: GcsArtifacts,
+        shard: str,
+        metadata: dict[str, Any],
+    ) -> dict[str, dict[str, Any]]:
         try:
             compressed, content_type = gcs.download_bytes(
                 object_name=metadata["object_name"]
@@ -374,12 +655,6 @@ class ParcelOfficialDossierStore:
             raise _unavailable(
                 "Official parcel dossier failed its row-count check"
             )
-
-        with self._lock:
-            self._shards[cache_key] = parsed
-            self._shards.move_to_end(cache_key)
-            while len(self._shards) > self._max_cached_shards:
-                self._shards.popitem(last=False)
         return parsed
 
     def get(
@@ -390,8 +665,7 @@ class ParcelOfficialDossierStore:
         if _BBL_RE.fullmatch(bbl) is None:
             raise HTTPException(status_code=422, detail="Invalid BBL")
         manifest = self._load_manifest(gcs)
-        shard = hashlib.sha256(bbl.encode("ascii")).hexdigest()[:2]
-        row = self._load_shard(gcs, manifest, shard).get(bbl)
+        row = self._load_shard(gcs, manifest, _shard_for(bbl)).get(bbl)
         if row is None:
             raise HTTPException(
                 status_code=404,
@@ -400,16 +674,53 @@ class ParcelOfficialDossierStore:
                     "snapshot"
                 ),
             )
-        return OfficialParcelDossier(
-            row=row,
-            borough=_BOROUGHS[bbl[0]],
-            generation=manifest["artifact_generation"],
-            pluto_retrieved_at=_parse_datetime(
-                manifest["sources"]["pluto"]["retrieved_at"]
-            ),
-            acris_updated_at=_parse_datetime(
-                manifest["sources"]["acris"][
-                    "feature_source_updated_at"
-                ]
-            ),
-        )
+        return _dossier(manifest, bbl, row)
+
+    def get_many(
+        self,
+        gcs: GcsArtifacts,
+        bbls: Iterable[str],
+    ) -> dict[str, OfficialParcelDossier]:
+        """Dossiers for ``bbls`` from one manifest, loading each shard once.
+
+        Lots missing from the snapshot are omitted rather than raised, so
+        callers can report them per item.
+        """
+        by_shard: dict[str, list[str]] = {}
+        for bbl in bbls:
+            if _BBL_RE.fullmatch(bbl) is None:
+                raise HTTPException(status_code=422, detail="Invalid BBL")
+            by_shard.setdefault(_shard_for(bbl), []).append(bbl)
+        if not by_shard:
+            return {}
+        manifest = self._load_manifest(gcs)
+        found: dict[str, OfficialParcelDossier] = {}
+        for shard, shard_bbls in by_shard.items():
+            rows = self._load_shard(gcs, manifest, shard)
+            for bbl in shard_bbls:
+                row = rows.get(bbl)
+                if row is not None:
+                    found[bbl] = _dossier(manifest, bbl, row)
+        return found
+
+
+def _shard_for(bbl: str) -> str:
+    return hashlib.sha256(bbl.encode("ascii")).hexdigest()[:2]
+
+
+def _dossier(
+    manifest: dict[str, Any],
+    bbl: str,
+    row: dict[str, Any],
+) -> OfficialParcelDossier:
+    return OfficialParcelDossier(
+        row=row,
+        borough=_BOROUGHS[bbl[0]],
+        generation=manifest["artifact_generation"],
+        pluto_retrieved_at=_parse_datetime(
+            manifest["sources"]["pluto"]["retrieved_at"]
+        ),
+        acris_updated_at=_parse_datetime(
+            manifest["sources"]["acris"]["feature_source_updated_at"]
+        ),
+    )
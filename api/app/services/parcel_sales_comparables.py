@@ -5,23 +5,47 @@ tax-lot-level records from the NYC Department of Finance annualized sales
 dataset using current PLUTO location facts, then explains why each record was
 selected. Unit sales, zero-consideration transfers, malformed records, and
 the subject BBL are excluded.
+
+Every subject in one borough/ZIP draws from the same three-year sales window,
+so windows are fetched once per ZIP, cached in memory (and optionally on local
+disk), and re-ranked locally for each subject. Each subject's PLUTO location
+is cached per BBL in the same two layers. A window or location whose refresh
+fails is served stale for a bounded period instead of failing the request.
+Requests go through the API's shared outbound pool, which fails fast with the
+same 503 while OpenData is degraded; ``aget`` is the non-blocking variant for
+async routes. Each window is parsed into NumPy columns once, so ranking a
+subject is a handful of array operations; only the selected records are turned
+into payloads.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
 import math
+import os
 import re
+import tempfile
 import threading
 from collections import OrderedDict
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
+from pathlib import Path
 from statistics import median
-from typing import Any, Callable
+from typing import Any, Callable, TypeVar
 
 import httpx
+import numpy as np
 from fastapi import HTTPException
 
+from .outbound_http import OutboundHttp, shared_outbound_http
+from .single_flight import AsyncSingleFlight, SingleFlight
+
+log = logging.getLogger(__name__)
+
 PLUTO_DATASET_ID = "64uk-42ks"
 SALES_DATASET_ID = "w2pb-icbu"
 PLUTO_RESOURCE_URL = (
@@ -40,6 +64,39 @@ MAX_COMPARABLES = 5
 MAX_DISTANCE_MILES = 2.0
 MIN_SALE_PRICE = 100_000
 _BBL_RE = re.compile(r"^[1-5][0-9]{9}$")
+_ZIP_RE = re.compile(r"^[0-9]{5}$")
+_SALES_SELECT = (
+    "bbl,address,zip_code,building_class_category,"
+    "building_class_as_of_final,apartment_number,"
+    "land_square_feet,gross_square_feet,residential_units,"
+    "commercial_units,total_units,year_built,sale_price,"
+    "sale_date,latitude,longitude"
+)
+_SUBJECT_SELECT = "bbl,zipcode,latitude,longitude,bldgclass,lotarea,bldgarea"
+_WINDOW_FILE_SCHEMA = "citylens/parcel-sales-window@v1"
+_SUBJECT_FILE_SCHEMA = "citylens/parcel-sales-subject@v1"
+_REQUEST_HEADERS = {"User-Agent": "CityLens parcel evidence/1.0"}
+# Lots located per PLUTO request while pre-warming; keeps the URL short.
+_PREWARM_LOOKUP_CHUNK = 50
+
+
+def sales_cache_dir_from_env() -> Path | None:
+    """``CITYLENS_SALES_CACHE_DIR``, or ``None`` to keep windows in memory only."""
+    raw = os.getenv("CITYLENS_SALES_CACHE_DIR")
+    if raw is None or raw.strip() == "":
+        return None
+    return Path(raw.strip())
+
+
+def sales_prewarm_top_from_env() -> int:
+    """How many top-ranked lots to pre-warm per new generation (0 disables)."""
+    raw = os.getenv("CITYLENS_SALES_PREWARM_TOP")
+    if raw is None or raw.strip() == "":
+        return 0
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return 0
 
 
 @dataclass(frozen=True)
@@ -53,6 +110,105 @@ class _Subject:
     building_class: str | None
 
 
+class _CandidateColumns:
+    """Subject-independent fields of a sales window, parsed once.
+
+    Rows that fail a filter not involving the subject are cleared in
+    ``usable``; their other columns hold placeholders (0 or NaN).
+    """
+
+    __slots__ = (
+        "bbl",
+        "family",
+        "gross_area",
+        "latitude",
+        "longitude",
+        "lot_area",
+        "sale_ordinal",
+        "usable",
+    )
+
+    def __init__(self, rows: Sequence[dict[str, Any]]) -> None:
+        count = len(rows)
+        self.bbl = np.zeros(count, dtype=np.int64)
+        self.sale_ordinal = np.zeros(count, dtype=np.int64)
+        self.lot_area = np.full(count, np.nan)
+        self.gross_area = np.full(count, np.nan)
+        self.latitude = np.full(count, np.nan)
+        self.longitude = np.full(count, np.nan)
+        # Code point of the building class's first character; 0 when absent.
+        self.family = np.zeros(count, dtype=np.int32)
+        self.usable = np.zeros(count, dtype=bool)
+        for index, raw in enumerate(rows):
+            bbl = _text(raw.get("bbl"), 10)
+            sale_date = _date(raw.get("sale_date"))
+            sale_price = _positive(raw.get("sale_price"))
+            lot_area = _positive(raw.get("land_square_feet"))
+            latitude = _number(raw.get("latitude"))
+            longitude = _number(raw.get("longitude"))
+            candidate_class = _text(raw.get("building_class_as_of_final"), 12)
+            gross_area = _positive(raw.get("gross_square_feet"))
+            if candidate_class:
+                self.family[index] = ord(candidate_class[0])
+            if gross_area is not None:
+                self.gross_area[index] = gross_area
+            if (
+                bbl is None
+                or _BBL_RE.fullmatch(bbl) is None
+                or sale_date is None
+                or sale_price is None
+                or lot_area is None
+                or latitude is None
+                or longitude is None
+                or _text(raw.get("apartment_number"), 40) is not None
+                or sale_price < MIN_SALE_PRICE
+                or not (-90 <= latitude <= 90)
+                or not (-180 <= longitude <= 180)
+            ):
+                continue
+            self.bbl[index] = int(bbl)
+            self.sale_ordinal[index] = sale_date.toordinal()
+            self.lot_area[index] = lot_area
+            self.latitude[index] = latitude
+            self.longitude[index] = longitude
+            self.usable[index] = True
+
+
+@dataclass(frozen=True)
+class _SalesWindow:
+    rows: tuple[dict[str, Any], ...]
+    fetched_at: datetime
+    source_data_updated_at: datetime | None
+    columns: _CandidateColumns
+
+    @classmethod
+    def parse(
+        cls,
+        rows: Sequence[dict[str, Any]],
+        *,
+        fetched_at: datetime,
+        source_data_updated_at: datetime | None,
+    ) -> _SalesWindow:
+        rows = tuple(rows)
+        return cls(
+            rows=rows,
+            fetched_at=fetched_at,
+            source_data_updated_at=source_data_updated_at,
+            columns=_CandidateColumns(rows),
+        )
+
+
+@dataclass(frozen=True)
+class _SubjectRows:
+    """The PLUTO rows found for one BBL (at most two), as fetched."""
+
+    rows: tuple[dict[str, Any], ...]
+    fetched_at: datetime
+
+
+_Cached = TypeVar("_Cached", _SalesWindow, _SubjectRows)
+
+
 @dataclass(frozen=True)
 class _Candidate:
     payload: dict[str, Any]
@@ -149,6 +305,64 @@ def _ratio_reason(
     return None
 
 
+def _parse_subject(
+    bbl: str,
+    rows: list[dict[str, Any]],
+    *,
+    dossier_row: dict[str, Any],
+) -> _Subject | None:
+    if len(rows) != 1:
+        return None
+    row = rows[0]
+    source_bbl = _text(row.get("bbl"), 10)
+    latitude = _number(row.get("latitude"))
+    longitude = _number(row.get("longitude"))
+    zip_code = _text(row.get("zipcode"), 10)
+    if (
+        source_bbl != bbl
+        or latitude is None
+        or longitude is None
+        or not zip_code
+        or not (-90 <= latitude <= 90)
+        or not (-180 <= longitude <= 180)
+    ):
+        return None
+    return _Subject(
+        bbl=bbl,
+        zip_code=zip_code,
+        latitude=latitude,
+        longitude=longitude,
+        lot_area_sqft=(
+            _positive(dossier_row.get("la"))
+            or _positive(row.get("lotarea"))
+        ),
+        building_area_sqft=(
+            _positive(dossier_row.get("ba"))
+            or _positive(row.get("bldgarea"))
+        ),
+        building_class=(
+            _text(dossier_row.get("bc"), 12)
+            or _text(row.get("bldgclass"), 12)
+        ),
+    )
+
+
+def _write_cache_file(path: Path, payload: dict[str, Any]) -> None:
+    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle, temp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as output:
+                output.write(body)
+            os.replace(temp, path)
+        except BaseException:
+            Path(temp).unlink(missing_ok=True)
+            raise
+    except OSError:
+        log.warning("sales cache write failed for %s", path, exc_info=True)
+
+
 def _last_modified(headers: httpx.Headers) -> datetime | None:
     value = headers.get("x-soda2-truth-last-modified") or headers.get(
         "last-modified"
@@ -167,20 +381,26 @@ def _last_modified(headers: httpx.Headers) -> datetime | None:
 
 
 class ParcelSalesComparableService:
-    """Fetch and cache a transparent official comparable-sale screen."""
+    """Fetch and cache a transparent official comparable-sale screen.
+
+    Results and subject locations are cached per subject BBL; the sales they
+    rank are cached per borough/ZIP window. Locations and windows are
+    optionally persisted under ``cache_dir``.
+    """
 
     def __init__(
         self,
         *,
-        http_client: httpx.Client | None = None,
+        http: OutboundHttp | None = None,
         now: Callable[[], datetime] = _utc_now,
         cache_ttl: timedelta = timedelta(hours=6),
         max_cached_parcels: int = 512,
+        max_cached_windows: int = 256,
+        max_cached_subjects: int = 4096,
+        stale_if_error: timedelta = timedelta(days=7),
+        cache_dir: str | Path | None = None,
     ) -> None:
-        self._http = http_client or httpx.Client(
-            timeout=httpx.Timeout(6.0),
-            headers={"User-Agent": "CityLens parcel evidence/1.0"},
-        )
+        self._http = http or shared_outbound_http()
         self._now = now
         self._cache_ttl = cache_ttl
         self._max_cached_parcels = max_cached_parcels
@@ -188,6 +408,36 @@ class ParcelSalesComparableService:
         self._cache: OrderedDict[
             str, tuple[datetime, dict[str, Any]]
         ] = OrderedDict()
+        self._max_cached_windows = max_cached_windows
+        self._stale_if_error = stale_if_error
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._windows: OrderedDict[tuple[str, str, str], _SalesWindow] = (
+            OrderedDict()
+        )
+        self._max_cached_subjects = max_cached_subjects
+        self._subjects: OrderedDict[str, _SubjectRows] = OrderedDict()
+        self._fills = SingleFlight()
+        self._async_fills = AsyncSingleFlight()
+        self._counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "fetches": 0,
+            "subject_hits": 0,
+            "subject_fetches": 0,
+            "fetch_errors": 0,
+            "stale_served": 0,
+        }
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "parcels": len(self._cache),
+                "windows": len(self._windows),
+                "max_windows": self._max_cached_windows,
+                "subjects": len(self._subjects),
+                "disk_enabled": self._cache_dir is not None,
+                **self._counters,
+            }
 
     @staticmethod
     def _unavailable() -> HTTPException:
@@ -198,14 +448,10 @@ class ParcelSalesComparableService:
             ),
         )
 
-    def _get_json(
-        self,
-        url: str,
-        *,
-        params: dict[str, str],
+    def _json_rows(
+        self, response: httpx.Response
     ) -> tuple[list[dict[str, Any]], httpx.Headers]:
         try:
-            response = self._http.get(url, params=params)
             response.raise_for_status()
             payload = response.json()
         except (
@@ -220,61 +466,129 @@ class ParcelSalesComparableService:
             raise self._unavailable()
         return payload, response.headers
 
+    def _get_json(
+        self,
+        url: str,
+        *,
+        params: dict[str, str],
+    ) -> tuple[list[dict[str, Any]], httpx.Headers]:
+        try:
+            response = self._http.get(
+                url, params=params, headers=_REQUEST_HEADERS
+            )
+        except httpx.HTTPError as exc:
+            raise self._unavailable() from exc
+        return self._json_rows(response)
+
+    async def _aget_json(
+        self,
+        url: str,
+        *,
+        params: dict[str, str],
+    ) -> tuple[list[dict[str, Any]], httpx.Headers]:
+        try:
+            response = await self._http.aget(
+                url, params=params, headers=_REQUEST_HEADERS
+            )
+        except httpx.HTTPError as exc:
+            raise self._unavailable() from exc
+        return self._json_rows(response)
+
+    @staticmethod
+    def _subject_query(bbl: str) -> dict[str, str]:
+        block = str(int(bbl[1:6]))
+        lot = str(int(bbl[6:]))
+        return {
+            "$select": _SUBJECT_SELECT,
+            "$where": (
+                f"borocode='{bbl[0]}' AND block='{block}' AND lot='{lot}'"
+            ),
+            "$limit": "2",
+        }
+
+    def _subject_rows(self, bbl: str) -> _SubjectRows:
+        """The subject's PLUTO rows: memory, then disk, then OpenData."""
+        now = self._now()
+        cached = self._memory_subject(bbl)
+        if cached is None:
+            cached = self._read_subject(bbl)
+            if cached is not None:
+                self._remember_subject(bbl, cached)
+        if self._fresh(cached, now):
+            self._count("subject_hits")
+            return cached  # type: ignore[return-value]
+
+        def _fill() -> _SubjectRows:
+            filled = self._memory_subject(bbl, touch=False)
+            if self._fresh(filled, now):
+                return filled  # type: ignore[return-value]
+            try:
+                rows, _ = self._get_json(
+                    PLUTO_RESOURCE_URL, params=self._subject_query(bbl)
+                )
+            except HTTPException:
+                stale = self._stale_fallback(cached, now)
+                if stale is None:
+                    raise
+                return stale
+            located = _SubjectRows(rows=tuple(rows), fetched_at=now)
+            self._count("subject_fetches")
+            self._remember_subject(bbl, located)
+            self._write_subject(bbl, located)
+            return located
+
+        return self._fills.do(("subject", bbl), _fill)
+
+    async def _asubject_rows(self, bbl: str) -> _SubjectRows:
+        """``_subject_rows`` without blocking the event loop."""
+        now = self._now()
+        cached = self._memory_subject(bbl)
+        if cached is None:
+            cached = await asyncio.to_thread(self._read_subject, bbl)
+            if cached is not None:
+                self._remember_subject(bbl, cached)
+        if self._fresh(cached, now):
+            self._count("subject_hits")
+            return cached  # type: ignore[return-value]
+
+        async def _fill() -> _SubjectRows:
+            filled = self._memory_subject(bbl, touch=False)
+            if self._fresh(filled, now):
+                return filled  # type: ignore[return-value]
+            try:
+                rows, _ = await self._aget_json(
+                    PLUTO_RESOURCE_URL, params=self._subject_query(bbl)
+                )
+            except HTTPException:
+                stale = self._stale_fallback(cached, now)
+                if stale is None:
+                    raise
+                return stale
+            located = _SubjectRows(rows=tuple(rows), fetched_at=now)
+            self._count("subject_fetches")
+            self._remember_subject(bbl, located)
+            await asyncio.to_thread(self._write_subject, bbl, located)
+            return located
+
+        return await self._async_fills.do(("subject", bbl), _fill)
+
     def _subject(
         self,
         bbl: str,
         *,
         dossier_row: dict[str, Any],
     ) -> _Subject | None:
-        block = str(int(bbl[1:6]))
-        lot = str(int(bbl[6:]))
-        rows, _ = self._get_json(
-            PLUTO_RESOURCE_URL,
-            params={
-                "$select": (
-                    "bbl,zipcode,latitude,longitude,bldgclass,"
-                    "lotarea,bldgarea"
-                ),
-                "$where": (
-                    f"borocode='{bbl[0]}' AND block='{block}' AND lot='{lot}'"
-                ),
-                "$limit": "2",
-            },
-        )
-        if len(rows) != 1:
-            return None
-        row = rows[0]
-        source_bbl = _text(row.get("bbl"), 10)
-        latitude = _number(row.get("latitude"))
-        longitude = _number(row.get("longitude"))
-        zip_code = _text(row.get("zipcode"), 10)
-        if (
-            source_bbl != bbl
-            or latitude is None
-            or longitude is None
-            or not zip_code
-            or not (-90 <= latitude <= 90)
-            or not (-180 <= longitude <= 180)
-        ):
-            return None
-        return _Subject(
-            bbl=bbl,
-            zip_code=zip_code,
-            latitude=latitude,
-            longitude=longitude,
-            lot_area_sqft=(
-                _positive(dossier_row.get("la"))
-                or _positive(row.get("lotarea"))
-            ),
-            building_area_sqft=(
-                _positive(dossier_row.get("ba"))
-                or _positive(row.get("bldgarea"))
-            ),
-            building_class=(
-                _text(dossier_row.get("bc"), 12)
-                or _text(row.get("bldgclass"), 12)
-            ),
-        )
+        located = self._subject_rows(bbl)
+        return _parse_subject(bbl, list(located.rows), dossier_row=dossier_row)
+
+    async def _asubject(
+        self,
+        bbl: str,
+        *,
+        dossier_row: dict[str, Any],
+    ) -> _Subject | None:
+        located = await self._asubject_rows(bbl)
+        return _parse_subject(bbl, list(located.rows), dossier_row=dossier_row)
 
     def _candidate(
         self,
@@ -416,96 +730,492 @@ class ParcelSalesComparableService:
             distance_miles=distance,
         )
 
-    def _build(
+    def _ranked(
         self,
-        bbl: str,
+        window: _SalesWindow,
         *,
-        dossier_row: dict[str, Any],
-    ) -> dict[str, Any]:
-        if _BBL_RE.fullmatch(bbl) is None:
-            raise HTTPException(status_code=404, detail="Parcel not found")
-        retrieved_at = self._now()
-        subject = self._subject(bbl, dossier_row=dossier_row)
-        if subject is None:
-            return {
-                "schema_version": COMPARABLE_SCHEMA,
-                "status": "insufficient_source_facts",
-                "subject_bbl": bbl,
-                "search_zip_code": None,
-                "query_window_start": date(retrieved_at.year - 3, 1, 1),
-                "source_candidate_count": 0,
-                "eligible_candidate_count": 0,
-                "source_limit_reached": False,
-                "comparables": [],
-                "summary": None,
-                "source_name": (
-                    "NYC Department of Finance annualized property sales"
-                ),
-                "source_dataset_id": SALES_DATASET_ID,
-                "source_url": SALES_SOURCE_URL,
-                "source_data_updated_at": None,
-                "source_retrieved_at": retrieved_at,
-                "selection_method": (
-                    "No comparable set was produced because current PLUTO "
-                    "location facts were unavailable."
-                ),
-                "interpretation": (
-                    "No value conclusion is available. Verify the parcel and "
-                    "review recorded transactions manually."
-                ),
-            }
+        subject: _Subject,
+        limit: int,
+    ) -> tuple[list[_Candidate], int]:
+        """The top ``limit`` eligible lots and how many lots were eligible.
 
-        start_date = date(retrieved_at.year - 3, 1, 1)
-        rows, headers = self._get_json(
-            SALES_RESOURCE_URL,
-            params={
-                "$select": (
-                    "bbl,address,zip_code,building_class_category,"
-                    "building_class_as_of_final,apartment_number,"
-                    "land_square_feet,gross_square_feet,residential_units,"
-                    "commercial_units,total_units,year_built,sale_price,"
-                    "sale_date,latitude,longitude"
-                ),
-                "$where": (
-                    f"borough='{bbl[0]}' AND "
-                    f"zip_code='{subject.zip_code}' AND "
-                    f"sale_price >= {MIN_SALE_PRICE} AND "
-                    f"sale_date >= '{start_date.isoformat()}T00:00:00' AND "
-                    "(apartment_number IS NULL OR apartment_number='')"
-                ),
-                "$order": "sale_date DESC",
-                "$limit": str(MAX_SOURCE_ROWS),
-            },
+        Applies ``_candidate``'s filters and score to the window's columns
+        at once, then builds payloads for the selected records only.
+        """
+        columns = window.columns
+        today = self._now().date().toordinal()
+        eligible = (
+            columns.usable
+            & (columns.bbl != int(subject.bbl))
+            & (columns.sale_ordinal <= today)
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            lat_a = math.radians(subject.latitude)
+            lat_b = np.radians(columns.latitude)
+            delta_lat = lat_b - lat_a
+            delta_lon = np.radians(columns.longitude - subject.longitude)
+            value = (
+                np.sin(delta_lat / 2) ** 2
+                + math.cos(lat_a) * np.cos(lat_b) * np.sin(delta_lon / 2) ** 2
+            )
+            distance = 2 * 3958.7613 * np.arcsin(np.minimum(1.0, np.sqrt(value)))
+            eligible &= distance <= MAX_DISTANCE_MILES
+
+            subject_lot = subject.lot_area_sqft
+            if subject_lot is not None and subject_lot > 0:
+                lot_gap = np.abs(np.log(subject_lot / columns.lot_area))
+                eligible &= lot_gap <= math.log(3)
+                lot_score = 3.0 - np.minimum(3.0, lot_gap * 2.0)
+                lot_match = (
+                    np.abs(columns.lot_area - subject_lot) / subject_lot <= 0.35
+                )
+            else:
+                lot_score = np.full(len(eligible), 1.0)
+                lot_match = np.zeros(len(eligible), dtype=bool)
+
+            subject_gross = subject.building_area_sqft
+            if subject_gross is not None and subject_gross > 0:
+                reported = ~np.isnan(columns.gross_area)
+                building_gap = np.abs(np.log(subject_gross / columns.gross_area))
+                building_score = np.where(
+                    reported, 2.0 - np.minimum(2.0, building_gap), 0.5
+                )
+                building_match = reported & (
+                    np.abs(columns.gross_area - subject_gross) / subject_gross
+                    <= 0.35
+                )
+            else:
+                building_score = np.full(len(eligible), 0.5)
+                building_match = np.zeros(len(eligible), dtype=bool)
+
+        if subject.building_class:
+            same_family = columns.family == ord(subject.building_class[0])
+            eligible &= same_family | (columns.family == 0)
+        else:
+            same_family = np.zeros(len(eligible), dtype=bool)
+        eligible &= lot_match | building_match
+
+        indexes = np.flatnonzero(eligible)
+        if not indexes.size:
+            return [], 0
+        recency_days = np.maximum(0, today - columns.sale_ordinal[indexes])
+        score = (
+            np.where(same_family[indexes], 4.0, 0.0)
+            + lot_score[indexes]
+            + building_score[indexes]
+            + (2.0 - np.minimum(2.0, distance[indexes]))
+            + np.maximum(0.0, 1.0 - recency_days / (365.25 * 4))
         )
-        candidates = [
+        bbls = columns.bbl[indexes]
+        ordinals = columns.sale_ordinal[indexes]
+        # Most recent record per BBL, earliest source row on a date tie.
+        by_bbl = np.lexsort((indexes, -ordinals, bbls))
+        first = np.ones(len(by_bbl), dtype=bool)
+        first[1:] = bbls[by_bbl][1:] != bbls[by_bbl][:-1]
+        latest = by_bbl[first]
+        # BBLs are fixed-width digits, so numeric order is string order.
+        order = latest[
+            np.lexsort(
+                (
+                    bbls[latest],
+                    distance[indexes][latest],
+                    -ordinals[latest],
+                    -score[latest],
+                )
+            )
+        ]
+        selected = [
             candidate
-            for raw in rows
+            for position in order[:limit]
             if (
                 candidate := self._candidate(
-                    raw,
+                    window.rows[indexes[position]],
                     subject=subject,
                 )
             )
             is not None
         ]
-        # Keep at most the most recent record for one BBL before ranking.
-        latest_by_bbl: dict[str, _Candidate] = {}
-        for candidate in sorted(
-            candidates,
-            key=lambda item: item.sale_date,
-            reverse=True,
-        ):
-            latest_by_bbl.setdefault(candidate.payload["bbl"], candidate)
-        ranked = sorted(
-            latest_by_bbl.values(),
-            key=lambda item: (
-                -item.score,
-                -item.sale_date.toordinal(),
-                item.distance_miles,
-                item.payload["bbl"],
+        return selected, len(latest)
+
+    @staticmethod
+    def _window_query(
+        borough: str, zip_code: str, start_date: date
+    ) -> dict[str, str]:
+        return {
+            "$select": _SALES_SELECT,
+            "$where": (
+                f"borough='{borough}' AND "
+                f"zip_code='{zip_code}' AND "
+                f"sale_price >= {MIN_SALE_PRICE} AND "
+                f"sale_date >= '{start_date.isoformat()}T00:00:00' AND "
+                "(apartment_number IS NULL OR apartment_number='')"
             ),
+            "$order": "sale_date DESC",
+            "$limit": str(MAX_SOURCE_ROWS),
+        }
+
+    def _fetch_window(
+        self,
+        borough: str,
+        zip_code: str,
+        start_date: date,
+    ) -> _SalesWindow:
+        fetched_at = self._now()
+        rows, headers = self._get_json(
+            SALES_RESOURCE_URL,
+            params=self._window_query(borough, zip_code, start_date),
+        )
+        return _SalesWindow.parse(
+            rows,
+            fetched_at=fetched_at,
+            source_data_updated_at=_last_modified(headers),
+        )
+
+    async def _afetch_window(
+        self,
+        borough: str,
+        zip_code: str,
+        start_date: date,
+    ) -> _SalesWindow:
+        fetched_at = self._now()
+        rows, headers = await self._aget_json(
+            SALES_RESOURCE_URL,
+            params=self._window_query(borough, zip_code, start_date),
+        )
+        # Parsing a full window into columns takes a few milliseconds;
+        # keep it off the event loop.
+        return await asyncio.to_thread(
+            _SalesWindow.parse,
+            rows,
+            fetched_at=fetched_at,
+            source_data_updated_at=_last_modified(headers),
+        )
+
+    def _window_path(self, key: tuple[str, str, str]) -> Path | None:
+        if self._cache_dir is None or _ZIP_RE.fullmatch(key[1]) is None:
+            return None
+        return self._cache_dir / f"{key[0]}-{key[1]}-{key[2]}.json"
+
+    def _read_window(self, key: tuple[str, str, str]) -> _SalesWindow | None:
+        path = self._window_path(key)
+        if path is None:
+            return None
+        try:
+            payload = json.loads(path.read_bytes())
+            rows = payload["rows"]
+            updated_at = payload["source_data_updated_at"]
+            if (
+                payload["schema"] != _WINDOW_FILE_SCHEMA
+                or not isinstance(rows, list)
+                or not all(isinstance(row, dict) for row in rows)
+            ):
+                raise ValueError("invalid sales window file")
+            return _SalesWindow.parse(
+                rows,
+                fetched_at=datetime.fromisoformat(payload["fetched_at"]),
+                source_data_updated_at=(
+                    datetime.fromisoformat(updated_at)
+                    if updated_at is not None
+                    else None
+                ),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, KeyError, TypeError, ValueError):
+            log.warning("discarding unreadable sales window %s", path)
+            path.unlink(missing_ok=True)
+            return None
+
+    def _write_window(
+        self, key: tuple[str, str, str], window: _SalesWindow
+    ) -> None:
+        path = self._window_path(key)
+        if path is None:
+            return
+        _write_cache_file(
+            path,
+            {
+                "schema": _WINDOW_FILE_SCHEMA,
+                "fetched_at": window.fetched_at.isoformat(),
+                "source_data_updated_at": (
+                    window.source_data_updated_at.isoformat()
+                    if window.source_data_updated_at is not None
+                    else None
+                ),
+                "rows": window.rows,
+            },
+        )
+
+    def _subject_path(self, bbl: str) -> Path | None:
+        if self._cache_dir is None or _BBL_RE.fullmatch(bbl) is None:
+            return None
+        return self._cache_dir / "subjects" / f"{bbl}.json"
+
+    def _read_subject(self, bbl: str) -> _SubjectRows | None:
+        path = self._subject_path(bbl)
+        if path is None:
+            return None
+        try:
+            payload = json.loads(path.read_bytes())
+            rows = payload["rows"]
+            if (
+                payload["schema"] != _SUBJECT_FILE_SCHEMA
+                or not isinstance(rows, list)
+                or not all(isinstance(row, dict) for row in rows)
+            ):
+                raise ValueError("invalid sales subject file")
+            return _SubjectRows(
+                rows=tuple(rows),
+                fetched_at=datetime.fromisoformat(payload["fetched_at"]),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, KeyError, TypeError, ValueError):
+            log.warning("discarding unreadable sales subject %s", path)
+            path.unlink(missing_ok=True)
+            return None
+
+    def _write_subject(self, bbl: str, located: _SubjectRows) -> None:
+        path = self._subject_path(bbl)
+        if path is None:
+            return
+        _write_cache_file(
+            path,
+            {
+                "schema": _SUBJECT_FILE_SCHEMA,
+                "fetched_at": located.fetched_at.isoformat(),
+                "rows": located.rows,
+            },
+        )
+
+    def _remember_subject(self, bbl: str, located: _SubjectRows) -> None:
+        with self._lock:
+            self._subjects[bbl] = located
+            self._subjects.move_to_end(bbl)
+            while len(self._subjects) > self._max_cached_subjects:
+                self._subjects.popitem(last=False)
+
+    def _memory_subject(
+        self, bbl: str, *, touch: bool = True
+    ) -> _SubjectRows | None:
+        with self._lock:
+            cached = self._subjects.get(bbl)
+            if cached is not None and touch:
+                self._subjects.move_to_end(bbl)
+        return cached
+
+    def _remember_window(
+        self, key: tuple[str, str, str], window: _SalesWindow
+    ) -> None:
+        with self._lock:
+            self._windows[key] = window
+            self._windows.move_to_end(key)
+            while len(self._windows) > self._max_cached_windows:
+                self._windows.popitem(last=False)
+
+    def _memory_window(
+        self, key: tuple[str, str, str], *, touch: bool = True
+    ) -> _SalesWindow | None:
+        with self._lock:
+            cached = self._windows.get(key)
+            if cached is not None and touch:
+                self._windows.move_to_end(key)
+        return cached
+
+    def _fresh(
+        self, cached: _SalesWindow | _SubjectRows | None, now: datetime
+    ) -> bool:
+        return cached is not None and now - cached.fetched_at <= self._cache_ttl
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _stale_fallback(self, cached: _Cached | None, now: datetime) -> _Cached | None:
+        """After a failed refresh, the cached entry if it may still serve."""
+        with self._lock:
+            self._counters["fetch_errors"] += 1
+            if cached is not None and now - cached.fetched_at <= self._stale_if_error:
+                self._counters["stale_served"] += 1
+                return cached
+        return None
+
+    def _sales_window(
+        self,
+        borough: str,
+        zip_code: str,
+        start_date: date,
+    ) -> _SalesWindow:
+        """The subject ZIP's sales window: memory, then disk, then OpenData."""
+        key = (borough, zip_code, start_date.isoformat())
+        now = self._now()
+        cached = self._memory_window(key)
+        from_disk = False
+        if cached is None:
+            cached = self._read_window(key)
+            from_disk = cached is not None
+            if cached is not None:
+                self._remember_window(key, cached)
+        if self._fresh(cached, now):
+            self._count("disk_hits" if from_disk else "memory_hits")
+            return cached  # type: ignore[return-value]
+
+        def _fill() -> _SalesWindow:
+            filled = self._memory_window(key, touch=False)
+            if self._fresh(filled, now):
+                return filled  # type: ignore[return-value]
+            try:
+                window = self._fetch_window(borough, zip_code, start_date)
+            except HTTPException:
+                stale = self._stale_fallback(cached, now)
+                if stale is None:
+                    raise
+                return stale
+            self._count("fetches")
+            self._remember_window(key, window)
+            self._write_window(key, window)
+            return window
+
+        return self._fills.do(key, _fill)
+
+    async def _asales_window(
+        self,
+        borough: str,
+        zip_code: str,
+        start_date: date,
+    ) -> _SalesWindow:
+        """``_sales_window`` without blocking the event loop."""
+        key = (borough, zip_code, start_date.isoformat())
+        now = self._now()
+        cached = self._memory_window(key)
+        from_disk = False
+        if cached is None:
+            cached = await asyncio.to_thread(self._read_window, key)
+            from_disk = cached is not None
+            if cached is not None:
+                self._remember_window(key, cached)
+        if self._fresh(cached, now):
+            self._count("disk_hits" if from_disk else "memory_hits")
+            return cached  # type: ignore[return-value]
+
+        async def _fill() -> _SalesWindow:
+            filled = self._memory_window(key, touch=False)
+            if self._fresh(filled, now):
+                return filled  # type: ignore[return-value]
+            try:
+                window = await self._afetch_window(borough, zip_code, start_date)
+            except HTTPException:
+                stale = self._stale_fallback(cached, now)
+                if stale is None:
+                    raise
+                return stale
+            self._count("fetches")
+            self._remember_window(key, window)
+            await asyncio.to_thread(self._write_window, key, window)
+            return window
+
+        return await self._async_fills.do(key, _fill)
+
+    def prewarm(self, bbls: Sequence[str]) -> int:
+        """Fetch the sales windows covering ``bbls``; returns windows warmed.
+
+        Lots are located with batched PLUTO queries, whose rows also fill the
+        subject location cache, and each distinct borough/ZIP window is then
+        fetched once. Failures are logged and skipped, so this is safe to run
+        in the background.
+        """
+        wanted = list(dict.fromkeys(bbl for bbl in bbls if _BBL_RE.fullmatch(bbl)))
+        keys: set[tuple[str, str]] = set()
+        for start in range(0, len(wanted), _PREWARM_LOOKUP_CHUNK):
+            chunk = wanted[start : start + _PREWARM_LOOKUP_CHUNK]
+            clauses = " OR ".join(
+                f"(borocode='{bbl[0]}' AND block='{int(bbl[1:6])}' "
+                f"AND lot='{int(bbl[6:])}')"
+                for bbl in chunk
+            )
+            fetched_at = self._now()
+            try:
+                rows, _ = self._get_json(
+                    PLUTO_RESOURCE_URL,
+                    params={
+                        "$select": _SUBJECT_SELECT,
+                        "$where": clauses,
+                        "$limit": str(len(chunk) * 2),
+                    },
+                )
+            except HTTPException:
+                log.warning("sales prewarm PLUTO lookup failed", exc_info=True)
+                continue
+            located: dict[str, list[dict[str, Any]]] = {}
+            for row in rows:
+                bbl = _text(row.get("bbl"), 10)
+                zip_code = _text(row.get("zipcode"), 10)
+                if bbl in chunk:
+                    located.setdefault(bbl, []).append(row)
+                    if zip_code:
+                        keys.add((bbl[0], zip_code))
+            for bbl, subject_rows in located.items():
+                # Same shape as the single-lot query, which is capped at two.
+                subject = _SubjectRows(
+                    rows=tuple(subject_rows[:2]), fetched_at=fetched_at
+                )
+                self._remember_subject(bbl, subject)
+                self._write_subject(bbl, subject)
+        start_date = date(self._now().year - 3, 1, 1)
+        warmed = 0
+        for borough, zip_code in sorted(keys):
+            try:
+                self._sales_window(borough, zip_code, start_date)
+            except HTTPException:
+                log.warning(
+                    "sales prewarm failed for %s/%s", borough, zip_code
+                )
+                continue
+            warmed += 1
+        return warmed
+
+    @staticmethod
+    def _unlocated(bbl: str, retrieved_at: datetime) -> dict[str, Any]:
+        return {
+            "schema_version": COMPARABLE_SCHEMA,
+            "status": "insufficient_source_facts",
+            "subject_bbl": bbl,
+            "search_zip_code": None,
+            "query_window_start": date(retrieved_at.year - 3, 1, 1),
+            "source_candidate_count": 0,
+            "eligible_candidate_count": 0,
+            "source_limit_reached": False,
+            "comparables": [],
+            "summary": None,
+            "source_name": (
+                "NYC Department of Finance annualized property sales"
+            ),
+            "source_dataset_id": SALES_DATASET_ID,
+            "source_url": SALES_SOURCE_URL,
+            "source_data_updated_at": None,
+            "source_retrieved_at": retrieved_at,
+            "selection_method": (
+                "No comparable set was produced because current PLUTO "
+                "location facts were unavailable."
+            ),
+            "interpretation": (
+                "No value conclusion is available. Verify the parcel and "
+                "review recorded transactions manually."
+            ),
+        }
+
+    def _result(
+        self,
+        bbl: str,
+        *,
+        subject: _Subject,
+        start_date: date,
+        window: _SalesWindow,
+    ) -> dict[str, Any]:
+        rows = window.rows
+        selected, eligible_count = self._ranked(
+            window, subject=subject, limit=MAX_COMPARABLES
         )
-        selected = ranked[:MAX_COMPARABLES]
         comparables = [candidate.payload for candidate in selected]
         land_rates = [
             item["price_per_land_sqft"]
@@ -545,7 +1255,7 @@ class ParcelSalesComparableService:
             "search_zip_code": subject.zip_code,
             "query_window_start": start_date,
             "source_candidate_count": len(rows),
-            "eligible_candidate_count": len(ranked),
+            "eligible_candidate_count": eligible_count,
             "source_limit_reached": len(rows) == MAX_SOURCE_ROWS,
             "comparables": comparables,
             "summary": summary,
@@ -554,8 +1264,8 @@ class ParcelSalesComparableService:
             ),
             "source_dataset_id": SALES_DATASET_ID,
             "source_url": SALES_SOURCE_URL,
-            "source_data_updated_at": _last_modified(headers),
-            "source_retrieved_at": retrieved_at,
+            "source_data_updated_at": window.source_data_updated_at,
+            "source_retrieved_at": window.fetched_at,
             "selection_method": (
                 "Recent priced records in the subject ZIP with a blank unit "
                 f"field, at least ${MIN_SALE_PRICE:,.0f} consideration, "
@@ -574,23 +1284,86 @@ class ParcelSalesComparableService:
             ),
         }
 
-    def get(
+    def _build(
         self,
         bbl: str,
         *,
         dossier_row: dict[str, Any],
     ) -> dict[str, Any]:
-        now = self._now()
+        if _BBL_RE.fullmatch(bbl) is None:
+            raise HTTPException(status_code=404, detail="Parcel not found")
+        retrieved_at = self._now()
+        subject = self._subject(bbl, dossier_row=dossier_row)
+        if subject is None:
+            return self._unlocated(bbl, retrieved_at)
+        start_date = date(retrieved_at.year - 3, 1, 1)
+        window = self._sales_window(bbl[0], subject.zip_code, start_date)
+        return self._result(
+            bbl, subject=subject, start_date=start_date, window=window
+        )
+
+    async def _abuild(
+        self,
+        bbl: str,
+        *,
+        dossier_row: dict[str, Any],
+    ) -> dict[str, Any]:
+        if _BBL_RE.fullmatch(bbl) is None:
+            raise HTTPException(status_code=404, detail="Parcel not found")
+        retrieved_at = self._now()
+        subject = await self._asubject(bbl, dossier_row=dossier_row)
+        if subject is None:
+            return self._unlocated(bbl, retrieved_at)
+        start_date = date(retrieved_at.year - 3, 1, 1)
+        window = await self._asales_window(bbl[0], subject.zip_code, start_date)
+        return self._result(
+            bbl, subject=subject, start_date=start_date, window=window
+        )
+
+    def _cached_result(self, bbl: str, now: datetime) -> dict[str, Any] | None:
         with self._lock:
             cached = self._cache.get(bbl)
             if cached is not None and now - cached[0] <= self._cache_ttl:
                 self._cache.move_to_end(bbl)
                 return cached[1]
+        return None
 
-        result = self._build(bbl, dossier_row=dossier_row)
+    def _remember_result(
+        self, bbl: str, now: datetime, result: dict[str, Any]
+    ) -> None:
+        # Date the entry by its sales window, so a result ranked from a
+        # stale window expires with that window rather than six hours later.
         with self._lock:
-            self._cache[bbl] = (now, result)
+            self._cache[bbl] = (min(now, result["source_retrieved_at"]), result)
             self._cache.move_to_end(bbl)
             while len(self._cache) > self._max_cached_parcels:
                 self._cache.popitem(last=False)
+
+    def get(
+        self,
+        bbl: str,
+        *,
+        dossier_row: dict[str, Any],
+    ) -> dict[str, Any]:
+        now = self._now()
+        cached = self._cached_result(bbl, now)
+        if cached is not None:
+            return cached
+        result = self._build(bbl, dossier_row=dossier_row)
+        self._remember_result(bbl, now, result)
+        return result
+
+    async def aget(
+        self,
+        bbl: str,
+        *,
+        dossier_row: dict[str, Any],
+    ) -> dict[str, Any]:
+        """``get`` for async routes; waits on OpenData without a thread."""
+        now = self._now()
+        cached = self._cached_result(bbl, now)
+        if cached is not None:
+            return cached
+        result = await self._abuild(bbl, dossier_row=dossier_row)
+        self._remember_result(bbl, now, result)
         return result
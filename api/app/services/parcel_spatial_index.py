@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from typing import Generic, NamedTuple, Optional, Protocol, TypeVar
+
+# ~1.1 km of latitude; a few hundred lots per cell in dense Manhattan.
+DEFAULT_CELL_DEGREES = 0.01
+# Web-mercator latitude limit; tiles never extend past it.
+_MAX_MERCATOR_LAT = 85.0511287798066
+
+
+class BBox(NamedTuple):
+    """WGS84 bounding box as ``(min_lng, min_lat, max_lng, max_lat)``."""
+
+    min_lng: float
+    min_lat: float
+    max_lng: float
+    max_lat: float
+
+    def contains(self, lng: float, lat: float) -> bool:
+        return (
+            self.min_lng <= lng <= self.max_lng
+            and self.min_lat <= lat <= self.max_lat
+        )
+
+
+class _HasPoint(Protocol):
+    lat: Optional[float]
+    lng: Optional[float]
+
+
+PointT = TypeVar("PointT", bound=_HasPoint)
+
+
+def tile_bbox(z: int, x: int, y: int) -> BBox:
+    """Bounds of XYZ (slippy-map) tile ``z/x/y``; raises ``ValueError``."""
+    if not 0 <= z <= 22:
+        raise ValueError("zoom must be between 0 and 22")
+    n = 1 << z
+    if not (0 <= x < n and 0 <= y < n):
+        raise ValueError("tile is outside the zoom level")
+
+    def _lat(row: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / n))))
+
+    return BBox(
+        min_lng=x / n * 360.0 - 180.0,
+        min_lat=max(_lat(y + 1), -_MAX_MERCATOR_LAT),
+        max_lng=(x + 1) / n * 360.0 - 180.0,
+        max_lat=min(_lat(y), _MAX_MERCATOR_LAT),
+    )
+
+
+class ParcelGridIndex(Generic[PointT]):
+    """Uniform lat/lng grid over one generation's map rows.
+
+    Built once per generation and shared read-only across requests. Queries
+    return rows in their published (rank) order, so a bbox result is the same
+    sequence the full feed would list. Rows without coordinates are never
+    returned by a spatial query.
+    """
+
+    __slots__ = ("_cell_degrees", "_cells", "_extent", "_rows")
+
+    def __init__(
+        self,
+        rows: Iterable[PointT],
+        *,
+        cell_degrees: float = DEFAULT_CELL_DEGREES,
+    ) -> None:
+        self._rows: tuple[PointT, ...] = tuple(rows)
+        self._cell_degrees = cell_degrees
+        cells: dict[tuple[int, int], list[int]] = {}
+        for offset, row in enumerate(self._rows):
+            if row.lat is None or row.lng is None:
+                continue
+            cells.setdefault(self._cell(row.lng, row.lat), []).append(offset)
+        self._cells: dict[tuple[int, int], tuple[int, ...]] = {
+            key: tuple(offsets) for key, offsets in cells.items()
+        }
+        if cells:
+            columns = [key[0] for key in cells]
+            rows_ = [key[1] for key in cells]
+            self._extent: tuple[int, int, int, int] | None = (
+                min(columns),
+                min(rows_),
+                max(columns),
+                max(rows_),
+            )
+        else:
+            self._extent = None
+
+    def _cell(self, lng: float, lat: float) -> tuple[int, int]:
+        return (
+            math.floor(lng / self._cell_degrees),
+            math.floor(lat / self._cell_degrees),
+        )
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def query(self, bbox: BBox) -> list[PointT]:
+        if self._extent is None:
+            return []
+        low = self._cell(bbox.min_lng, bbox.min_lat)
+        high = self._cell(bbox.max_lng, bbox.max_lat)
+        # Clamp to occupied cells so a world-sized bbox stays cheap.
+        min_col = max(low[0], self._extent[0])
+        min_row = max(low[1], self._extent[1])
+        max_col = min(high[0], self._extent[2])
+        max_row = min(high[1], self._extent[3])
+        offsets: list[int] = []
+        for col in range(min_col, max_col + 1):
+            for row in range(min_row, max_row + 1):
+                for offset in self._cells.get((col, row), ()):
+                    point = self._rows[offset]
+                    if bbox.contains(point.lng, point.lat):  # type: ignore[arg-type]
+                        offsets.append(offset)
+        offsets.sort()
+        return [self._rows[offset] for offset in offsets]
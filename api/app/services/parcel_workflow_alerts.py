@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from collections import Counter
 from datetime import datetime, timezone
-from typing import Any, Iterable
+from typing import Any, Iterable, Mapping
 
 from .parcel_workflow_actions import workflow_is_terminal
 
@@ -915,7 +915,7 @@ def _row_alerts(
 
 def build_workflow_alerts(
     items: Iterable[dict[str, Any]],
-    current_rows: Iterable[dict[str, Any]],
+    current_rows: Iterable[dict[str, Any]] | Mapping[str, dict[str, Any]],
     *,
     feed_generated_at: str | None,
     screening_rows: dict[str, dict[str, Any]] | None = None,
@@ -924,7 +924,11 @@ def build_workflow_alerts(
         dict[str, dict[str, dict[str, Any]]] | None
     ) = None,
 ) -> dict[str, Any]:
-    """Return authenticated in-app changes for active watched leads."""
+    """Return authenticated in-app changes for active watched leads.
+
+    ``current_rows`` is either the current feed rows or a BBL-keyed mapping of
+    them; a mapping only needs to hold the user's watched and issue BBLs.
+    """
 
     screening_rows = screening_rows or {}
     data_sources = data_sources or {}
@@ -953,11 +957,14 @@ def build_workflow_alerts(
             for issue in item["evidence_issues"].values()
         )
     ]
-    current_by_bbl = {
-        str(row.get("bbl")): row
-        for row in current_rows
-        if isinstance(row, dict) and row.get("bbl")
-    }
+    if isinstance(current_rows, Mapping):
+        current_by_bbl = current_rows
+    else:
+        current_by_bbl = {
+            str(row.get("bbl")): row
+            for row in current_rows
+            if isinstance(row, dict) and row.get("bbl")
+        }
     alerts: list[dict[str, Any]] = []
     changed_bbls: set[str] = set()
     removed_count = 0
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+from dataclasses import dataclass, field
+
+from pydantic import BaseModel
+
+# Bodies are compressed once per generation, so spend more CPU than the
+# per-request GZipMiddleware (level 6) can afford.
+_GZIP_LEVEL = 9
+# Matches GZipMiddleware.minimum_size in app/main.py.
+_MIN_COMPRESS_BYTES = 1_000
+
+
+@dataclass(frozen=True)
+class PreparedJson:
+    """A response model serialized once, with a strong content ETag.
+
+    Bodies are built once per published generation and shared across
+    requests, so the hot path returns cached bytes instead of re-running
+    pydantic serialization. ``encoded`` holds pre-compressed variants by
+    content-coding so GZipMiddleware never recompresses a cached body.
+    """
+
+    body: bytes
+    etag: str
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> PreparedJson:
+        # Match FastAPI's response_model serialization (aliases on).
+        body = model.model_dump_json(by_alias=True).encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        encoded: dict[str, bytes] = {}
+        if len(body) >= _MIN_COMPRESS_BYTES:
+            encoded["gzip"] = gzip.compress(body, compresslevel=_GZIP_LEVEL, mtime=0)
+        return cls(body=body, etag=f'"{digest}"', encoded=encoded)
+
+    def negotiate(self, accept_encoding: str | None) -> tuple[bytes, str | None]:
+        """Pick the smallest variant the client accepts (q=0 excludes)."""
+        accepted = _accepted_codings(accept_encoding)
+        choices = [
+            (len(payload), coding, payload)
+            for coding, payload in self.encoded.items()
+            if accepted.get(coding, accepted.get("*", 0.0)) > 0.0
+        ]
+        if not choices:
+            return self.body, None
+        _, coding, payload = min(choices)
+        return payload, coding
+
+    def etag_for(self, coding: str | None) -> str:
+        """Strong validators must differ per content-coding (RFC 9110 8.8.3)."""
+        return self.etag if coding is None else f'{self.etag[:-1]}-{coding}"'
+
+    def not_modified(self, if_none_match: str | None) -> bool:
+        """True when ``If-None-Match`` names any variant of this body."""
+        return any(
+            etag_matches(if_none_match, self.etag_for(coding))
+            for coding in (None, *self.encoded)
+        )
+
+
+def _accepted_codings(accept_encoding: str | None) -> dict[str, float]:
+    accepted: dict[str, float] = {}
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Evaluate ``If-None-Match`` against ``etag`` (RFC 9110 weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.removeprefix("W/") == opaque:
+            return True
+    return False
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from .auth_context import AuthContext
+
+
+@dataclass
+class _Principal:
+    context: AuthContext
+    checked_at: float
+    # When Firestore last recorded a login for this principal; kept across
+    # refreshes so `last_login_at` is written at most once per interval.
+    login_at: float | None
+
+
+class PrincipalCache:
+    """Bounded, short-TTL cache of resolved ``AuthContext`` principals.
+
+    Keys are built by ``require_auth`` from what it has already verified: a
+    user API key's SHA-256, an admin key hash, or an OIDC identity together
+    with the claims that feed its user document. A fresh hit skips Firestore
+    entirely. Once an entry is older than ``ttl_seconds`` the caller resolves
+    it again; ``login_due`` tells it whether that refresh should also record
+    a login. ``invalidate_user`` drops every entry for an app user, e.g. when
+    one of their API keys is revoked. Other instances keep serving a revoked
+    key for at most ``ttl_seconds``. ``ttl_seconds <= 0`` disables caching.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 30.0,
+        max_entries: int = 10_000,
+        login_write_interval_seconds: float = 900.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._login_interval = login_write_interval_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _Principal] = OrderedDict()
+        self._counters = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "ttl_seconds": self._ttl_seconds,
+                "entries": len(self._entries),
+                **self._counters,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, key: Hashable) -> AuthContext | None:
+        if self._ttl_seconds <= 0:
+            return None
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now - entry.checked_at >= self._ttl_seconds:
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            return entry.context
+
+    def login_due(self, key: Hashable) -> bool:
+        """Whether resolving ``key`` now should write ``last_login_at``."""
+        if self._ttl_seconds <= 0:
+            return True
+        with self._lock:
+            entry = self._entries.get(key)
+            login_at = entry.login_at if entry is not None else None
+        return login_at is None or self._clock() - login_at >= self._login_interval
+
+    def put(
+        self,
+        key: Hashable,
+        context: AuthContext,
+        *,
+        login_recorded: bool = False,
+    ) -> None:
+        if self._ttl_seconds <= 0:
+            return
+        now = self._clock()
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if login_recorded:
+                login_at: float | None = now
+            else:
+                login_at = previous.login_at if previous is not None else None
+            self._entries[key] = _Principal(context, now, login_at)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, app_user_id: str) -> int:
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry.context.app_user_id == app_user_id
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._counters["invalidations"] += len(stale)
+        return len(stale)
@@ -32,7 +32,9 @@ def _client_ip(request: Request) -> str:
     return "unknown"
 
 
-def enforce_token_bucket(*, key: str, capacity: int, refill_per_second: float) -> None:
+def enforce_token_bucket(
+    *, key: str, capacity: int, refill_per_second: float, cost: float = 1.0
+) -> None:
     now = time.monotonic()
 
     with _lock:
@@ -45,10 +47,10 @@ def enforce_token_bucket(*, key: str, capacity: int, refill_per_second: float) -
         bucket.tokens = min(float(capacity), bucket.tokens + elapsed * refill_per_second)
         bucket.last_refill_s = now
 
-        if bucket.tokens < 1.0:
+        if bucket.tokens < cost:
             raise HTTPException(status_code=429, detail="Rate limit exceeded")
 
-        bucket.tokens -= 1.0
+        bucket.tokens -= cost
 
 
 def demo_rate_limit(request: Request) -> None:
@@ -67,3 +69,14 @@ def pilot_request_rate_limit(request: Request) -> None:
         capacity=3,
         refill_per_second=1 / 1_200,
     )
+
+
+def parcel_tile_rate_limit(request: Request) -> None:
+    ip = _client_ip(request)
+    # A map viewport fetches a dozen or more tiles at once and pans in bursts,
+    # so tiles get their own, wider bucket instead of the demo limiter.
+    enforce_token_bucket(
+        key=f"parcel-tiles:{ip}",
+        capacity=200,
+        refill_per_second=20.0,
+    )
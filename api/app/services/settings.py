@@ -120,6 +120,15 @@ class Settings:
     # by the three tiered parcel read endpoints.
     parcel_smoke_api_key_hashes: list[str] = field(default_factory=list)
 
+    # Resolved principals are reused for this many seconds per process, and
+    # an OIDC user's `last_login_at` is written at most once per interval.
+    principal_cache_ttl_seconds: int = 30
+    principal_cache_max_entries: int = 10_000
+    login_write_interval_seconds: int = 900
+
+    # Connections kept open per host by the shared Storage client.
+    gcs_http_pool_size: int = 40
+
     # Plan
     free_monthly_runs: int = 5
 
@@ -172,6 +181,10 @@ def get_settings() -> Settings:
             default="",
             required=False,
         ),
+        principal_cache_ttl_seconds=_env_int("CITYLENS_PRINCIPAL_CACHE_TTL_SECONDS", 30),
+        principal_cache_max_entries=_env_int("CITYLENS_PRINCIPAL_CACHE_MAX_ENTRIES", 10_000),
+        login_write_interval_seconds=_env_int("CITYLENS_LOGIN_WRITE_INTERVAL_SECONDS", 900),
+        gcs_http_pool_size=_env_int("CITYLENS_GCS_HTTP_POOL_SIZE", 40),
         free_monthly_runs=_env_int("CITYLENS_FREE_MONTHLY_RUNS", 5),
         docs_access_key_sha256=_opt_env("CITYLENS_DOCS_ACCESS_KEY_SHA256"),
     )
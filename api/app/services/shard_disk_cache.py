@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+import logging
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+log = logging.getLogger(__name__)
+
+_DEFAULT_MAX_MB = 512
+
+# File layout (all integers little-endian):
+#   magic "CLSHARD1" | u16 key width | u32 row count | 32-byte sha256 of body
+#   body: sorted fixed-width ASCII keys | (count + 1) u32 value offsets |
+#         concatenated encoded values
+_MAGIC = b"CLSHARD1"
+_HEADER = struct.Struct("<8sHI32s")
+_OFFSET = struct.Struct("<I")
+_SAFE_NAME = frozenset("0123456789abcdefghijklmnopqrstuvwxyz-_TZ")
+
+V = TypeVar("V")
+
+
+def _max_bytes_from_env() -> int:
+    raw = os.getenv("CITYLENS_SHARD_CACHE_MAX_MB")
+    if raw is None or raw.strip() == "":
+        return _DEFAULT_MAX_MB * 1024 * 1024
+    try:
+        return max(0, int(float(raw) * 1024 * 1024))
+    except ValueError:
+        return _DEFAULT_MAX_MB * 1024 * 1024
+
+
+def encode_shard(rows: Mapping[str, bytes]) -> bytes:
+    """Serialize ``rows`` (equal-width ASCII keys) into the shard file format."""
+    keys = sorted(rows)
+    width = len(keys[0]) if keys else 0
+    if any(len(key) != width for key in keys):
+        raise ValueError("shard keys must share one width")
+    key_block = "".join(keys).encode("ascii")
+    offsets = bytearray()
+    values = bytearray()
+    for key in keys:
+        offsets += _OFFSET.pack(len(values))
+        values += rows[key]
+    offsets += _OFFSET.pack(len(values))
+    body = key_block + bytes(offsets) + bytes(values)
+    digest = hashlib.sha256(body).digest()
+    return _HEADER.pack(_MAGIC, width, len(keys), digest) + body
+
+
+class _Keys(Sequence[bytes]):
+    __slots__ = ("_buffer", "_count", "_start", "_width")
+
+    def __init__(self, buffer: Any, start: int, width: int, count: int) -> None:
+        self._buffer = buffer
+        self._start = start
+        self._width = width
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> bytes:  # type: ignore[override]
+        start = self._start + index * self._width
+        return self._buffer[start : start + self._width]
+
+
+class MappedShard(Mapping[str, V], Generic[V]):
+    """Read-only view over a shard file, decoding values on lookup.
+
+    Keys are binary-searched in place, so opening a shard costs a page-in
+    and a digest check rather than a parse.
+    """
+
+    __slots__ = ("_buffer", "_count", "_decode", "_keys", "_offsets", "_values", "nbytes")
+
+    def __init__(self, buffer: Any, decode: Callable[[bytes], V]) -> None:
+        magic, width, count, digest = _HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC:
+            raise ValueError("not a shard file")
+        with memoryview(buffer) as view:
+            verified = hashlib.sha256(view[_HEADER.size :]).digest() == digest
+        if not verified:
+            raise ValueError("shard digest mismatch")
+        self._buffer = buffer
+        self._decode = decode
+        self._count = count
+        self._keys = _Keys(buffer, _HEADER.size, width, count)
+        self._offsets = _HEADER.size + width * count
+        self._values = self._offsets + _OFFSET.size * (count + 1)
+        self.nbytes = len(buffer)
+        if self._values + self._offset(count) != len(buffer):
+            raise ValueError("shard length mismatch")
+
+    def _offset(self, index: int) -> int:
+        return _OFFSET.unpack_from(self._buffer, self._offsets + index * _OFFSET.size)[0]
+
+    def __getitem__(self, key: str) -> V:
+        try:
+            target = key.encode("ascii")
+        except UnicodeEncodeError:
+            raise KeyError(key) from None
+        index = bisect.bisect_left(self._keys, target)
+        if index >= self._count or self._keys[index] != target:
+            raise KeyError(key)
+        start = self._values + self._offset(index)
+        end = self._values + self._offset(index + 1)
+        return self._decode(self._buffer[start:end])
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self._keys[index].decode("ascii")
+
+
+class ShardDiskCache:
+    """Size-bounded local-disk tier for verified, parsed artifact shards.
+
+    Shards are written after the caller's integrity and schema checks pass,
+    as ``<root>/<namespace>/<generation>/<shard>-<sha256>.bin`` where
+    ``sha256`` is the published artifact digest, so a file can only ever be
+    reused for the exact artifact it was built from. Writes are atomic
+    (temp file + rename) and each file carries a body digest that is checked
+    when it is opened, so a torn or corrupted file is discarded rather than
+    served. Least-recently-used files are evicted to stay under
+    ``max_bytes``. Old generations are collected by ``retain``, which a
+    store calls when the generations it serves change, not by ``store``, so
+    a generation still serving reads and one being prefetched can both
+    write at once.
+
+    Point ``root`` at local disk or ``/dev/shm``. The directory may be
+    shared by several worker processes.
+    """
+
+    def __init__(self, root: str | Path, *, max_bytes: int | None = None) -> None:
+        self._root = Path(root)
+        self._max_bytes = _max_bytes_from_env() if max_bytes is None else max_bytes
+        self._lock = threading.Lock()
+        self._files: OrderedDict[Path, int] | None = None
+        # Per namespace, the generations a store is serving or prefetching.
+        self._retained: dict[str, frozenset[str]] = {}
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "write_errors": 0,
+            "corrupt": 0,
+            "evictions": 0,
+            "generations_collected": 0,
+        }
+
+    @classmethod
+    def from_env(cls) -> ShardDiskCache | None:
+        """The cache at ``CITYLENS_SHARD_CACHE_DIR``, or ``None`` when unset."""
+        root = os.getenv("CITYLENS_SHARD_CACHE_DIR")
+        if root is None or root.strip() == "":
+            return None
+        return cls(root.strip())
+
+    @staticmethod
+    def _check_names(*parts: str) -> None:
+        for part in parts:
+            if not part or not set(part) <= _SAFE_NAME:
+                raise ValueError("unsafe shard cache key")
+
+    def _path(self, namespace: str, generation: str, shard: str, sha256: str) -> Path:
+        self._check_names(namespace, generation, shard, sha256)
+        return self._root / namespace / generation / f"{shard}-{sha256}.bin"
+
+    def _index(self) -> OrderedDict[Path, int]:
+        # Called with the lock held. Seeded from disk once so files left by a
+        # previous process count toward the bound, oldest first.
+        if self._files is None:
+            found: list[tuple[float, Path, int]] = []
+            if self._root.is_dir():
+                for path in self._root.glob("*/*/*.bin"):
+                    try:
+                        stat = path.stat()
+                    except FileNotFoundError:
+                        continue
+                    found.append((stat.st_mtime, path, stat.st_size))
+            found.sort()
+            self._files = OrderedDict((path, size) for _, path, size in found)
+        return self._files
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            files = self._index()
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                "root": str(self._root),
+                "max_bytes": self._max_bytes,
+                "bytes": sum(files.values()),
+                "files": len(files),
+                **self._counters,
+                "hit_ratio": (
+                    round(self._counters["hits"] / lookups, 4) if lookups else None
+                ),
+            }
+
+    def retain(self, namespace: str, generations: Iterable[str]) -> None:
+        """Keep only ``generations`` of ``namespace``; delete the others.
+
+        A no-op while the set is unchanged, so stores may call it on every
+        manifest check. Writes for generations outside the set are dropped,
+        so a late request on a retired generation cannot recreate it.
+        """
+        keep = frozenset(generations)
+        self._check_names(namespace, *keep)
+        with self._lock:
+            if self._retained.get(namespace) == keep:
+                return
+            self._retained[namespace] = keep
+            base = self._root / namespace
+            stale = (
+                [d for d in base.iterdir() if d.is_dir() and d.name not in keep]
+                if base.is_dir()
+                else []
+            )
+            files = self._index()
+            for directory in stale:
+                for cached in [p for p in files if p.parent == directory]:
+                    del files[cached]
+                self._counters["generations_collected"] += 1
+        for directory in stale:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def load(
+        self,
+        namespace: str,
+        generation: str,
+        shard: str,
+        sha256: str,
+        decode: Callable[[bytes], V],
+    ) -> MappedShard[V] | None:
+        """Map a previously stored shard, or ``None`` on a miss."""
+        path = self._path(namespace, generation, shard, sha256)
+        try:
+            with open(path, "rb") as handle:
+                buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError, OSError):
+            # ValueError: an empty file cannot be mapped.
+            with self._lock:
+                self._counters["misses"] += 1
+                self._index().pop(path, None)
+            return None
+        try:
+            view: MappedShard[V] = MappedShard(buffer, decode)
+        except (ValueError, struct.error):
+            log.warning("discarding corrupt shard cache file %s", path)
+            with self._lock:
+                self._counters["corrupt"] += 1
+                self._counters["misses"] += 1
+                self._index().pop(path, None)
+            path.unlink(missing_ok=True)
+            return None
+        with self._lock:
+            self._counters["hits"] += 1
+            files = self._index()
+            files[path] = view.nbytes
+            files.move_to_end(path)
+        return view
+
+    def store(
+        self,
+        namespace: str,
+        generation: str,
+        shard: str,
+        sha256: str,
+        rows: Mapping[str, bytes],
+    ) -> None:
+        """Persist verified ``rows``; failures are logged, never raised."""
+        path = self._path(namespace, generation, shard, sha256)
+        with self._lock:
+            retained = self._retained.get(namespace)
+        if retained is not None and generation not in retained:
+            return
+        payload = encode_shard(rows)
+        if len(payload) > self._max_bytes:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle, temp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(handle, "wb") as output:
+                    output.write(payload)
+                os.replace(temp, path)
+            except BaseException:
+                Path(temp).unlink(missing_ok=True)
+                raise
+        except OSError:
+            log.warning("shard cache write failed for %s", path, exc_info=True)
+            with self._lock:
+                self._counters["write_errors"] += 1
+            return
+        with self._lock:
+            self._counters["writes"] += 1
+            files = self._index()
+            files[path] = len(payload)
+            files.move_to_end(path)
+            evicted = []
+            total = sum(files.values())
+            while total > self._max_bytes and len(files) > 1:
+                victim, size = files.popitem(last=False)
+                total -= size
+                evicted.append(victim)
+            self._counters["evictions"] += len(evicted)
+        for victim in evicted:
+            victim.unlink(missing_ok=True)
+
+
+def shard_tier_stats(
+    counters: Mapping[str, int],
+    *,
+    cached_shards: int,
+    max_cached_shards: int,
+    disk_cache: ShardDiskCache | None,
+) -> dict[str, Any]:
+    """Per-tier hit ratios for a shard store's memory LRU and disk tier."""
+
+    def _ratio(hits: int, misses: int) -> float | None:
+        return round(hits / (hits + misses), 4) if hits + misses else None
+
+    return {
+        "memory": {
+            "entries": cached_shards,
+            "max_entries": max_cached_shards,
+            "hits": counters["memory_hits"],
+            "misses": counters["memory_misses"],
+            "hit_ratio": _ratio(counters["memory_hits"], counters["memory_misses"]),
+        },
+        "disk": {
+            "enabled": disk_cache is not None,
+            "hits": counters["disk_hits"],
+            "misses": counters["disk_misses"],
+            "hit_ratio": _ratio(counters["disk_hits"], counters["disk_misses"]),
+        },
+        "remote_fetches": counters["remote_fetches"],
+    }
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+_DEFAULT_WORKERS = 8
+
+
+def shard_prefetch_top_from_env() -> int:
+    """``CITYLENS_SHARD_PREFETCH_TOP``: hot shards loaded before a cutover."""
+    raw = os.getenv("CITYLENS_SHARD_PREFETCH_TOP")
+    if raw is None or raw.strip() == "":
+        return 0
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return 0
+
+
+class GenerationPrefetch:
+    """Hold a shard store on its current generation until a new one is warm.
+
+    When a store sees a newly published generation it asks ``cutover``.
+    With prefetching enabled and a generation already serving, the first ask
+    starts loading the new generation's ``top`` hottest shards on a bounded
+    pool and returns ``False``, so the store keeps serving the old one; once
+    that run finishes (successfully or not) ``cutover`` returns ``True``.
+    Shard failures are counted, not raised; the request path loads any
+    shard that could not be prefetched as it always has. Stores with a
+    disk tier retain both generations there for the hold
+    (``ShardDiskCache.retain``) and drop the old one at cutover.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        top: int,
+        workers: int = _DEFAULT_WORKERS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._name = name
+        self._top = max(0, top)
+        self._workers = max(1, workers)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._generation: str | None = None
+        self._state = "idle"
+        self._total = 0
+        self._loaded = 0
+        self._failed = 0
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            finished = self._finished_at if self._finished_at is not None else self._clock()
+            return {
+                "enabled": self._top > 0,
+                "top": self._top,
+                "state": self._state,
+                "generation": self._generation,
+                "total": self._total,
+                "loaded": self._loaded,
+                "failed": self._failed,
+                "elapsed_s": (
+                    round(finished - self._started_at, 3)
+                    if self._started_at is not None
+                    else None
+                ),
+            }
+
+    def cutover(
+        self,
+        current: str | None,
+        pending: str,
+        *,
+        hottest: Callable[[], Sequence[str]],
+        load: Callable[[str], object],
+    ) -> bool:
+        """Whether the store may switch from ``current`` to ``pending`` now."""
+        if self._top == 0 or current is None or current == pending:
+            return True
+        with self._lock:
+            if self._generation == pending:
+                return self._state == "done"
+            shards = list(hottest())[: self._top]
+            self._generation = pending
+            self._state = "running" if shards else "done"
+            self._total = len(shards)
+            self._loaded = 0
+            self._failed = 0
+            self._started_at = self._clock()
+            self._finished_at = None if shards else self._started_at
+            if not shards:
+                # Nothing has been read yet, so there is nothing to warm.
+                return True
+            self._done.clear()
+        threading.Thread(
+            target=self._run,
+            args=(pending, shards, load),
+            name=f"{self._name}-prefetch",
+            daemon=True,
+        ).start()
+        return False
+
+    def _run(
+        self,
+        generation: str,
+        shards: list[str],
+        load: Callable[[str], object],
+    ) -> None:
+        def _one(shard: str) -> None:
+            try:
+                load(shard)
+            except Exception:
+                log.warning(
+                    "%s prefetch of shard %s failed", self._name, shard, exc_info=True
+                )
+                with self._lock:
+                    self._failed += 1
+                return
+            with self._lock:
+                self._loaded += 1
+
+        with ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix=f"{self._name}-prefetch"
+        ) as pool:
+            list(pool.map(_one, shards))
+        with self._lock:
+            current = self._generation == generation
+            if current:
+                self._state = "done"
+                self._finished_at = self._clock()
+        log.info(
+            "%s prefetched %d shards of generation %s",
+            self._name,
+            len(shards),
+            generation,
+        )
+        if current:
+            self._done.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the current run finishes; for tests and tooling."""
+        return self._done.wait(timeout)
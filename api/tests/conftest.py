@@ -13,7 +13,7 @@ if str(_API_ROOT) not in sys.path:
 
 import pytest  # noqa: E402
 
-from app.services import rate_limit  # noqa: E402
+from app.services import auth, rate_limit  # noqa: E402
 from app.services.auth_context import AuthContext  # noqa: E402
 
 
@@ -29,6 +29,9 @@ def _set_required_env(monkeypatch) -> Iterator[None]:
     # in-memory production limiter from coupling otherwise independent tests.
     with rate_limit._lock:
         rate_limit._buckets.clear()
+    # Principals are cached per process; never let one test's store answer
+    # for another's.
+    auth._principal_cache_cached.cache_clear()
     monkeypatch.setenv("GOOGLE_CLOUD_PROJECT", "test-project")
     monkeypatch.setenv("CITYLENS_REGION", "us-central1")
     monkeypatch.setenv("CITYLENS_BUCKET", "test-bucket")
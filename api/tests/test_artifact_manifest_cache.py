@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from app.services.artifact_manifest_cache import ArtifactManifestCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class VersionedGcs:
+    """Fake bucket that records metadata probes separately from downloads."""
+
+    bucket_name = "test-bucket"
+
+    def __init__(self, objects: dict[str, tuple[bytes, str]]) -> None:
+        self.objects = objects
+        self.probes: list[str] = []
+        self.downloads: list[str] = []
+
+    def download_bytes(self, *, object_name: str) -> tuple[bytes, str | None]:
+        raise AssertionError("versioned reads must not use download_bytes")
+
+    def object_generation(self, *, object_name: str) -> str | None:
+        self.probes.append(object_name)
+        found = self.objects.get(object_name)
+        return None if found is None else found[1]
+
+    def download_bytes_with_generation(
+        self, *, object_name: str
+    ) -> tuple[bytes, str | None, str]:
+        self.downloads.append(object_name)
+        if object_name not in self.objects:
+            raise FileNotFoundError(object_name)
+        body, generation = self.objects[object_name]
+        return body, "application/json", generation
+
+
+class PlainGcs:
+    def __init__(self) -> None:
+        self.requests: list[str] = []
+
+    def download_bytes(self, *, object_name: str) -> tuple[bytes, str | None]:
+        self.requests.append(object_name)
+        return b"{}", "application/json"
+
+
+def test_serves_cached_manifest_inside_ttl_without_gcs() -> None:
+    clock = FakeClock()
+    gcs = VersionedGcs({"m.json": (b'{"v": 1}', "1")})
+    cache = ArtifactManifestCache(ttl_seconds=30, background=False, clock=clock)
+
+    first = cache.download_bytes(gcs, object_name="m.json")
+    clock.now += 29
+    second = cache.download_bytes(gcs, object_name="m.json")
+
+    assert first == second == (b'{"v": 1}', "application/json")
+    assert gcs.downloads == ["m.json"]
+    assert gcs.probes == []
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_revalidates_by_generation_and_only_downloads_on_change() -> None:
+    clock = FakeClock()
+    gcs = VersionedGcs({"m.json": (b'{"v": 1}', "1")})
+    cache = ArtifactManifestCache(ttl_seconds=30, background=False, clock=clock)
+    cache.download_bytes(gcs, object_name="m.json")
+
+    clock.now += 31
+    unchanged, _ = cache.download_bytes(gcs, object_name="m.json")
+    gcs.objects["m.json"] = (b'{"v": 2}', "2")
+    clock.now += 31
+    changed, _ = cache.download_bytes(gcs, object_name="m.json")
+
+    assert unchanged == b'{"v": 1}'
+    assert changed == b'{"v": 2}'
+    assert gcs.probes == ["m.json", "m.json"]
+    assert gcs.downloads == ["m.json", "m.json"]
+    stats = cache.stats()
+    assert stats["revalidated_unchanged"] == 1
+    assert stats["revalidated_changed"] == 1
+
+
+def test_deleted_manifest_is_not_served_after_revalidation() -> None:
+    clock = FakeClock()
+    gcs = VersionedGcs({"m.json": (b"{}", "1")})
+    cache = ArtifactManifestCache(ttl_seconds=30, background=False, clock=clock)
+    cache.download_bytes(gcs, object_name="m.json")
+
+    del gcs.objects["m.json"]
+    clock.now += 31
+    with pytest.raises(FileNotFoundError):
+        cache.download_bytes(gcs, object_name="m.json")
+
+    assert cache.stats()["entries"] == 0
+
+
+def test_background_revalidation_serves_stale_body_then_refreshes() -> None:
+    clock = FakeClock()
+    gcs = VersionedGcs({"m.json": (b'{"v": 1}', "1")})
+    cache = ArtifactManifestCache(ttl_seconds=30, clock=clock)
+    cache.download_bytes(gcs, object_name="m.json")
+
+    gcs.objects["m.json"] = (b'{"v": 2}', "2")
+    clock.now += 45
+    stale, _ = cache.download_bytes(gcs, object_name="m.json")
+    deadline = time.monotonic() + 5
+    while cache.stats()["revalidated_changed"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    fresh, _ = cache.download_bytes(gcs, object_name="m.json")
+
+    assert stale == b'{"v": 1}'
+    assert fresh == b'{"v": 2}'
+    assert cache.stats()["stale_hits"] == 1
+
+
+def test_expired_entry_past_stale_window_revalidates_inline() -> None:
+    clock = FakeClock()
+    gcs = VersionedGcs({"m.json": (b'{"v": 1}', "1")})
+    cache = ArtifactManifestCache(ttl_seconds=30, clock=clock)
+    cache.download_bytes(gcs, object_name="m.json")
+
+    gcs.objects["m.json"] = (b'{"v": 2}', "2")
+    clock.now += 61
+    body, _ = cache.download_bytes(gcs, object_name="m.json")
+
+    assert body == b'{"v": 2}'
+    assert cache.stats()["stale_hits"] == 0
+
+
+def test_clients_without_generation_support_bypass_the_cache() -> None:
+    gcs = PlainGcs()
+    cache = ArtifactManifestCache(ttl_seconds=30)
+
+    cache.download_bytes(gcs, object_name="m.json")
+    cache.download_bytes(gcs, object_name="m.json")
+
+    assert gcs.requests == ["m.json", "m.json"]
+    assert cache.stats()["bypassed"] == 2
+
+
+def test_zero_ttl_disables_caching() -> None:
+    gcs = VersionedGcs({"m.json": (b"{}", "1")})
+    cache = ArtifactManifestCache(ttl_seconds=0)
+
+    with pytest.raises(AssertionError):
+        cache.download_bytes(gcs, object_name="m.json")
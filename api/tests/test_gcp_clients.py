@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.routes import me as me_routes
+from app.routes import parcel_intel as parcel_intel_routes
+from app.services import auth as auth_module
+from app.services import gcp_clients as gcp_clients_module
+from app.services.gcp_clients import GcpClients
+from app.services.settings import get_settings
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def clients(monkeypatch) -> GcpClients:
+    registry = GcpClients(
+        project_id="test-project",
+        firestore_factory=_FakeClient,
+        storage_factory=_FakeClient,
+    )
+    monkeypatch.setattr(gcp_clients_module, "gcp_clients", lambda _settings: registry)
+    for module in (auth_module, me_routes, parcel_intel_routes):
+        monkeypatch.setattr(module, "gcp_clients", lambda _settings: registry)
+    return registry
+
+
+def test_concurrent_first_use_constructs_each_client_once(clients: GcpClients) -> None:
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        firestore = set(pool.map(lambda _: id(clients.firestore()), range(64)))
+        storage = set(pool.map(lambda _: id(clients.storage()), range(64)))
+
+    assert len(firestore) == len(storage) == 1
+    assert clients.stats() == {
+        "firestore_constructed": 1,
+        "storage_constructed": 1,
+        "gcs_pool_size": 40,
+    }
+
+
+def test_request_dependencies_share_the_process_clients(clients: GcpClients) -> None:
+    settings = get_settings()
+
+    stores = [
+        auth_module._store_factory(settings),
+        me_routes.get_store(settings),
+        me_routes.get_store(settings),
+    ]
+    gcs = [parcel_intel_routes.get_gcs(settings) for _ in range(3)]
+
+    assert {id(store.client) for store in stores} == {id(clients.firestore())}
+    assert {id(item.client) for item in gcs} == {id(clients.storage())}
+    assert clients.stats()["firestore_constructed"] == 1
+    assert clients.stats()["storage_constructed"] == 1
+
+
+def test_close_releases_clients_and_next_use_rebuilds(clients: GcpClients) -> None:
+    firestore = clients.firestore()
+    clients.close()
+
+    assert firestore.closed
+    assert clients.firestore() is not firestore
+    assert clients.stats()["firestore_constructed"] == 2
+
+
+def test_pool_size_comes_from_settings(monkeypatch) -> None:
+    monkeypatch.setenv("CITYLENS_GCS_HTTP_POOL_SIZE", "96")
+    gcp_clients_module._gcp_clients_cached.cache_clear()
+    try:
+        registry = gcp_clients_module.gcp_clients(get_settings())
+        assert registry.stats()["gcs_pool_size"] == 96
+        assert registry.stats()["storage_constructed"] == 0
+    finally:
+        gcp_clients_module._gcp_clients_cached.cache_clear()
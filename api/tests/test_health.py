@@ -87,6 +87,10 @@ def test_ready_ok_with_fresh_parcel_intel() -> None:
     assert body["parcel_intel"]["prospective_validation"]["status"] == (
         "unavailable"
     )
+    assert body["manifest_cache"]["bypassed"] >= 1
+    assert body["decision_audit_cache"]["hit_rate"] is None
+    assert body["shard_prefetch"]["resolver"]["state"] == "idle"
+    assert set(body["gcp_clients"]) >= {"firestore_constructed", "storage_constructed"}
     assert store.pings == 1
 
 
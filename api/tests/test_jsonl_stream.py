@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+
+import pytest
+
+from app.services.jsonl_stream import (
+    ArtifactIntegrityError,
+    VerifiedJsonlStream,
+    loads_line,
+)
+
+
+def _chunks(body: bytes, size: int) -> list[bytes]:
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+def test_lines_split_across_chunk_boundaries(chunk_size: int) -> None:
+    body = b'{"bbl": "1"}\n\n{"bbl": "2"}\n{"bbl": "3"}'
+
+    stream = VerifiedJsonlStream(
+        _chunks(body, chunk_size),
+        expected_size=len(body),
+        expected_sha256=hashlib.sha256(body).hexdigest(),
+    )
+    lines = list(stream)
+
+    assert lines == [b'{"bbl": "1"}', b"", b'{"bbl": "2"}', b'{"bbl": "3"}']
+    assert stream.size == len(body)
+    assert stream.sha256 == hashlib.sha256(body).hexdigest()
+
+
+def test_digest_mismatch_is_raised_after_the_last_line() -> None:
+    body = b'{"bbl": "1"}\n'
+    stream = iter(
+        VerifiedJsonlStream(
+            _chunks(body, 4),
+            expected_size=len(body),
+            expected_sha256="0" * 64,
+        )
+    )
+
+    assert next(stream) == b'{"bbl": "1"}'
+    with pytest.raises(ArtifactIntegrityError) as exc_info:
+        next(stream)
+    assert exc_info.value.actual_sha256 == hashlib.sha256(body).hexdigest()
+
+
+def test_oversized_stream_fails_before_it_is_fully_read() -> None:
+    pulled: list[bytes] = []
+
+    def _source():
+        for chunk in (b'{"a": 1}\n', b'{"b": 2}\n', b'{"c": 3}\n'):
+            pulled.append(chunk)
+            yield chunk
+
+    with pytest.raises(ArtifactIntegrityError) as exc_info:
+        list(VerifiedJsonlStream(_source(), expected_size=10))
+
+    assert len(pulled) == 2
+    assert exc_info.value.actual_sha256 is None
+
+
+def test_short_stream_fails_size_check() -> None:
+    with pytest.raises(ArtifactIntegrityError):
+        list(VerifiedJsonlStream([b"{}\n"], expected_size=10))
+
+
+def test_loads_line_matches_stdlib_semantics() -> None:
+    assert loads_line(b'{"bbl": "3000000001", "score": 0.5}') == {
+        "bbl": "3000000001",
+        "score": 0.5,
+    }
+    assert math.isnan(loads_line(b'{"score": NaN}')["score"])
+    assert loads_line(b'{"address": "caf\xe9"}') == {"address": "caf�"}
+    with pytest.raises(json.JSONDecodeError):
+        loads_line(b"{not json")
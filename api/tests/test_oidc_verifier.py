@@ -10,6 +10,7 @@ import base64
 import time
 from unittest.mock import patch
 
+import httpx
 import jwt
 import pytest
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
@@ -21,6 +22,7 @@ from cryptography.hazmat.primitives.serialization import (
 )
 
 from app.services.oidc_verifier import AuthVerificationError, OIDCVerifier
+from app.services.outbound_http import OutboundHttp
 
 
 def _b64u(data: bytes) -> str:
@@ -131,3 +133,25 @@ def test_oidc_verifier_algorithm_allowlist_includes_eddsa() -> None:
 
     src = inspect.getsource(OIDCVerifier.verify)
     assert '"EdDSA"' in src, "OIDCVerifier must accept EdDSA (Neon Auth signs JWTs with Ed25519)"
+
+
+def test_oidc_verifier_fetches_jwks_through_the_shared_pool() -> None:
+    sk_pem, jwks, kid = _make_eddsa_keypair_and_jwks()
+    now = int(time.time())
+    token = _sign(sk_pem, kid, {"sub": "user-1", "iat": now, "exp": now + 600})
+    fetched: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        fetched.append(str(request.url))
+        return httpx.Response(200, json=jwks)
+
+    verifier = OIDCVerifier(
+        jwks_url="https://example.test/jwks",
+        issuer=None,
+        audience=None,
+        http=OutboundHttp(transport=httpx.MockTransport(handler)),
+    )
+
+    assert verifier.verify(token)["sub"] == "user-1"
+    assert verifier.verify(token)["sub"] == "user-1"
+    assert fetched == ["https://example.test/jwks"]
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from app.services.outbound_http import OutboundHttp, UpstreamUnavailable
+
+URL = "https://data.example.test/resource/x.json"
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_circuit_opens_after_consecutive_failures_and_probes_after_cooldown() -> None:
+    statuses = [503] * 3 + [200]
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.host)
+        return httpx.Response(statuses.pop(0), json=[])
+
+    clock = _Clock()
+    http = OutboundHttp(
+        transport=httpx.MockTransport(handler),
+        failure_threshold=3,
+        reset_after=30.0,
+        clock=clock,
+    )
+    for _ in range(3):
+        assert http.get(URL).status_code == 503
+
+    # Open: fail fast without touching the upstream.
+    with pytest.raises(UpstreamUnavailable):
+        http.get(URL)
+    assert len(calls) == 3
+    assert http.stats()["hosts"]["data.example.test"] == {
+        "state": "open",
+        "rejected": 1,
+    }
+
+    clock.now = 31.0
+    assert http.get(URL).status_code == 200
+    assert http.stats()["hosts"]["data.example.test"]["state"] == "closed"
+
+
+def test_a_failed_probe_reopens_the_circuit() -> None:
+    def handler(_request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused")
+
+    clock = _Clock()
+    http = OutboundHttp(
+        transport=httpx.MockTransport(handler),
+        failure_threshold=1,
+        clock=clock,
+    )
+    with pytest.raises(httpx.ConnectError):
+        http.get(URL)
+    clock.now = 31.0
+    with pytest.raises(httpx.ConnectError):
+        http.get(URL)
+    with pytest.raises(UpstreamUnavailable):
+        http.get(URL)
+
+
+def test_client_errors_do_not_trip_the_circuit() -> None:
+    http = OutboundHttp(
+        transport=httpx.MockTransport(lambda _request: httpx.Response(404)),
+        failure_threshold=1,
+    )
+    for _ in range(3):
+        assert http.get(URL).status_code == 404
+    assert http.stats()["hosts"]["data.example.test"]["state"] == "closed"
+
+
+def test_per_host_limit_times_out_instead_of_queueing_forever() -> None:
+    entered = threading.Event()
+    release = threading.Event()
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        entered.set()
+        release.wait(5)
+        return httpx.Response(200, json=[])
+
+    http = OutboundHttp(
+        transport=httpx.MockTransport(handler),
+        max_per_host=1,
+        timeout=httpx.Timeout(6.0, pool=0.05),
+    )
+    first = threading.Thread(target=http.get, args=(URL,))
+    first.start()
+    assert entered.wait(5)
+    try:
+        with pytest.raises(httpx.PoolTimeout):
+            http.get(URL)
+        # Another host is not held up by the busy one.
+        other = http.get("https://other.example.test/x.json")
+        assert other.status_code == 200
+    finally:
+        release.set()
+        first.join()
+    assert http.stats()["hosts"]["data.example.test"]["state"] == "closed"
+
+
+def test_async_requests_share_limits_and_breaker_with_sync_callers() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(502, json={"q": request.url.params["q"]})
+
+    http = OutboundHttp(
+        transport=httpx.MockTransport(handler),
+        failure_threshold=1,
+        reset_after=60.0,
+    )
+
+    async def _main() -> None:
+        response = await http.aget(URL, params={"q": "1"})
+        assert response.status_code == 502
+        with pytest.raises(UpstreamUnavailable):
+            await http.aget(URL, params={"q": "2"})
+        await http.aclose()
+
+    asyncio.run(_main())
+    with pytest.raises(UpstreamUnavailable):
+        http.get(URL)
+
+
+def test_pooled_clients_negotiate_http2() -> None:
+    http = OutboundHttp()
+    try:
+        # httpx only offers h2 over ALPN when the pool was built with http2.
+        assert http.client._transport._pool._http2 is True
+        assert http.async_client._transport._pool._http2 is True
+    finally:
+        asyncio.run(http.aclose())
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import threading
 
 import pytest
 from fastapi.testclient import TestClient
@@ -16,6 +17,7 @@ from app.services.parcel_address_resolver import (
     ParcelAddressResolver,
     normalize_resolver_address,
 )
+from app.services.shard_disk_cache import ShardDiskCache
 
 
 class FakeGcs:
@@ -37,8 +39,8 @@ class FakeGcs:
 
 def _resolver_store(
     address_bbls: dict[str, list[str]],
+    generation: str = "20260727T000234316462Z-1824ab6b25f2",
 ) -> dict[str, bytes]:
-    generation = "20260727T000234316462Z-1824ab6b25f2"
     artifact_prefix = f"{RESOLVER_PREFIX}/generations/{generation}"
     by_shard: dict[str, list[dict]] = {}
     for address, bbls in address_bbls.items():
@@ -304,3 +306,222 @@ def test_integrity_mismatch_fails_closed(auth_override) -> None:
 
     assert response.status_code == 503
     assert "integrity" in response.json()["detail"].lower()
+
+
+def test_disk_tier_reopens_verified_shards_after_restart(tmp_path) -> None:
+    fake = FakeGcs(
+        _resolver_store(
+            {
+                "10 Test Street": ["1000010001", "1000010002"],
+                "12 Test Street": ["1000010003"],
+            }
+        )
+    )
+    disk = ShardDiskCache(tmp_path, max_bytes=10_000_000)
+    cold = ParcelAddressResolver(disk_cache=disk).resolve(
+        fake, "10 Test Street, Manhattan, NY"
+    )
+    fetched = [name for name in fake.requests if "/shards/" in name]
+
+    restarted = ParcelAddressResolver(disk_cache=disk)
+    warm = restarted.resolve(fake, "10 Test Street, Manhattan, NY")
+
+    assert [name for name in fake.requests if "/shards/" in name] == fetched
+    assert warm.candidates == cold.candidates
+    assert [candidate.bbl for candidate in warm.candidates] == [
+        "1000010001",
+        "1000010002",
+    ]
+    stats = restarted.stats()
+    assert stats["disk"]["hits"] == 1
+    assert stats["remote_fetches"] == 0
+
+
+def test_new_generation_serves_after_hot_shards_are_prefetched() -> None:
+    addresses = {"10 TEST STREET": ["1000010001"], "12 TEST STREET": ["1000010003"]}
+    fake = FakeGcs(_resolver_store(addresses))
+    resolver = ParcelAddressResolver(prefetch_top=4)
+    assert resolver.resolve(fake, "10 Test Street").generation.endswith("1824ab6b25f2")
+
+    newer = "20260803T000112004211Z-9b1f33c07a2e"
+    fake.store = _resolver_store(addresses, generation=newer)
+    fake.requests.clear()
+    during = resolver.resolve(fake, "10 Test Street")
+    assert resolver.prefetch.wait(5)
+    after = resolver.resolve(fake, "10 Test Street")
+
+    assert during.generation.endswith("1824ab6b25f2")
+    assert after.generation == newer
+    hot = hashlib.sha256(b"10 TEST STREET").hexdigest()[:2]
+    assert [name for name in fake.requests if "/shards/" in name] == [
+        f"{RESOLVER_PREFIX}/generations/{newer}/shards/{hot}.jsonl"
+    ]
+    stats = resolver.prefetch.stats()
+    assert stats["state"] == "done"
+    assert (stats["generation"], stats["total"], stats["loaded"]) == (newer, 1, 1)
+
+
+def test_old_generation_keeps_its_disk_shards_while_the_new_one_prefetches(
+    tmp_path,
+) -> None:
+    addresses = {"10 TEST STREET": ["1000010001"], "12 TEST STREET": ["1000010003"]}
+    old = "20260727T000234316462Z-1824ab6b25f2"
+    newer = "20260803T000112004211Z-9b1f33c07a2e"
+    release = threading.Event()
+
+    class GatedGcs(FakeGcs):
+        def download_bytes(self, *, object_name: str) -> tuple[bytes, str | None]:
+            if f"/{newer}/shards/" in object_name:
+                release.wait(5)
+            return super().download_bytes(object_name=object_name)
+
+    fake = GatedGcs(_resolver_store(addresses, generation=old))
+    disk = ShardDiskCache(tmp_path, max_bytes=10_000_000)
+    resolver = ParcelAddressResolver(
+        max_cached_shards=2, disk_cache=disk, prefetch_top=1
+    )
+    resolver.resolve(fake, "10 Test Street")
+
+    fake.store = {**fake.store, **_resolver_store(addresses, generation=newer)}
+    # The first check starts the (gated) prefetch; the old generation keeps
+    # serving, and a cold shard it reads is written to disk meanwhile.
+    assert resolver.resolve(fake, "10 Test Street").generation == old
+    assert resolver.resolve(fake, "12 Test Street").generation == old
+    release.set()
+    assert resolver.prefetch.wait(5)
+
+    resolver_dir = tmp_path / "resolver"
+    assert len(list((resolver_dir / old).glob("*.bin"))) == 2
+    assert len(list((resolver_dir / newer).glob("*.bin"))) == 1
+
+    assert resolver.resolve(fake, "10 Test Street").generation == newer
+    assert not (resolver_dir / old).exists()
+    # The prefetched shard survived the hold and serves a restart from disk.
+    restarted = ParcelAddressResolver(disk_cache=disk)
+    fake.requests.clear()
+    assert restarted.resolve(fake, "10 Test Street").generation == newer
+    assert not [name for name in fake.requests if "/shards/" in name]
+
+
+def test_batch_streams_ndjson_in_input_order_with_per_item_errors(
+    auth_override,
+) -> None:
+    auth_override()
+    fake = FakeGcs(
+        _resolver_store(
+            {
+                "464 OVINGTON AVENUE": ["3058920038"],
+                "10 TEST STREET": ["1000010001", "1000010002"],
+            }
+        )
+    )
+    app.dependency_overrides[parcel_intel_routes.get_gcs] = lambda: fake
+    addresses = [
+        "10 Test St, Manhattan, NY",
+        "464 Ovington Ave., Brooklyn, NY 11209",
+        "Brooklyn, NY",
+        "11 Test Street, Manhattan, NY",
+        "464 OVINGTON AVENUE",
+    ]
+
+    response = TestClient(app).post(
+        "/v1/parcel-intel/resolve-address/batch",
+        json={"addresses": addresses},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["cache-control"] == "private, no-store"
+    assert "Authorization" in response.headers["vary"]
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["index"] for line in lines] == list(range(len(addresses)))
+    assert [
+        line["result"]["match_status"] if line["result"] else line["status"]
+        for line in lines
+    ] == ["ambiguous", "unique", "error", "not_found", "unique"]
+    assert lines[2]["error_status"] == 422
+    assert lines[1]["result"]["candidates"] == [
+        {"bbl": "3058920038", "borough": "brooklyn"}
+    ]
+    assert "OVINGTON" not in response.text.upper()
+    shard_reads = [name for name in fake.requests if "/shards/" in name]
+    assert len(shard_reads) == len(set(shard_reads))
+
+
+def test_batch_reports_unexpected_shard_errors_per_item(caplog) -> None:
+    store = _resolver_store(
+        {"464 OVINGTON AVENUE": ["3058920038"], "10 TEST STREET": ["1000010001"]}
+    )
+    manifest = json.loads(store[f"{RESOLVER_PREFIX}/manifest.json"])
+    broken = hashlib.sha256(b"10 TEST STREET").hexdigest()[:2]
+    broken_object = manifest["artifacts"][broken]["object_name"]
+
+    class FlakyGcs(FakeGcs):
+        def download_bytes(self, *, object_name: str) -> tuple[bytes, str | None]:
+            if object_name == broken_object:
+                raise ConnectionError("gcs reset")
+            return super().download_bytes(object_name=object_name)
+
+    results = list(
+        ParcelAddressResolver().resolve_many(
+            FlakyGcs(store),
+            ["10 Test Street", "464 Ovington Avenue", "10 TEST STREET"],
+        )
+    )
+
+    assert [getattr(result, "status_code", None) for result in results] == [
+        503,
+        None,
+        503,
+    ]
+    assert results[0].detail == "Parcel address resolver is unavailable"
+    assert [candidate.bbl for candidate in results[1].candidates] == [
+        "3058920038"
+    ]
+    # One log line per failed shard, not per input.
+    assert caplog.text.count(f"resolver shard {broken} failed to load") == 1
+
+
+def test_batch_rate_limit_matches_the_single_route_per_address(auth_override) -> None:
+    auth_override()
+    fake = FakeGcs(_resolver_store({"10 TEST STREET": ["1000010001"]}))
+    app.dependency_overrides[parcel_intel_routes.get_gcs] = lambda: fake
+    client = TestClient(app)
+
+    full = client.post(
+        "/v1/parcel-intel/resolve-address/batch",
+        json={"addresses": ["10 Test Street"] * 5_000},
+    )
+    assert full.status_code == 200
+    assert len(full.text.splitlines()) == 5_000
+    # The burst is one full batch; the budget refills at 0.1 address/s.
+    again = client.post(
+        "/v1/parcel-intel/resolve-address/batch",
+        json={"addresses": ["10 Test Street"] * 10},
+    )
+    assert again.status_code == 429
+
+
+def test_batch_reports_failed_shards_per_item() -> None:
+    store = _resolver_store(
+        {"464 OVINGTON AVENUE": ["3058920038"], "10 TEST STREET": ["1000010001"]}
+    )
+    manifest = json.loads(store[f"{RESOLVER_PREFIX}/manifest.json"])
+    tampered = hashlib.sha256(b"10 TEST STREET").hexdigest()[:2]
+    assert tampered != hashlib.sha256(b"464 OVINGTON AVENUE").hexdigest()[:2]
+    store[manifest["artifacts"][tampered]["object_name"]] += b"tamper"
+    resolver = ParcelAddressResolver()
+
+    results = list(
+        resolver.resolve_many(
+            FakeGcs(store), ["10 Test Street", "464 Ovington Avenue", "x"]
+        )
+    )
+
+    assert results[0].status_code == 503
+    assert "integrity" in results[0].detail.lower()
+    assert [candidate.bbl for candidate in results[1].candidates] == [
+        "3058920038"
+    ]
+    assert results[2].status_code == 422
+    assert resolver.stats()["remote_fetches"] == 1
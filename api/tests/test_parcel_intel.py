@@ -14,7 +14,11 @@ from __future__ import annotations
 
 import hashlib
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from types import SimpleNamespace
 
 import pytest
 from fastapi.testclient import TestClient
@@ -22,8 +26,11 @@ from fastapi.testclient import TestClient
 from app.main import app
 from app.models.schemas import ParcelIntelRow
 from app.routes import parcel_intel as parcel_intel_routes
+from app.services import rate_limit
+from app.services.artifact_manifest_cache import ArtifactManifestCache
 from app.services.auth import maybe_auth
 from app.services.auth_context import AuthContext
+from app.services.parcel_official_dossier import ROW_FIELDS, OfficialParcelDossier
 
 
 class FakeGcs:
@@ -1203,6 +1210,135 @@ def test_parcel_intel_map_returns_full_authenticated_inventory(monkeypatch) -> N
     } <= vary
 
 
+def test_parcel_intel_map_bbox_and_tile_queries_keep_tiering(
+    monkeypatch,
+) -> None:
+    _set_required_env(monkeypatch)
+    # 30 Brooklyn rows march north from 40.680 in 0.001 degree steps; the
+    # first 25 are the public preview.
+    rows = [
+        _row(
+            f"30200001{i:02d}",
+            acquisition_rank=i + 1,
+            lat=40.680 + i * 0.001,
+            lng=-73.975,
+            owner_name="BROOKLYN OWNER LLC",
+        )
+        for i in range(30)
+    ]
+    fake = _make_fake_gcs(["brooklyn"], {"brooklyn": rows})
+    app.dependency_overrides[parcel_intel_routes.get_gcs] = lambda: fake
+    client = TestClient(app)
+    # Covers rows 20..29: five preview rows and five full-inventory rows.
+    window = "-73.98,40.6995,-73.97,40.7095"
+
+    anon = client.get("/v1/parcel-intel/map", params={"bbox": window})
+    assert anon.status_code == 200, anon.text
+    body = anon.json()
+    assert [row["bbl"] for row in body["rows"]] == [
+        f"30200001{i:02d}" for i in range(20, 25)
+    ]
+    assert all(row["owner_name"] is None for row in body["rows"])
+    assert body["access_scope"] == "public_preview"
+    assert body["bbox"] == [-73.98, 40.6995, -73.97, 40.7095]
+    # Anonymous counts stay citywide so small boxes cannot locate the
+    # unpublished part of the inventory.
+    assert body["available_count"] == 30
+    assert anon.headers["x-citylens-inventory-available"] == "30"
+    assert "s-maxage=600" in anon.headers["cache-control"]
+
+    _authed()
+    authed = client.get("/v1/parcel-intel/map", params={"bbox": window})
+    assert authed.status_code == 200, authed.text
+    authed_body = authed.json()
+    assert [row["bbl"] for row in authed_body["rows"]] == [
+        f"30200001{i:02d}" for i in range(20, 30)
+    ]
+    assert authed_body["rows"][0]["owner_name"] == "BROOKLYN OWNER LLC"
+    assert authed_body["available_count"] == 10
+    assert authed_body["inventory_complete"] is True
+    assert authed.headers["cache-control"] == "private, no-store"
+    assert "Authorization" in authed.headers["vary"]
+
+    tile = client.get("/v1/parcel-intel/map", params={"tile": "12/1206/1540"})
+    assert tile.status_code == 200, tile.text
+    assert tile.json()["returned_count"] == 30
+    empty = client.get("/v1/parcel-intel/map", params={"tile": "12/0/0"})
+    assert empty.json()["rows"] == []
+
+    for params in (
+        {"bbox": "1,2,3"},
+        {"bbox": "-73.9,40.7,-74.0,40.8"},
+        {"bbox": "a,b,c,d"},
+        {"tile": "3/8/0"},
+        {"tile": "3-1-1"},
+        {"bbox": window, "tile": "12/1206/1540"},
+    ):
+        assert client.get(
+            "/v1/parcel-intel/map", params=params
+        ).status_code == 422, params
+
+
+def test_parcel_intel_vector_tiles_are_tiered_and_cached(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    rows = [
+        _row(
+            f"30200001{i:02d}",
+            acquisition_rank=i + 1,
+            lat=40.680 + i * 0.001,
+            lng=-73.975,
+            owner_name="BROOKLYN OWNER LLC",
+        )
+        for i in range(30)
+    ]
+    fake = _make_atomic_fake_gcs(["brooklyn"], {"brooklyn": rows})
+    app.dependency_overrides[parcel_intel_routes.get_gcs] = lambda: fake
+    client = TestClient(app)
+    generation = "20260723T230308737433Z-aaaaaaaaaaaa"
+    path = "/v1/parcel-intel/tiles/12/1206/1540.mvt"
+
+    anon = client.get(path)
+    assert anon.status_code == 200, anon.text
+    assert anon.headers["content-type"] == "application/vnd.mapbox-vector-tile"
+    assert anon.headers["x-citylens-inventory-scope"] == "public_preview"
+    assert "s-maxage=600" in anon.headers["cache-control"]
+    assert b"parcels" in anon.content
+    assert b"3020000124" in anon.content
+    assert b"3020000125" not in anon.content
+    # Premium attributes are absent from anonymous tiles, keys included.
+    assert b"owner_name" not in anon.content
+    assert b"BROOKLYN OWNER LLC" not in anon.content
+
+    pinned = client.get(path, params={"generation": generation})
+    assert pinned.status_code == 200
+    assert pinned.content == anon.content
+    assert "immutable" in pinned.headers["cache-control"]
+    stale = client.get(path, params={"generation": "20250101T000000000000Z-old"})
+    assert stale.status_code == 404
+
+    assert client.get("/v1/parcel-intel/tiles/3/8/0.mvt").status_code == 404
+    assert client.get("/v1/parcel-intel/tiles/23/0/0.mvt").status_code == 422
+    empty = client.get("/v1/parcel-intel/tiles/12/0/0.mvt")
+    assert empty.status_code == 200
+    assert empty.content == b""
+
+    _authed()
+    authed = client.get(path, params={"generation": generation})
+    assert authed.status_code == 200, authed.text
+    assert authed.headers["cache-control"] == "private, no-store"
+    assert authed.headers["x-citylens-inventory-scope"] == "authenticated_full"
+    assert b"3020000129" in authed.content
+    assert b"owner_name" in authed.content
+    assert b"BROOKLYN OWNER LLC" in authed.content
+
+    # Each (tier, tile) is encoded once per generation.
+    registry = parcel_intel_routes.get_registry()
+    cached = set(registry._tiles)
+    client.get(path)
+    assert set(registry._tiles) == cached
+    assert {key[1] for key in cached} == {"public_preview", "authenticated_full"}
+
+
 def test_parcel_detail_is_tiered_and_keeps_geometry(monkeypatch) -> None:
     _set_required_env(monkeypatch)
     geometry = {
@@ -1381,6 +1517,138 @@ def test_parcel_detail_is_tiered_and_keeps_geometry(monkeypatch) -> None:
     assert private.headers["cache-control"] == "private, no-store"
 
 
+def test_registry_announces_each_new_generation_once(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    announced: list[tuple[object, object]] = []
+    registry = parcel_intel_routes.ParcelIntelRegistry(
+        manifest_cache=ArtifactManifestCache(ttl_seconds=0),
+        on_new_generation=lambda reg, gcs: announced.append((reg, gcs)),
+    )
+    fake = _make_fake_gcs(["brooklyn"])
+
+    registry.index(fake)
+    registry.borough(fake, "brooklyn")
+    assert announced == [(registry, fake)]
+
+    fake._store["parcel-intel/v1/manifest.json"] = json.dumps(
+        _manifest(["brooklyn"], generated_at="2026-05-09T00:00:00+00:00")
+    ).encode("utf-8")
+    registry.index(fake)
+    assert len(announced) == 2
+
+
+class _FakeDossiers:
+    def __init__(self, known: set[str]) -> None:
+        self.known = known
+        self.calls: list[list[str]] = []
+
+    def get_many(self, gcs, bbls) -> dict[str, OfficialParcelDossier]:
+        bbls = list(bbls)
+        self.calls.append(bbls)
+        row = {field: None for field in ROW_FIELDS}
+        row.update(f07=False, f15=False, er=False, a="1 TEST STREET")
+        return {
+            bbl: OfficialParcelDossier(
+                row={**row, "b": bbl},
+                borough="brooklyn",
+                generation="20260727T005131244552Z-9624c5a2e365",
+                pluto_retrieved_at=datetime(2026, 7, 20, tzinfo=timezone.utc),
+                acris_updated_at=datetime(2026, 7, 21, tzinfo=timezone.utc),
+            )
+            for bbl in bbls
+            if bbl in self.known
+        }
+
+
+def test_parcel_batch_returns_single_parcel_payloads_per_item(
+    monkeypatch,
+) -> None:
+    _set_required_env(monkeypatch)
+    rows = [
+        _row("3020000001", acquisition_rank=1, owner_name="ACME REALTY LLC"),
+        _row("3020000026", acquisition_rank=26),
+    ]
+    fake = _make_fake_gcs(["brooklyn"], {"brooklyn": rows})
+    dossiers = _FakeDossiers({"3020000001", "3099999999"})
+    app.dependency_overrides[parcel_intel_routes.get_gcs] = lambda: fake
+    app.dependency_overrides[parcel_intel_routes.get_official_dossiers] = (
+        lambda: dossiers
+    )
+    client = TestClient(app)
+    requested = ["3099999999", "3020000026", "3020000001", "1000000001"]
+
+    anonymous = client.post(
+        "/v1/parcel-intel/parcels/batch", json={"bbls": requested}
+    )
+    assert anonymous.status_code == 401
+    assert dossiers.calls == []
+
+    _authed()
+    response = client.post(
+        "/v1/parcel-intel/parcels/batch", json={"bbls": requested}
+    )
+    assert response.status_code == 200, response.text
+    assert response.headers["cache-control"] == "private, no-store"
+    assert "x-citylens-parcel-smoke-key" in response.headers["vary"].lower()
+    payload = response.json()
+    assert payload["schema_version"] == "citylens/parcel-batch@v1"
+    items = {item["bbl"]: item for item in payload["items"]}
+    assert [item["bbl"] for item in payload["items"]] == requested
+    assert items["3099999999"]["dossier_status"] == "found"
+    assert items["3099999999"]["parcel_status"] == "not_found"
+    assert items["3099999999"]["parcel"] is None
+    assert items["3020000026"]["dossier"] is None
+    assert items["1000000001"]["dossier_status"] == "not_found"
+    assert items["1000000001"]["parcel_status"] == "not_found"
+
+    single = client.get("/v1/parcel-intel/parcel/3020000001").json()
+    assert items["3020000001"]["parcel"] == single
+    assert items["3020000001"]["parcel"]["owner_name"] == "ACME REALTY LLC"
+    assert items["3020000001"]["dossier"]["official_links"]["zola"].endswith(
+        "/3/2000/1"
+    )
+    # One dossier lookup and one borough feed read serve the whole batch.
+    assert dossiers.calls == [requested]
+    assert fake.requests.count("parcel-intel/v1/brooklyn.jsonl") == 1
+
+    for bad in ([], ["3020000001"] * 2, ["302000000X"], ["3020000001"] * 201):
+        rejected = client.post("/v1/parcel-intel/parcels/batch", json={"bbls": bad})
+        assert rejected.status_code == 422, bad
+    duplicate = client.post(
+        "/v1/parcel-intel/parcels/batch", json={"bbls": ["3020000001"] * 2}
+    )
+    assert duplicate.json()["detail"][0]["type"] == "duplicate_bbls"
+
+
+def test_parcel_batch_rate_limit_matches_single_dossier_calls(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    fake = _make_fake_gcs(["brooklyn"], {"brooklyn": []})
+    app.dependency_overrides[parcel_intel_routes.get_gcs] = lambda: fake
+    app.dependency_overrides[parcel_intel_routes.get_official_dossiers] = (
+        lambda: _FakeDossiers(set())
+    )
+    now = [1_000.0]
+    monkeypatch.setattr(
+        rate_limit, "time", SimpleNamespace(monotonic=lambda: now[0])
+    )
+    client = TestClient(app)
+    _authed()
+
+    def batch(count: int) -> int:
+        bbls = [f"30200{index:05d}" for index in range(1, count + 1)]
+        return client.post(
+            "/v1/parcel-intel/parcels/batch", json={"bbls": bbls}
+        ).status_code
+
+    assert batch(200) == 200
+    assert batch(1) == 429
+    # Each lot costs what one dossier call does: the budget refills at 0.25/s.
+    now[0] += 4.0
+    assert batch(2) == 429
+    assert batch(1) == 200
+    assert batch(1) == 429
+
+
 def test_parcel_intel_rejects_unknown_borough(monkeypatch) -> None:
     _set_required_env(monkeypatch)
     fake = _make_fake_gcs(["brooklyn"])
@@ -1538,6 +1806,71 @@ def test_parcel_intel_invalidates_cache_on_new_generated_at(monkeypatch) -> None
     assert second.json()["rows"][0]["address"] == "ROW V2"
 
 
+def test_borough_rows_are_validated_once_and_indexed_by_bbl() -> None:
+    fake = _make_fake_gcs(
+        ["brooklyn"],
+        {
+            "brooklyn": [
+                _row("3020000001", address="FIRST"),
+                _row("3020000002", address="SECOND"),
+                _row("3020000001", address="DUPLICATE"),
+            ]
+        },
+    )
+    registry = parcel_intel_routes.ParcelIntelRegistry()
+
+    first_rows, _ = registry.borough(fake, "brooklyn")
+    second_rows, _ = registry.borough(fake, "brooklyn")
+    row, _ = registry.parcel(fake, "3020000002")
+    duplicate, _ = registry.parcel(fake, "3020000001")
+
+    assert second_rows is first_rows
+    assert [r.address for r in first_rows.head(2)] == ["FIRST", "SECOND"]
+    assert row is first_rows[1]
+    assert duplicate.address == "FIRST"
+    assert fake.requests.count("parcel-intel/v1/brooklyn.jsonl") == 1
+    with pytest.raises(parcel_intel_routes.HTTPException) as exc_info:
+        registry.parcel(fake, "3020000009")
+    assert exc_info.value.status_code == 404
+
+
+def test_concurrent_cold_requests_download_each_artifact_once() -> None:
+    fake = _make_atomic_fake_gcs(
+        ["brooklyn"], {"brooklyn": [_row("3020000001")]}
+    )
+    download = fake.download_bytes
+
+    def _slow_download(*, object_name: str) -> tuple[bytes, str | None]:
+        if not object_name.endswith("manifest.json"):
+            time.sleep(0.05)
+        return download(object_name=object_name)
+
+    fake.download_bytes = _slow_download
+    registry = parcel_intel_routes.ParcelIntelRegistry()
+    barrier = threading.Barrier(64)
+
+    def _request(index: int) -> int:
+        barrier.wait()
+        if index % 2:
+            rows, _ = registry.citywide_map(fake)
+        else:
+            rows, _ = registry.borough(fake, "brooklyn")
+        return len(rows)
+
+    with ThreadPoolExecutor(max_workers=64) as pool:
+        counts = list(pool.map(_request, range(64)))
+
+    assert counts == [1] * 64
+    artifact_reads = [
+        name for name in fake.requests if not name.endswith("manifest.json")
+    ]
+    prefix = "parcel-intel/v1/generations/20260723T230308737433Z-aaaaaaaaaaaa"
+    assert sorted(artifact_reads) == [
+        f"{prefix}/brooklyn.jsonl",
+        f"{prefix}/map.jsonl",
+    ]
+
+
 def test_atomic_manifest_reads_immutable_generation_not_legacy_files(
     monkeypatch,
 ) -> None:
@@ -1597,6 +1930,48 @@ def test_atomic_artifact_checksum_mismatch_fails_closed(monkeypatch) -> None:
     )
 
 
+class StreamingFakeGcs(FakeGcs):
+    """FakeGcs that also streams artifacts in tiny chunks."""
+
+    def __init__(self, store: dict[str, bytes]) -> None:
+        super().__init__(store)
+        self.streamed: list[str] = []
+
+    def open_chunks(self, *, object_name: str):
+        self.streamed.append(object_name)
+        if object_name not in self._store:
+            raise FileNotFoundError(object_name)
+        body = self._store[object_name]
+        return (body[i : i + 5] for i in range(0, len(body), 5))
+
+
+def test_atomic_artifacts_are_streamed_and_verified_before_caching() -> None:
+    atomic = _make_atomic_fake_gcs(
+        ["brooklyn"],
+        {"brooklyn": [_row("3020000001", address="ORIGINAL")]},
+    )
+    fake = StreamingFakeGcs(dict(atomic._store))
+    manifest = json.loads(fake._store["parcel-intel/v1/manifest.json"])
+    object_name = manifest["artifacts"]["brooklyn.jsonl"]["object_name"]
+    original = fake._store[object_name]
+    fake._store[object_name] = original.replace(b"ORIGINAL", b"TAMPERED")
+    registry = parcel_intel_routes.ParcelIntelRegistry()
+
+    with pytest.raises(parcel_intel_routes.HTTPException) as exc_info:
+        registry.borough(fake, "brooklyn")
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.detail == (
+        "Parcel intelligence artifact integrity check failed"
+    )
+
+    fake._store[object_name] = original
+    rows, _ = registry.borough(fake, "brooklyn")
+
+    assert [row.address for row in rows] == ["ORIGINAL"]
+    assert fake.streamed == [object_name, object_name]
+    assert object_name not in fake.requests
+
+
 def test_atomic_manifest_rejects_untrusted_artifact_prefix(monkeypatch) -> None:
     _set_required_env(monkeypatch)
     fake = _make_atomic_fake_gcs(["brooklyn"])
@@ -1716,6 +2091,150 @@ def test_anon_sweep_capped_at_25_rows(monkeypatch) -> None:
     assert "s-maxage=600" in r.headers["cache-control"]
 
 
+def test_anon_preview_bodies_are_built_once_and_support_304(
+    monkeypatch,
+) -> None:
+    _set_required_env(monkeypatch)
+    rows = [_row(f"30200001{i:02d}") for i in range(30)]
+    fake = _make_fake_gcs(["brooklyn"], {"brooklyn": rows})
+    app.dependency_overrides[parcel_intel_routes.get_gcs] = lambda: fake
+    strip_calls: list[str] = []
+    strip_row = parcel_intel_routes._strip_premium_fields
+    strip_map_row = parcel_intel_routes._strip_map_premium_fields
+
+    def _counting_strip(row):
+        strip_calls.append("sweep")
+        return strip_row(row)
+
+    def _counting_map_strip(row):
+        strip_calls.append("map")
+        return strip_map_row(row)
+
+    monkeypatch.setattr(
+        parcel_intel_routes, "_strip_premium_fields", _counting_strip
+    )
+    monkeypatch.setattr(
+        parcel_intel_routes, "_strip_map_premium_fields", _counting_map_strip
+    )
+
+    client = TestClient(app)
+    params = {"borough": "brooklyn", "top": 10}
+    first = client.get("/v1/parcel-intel/sweep", params=params)
+    second = client.get("/v1/parcel-intel/sweep", params=params)
+    wider = client.get(
+        "/v1/parcel-intel/sweep", params={"borough": "brooklyn", "top": 25}
+    )
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content
+    assert len(first.json()["rows"]) == 10
+    assert len(wider.json()["rows"]) == 25
+    etag = first.headers["etag"]
+    assert etag.startswith('"') and etag == second.headers["etag"]
+    assert wider.headers["etag"] != etag
+
+    not_modified = client.get(
+        "/v1/parcel-intel/sweep",
+        params=params,
+        headers={"If-None-Match": f'W/"other", {etag}'},
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    assert "s-maxage=600" in not_modified.headers["cache-control"]
+    assert "Authorization" in not_modified.headers["vary"]
+
+    maps = [
+        client.get("/v1/parcel-intel/map", params={"top_per_borough": top})
+        for top in (1000, 1000, 5)
+    ]
+    assert [len(r.json()["rows"]) for r in maps] == [25, 25, 5]
+    assert maps[0].headers["etag"] == maps[1].headers["etag"]
+    assert maps[2].headers["x-citylens-inventory-count"] == "5"
+    assert maps[2].headers["x-citylens-inventory-available"] == "30"
+    map_304 = client.get(
+        "/v1/parcel-intel/map",
+        headers={"If-None-Match": maps[0].headers["etag"]},
+    )
+    assert map_304.status_code == 304
+    assert map_304.headers["x-citylens-inventory-scope"] == "public_preview"
+
+    # Every preview row was stripped exactly once for the generation.
+    assert strip_calls.count("sweep") == 25
+    assert strip_calls.count("map") == 25
+
+    _authed()
+    authed = client.get(
+        "/v1/parcel-intel/sweep",
+        params=params,
+        headers={"If-None-Match": etag},
+    )
+    assert authed.status_code == 200
+    assert authed.headers["etag"] != etag
+    assert authed.headers["cache-control"] == "private, no-store"
+
+
+def test_authed_map_body_is_serialized_and_compressed_once(
+    monkeypatch,
+) -> None:
+    _set_required_env(monkeypatch)
+    rows = [_row(f"30200001{i:02d}") for i in range(30)]
+    fake = _make_fake_gcs(["brooklyn"], {"brooklyn": rows})
+    app.dependency_overrides[parcel_intel_routes.get_gcs] = lambda: fake
+    _authed()
+    prepared: list[int] = []
+    from_model = parcel_intel_routes.PreparedJson.from_model
+
+    def _counting_from_model(model):
+        prepared.append(1)
+        return from_model(model)
+
+    monkeypatch.setattr(
+        parcel_intel_routes.PreparedJson,
+        "from_model",
+        staticmethod(_counting_from_model),
+    )
+
+    client = TestClient(app)
+    gzip_headers = {"Accept-Encoding": "gzip"}
+    first = client.get("/v1/parcel-intel/map", headers=gzip_headers)
+    second = client.get("/v1/parcel-intel/map", headers=gzip_headers)
+    identity = client.get(
+        "/v1/parcel-intel/map", headers={"Accept-Encoding": "identity"}
+    )
+
+    assert first.status_code == second.status_code == identity.status_code == 200
+    assert len(first.json()["rows"]) == 30
+    assert first.json() == identity.json()
+    assert first.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in identity.headers
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.headers["etag"].endswith('-gzip"')
+    assert identity.headers["etag"] != first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-store"
+    vary = {v.strip().lower() for v in first.headers["vary"].split(",")}
+    assert {
+        "authorization",
+        "x-api-key",
+        "x-citylens-parcel-smoke-key",
+        "accept-encoding",
+    } <= vary
+    assert first.headers["x-citylens-inventory-scope"] == "authenticated_full"
+    assert first.headers["x-citylens-inventory-count"] == "30"
+
+    not_modified = client.get(
+        "/v1/parcel-intel/map",
+        headers={**gzip_headers, "If-None-Match": first.headers["etag"]},
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.headers["cache-control"] == "private, no-store"
+    # The identity validator names the same body, so it also revalidates.
+    assert client.get(
+        "/v1/parcel-intel/map",
+        headers={"If-None-Match": identity.headers["etag"]},
+    ).status_code == 304
+    assert len(prepared) == 1
+
+
 def test_anon_sweep_strips_premium_fields(monkeypatch) -> None:
     _set_required_env(monkeypatch)
     feats = [
@@ -2067,3 +2586,106 @@ def test_change_and_owner_fields_default_when_absent(monkeypatch) -> None:
     assert served["change_latest_imagery_year"] is None
     assert served["recent_change"] is False
     assert served["owner_name"] is None
+
+
+def test_workflow_lookups_touch_only_requested_bbls_once_per_generation(
+    monkeypatch,
+) -> None:
+    rows = [_row(f"30200001{i:02d}", acquisition_rank=i + 1) for i in range(30)]
+    fake = _make_fake_gcs(["brooklyn"], {"brooklyn": rows})
+    registry = parcel_intel_routes.ParcelIntelRegistry()
+    audits: list[str] = []
+    build_audit = parcel_intel_routes.build_parcel_decision_audit
+
+    def _counting_audit(row, manifest, *, premium_access):
+        audits.append(row.bbl)
+        return build_audit(row, manifest, premium_access=premium_access)
+
+    monkeypatch.setattr(
+        parcel_intel_routes, "build_parcel_decision_audit", _counting_audit
+    )
+
+    wanted = {"3020000103", "3020000107", "3999999999"}
+    current, manifest = registry.map_rows_by_bbl(fake, wanted)
+    assert set(current) == {"3020000103", "3020000107"}
+    assert current["3020000103"]["acquisition_rank"] == 4
+    assert manifest["generated_at"] == "2026-05-08T00:00:00+00:00"
+
+    checks, _ = registry.decision_audit_checks(fake, {"3020000103"})
+    assert set(checks) == {"3020000103"}
+    assert checks["3020000103"]
+    assert all(
+        check["key"] == key for key, check in checks["3020000103"].items()
+    )
+
+    again, _ = registry.map_rows_by_bbl(fake, {"3020000103"})
+    assert again["3020000103"] is current["3020000103"]
+    registry.decision_audit_checks(fake, {"3020000103", "3020000107"})
+    assert audits == ["3020000103", "3020000107"]
+
+    # A republish drops every per-BBL memo with the rest of the caches.
+    moved = [_row("3020000103", acquisition_rank=99)]
+    newer = _make_fake_gcs(
+        ["brooklyn"],
+        {"brooklyn": moved},
+        generated_at="2026-06-08T00:00:00+00:00",
+    )
+    refreshed, _ = registry.map_rows_by_bbl(newer, wanted)
+    assert refreshed["3020000103"]["acquisition_rank"] == 99
+    registry.decision_audit_checks(newer, wanted)
+    assert audits[-1] == "3020000103"
+    assert len(audits) == 3
+
+
+def test_parcel_decision_audits_are_memoized_per_generation_and_tier(
+    monkeypatch,
+) -> None:
+    _set_required_env(monkeypatch)
+    rows = [
+        _row("3020000001", acquisition_rank=1, owner_name="ACME REALTY LLC")
+    ]
+    fake = _make_fake_gcs(["brooklyn"], {"brooklyn": rows})
+    app.dependency_overrides[parcel_intel_routes.get_gcs] = lambda: fake
+    registry = parcel_intel_routes.ParcelIntelRegistry()
+    app.dependency_overrides[parcel_intel_routes.get_registry] = lambda: registry
+    built: list[bool] = []
+    build_audit = parcel_intel_routes.build_parcel_decision_audit
+
+    def _counting_audit(row, manifest, *, premium_access):
+        built.append(premium_access)
+        return build_audit(row, manifest, premium_access=premium_access)
+
+    monkeypatch.setattr(
+        parcel_intel_routes, "build_parcel_decision_audit", _counting_audit
+    )
+    client = TestClient(app)
+
+    public = [client.get("/v1/parcel-intel/parcel/3020000001") for _ in range(3)]
+    _authed()
+    authed = [client.get("/v1/parcel-intel/parcel/3020000001") for _ in range(2)]
+
+    assert {response.status_code for response in public + authed} == {200}
+    assert public[0].json() == public[2].json()
+    assert public[0].json()["decision_audit"] != authed[0].json()["decision_audit"]
+    # One build per tier; the rest are memo hits.
+    assert built == [False, True]
+    stats = registry.decision_audit_stats()
+    assert stats["entries"] == 2
+    assert stats["hits"] == 3
+    assert stats["misses"] == 2
+    assert stats["hit_rate"] == 0.6
+
+    # Alert checks for the same lead reuse the premium audit.
+    checks, _ = registry.decision_audit_checks(fake, {"3020000001"})
+    assert set(checks["3020000001"]) == {
+        check["key"] for check in authed[0].json()["decision_audit"]["checks"]
+    }
+    assert built == [False, True]
+
+    newer = _make_fake_gcs(
+        ["brooklyn"], {"brooklyn": rows}, generated_at="2026-06-08T00:00:00+00:00"
+    )
+    app.dependency_overrides[parcel_intel_routes.get_gcs] = lambda: newer
+    assert client.get("/v1/parcel-intel/parcel/3020000001").status_code == 200
+    assert built == [False, True, True]
+    assert registry.decision_audit_stats()["entries"] == 1
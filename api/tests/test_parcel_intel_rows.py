@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from app.services.parcel_intel_rows import ParcelRowIndex
+
+
+@dataclass(frozen=True)
+class _Row:
+    bbl: str
+    rank: int
+
+
+def test_row_index_keeps_published_order_and_first_bbl_wins() -> None:
+    rows = [_Row("3000000001", 1), _Row("3000000002", 2), _Row("3000000001", 3)]
+
+    index = ParcelRowIndex(rows)
+
+    assert len(index) == 3
+    assert [row.rank for row in index] == [1, 2, 3]
+    assert index.get("3000000001") == _Row("3000000001", 1)
+    assert index.get("3000000002") is rows[1]
+    assert index.get("3000000009") is None
+    assert "3000000002" in index
+    assert "3000000009" not in index
+
+
+def test_row_index_slices_are_immutable_tuples() -> None:
+    index = ParcelRowIndex(_Row(f"30000000{i:02d}", i) for i in range(5))
+
+    assert index.head(2) == (_Row("3000000000", 0), _Row("3000000001", 1))
+    assert index.head(0) == ()
+    assert index.head(-1) == ()
+    assert index[1:3] == index.rows[1:3]
+    assert isinstance(index.rows, tuple)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import struct
+
+from app.services.parcel_mvt import encode_point_layer, tile_pixel
+
+
+def _fields(buf: bytes) -> list[tuple[int, int | bytes]]:
+    """Minimal protobuf reader: (field, varint | fixed64 bytes | payload)."""
+    out: list[tuple[int, int | bytes]] = []
+    pos = 0
+
+    def _varint() -> int:
+        nonlocal pos
+        shift = value = 0
+        while True:
+            byte = buf[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                return value
+
+    while pos < len(buf):
+        key = _varint()
+        field, wire_type = key >> 3, key & 0x7
+        if wire_type == 0:
+            out.append((field, _varint()))
+        elif wire_type == 1:
+            out.append((field, buf[pos : pos + 8]))
+            pos += 8
+        else:
+            length = _varint()
+            out.append((field, buf[pos : pos + length]))
+            pos += length
+    return out
+
+
+def _packed(buf: bytes) -> list[int]:
+    values = []
+    pos = 0
+    while pos < len(buf):
+        shift = value = 0
+        while True:
+            byte = buf[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                break
+        values.append(value)
+    return values
+
+
+def _unzigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+
+def _decode(tile: bytes) -> dict:
+    ((field, layer_bytes),) = _fields(tile)
+    assert field == 3
+    layer = _fields(layer_bytes)
+    keys = [v.decode() for f, v in layer if f == 3]
+    values = []
+    for f, raw in layer:
+        if f != 4:
+            continue
+        ((kind, value),) = _fields(raw)
+        if kind == 1:
+            values.append(value.decode())
+        elif kind == 3:
+            values.append(struct.unpack("<d", value)[0])
+        elif kind == 6:
+            values.append(_unzigzag(value))
+        elif kind == 7:
+            values.append(bool(value))
+    features = []
+    for f, raw in layer:
+        if f != 2:
+            continue
+        parts = dict(_fields(raw))
+        tags = _packed(parts[2])
+        command, dx, dy = _packed(parts[4])
+        assert command == 9 and parts[3] == 1
+        features.append(
+            {
+                "id": parts.get(1),
+                "xy": (_unzigzag(dx), _unzigzag(dy)),
+                "properties": {
+                    keys[tags[i]]: values[tags[i + 1]]
+                    for i in range(0, len(tags), 2)
+                },
+            }
+        )
+    meta = {f: v for f, v in layer if f in (1, 5, 15)}
+    return {
+        "name": meta[1].decode(),
+        "extent": meta[5],
+        "version": meta[15],
+        "features": features,
+    }
+
+
+def test_point_layer_round_trips_ids_geometry_and_typed_properties() -> None:
+    tile = encode_point_layer(
+        "parcels",
+        [
+            (
+                3020000101,
+                (10, 4000),
+                {
+                    "bbl": "3020000101",
+                    "score": 0.5,
+                    "delta": -3,
+                    "recent_change": True,
+                    "routes": ["2", "3"],
+                    "owner_name": None,
+                },
+            ),
+            (None, (-20, 5), {"bbl": "3020000102", "score": 0.5}),
+        ],
+    )
+
+    decoded = _decode(tile)
+
+    assert decoded["name"] == "parcels"
+    assert decoded["extent"] == 4096
+    assert decoded["version"] == 2
+    first, second = decoded["features"]
+    assert first["id"] == 3020000101
+    assert first["xy"] == (10, 4000)
+    assert first["properties"] == {
+        "bbl": "3020000101",
+        "score": 0.5,
+        "delta": -3,
+        "recent_change": True,
+        "routes": "2, 3",
+    }
+    assert second["id"] is None
+    assert second["xy"] == (-20, 5)
+    assert second["properties"] == {"bbl": "3020000102", "score": 0.5}
+
+
+def test_empty_layer_is_an_empty_tile() -> None:
+    assert encode_point_layer("parcels", []) == b""
+
+
+def test_tile_pixel_projects_into_tile_space() -> None:
+    # Zoom-15 tile covering downtown Brooklyn; the point is inside it.
+    px, py = tile_pixel(-73.9855, 40.6925, 15, 9649, 12322)
+    assert 0 <= px < 4096 and 0 <= py < 4096
+    # The tile's north-west corner maps to the origin.
+    assert tile_pixel(-180.0, 0.0, 1, 0, 1) == (0, 0)
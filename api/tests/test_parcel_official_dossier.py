@@ -5,6 +5,7 @@ import hashlib
 import json
 
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
 from app.main import app
@@ -15,8 +16,10 @@ from app.services.parcel_official_dossier import (
     DOSSIER_SCHEMA,
     PUBLICATION_SCHEMA,
     ROW_FIELDS,
+    CompactDossierShard,
     ParcelOfficialDossierStore,
 )
+from app.services.shard_disk_cache import ShardDiskCache
 
 
 class FakeGcs:
@@ -244,7 +247,7 @@ def test_sales_comparables_route_uses_private_authenticated_dossier(
     class FakeComparables:
         calls: list[tuple[str, dict]] = []
 
-        def get(self, bbl: str, *, dossier_row: dict) -> dict:
+        async def aget(self, bbl: str, *, dossier_row: dict) -> dict:
             self.calls.append((bbl, dossier_row))
             return {
                 "schema_version": (
@@ -423,3 +426,92 @@ def test_read_only_parcel_smoke_key_can_verify_dossier_but_not_workflow(
     assert dossier.status_code == 200
     assert dossier.json()["bbl"] == "3058920038"
     assert workflow.status_code == 401
+
+
+def test_disk_tier_serves_evicted_and_restarted_shards_without_gcs(
+    tmp_path,
+) -> None:
+    other = _other_bbl_in_same_shard("3058920038")
+    fake = FakeGcs(_store([_row(), _row(other, pluto_owner=None)]))
+    disk = ShardDiskCache(tmp_path, max_bytes=10_000_000)
+    store = ParcelOfficialDossierStore(max_cached_shards=1, disk_cache=disk)
+
+    first = store.get(fake, "3058920038")
+    shard_reads = [name for name in fake.requests if "/shards/" in name]
+    assert len(shard_reads) == 1
+
+    # A warm restart (fresh in-process LRU) pages the shard in from disk.
+    restarted = ParcelOfficialDossierStore(disk_cache=disk)
+    again = restarted.get(fake, "3058920038")
+    neighbour = restarted.get(fake, other)
+    assert [name for name in fake.requests if "/shards/" in name] == shard_reads
+    assert again.row == first.row
+    assert neighbour.row["po"] is None
+    with pytest.raises(HTTPException) as missing:
+        restarted.get(fake, _other_bbl_in_same_shard(other))
+    assert missing.value.status_code == 404
+
+    assert store.stats()["remote_fetches"] == 1
+    stats = restarted.stats()
+    assert stats["remote_fetches"] == 0
+    assert stats["disk"] == {
+        "enabled": True,
+        "hits": 1,
+        "misses": 0,
+        "hit_ratio": 1.0,
+    }
+    assert stats["memory"]["hits"] == 2
+    assert stats["memory"]["misses"] == 1
+
+
+def test_get_many_loads_each_shard_once_and_omits_missing_lots() -> None:
+    other = _other_bbl_in_same_shard("3058920038")
+    missing = _other_bbl_in_same_shard(other)
+    fake = FakeGcs(
+        _store([_row(), _row(other, pluto_owner=None), _row("1000010001")])
+    )
+    store = ParcelOfficialDossierStore()
+
+    found = store.get_many(fake, ["1000010001", "3058920038", missing, other])
+
+    assert sorted(found) == sorted(["1000010001", "3058920038", other])
+    assert found[other].row["po"] is None
+    assert found["1000010001"].borough == "manhattan"
+    assert found["3058920038"] == store.get(fake, "3058920038")
+    shard_reads = [name for name in fake.requests if "/shards/" in name]
+    assert len(shard_reads) == len(set(shard_reads)) == 2
+    assert store.get_many(fake, []) == {}
+    with pytest.raises(HTTPException) as invalid:
+        store.get_many(fake, ["3058920038", "not-a-bbl"])
+    assert invalid.value.status_code == 422
+
+
+def test_compact_shard_round_trips_rows_exactly() -> None:
+    rows = {
+        "3058920038": _row(),
+        "1000010001": {
+            **_row("1000010001", pluto_owner=None, acris_owner="ÉCOLE LLC"),
+            "sp": None,
+            "yh": 0,
+            "la": 12.5,
+            "f07": True,
+            "z2": "R6A",
+        },
+        "5000020002": _row("5000020002"),
+    }
+    shard = CompactDossierShard(rows)
+
+    assert len(shard) == 3
+    assert list(shard) == sorted(rows)
+    assert dict(shard.items()) == rows
+    for bbl, row in rows.items():
+        materialized = shard[bbl]
+        assert list(materialized) == ROW_FIELDS
+        assert {key: type(value) for key, value in materialized.items()} == {
+            key: type(value) for key, value in row.items()
+        }
+    assert shard.get("3058920039") is None
+    assert "305892003" not in shard
+    assert " 3058920038" not in shard
+    assert 3058920038 not in shard
+    assert dict(CompactDossierShard({}).items()) == {}
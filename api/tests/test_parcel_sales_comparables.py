@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
 
 import httpx
 import pytest
 from fastapi import HTTPException
+from scripts._sales_ranking_reference import ranked_scalar
 
 from app.models.schemas import ParcelSalesComparablesResponse
+from app.services.outbound_http import OutboundHttp
 from app.services.parcel_sales_comparables import (
     PLUTO_DATASET_ID,
     SALES_DATASET_ID,
     ParcelSalesComparableService,
+    _SalesWindow,
+    _Subject,
 )
 
 SUBJECT_BBL = "3058920038"
@@ -66,11 +72,19 @@ def _service(
     *,
     subject_rows: list[dict[str, str]] | None = None,
     sales_rows: list[dict[str, str]] | None = None,
+    now=lambda: NOW,
+    sales_down: list[bool] | None = None,
+    pluto_down: list[bool] | None = None,
+    **options,
 ) -> tuple[ParcelSalesComparableService, list[httpx.Request]]:
     requests: list[httpx.Request] = []
 
     def handler(request: httpx.Request) -> httpx.Response:
         requests.append(request)
+        if SALES_DATASET_ID in request.url.path and sales_down and sales_down[0]:
+            return httpx.Response(504, json={"error": "timeout"})
+        if PLUTO_DATASET_ID in request.url.path and pluto_down and pluto_down[0]:
+            return httpx.Response(504, json={"error": "timeout"})
         if PLUTO_DATASET_ID in request.url.path:
             return httpx.Response(
                 200,
@@ -92,11 +106,12 @@ def _service(
             )
         raise AssertionError(f"Unexpected URL: {request.url}")
 
-    client = httpx.Client(transport=httpx.MockTransport(handler))
+    http = OutboundHttp(transport=httpx.MockTransport(handler))
     return (
         ParcelSalesComparableService(
-            http_client=client,
-            now=lambda: NOW,
+            http=http,
+            now=now,
+            **options,
         ),
         requests,
     )
@@ -203,9 +218,7 @@ def test_source_failures_are_explicit_service_unavailable() -> None:
         return httpx.Response(429, json={"error": "rate limited"})
 
     service = ParcelSalesComparableService(
-        http_client=httpx.Client(
-            transport=httpx.MockTransport(handler),
-        ),
+        http=OutboundHttp(transport=httpx.MockTransport(handler)),
         now=lambda: NOW,
     )
 
@@ -217,3 +230,228 @@ def test_source_failures_are_explicit_service_unavailable() -> None:
 
     assert exc_info.value.status_code == 503
     assert "temporarily unavailable" in str(exc_info.value.detail)
+
+
+def _sales_requests(requests: list[httpx.Request]) -> list[httpx.Request]:
+    return [r for r in requests if SALES_DATASET_ID in r.url.path]
+
+
+_DOSSIER_ROW = {"la": 9260, "ba": 3006, "bc": "B3"}
+_NEIGHBOUR = "3058900040"
+
+
+def test_subjects_in_one_zip_share_a_sales_window() -> None:
+    subject_rows = [_subject_row()]
+    service, requests = _service(
+        subject_rows=subject_rows,
+        sales_rows=[
+            _sale(_NEIGHBOUR, address="450 OVINGTON AVENUE"),
+            _sale(SUBJECT_BBL, address="464 OVINGTON AVENUE"),
+        ],
+    )
+
+    first = service.get(SUBJECT_BBL, dossier_row=_DOSSIER_ROW)
+    subject_rows[:] = [_subject_row(bbl=_NEIGHBOUR)]
+    second = service.get(_NEIGHBOUR, dossier_row=_DOSSIER_ROW)
+
+    assert len(_sales_requests(requests)) == 1
+    assert [item["bbl"] for item in first["comparables"]] == [_NEIGHBOUR]
+    assert [item["bbl"] for item in second["comparables"]] == [SUBJECT_BBL]
+    assert second["source_retrieved_at"] == NOW
+    assert service.stats()["fetches"] == 1
+    assert service.stats()["memory_hits"] == 1
+
+
+def test_async_lookups_share_windows_with_sync_lookups() -> None:
+    subject_rows = [_subject_row()]
+    service, requests = _service(
+        subject_rows=subject_rows,
+        sales_rows=[
+            _sale(_NEIGHBOUR, address="450 OVINGTON AVENUE"),
+            _sale(SUBJECT_BBL, address="464 OVINGTON AVENUE"),
+        ],
+    )
+
+    async def _concurrent_first_lookups() -> list[dict]:
+        return await asyncio.gather(
+            *(
+                service.aget(SUBJECT_BBL, dossier_row=_DOSSIER_ROW)
+                for _ in range(3)
+            )
+        )
+
+    results = asyncio.run(_concurrent_first_lookups())
+    subject_rows[:] = [_subject_row(bbl=_NEIGHBOUR)]
+    neighbour = service.get(_NEIGHBOUR, dossier_row=_DOSSIER_ROW)
+
+    assert len(_sales_requests(requests)) == 1
+    assert results[0] == results[1] == results[2]
+    assert [item["bbl"] for item in results[0]["comparables"]] == [_NEIGHBOUR]
+    assert [item["bbl"] for item in neighbour["comparables"]] == [SUBJECT_BBL]
+    seen = len(requests)
+    assert service.get(SUBJECT_BBL, dossier_row=_DOSSIER_ROW) == results[0]
+    assert len(requests) == seen
+
+
+def test_slow_source_serves_a_bounded_stale_window() -> None:
+    clock = [NOW]
+    sales_down = [False]
+    service, requests = _service(
+        sales_rows=[_sale(_NEIGHBOUR, address="450 OVINGTON AVENUE")],
+        now=lambda: clock[0],
+        sales_down=sales_down,
+    )
+    service.get(SUBJECT_BBL, dossier_row=_DOSSIER_ROW)
+
+    sales_down[0] = True
+    clock[0] = NOW + timedelta(hours=7)
+    stale = service.get(SUBJECT_BBL, dossier_row=_DOSSIER_ROW)
+    assert stale["status"] == "available"
+    assert stale["source_retrieved_at"] == NOW
+    assert service.stats()["stale_served"] == 1
+
+    clock[0] = NOW + timedelta(days=8)
+    with pytest.raises(HTTPException) as exc_info:
+        service.get(SUBJECT_BBL, dossier_row=_DOSSIER_ROW)
+    assert exc_info.value.status_code == 503
+
+    sales_down[0] = False
+    fresh = service.get(SUBJECT_BBL, dossier_row=_DOSSIER_ROW)
+    assert fresh["source_retrieved_at"] == NOW + timedelta(days=8)
+    assert len(_sales_requests(requests)) == 4
+
+
+def test_sales_windows_persist_to_disk_across_restarts(tmp_path) -> None:
+    rows = [_sale(_NEIGHBOUR, address="450 OVINGTON AVENUE")]
+    first, _ = _service(sales_rows=rows, cache_dir=tmp_path)
+    expected = first.get(SUBJECT_BBL, dossier_row=_DOSSIER_ROW)
+    assert len(list(tmp_path.glob("3-11209-*.json"))) == 1
+
+    restarted, requests = _service(
+        sales_rows=[], cache_dir=tmp_path, sales_down=[True]
+    )
+    again = restarted.get(SUBJECT_BBL, dossier_row=_DOSSIER_ROW)
+
+    assert _sales_requests(requests) == []
+    assert again == expected
+    assert restarted.stats()["disk_hits"] == 1
+
+    next(tmp_path.glob("*.json")).write_text("{not json")
+    corrupt, requests = _service(sales_rows=rows, cache_dir=tmp_path)
+    corrupt.get(SUBJECT_BBL, dossier_row=_DOSSIER_ROW)
+    assert len(_sales_requests(requests)) == 1
+
+
+def test_prewarm_fetches_each_zip_window_once() -> None:
+    service, requests = _service(
+        subject_rows=[
+            _subject_row(),
+            _subject_row(bbl=_NEIGHBOUR),
+        ],
+        sales_rows=[_sale(_NEIGHBOUR, address="450 OVINGTON AVENUE")],
+    )
+
+    assert service.prewarm([SUBJECT_BBL, _NEIGHBOUR, "not-a-bbl"]) == 1
+    pluto = [r for r in requests if PLUTO_DATASET_ID in r.url.path]
+    assert len(pluto) == 1
+    assert "lot='38'" in pluto[0].url.params["$where"]
+    assert len(_sales_requests(requests)) == 1
+
+    requests.clear()
+    service.get(SUBJECT_BBL, dossier_row=_DOSSIER_ROW)
+    assert _sales_requests(requests) == []
+
+
+def test_prewarmed_subject_is_ranked_while_pluto_is_down(tmp_path) -> None:
+    clock = [NOW]
+    pluto_down = [False]
+    sales_rows = [_sale(_NEIGHBOUR, address="450 OVINGTON AVENUE")]
+    service, requests = _service(
+        sales_rows=sales_rows,
+        now=lambda: clock[0],
+        pluto_down=pluto_down,
+        cache_dir=tmp_path,
+    )
+    assert service.prewarm([SUBJECT_BBL]) == 1
+    assert len(list(tmp_path.glob("subjects/*.json"))) == 1
+
+    pluto_down[0] = True
+    requests.clear()
+    warm = service.get(SUBJECT_BBL, dossier_row=_DOSSIER_ROW)
+    assert [item["bbl"] for item in warm["comparables"]] == [_NEIGHBOUR]
+    assert [r for r in requests if PLUTO_DATASET_ID in r.url.path] == []
+    assert service.stats()["subject_hits"] == 1
+
+    # Past its TTL, the location is served stale while PLUTO stays down.
+    clock[0] = NOW + timedelta(hours=7)
+    restarted, requests = _service(
+        sales_rows=sales_rows,
+        now=lambda: clock[0],
+        pluto_down=[True],
+        cache_dir=tmp_path,
+    )
+    stale = restarted.get(SUBJECT_BBL, dossier_row=_DOSSIER_ROW)
+    assert [item["bbl"] for item in stale["comparables"]] == [_NEIGHBOUR]
+    assert restarted.stats()["stale_served"] == 1
+
+    clock[0] = NOW + timedelta(days=8)
+    expired, _ = _service(pluto_down=[True], now=lambda: clock[0], cache_dir=tmp_path)
+    with pytest.raises(HTTPException) as exc_info:
+        expired.get(SUBJECT_BBL, dossier_row=_DOSSIER_ROW)
+    assert exc_info.value.status_code == 503
+
+
+def test_vectorized_ranking_matches_the_scalar_reference() -> None:
+    rng = random.Random(11)
+    rows = []
+    for index in range(1_500):
+        row = _sale(
+            # A small BBL pool so repeat sales of one lot are common.
+            f"30589{rng.randint(0, 400):05d}",
+            address=f"{index} OVINGTON AVENUE",
+            sale_price=str(rng.choice([50_000, 250_000, 1_250_000, 4_000_000])),
+            sale_date=(
+                f"{rng.choice([2023, 2024, 2025, 2026, 2027])}-"
+                f"{rng.randint(1, 12):02d}-{rng.choice([1, 15])}T00:00:00.000"
+            ),
+            latitude=f"{40.6368 + rng.uniform(-0.04, 0.04):.6f}",
+            longitude=f"{-74.0312 + rng.uniform(-0.04, 0.04):.6f}",
+            apartment_number=rng.choice(["", "", "", "4B"]),
+            land_square_feet=rng.choice(["", "0", "4000", "9000", "9260", "30000"]),
+            gross_square_feet=rng.choice(["", "2000", "3006", "3400", "12000"]),
+            building_class=rng.choice(["", "A1", "B2", "B3", "C0"]),
+        )
+        if rng.random() < 0.02:
+            row["bbl"] = rng.choice([SUBJECT_BBL, "", "bad"])
+        rows.append(row)
+    window = _SalesWindow.parse(
+        rows, fetched_at=NOW, source_data_updated_at=None
+    )
+    service, _ = _service()
+    subjects = [
+        _Subject(
+            bbl=SUBJECT_BBL,
+            zip_code="11209",
+            latitude=40.6368,
+            longitude=-74.0312,
+            lot_area_sqft=lot_area,
+            building_area_sqft=building_area,
+            building_class=building_class,
+        )
+        for lot_area in (None, 9260.0)
+        for building_area in (None, 3006.0)
+        for building_class in (None, "B3")
+    ]
+    for subject in subjects:
+        expected = ranked_scalar(service, rows, subject=subject)
+        selected, eligible = service._ranked(
+            window, subject=subject, limit=len(rows)
+        )
+        assert eligible == len(expected)
+        assert [item.payload for item in selected] == [
+            item.payload for item in expected
+        ]
+        assert [item.score for item in selected] == [
+            item.score for item in expected
+        ]
+    assert any(ranked_scalar(service, rows, subject=s) for s in subjects)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+
+from app.services.parcel_spatial_index import BBox, ParcelGridIndex, tile_bbox
+
+
+@dataclass(frozen=True)
+class _Point:
+    bbl: str
+    lat: float | None
+    lng: float | None
+
+
+def test_query_returns_rows_inside_bbox_in_published_order() -> None:
+    rows = [
+        _Point("3000000003", 40.6805, -73.9755),
+        _Point("1000000001", 40.7505, -73.9855),
+        _Point("3000000002", 40.6801, -73.9751),
+        _Point("0000000000", None, None),
+        _Point("3000000004", 40.6999, -73.9501),
+    ]
+    index = ParcelGridIndex(rows, cell_degrees=0.01)
+
+    inside = index.query(BBox(-73.98, 40.68, -73.97, 40.69))
+
+    assert [row.bbl for row in inside] == ["3000000003", "3000000002"]
+    assert index.query(BBox(-180.0, -90.0, 180.0, 90.0)) == [
+        row for row in rows if row.lat is not None
+    ]
+    assert index.query(BBox(2.0, 48.0, 3.0, 49.0)) == []
+    assert ParcelGridIndex([]).query(BBox(-180.0, -90.0, 180.0, 90.0)) == []
+
+
+def test_bbox_edges_are_inclusive_across_cell_boundaries() -> None:
+    rows = [_Point("1", 40.70, -74.00), _Point("2", 40.71, -73.99)]
+    index = ParcelGridIndex(rows, cell_degrees=0.01)
+
+    assert [row.bbl for row in index.query(BBox(-74.00, 40.70, -73.99, 40.71))] == [
+        "1",
+        "2",
+    ]
+
+
+def test_tile_bbox_matches_slippy_map_bounds() -> None:
+    world = tile_bbox(0, 0, 0)
+    assert world.min_lng == -180.0 and world.max_lng == 180.0
+    assert world.max_lat == pytest.approx(85.0511287798)
+
+    # Zoom-15 tile covering downtown Brooklyn.
+    tile = tile_bbox(15, 9649, 12322)
+    assert tile.contains(-73.9855, 40.6925)
+    assert tile.max_lng - tile.min_lng == pytest.approx(360 / 2**15)
+
+    with pytest.raises(ValueError):
+        tile_bbox(3, 8, 0)
+    with pytest.raises(ValueError):
+        tile_bbox(23, 0, 0)
@@ -14,6 +14,7 @@ from app.services.firestore_store import (
     _product_usage_day_payload,
     _workflow_effective_payload,
 )
+from app.services.parcel_decision_audit import build_parcel_decision_audit
 from app.services.parcel_workflow_actions import workflow_reminder_fingerprint
 
 
@@ -400,6 +401,11 @@ class _FakeWorkflowRegistry:
             }
         ), {"generated_at": "2026-07-24T02:43:29Z"}
 
+    def decision_audit(self, row, manifest, *, premium_access):
+        return build_parcel_decision_audit(
+            row, manifest, premium_access=premium_access
+        )
+
 
 @pytest.fixture(autouse=True)
 def _workflow_feed_override():
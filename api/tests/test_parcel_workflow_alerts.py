@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from types import SimpleNamespace
 
 from fastapi.testclient import TestClient
 
@@ -593,7 +592,24 @@ class _FakeRow:
         return _current_row(owner_name="OLD OWNER LLC")
 
 
-class _FakeRegistry:
+class _FakeBblLookups:
+    """Registry per-BBL lookups derived from the fake `citywide_map`."""
+
+    def map_rows_by_bbl(self, gcs, bbls):
+        rows, manifest = self.citywide_map(gcs)
+        wanted = set(bbls)
+        dumped = (row.model_dump() for row in rows)
+        return (
+            {row["bbl"]: row for row in dumped if row["bbl"] in wanted},
+            manifest,
+        )
+
+    def decision_audit_checks(self, gcs, bbls):
+        _, manifest = self.citywide_map(gcs)
+        return {}, manifest
+
+
+class _FakeRegistry(_FakeBblLookups):
     def citywide_map(self, _gcs):
         return (
             [_FakeRow()],
@@ -613,7 +629,7 @@ class _FakeScreeningRow:
         return _screening_row()
 
 
-class _FakeExitRegistry:
+class _FakeExitRegistry(_FakeBblLookups):
     def citywide_map(self, _gcs):
         return (
             [],
@@ -667,6 +683,24 @@ class _FakeReviewedRegistry(_FakeRegistry):
         rows, manifest = super().citywide_map(_gcs)
         return [_FakeReviewedRow()], manifest
 
+    def decision_audit_checks(self, gcs, bbls):
+        _, manifest = self.citywide_map(gcs)
+        assert set(bbls) == {"3020960069"}
+        return (
+            {
+                "3020960069": {
+                    "property_facts": {
+                        "key": "property_facts",
+                        "label": "Current property facts",
+                        "status": "verified",
+                        "source": "NYC PLUTO",
+                        "as_of": "2026-07-24",
+                    }
+                }
+            },
+            manifest,
+        )
+
 
 def test_workflow_alerts_endpoint_is_authenticated_and_typed(
     auth_override,
@@ -731,7 +765,6 @@ def test_workflow_alerts_endpoint_returns_typed_source_backed_exit(
 
 def test_workflow_alerts_endpoint_builds_current_review_versions(
     auth_override,
-    monkeypatch,
 ) -> None:
     auth_override(app_user_id="alerts-user")
     app.dependency_overrides[parcel_workflow.get_store] = (
@@ -741,23 +774,6 @@ def test_workflow_alerts_endpoint_builds_current_review_versions(
     app.dependency_overrides[parcel_workflow.get_registry] = (
         lambda: _FakeReviewedRegistry()
     )
-    current_check = SimpleNamespace(
-        key="property_facts",
-        model_dump=lambda: {
-            "key": "property_facts",
-            "label": "Current property facts",
-            "status": "verified",
-            "source": "NYC PLUTO",
-            "as_of": "2026-07-24",
-        },
-    )
-    monkeypatch.setattr(
-        parcel_workflow,
-        "build_parcel_decision_audit",
-        lambda row, manifest, premium_access: SimpleNamespace(
-            checks=[current_check]
-        ),
-    )
     client = TestClient(app)
 
     response = client.get("/v1/parcel-intel/workflow/alerts")
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import gzip
+import json
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.services.prepared_json import PreparedJson, etag_matches
+
+
+class _Body(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    schema_: str = Field(alias="schema", serialization_alias="schema")
+    rows: list[int]
+
+
+def test_prepared_body_is_stable_and_uses_aliases() -> None:
+    first = PreparedJson.from_model(_Body(schema="v1", rows=[1, 2]))
+    second = PreparedJson.from_model(_Body(schema="v1", rows=[1, 2]))
+    changed = PreparedJson.from_model(_Body(schema="v1", rows=[1, 3]))
+
+    assert json.loads(first.body) == {"schema": "v1", "rows": [1, 2]}
+    assert first == second
+    assert first.etag.startswith('"') and first.etag.endswith('"')
+    assert changed.etag != first.etag
+
+
+def test_if_none_match_uses_weak_comparison() -> None:
+    etag = '"abc"'
+
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('W/"abc"', etag)
+    assert etag_matches('"zzz", W/"abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches("", etag)
+    assert not etag_matches('"abcd"', etag)
+
+
+def test_large_bodies_carry_compressed_variants_and_negotiate() -> None:
+    prepared = PreparedJson.from_model(
+        _Body(schema="v1", rows=list(range(2_000)))
+    )
+
+    assert gzip.decompress(prepared.encoded["gzip"]) == prepared.body
+    assert prepared.negotiate("gzip, deflate") == (
+        prepared.encoded["gzip"],
+        "gzip",
+    )
+    assert prepared.negotiate(None) == (prepared.body, None)
+    assert prepared.negotiate("identity") == (prepared.body, None)
+    assert prepared.negotiate("gzip;q=0, br;q=0") == (prepared.body, None)
+    assert prepared.negotiate("*") == (prepared.encoded["gzip"], "gzip")
+    # gzip is the only prepared coding, even for clients that prefer br.
+    assert set(prepared.encoded) == {"gzip"}
+    assert prepared.negotiate("br, gzip;q=0.5")[1] == "gzip"
+
+    gzip_etag = prepared.etag_for("gzip")
+    assert gzip_etag != prepared.etag and gzip_etag.endswith('-gzip"')
+    assert prepared.not_modified(gzip_etag)
+    assert prepared.not_modified(prepared.etag)
+    assert not prepared.not_modified('"other"')
+
+
+def test_small_bodies_are_not_compressed() -> None:
+    prepared = PreparedJson.from_model(_Body(schema="v1", rows=[1]))
+
+    assert prepared.encoded == {}
+    assert prepared.negotiate("gzip") == (prepared.body, None)
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import base64
+import json
+from copy import deepcopy
+from typing import Any
+
+import pytest
+from fastapi import HTTPException
+
+from app.services import auth as auth_module
+from app.services.auth_context import AuthContext
+from app.services.firestore_store import FirestoreStore
+from app.services.principal_cache import PrincipalCache
+from app.services.settings import get_settings
+
+
+class _Snapshot:
+    def __init__(self, value: dict[str, Any] | None) -> None:
+        self.exists = value is not None
+        self._value = value
+
+    def to_dict(self) -> dict[str, Any] | None:
+        return deepcopy(self._value)
+
+
+class _Document:
+    def __init__(self, client: "_Client", path: tuple[str, ...]) -> None:
+        self.client = client
+        self.path = path
+
+    def get(self) -> _Snapshot:
+        self.client.reads += 1
+        return _Snapshot(self.client.documents.get(self.path))
+
+    def set(self, value: dict[str, Any], *, merge: bool = False) -> None:
+        self.client.writes += 1
+        existing = self.client.documents.get(self.path, {}) if merge else {}
+        self.client.documents[self.path] = {**existing, **deepcopy(value)}
+
+    def collection(self, name: str) -> "_Collection":
+        return _Collection(self.client, (*self.path, name))
+
+
+class _Collection:
+    def __init__(self, client: "_Client", path: tuple[str, ...]) -> None:
+        self.client = client
+        self.path = path
+
+    def document(self, identifier: str) -> _Document:
+        return _Document(self.client, (*self.path, identifier))
+
+
+class _Client:
+    """Document get/set only, counting every Firestore operation."""
+
+    def __init__(self) -> None:
+        self.documents: dict[tuple[str, ...], dict[str, Any]] = {}
+        self.reads = 0
+        self.writes = 0
+
+    def collection(self, name: str) -> _Collection:
+        return _Collection(self, (name,))
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _context(app_user_id: str) -> AuthContext:
+    return AuthContext(
+        app_user_id=app_user_id,
+        auth_provider="mock",
+        auth_subject=f"sub-{app_user_id}",
+        email=None,
+        email_verified=False,
+        is_admin=False,
+        plan_type="free",
+    )
+
+
+def _mock_token(claims: dict[str, Any]) -> str:
+    body = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode()
+    return "mock." + body.rstrip("=")
+
+
+@pytest.fixture
+def client(monkeypatch) -> _Client:
+    fake = _Client()
+    store = FirestoreStore(project_id="test-project", client=fake)
+    monkeypatch.setattr(auth_module, "_store_factory", lambda _settings: store)
+    return fake
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    fake = _Clock()
+    cache = PrincipalCache(
+        ttl_seconds=30, login_write_interval_seconds=900, clock=fake
+    )
+    monkeypatch.setattr(auth_module, "principal_cache", lambda _settings: cache)
+    return fake
+
+
+def _authenticate(token: str) -> AuthContext:
+    return auth_module.require_auth(
+        authorization=f"Bearer {token}", x_api_key=None, settings=get_settings()
+    )
+
+
+def test_entries_expire_and_lru_is_bounded() -> None:
+    clock = _Clock()
+    cache = PrincipalCache(ttl_seconds=30, max_entries=2, clock=clock)
+    cache.put("a", _context("user-a"))
+    cache.put("b", _context("user-b"))
+    assert cache.get("a") == _context("user-a")
+
+    cache.put("c", _context("user-c"))
+    assert cache.get("b") is None
+    clock.now += 30
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 1
+
+
+def test_login_is_due_once_per_interval_across_refreshes() -> None:
+    clock = _Clock()
+    cache = PrincipalCache(
+        ttl_seconds=30, login_write_interval_seconds=900, clock=clock
+    )
+    assert cache.login_due("a")
+    cache.put("a", _context("user-a"), login_recorded=True)
+
+    clock.now += 60
+    assert not cache.login_due("a")
+    cache.put("a", _context("user-a"))
+    clock.now += 840
+    assert cache.login_due("a")
+
+
+def test_invalidate_user_drops_all_of_their_principals() -> None:
+    cache = PrincipalCache()
+    cache.put(("user_api_key", "1"), _context("user-a"))
+    cache.put(("oidc", "sub-a"), _context("user-a"))
+    cache.put(("oidc", "sub-b"), _context("user-b"))
+
+    assert cache.invalidate_user("user-a") == 2
+    assert cache.get(("oidc", "sub-a")) is None
+    assert cache.get(("oidc", "sub-b")) == _context("user-b")
+
+
+def test_zero_ttl_disables_caching() -> None:
+    cache = PrincipalCache(ttl_seconds=0)
+    cache.put("a", _context("user-a"))
+    assert cache.get("a") is None
+    assert cache.login_due("a")
+
+
+def test_oidc_hot_path_skips_firestore_and_throttles_login_writes(
+    client: _Client, clock: _Clock
+) -> None:
+    token = _mock_token({"sub": "u1", "email": "u1@example.com", "email_verified": True})
+
+    first = _authenticate(token)
+    assert (client.reads, client.writes) == (2, 2)
+    for _ in range(10):
+        assert _authenticate(token) == first
+    assert (client.reads, client.writes) == (2, 2)
+
+    clock.now += 60
+    assert _authenticate(token) == first
+    assert (client.reads, client.writes) == (4, 2)
+
+    clock.now += 900
+    _authenticate(token)
+    assert (client.reads, client.writes) == (6, 4)
+
+
+def test_changed_claims_resolve_and_write_again(
+    client: _Client, clock: _Clock
+) -> None:
+    _authenticate(_mock_token({"sub": "u1", "email": "old@example.com"}))
+    renamed = _authenticate(_mock_token({"sub": "u1", "email": "new@example.com"}))
+
+    assert renamed.email == "new@example.com"
+    assert client.writes == 4
+    user = next(
+        doc for path, doc in client.documents.items() if path[0] == "users"
+    )
+    assert user["email"] == "new@example.com"
+
+
+def test_user_api_key_hits_skip_firestore_until_revoked(
+    client: _Client, clock: _Clock, monkeypatch
+) -> None:
+    monkeypatch.setenv("CITYLENS_ALLOW_USER_API_KEYS", "true")
+    store = auth_module._store_factory(get_settings())
+    client.documents[("users", "user-a")] = {"user_id": "user-a", "plan_type": "pro"}
+    key_id, plaintext, _ = store.create_api_key(app_user_id="user-a", label="cli")
+    client.reads = client.writes = 0
+
+    assert _authenticate(plaintext).plan_type == "pro"
+    ops = client.reads + client.writes
+    assert _authenticate(plaintext).plan_type == "pro"
+    assert client.reads + client.writes == ops
+
+    assert store.revoke_api_key(app_user_id="user-a", key_id=key_id)
+    auth_module.principal_cache(get_settings()).invalidate_user("user-a")
+    with pytest.raises(HTTPException) as exc:
+        _authenticate(plaintext)
+    assert exc.value.status_code == 401
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+import os
+
+from app.services.shard_disk_cache import ShardDiskCache, encode_shard
+
+GENERATION = "20260727T005131244552Z-9624c5a2e365"
+NEXT_GENERATION = "20260827T005131244552Z-0000c5a2e365"
+
+
+def _rows(count: int, *, start: int = 0) -> dict[str, bytes]:
+    return {
+        f"3{index:09d}": json.dumps({"index": index}).encode()
+        for index in range(start, start + count)
+    }
+
+
+def test_stored_shard_maps_back_with_lookups_and_iteration(tmp_path) -> None:
+    cache = ShardDiskCache(tmp_path, max_bytes=1_000_000)
+    rows = _rows(50)
+    cache.store("dossier", GENERATION, "ab", "c" * 64, rows)
+
+    mapped = cache.load("dossier", GENERATION, "ab", "c" * 64, json.loads)
+
+    assert mapped is not None
+    assert len(mapped) == 50
+    assert list(mapped) == sorted(rows)
+    assert mapped["3000000007"] == {"index": 7}
+    assert mapped.get("3999999999") is None
+    assert mapped.get("not-ascii-é") is None
+    assert "3000000049" in mapped
+    # Another artifact digest is a different file.
+    assert cache.load("dossier", GENERATION, "ab", "d" * 64, json.loads) is None
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["files"] == 1
+
+
+def test_empty_shard_round_trips(tmp_path) -> None:
+    cache = ShardDiskCache(tmp_path, max_bytes=1_000_000)
+    cache.store("resolver", GENERATION, "00", "e" * 64, {})
+    mapped = cache.load("resolver", GENERATION, "00", "e" * 64, bytes)
+    assert mapped is not None
+    assert len(mapped) == 0
+
+
+def test_corrupt_file_is_discarded_not_served(tmp_path) -> None:
+    cache = ShardDiskCache(tmp_path, max_bytes=1_000_000)
+    cache.store("dossier", GENERATION, "ab", "c" * 64, _rows(5))
+    (path,) = tmp_path.glob("dossier/*/*.bin")
+    payload = bytearray(path.read_bytes())
+    payload[-1] ^= 0xFF
+    path.write_bytes(bytes(payload))
+
+    assert cache.load("dossier", GENERATION, "ab", "c" * 64, json.loads) is None
+    assert not path.exists()
+    assert cache.stats()["corrupt"] == 1
+
+
+def test_size_bound_evicts_least_recently_used_files(tmp_path) -> None:
+    size = len(encode_shard(_rows(20, start=10)))
+    cache = ShardDiskCache(tmp_path, max_bytes=size * 2)
+    cache.store("dossier", GENERATION, "00", "a" * 64, _rows(20, start=10))
+    cache.store("dossier", GENERATION, "01", "b" * 64, _rows(20, start=30))
+    # Touch 00 so 01 is the least recently used when 02 arrives.
+    assert cache.load("dossier", GENERATION, "00", "a" * 64, json.loads)
+    cache.store("dossier", GENERATION, "02", "c" * 64, _rows(20, start=50))
+
+    names = sorted(path.name[:2] for path in tmp_path.glob("dossier/*/*.bin"))
+    assert names == ["00", "02"]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_retain_collects_other_generations_at_cutover(tmp_path) -> None:
+    cache = ShardDiskCache(tmp_path, max_bytes=1_000_000)
+    cache.store("dossier", GENERATION, "00", "a" * 64, _rows(3))
+    cache.store("resolver", GENERATION, "00", "a" * 64, _rows(3))
+    cache.store("dossier", NEXT_GENERATION, "00", "b" * 64, _rows(3))
+    # Storing never collects; both generations stay until the cutover.
+    assert (tmp_path / "dossier" / GENERATION).is_dir()
+
+    cache.retain("dossier", [NEXT_GENERATION])
+
+    assert not (tmp_path / "dossier" / GENERATION).exists()
+    assert (tmp_path / "dossier" / NEXT_GENERATION).is_dir()
+    # Other namespaces keep their own generation.
+    assert (tmp_path / "resolver" / GENERATION).is_dir()
+    stats = cache.stats()
+    assert (stats["files"], stats["generations_collected"]) == (2, 1)
+    # A late write for the retired generation does not recreate it.
+    cache.store("dossier", GENERATION, "01", "c" * 64, _rows(3))
+    assert not (tmp_path / "dossier" / GENERATION).exists()
+
+
+def test_interleaved_stores_from_serving_and_pending_generations_survive(
+    tmp_path,
+) -> None:
+    cache = ShardDiskCache(tmp_path, max_bytes=1_000_000)
+    cache.retain("dossier", [GENERATION, NEXT_GENERATION])
+    for index in range(4):
+        cache.store("dossier", GENERATION, f"{index:02d}", "a" * 64, _rows(3))
+        cache.store("dossier", NEXT_GENERATION, f"{index:02d}", "b" * 64, _rows(3))
+
+    for index in range(4):
+        shard = f"{index:02d}"
+        assert cache.load("dossier", GENERATION, shard, "a" * 64, json.loads)
+        assert cache.load("dossier", NEXT_GENERATION, shard, "b" * 64, json.loads)
+    stats = cache.stats()
+    assert (stats["files"], stats["generations_collected"], stats["misses"]) == (8, 0, 0)
+
+
+def test_restarted_process_reuses_files_and_counts_them(tmp_path) -> None:
+    ShardDiskCache(tmp_path, max_bytes=1_000_000).store(
+        "dossier", GENERATION, "00", "a" * 64, _rows(3)
+    )
+    restarted = ShardDiskCache(tmp_path, max_bytes=1_000_000)
+    assert restarted.stats()["files"] == 1
+    mapped = restarted.load("dossier", GENERATION, "00", "a" * 64, json.loads)
+    assert mapped is not None and mapped["3000000002"] == {"index": 2}
+
+
+def test_from_env_is_opt_in(monkeypatch, tmp_path) -> None:
+    monkeypatch.delenv("CITYLENS_SHARD_CACHE_DIR", raising=False)
+    assert ShardDiskCache.from_env() is None
+    monkeypatch.setenv("CITYLENS_SHARD_CACHE_DIR", os.fspath(tmp_path))
+    monkeypatch.setenv("CITYLENS_SHARD_CACHE_MAX_MB", "2")
+    cache = ShardDiskCache.from_env()
+    assert cache is not None
+    assert cache.stats()["max_bytes"] == 2 * 1024 * 1024
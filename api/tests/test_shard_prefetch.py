@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import threading
+
+from app.services.shard_prefetch import GenerationPrefetch, shard_prefetch_top_from_env
+
+
+def test_disabled_or_first_generation_cuts_over_immediately() -> None:
+    def _load(shard: str) -> None:
+        raise AssertionError("nothing should be prefetched")
+
+    disabled = GenerationPrefetch("test", top=0)
+    enabled = GenerationPrefetch("test", top=4)
+
+    assert disabled.cutover("a", "b", hottest=lambda: ["00"], load=_load)
+    assert enabled.cutover(None, "a", hottest=lambda: ["00"], load=_load)
+    assert enabled.cutover("a", "a", hottest=lambda: ["00"], load=_load)
+    assert enabled.cutover("a", "b", hottest=lambda: [], load=_load)
+    assert disabled.stats()["enabled"] is False
+
+
+def test_cutover_waits_for_the_top_shards_and_counts_failures() -> None:
+    release = threading.Event()
+    loaded: list[str] = []
+
+    def _load(shard: str) -> None:
+        release.wait(5)
+        if shard == "bad":
+            raise OSError("upstream down")
+        loaded.append(shard)
+
+    prefetch = GenerationPrefetch("test", top=3, workers=2)
+    hottest = ["00", "bad", "01", "cold"]
+
+    assert not prefetch.cutover("a", "b", hottest=lambda: hottest, load=_load)
+    assert not prefetch.cutover("a", "b", hottest=lambda: hottest, load=_load)
+    assert prefetch.stats()["state"] == "running"
+    release.set()
+    assert prefetch.wait(5)
+
+    assert prefetch.cutover("a", "b", hottest=lambda: hottest, load=_load)
+    assert sorted(loaded) == ["00", "01"]
+    stats = prefetch.stats()
+    assert (stats["state"], stats["total"], stats["loaded"], stats["failed"]) == (
+        "done",
+        3,
+        2,
+        1,
+    )
+
+
+def test_prefetch_top_env_defaults_to_disabled(monkeypatch) -> None:
+    monkeypatch.delenv("CITYLENS_SHARD_PREFETCH_TOP", raising=False)
+    assert shard_prefetch_top_from_env() == 0
+    monkeypatch.setenv("CITYLENS_SHARD_PREFETCH_TOP", "not-a-number")
+    assert shard_prefetch_top_from_env() == 0
+    monkeypatch.setenv("CITYLENS_SHARD_PREFETCH_TOP", "64")
+    assert shard_prefetch_top_from_env() == 64
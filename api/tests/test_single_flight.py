@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services.single_flight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrent_callers_share_one_execution() -> None:
+    flights = SingleFlight()
+    barrier = threading.Barrier(64)
+    calls: list[int] = []
+
+    def _load() -> str:
+        calls.append(1)
+        time.sleep(0.05)
+        return "payload"
+
+    def _request() -> str:
+        barrier.wait()
+        return flights.do(("generation", "map.jsonl"), _load)
+
+    with ThreadPoolExecutor(max_workers=64) as pool:
+        results = list(pool.map(lambda _: _request(), range(64)))
+
+    assert results == ["payload"] * 64
+    assert len(calls) == 1
+    assert flights.in_flight() == 0
+
+
+def test_waiters_receive_the_leaders_error_and_next_call_retries() -> None:
+    flights = SingleFlight()
+    barrier = threading.Barrier(8)
+    calls: list[int] = []
+
+    def _fail() -> str:
+        calls.append(1)
+        time.sleep(0.05)
+        raise RuntimeError("integrity check failed")
+
+    def _request() -> str:
+        barrier.wait()
+        return flights.do("key", _fail)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(_request) for _ in range(8)]
+    for future in futures:
+        with pytest.raises(RuntimeError, match="integrity check failed"):
+            future.result()
+
+    assert len(calls) == 1
+    assert flights.do("key", lambda: "recovered") == "recovered"
+
+
+def test_distinct_keys_do_not_block_each_other() -> None:
+    flights = SingleFlight()
+
+    assert flights.do("a", lambda: 1) == 1
+    assert flights.do("b", lambda: 2) == 2
+
+
+def test_async_callers_share_one_execution_and_its_error() -> None:
+    flights = AsyncSingleFlight()
+    calls: list[int] = []
+
+    async def _load() -> str:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "payload"
+
+    async def _fail() -> str:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    async def _main() -> None:
+        results = await asyncio.gather(
+            *(flights.do("window", _load) for _ in range(32))
+        )
+        assert results == ["payload"] * 32
+        failures = await asyncio.gather(
+            *(flights.do("window", _fail) for _ in range(4)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(item, RuntimeError) for item in failures)
+        assert flights.in_flight() == 0
+
+    asyncio.run(_main())
+    assert len(calls) == 2
@@ -0,0 +1,52 @@
+"""Scalar reference for comparable-sale ranking.
+
+``ParcelSalesComparableService._ranked`` scores a window's NumPy columns at
+once. This is the record-at-a-time loop it replaced, kept outside the service
+so the API has a single ranking path. The parity test and the scoring
+benchmark both compare ``_ranked`` against it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from app.services.parcel_sales_comparables import (
+    ParcelSalesComparableService,
+    _Candidate,
+    _Subject,
+)
+
+
+def ranked_scalar(
+    service: ParcelSalesComparableService,
+    rows: Sequence[dict[str, Any]],
+    *,
+    subject: _Subject,
+) -> list[_Candidate]:
+    """Every eligible lot, ranked one record at a time.
+
+    ``_ranked`` must produce the same order.
+    """
+    candidates = [
+        candidate
+        for raw in rows
+        if (candidate := service._candidate(raw, subject=subject)) is not None
+    ]
+    # Keep at most the most recent record for one BBL before ranking.
+    latest_by_bbl: dict[str, _Candidate] = {}
+    for candidate in sorted(
+        candidates,
+        key=lambda item: item.sale_date,
+        reverse=True,
+    ):
+        latest_by_bbl.setdefault(candidate.payload["bbl"], candidate)
+    return sorted(
+        latest_by_bbl.values(),
+        key=lambda item: (
+            -item.score,
+            -item.sale_date.toordinal(),
+            item.distance_miles,
+            item.payload["bbl"],
+        ),
+    )
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Load-test Firestore operations per authenticated request.
+
+Replays a synthetic session of authenticated requests through the real
+``require_auth`` and ``FirestoreStore`` against an in-memory client that
+counts every document read and write. Half the users sign in with an OIDC
+token (the mock verifier stands in for JWKS), half with a ``clk_live_`` API
+key. Requests arrive every ``--interval`` simulated seconds on an injected
+clock, so TTL expiry and login-write throttling happen as they would in a
+long-lived instance. The session is replayed twice:
+
+- ``uncached``: principal cache disabled, i.e. the previous behaviour.
+- ``cached``: the default principal TTL and login-write interval.
+
+No network or GCP credentials are used.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import os
+import random
+import sys
+from copy import deepcopy
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+API_ROOT = ROOT / "api"
+if str(API_ROOT) not in sys.path:
+    sys.path.insert(0, str(API_ROOT))
+
+for _name, _value in {
+    "GOOGLE_CLOUD_PROJECT": "benchmark",
+    "CITYLENS_REGION": "us-central1",
+    "CITYLENS_BUCKET": "benchmark",
+    "CITYLENS_JOB_NAME": "benchmark",
+    "CITYLENS_AUTH_PROVIDER": "mock",
+    "CITYLENS_ALLOW_MOCK_AUTH": "true",
+    "CITYLENS_ALLOW_USER_API_KEYS": "true",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+from app.services import auth
+from app.services.firestore_store import FirestoreStore
+from app.services.principal_cache import PrincipalCache
+from app.services.settings import get_settings
+
+
+class _Snapshot:
+    def __init__(self, value: dict[str, Any] | None) -> None:
+        self.exists = value is not None
+        self._value = value
+
+    def to_dict(self) -> dict[str, Any] | None:
+        return deepcopy(self._value)
+
+
+class _Document:
+    def __init__(self, client: _CountingClient, path: tuple[str, ...]) -> None:
+        self._client = client
+        self._path = path
+
+    def get(self) -> _Snapshot:
+        self._client.reads += 1
+        return _Snapshot(self._client.documents.get(self._path))
+
+    def set(self, value: dict[str, Any], *, merge: bool = False) -> None:
+        self._client.writes += 1
+        existing = self._client.documents.get(self._path, {}) if merge else {}
+        self._client.documents[self._path] = {**existing, **deepcopy(value)}
+
+    def collection(self, name: str) -> _Collection:
+        return _Collection(self._client, (*self._path, name))
+
+
+class _Collection:
+    def __init__(self, client: _CountingClient, path: tuple[str, ...]) -> None:
+        self._client = client
+        self._path = path
+
+    def document(self, identifier: str) -> _Document:
+        return _Document(self._client, (*self._path, identifier))
+
+
+class _CountingClient:
+    def __init__(self) -> None:
+        self.documents: dict[tuple[str, ...], dict[str, Any]] = {}
+        self.reads = 0
+        self.writes = 0
+
+    def collection(self, name: str) -> _Collection:
+        return _Collection(self, (name,))
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _mock_token(subject: str) -> str:
+    claims = {"sub": subject, "email": f"{subject}@example.com", "email_verified": True}
+    body = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode()
+    return "mock." + body.rstrip("=")
+
+
+def _replay(
+    *, users: int, requests: int, interval: float, seed: int, ttl_seconds: int
+) -> dict[str, Any]:
+    settings = get_settings()
+    client = _CountingClient()
+    store = FirestoreStore(project_id="benchmark", client=client)
+    clock = _Clock()
+    cache = PrincipalCache(
+        ttl_seconds=ttl_seconds,
+        max_entries=settings.principal_cache_max_entries,
+        login_write_interval_seconds=settings.login_write_interval_seconds,
+        clock=clock,
+    )
+    auth._store_factory = lambda _settings: store
+    auth.principal_cache = lambda _settings: cache
+
+    tokens = []
+    for index in range(users):
+        if index % 2:
+            app_user_id = f"key-user-{index}"
+            client.documents[("users", app_user_id)] = {
+                "user_id": app_user_id,
+                "plan_type": "pro",
+            }
+            tokens.append(store.create_api_key(app_user_id=app_user_id, label="cli")[1])
+        else:
+            tokens.append(_mock_token(f"oidc-user-{index}"))
+    client.reads = client.writes = 0
+
+    rng = random.Random(seed)
+    for _ in range(requests):
+        clock.now += interval
+        auth.require_auth(
+            authorization=f"Bearer {rng.choice(tokens)}",
+            x_api_key=None,
+            settings=settings,
+        )
+    return {
+        "reads": client.reads,
+        "writes": client.writes,
+        "reads_per_request": round(client.reads / requests, 3),
+        "writes_per_request": round(client.writes / requests, 3),
+        "ops_per_request": round((client.reads + client.writes) / requests, 3),
+        "cache": cache.stats(),
+    }
+
+
+def run(*, users: int, requests: int, interval: float, seed: int) -> dict[str, Any]:
+    store_factory, principal_cache = auth._store_factory, auth.principal_cache
+    try:
+        uncached = _replay(
+            users=users, requests=requests, interval=interval, seed=seed, ttl_seconds=0
+        )
+        cached = _replay(
+            users=users,
+            requests=requests,
+            interval=interval,
+            seed=seed,
+            ttl_seconds=get_settings().principal_cache_ttl_seconds,
+        )
+    finally:
+        auth._store_factory, auth.principal_cache = store_factory, principal_cache
+    before = uncached["ops_per_request"]
+    after = cached["ops_per_request"]
+    return {
+        "users": users,
+        "requests": requests,
+        "simulated_seconds": round(requests * interval, 1),
+        "uncached": uncached,
+        "cached": cached,
+        "ops_reduction": round(before / after, 1) if after else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Count Firestore reads/writes per authenticated request with and "
+            "without the principal cache."
+        )
+    )
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument(
+        "--interval", type=float, default=0.2, help="simulated seconds between requests"
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    report = run(
+        users=args.users,
+        requests=args.requests,
+        interval=args.interval,
+        seed=args.seed,
+    )
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Benchmark baseline footprint extraction: GDB scan vs the tile store.
+
+Writes a synthetic borough-sized FileGDB (NY State Plane, like the county
+downloads) and draws random AOIs the size of a worker run. Both paths are
+timed per AOI:
+
+- ``gdb_scan``: ``_features_for_bbox`` against the local GDB, as every run
+  did before. This excludes restoring the GDB tarball, which the real path
+  also pays on a cold worker; its size is reported as ``gdb_bytes``.
+- ``tile_store``: a cold ``FootprintTileStore`` (empty cache directory)
+  that reads the pointer, the index, and the AOI's shards from an
+  in-memory GCS client.
+
+Feature counts from the two paths are compared for every AOI. The GCS
+client is in memory, so no network or credentials are used.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+WORKER_ROOT = ROOT / "worker"
+if str(WORKER_ROOT) not in sys.path:
+    sys.path.insert(0, str(WORKER_ROOT))
+
+import fiona
+from fiona.crs import CRS as FionaCRS
+from pyproj import CRS, Transformer
+from services.footprint_tiles import (
+    TILE_SIZE_M,
+    FootprintTileStore,
+    build_tile_store_from_gdbs,
+    upload_tile_store,
+)
+from services.imagery_inputs import _features_for_bbox
+
+# South-west corner of the synthetic area, Brooklyn in EPSG:2263 (ftUS).
+_ORIGIN_FT = (975_000.0, 160_000.0)
+
+
+class _MemoryBlob:
+    def __init__(self, storage: dict[str, bytes], name: str) -> None:
+        self._storage = storage
+        self._name = name
+
+    def exists(self) -> bool:
+        return self._name in self._storage
+
+    def download_to_filename(self, path: str) -> None:
+        Path(path).write_bytes(self._storage[self._name])
+
+    def upload_from_filename(self, path: str) -> None:
+        self._storage[self._name] = Path(path).read_bytes()
+
+
+class _MemoryGcs:
+    def __init__(self) -> None:
+        self.storage: dict[str, bytes] = {}
+
+    def bucket(self, name: str) -> _MemoryGcs:
+        return self
+
+    def blob(self, name: str) -> _MemoryBlob:
+        return _MemoryBlob(self.storage, name)
+
+
+def _write_gdb(path: Path, *, buildings: int, extent_ft: float, seed: int) -> None:
+    rng = random.Random(seed)
+    schema = {
+        "geometry": "Polygon",
+        "properties": {"Source": "str", "SourceDate": "str", "NYSGeo_Source": "str"},
+    }
+    with fiona.open(
+        str(path),
+        "w",
+        driver="OpenFileGDB",
+        crs=FionaCRS.from_epsg(2263),
+        schema=schema,
+        layer="Kings_Building_Footprints",
+    ) as dst:
+        records = []
+        for index in range(buildings):
+            x = _ORIGIN_FT[0] + rng.uniform(0, extent_ft)
+            y = _ORIGIN_FT[1] + rng.uniform(0, extent_ft)
+            w, h = rng.uniform(20, 120), rng.uniform(20, 120)
+            ring = [(x, y), (x + w, y), (x + w, y + h), (x, y + h), (x, y)]
+            records.append(
+                {
+                    "geometry": {"type": "Polygon", "coordinates": [ring]},
+                    "properties": {
+                        "Source": f"synthetic-{index}",
+                        "SourceDate": "2022-01-01",
+                        "NYSGeo_Source": "benchmark",
+                    },
+                }
+            )
+        dst.writerecords(records)
+
+
+def _aois(*, count: int, extent_ft: float, half_size: float, seed: int) -> list[tuple]:
+    rng = random.Random(seed + 1)
+    to_3857 = Transformer.from_crs(CRS.from_epsg(2263), CRS.from_epsg(3857), always_xy=True)
+    aois = []
+    for _ in range(count):
+        x, y = to_3857.transform(
+            _ORIGIN_FT[0] + rng.uniform(0.1, 0.9) * extent_ft,
+            _ORIGIN_FT[1] + rng.uniform(0.1, 0.9) * extent_ft,
+        )
+        aois.append((x - half_size, y - half_size, x + half_size, y + half_size))
+    return aois
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    return {
+        "mean_ms": round(statistics.fmean(samples) * 1000, 2),
+        "p95_ms": round(sorted(samples)[int(len(samples) * 0.95) - 1] * 1000, 2),
+    }
+
+
+def run(
+    *, buildings: int, extent_ft: float, aois: int, half_size: float, seed: int
+) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        gdb = root / "Kings_Building_Footprints.gdb"
+        _write_gdb(gdb, buildings=buildings, extent_ft=extent_ft, seed=seed)
+        gdb_bytes = sum(p.stat().st_size for p in gdb.rglob("*") if p.is_file())
+
+        built = time.perf_counter()
+        index = build_tile_store_from_gdbs({"Kings": gdb}, root / "store")
+        build_seconds = time.perf_counter() - built
+        gcs = _MemoryGcs()
+        upload_tile_store(root / "store", gcs_client=gcs, bucket="benchmark")
+
+        target_crs = CRS.from_epsg(3857)
+        scan_times: list[float] = []
+        tile_times: list[float] = []
+        tile_bytes: list[int] = []
+        tiles_read: list[int] = []
+        features: list[int] = []
+        for number, aoi in enumerate(
+            _aois(count=aois, extent_ft=extent_ft, half_size=half_size, seed=seed)
+        ):
+            started = time.perf_counter()
+            scanned = _features_for_bbox(gdb_path=gdb, bbox=aoi, target_crs=target_crs)
+            scan_times.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            store = FootprintTileStore.open(
+                gcs_client=gcs, bucket="benchmark", cache_dir=root / f"cache-{number}"
+            )
+            assert store is not None
+            tiled = store.features_for_bbox(aoi)
+            tile_times.append(time.perf_counter() - started)
+            tile_bytes.append(store.stats()["bytes_downloaded"])
+            tiles_read.append(store.stats()["tiles_downloaded"])
+            features.append(len(tiled))
+            if abs(len(tiled) - len(scanned)) > max(2, len(scanned) // 100):
+                raise RuntimeError(f"AOI {number}: {len(tiled)} tiled vs {len(scanned)} scanned")
+
+        return {
+            "buildings": buildings,
+            "aois": aois,
+            "aoi_half_size_m": half_size,
+            "mean_features_per_aoi": round(statistics.fmean(features), 1),
+            "gdb_bytes": gdb_bytes,
+            "store": {
+                "tile_size_m": TILE_SIZE_M,
+                "tiles": len(index["tiles"]),
+                "bytes": sum(tile["bytes"] for tile in index["tiles"].values()),
+                "build_seconds": round(build_seconds, 2),
+            },
+            "gdb_scan": _summary(scan_times),
+            "tile_store": {
+                **_summary(tile_times),
+                "mean_tiles_downloaded": round(statistics.fmean(tiles_read), 2),
+                "mean_bytes_downloaded": round(statistics.fmean(tile_bytes)),
+            },
+            "speedup": round(statistics.fmean(scan_times) / statistics.fmean(tile_times), 1),
+        }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare GDB scans with the pre-tiled footprint store."
+    )
+    parser.add_argument("--buildings", type=int, default=100_000)
+    parser.add_argument("--extent-ft", type=float, default=60_000.0)
+    parser.add_argument("--aois", type=int, default=30)
+    parser.add_argument("--half-size", type=float, default=250.0, help="AOI half-size, EPSG:3857")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+    report = run(
+        buildings=args.buildings,
+        extent_ft=args.extent_ft,
+        aois=args.aois,
+        half_size=args.half_size,
+        seed=args.seed,
+    )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Micro-benchmark footprint reprojection: per geometry vs batched.
+
+Generates synthetic WGS84 building footprints as GeoJSON dicts, projects
+them to EPSG:3857, and writes a FeatureCollection, two ways:
+
+- ``per_geometry``: the previous pipeline. Each geometry goes through
+  ``shape``, then ``shapely.ops.transform(transformer.transform, geom)``
+  (one pyproj callback per geometry), then ``mapping``. The file is
+  written with ``json.dumps(indent=2)``.
+- ``batched``: ``shape`` per feature, then ``_project_geometries`` (one
+  ``shapely.transform``/pyproj call over every vertex), an array
+  ``is_empty`` filter, and ``_write_feature_collection``, which encodes
+  all geometries in one ``shapely.to_geojson`` call.
+
+``project_*`` times only the reprojection step; ``total_*`` includes
+parsing and writing. The two written files are compared vertex by
+vertex. No network is used.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+WORKER_ROOT = ROOT / "worker"
+if str(WORKER_ROOT) not in sys.path:
+    sys.path.insert(0, str(WORKER_ROOT))
+
+import numpy as np
+import shapely
+from pyproj import CRS, Transformer
+from services.imagery_inputs import _project_geometries, _write_feature_collection
+from shapely.geometry import mapping, shape
+from shapely.ops import transform as shapely_transform
+
+
+def _footprints(count: int, seed: int) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    features = []
+    for _ in range(count):
+        lon = rng.uniform(-74.05, -73.75)
+        lat = rng.uniform(40.55, 40.90)
+        w, h = rng.uniform(0.0001, 0.0006), rng.uniform(0.0001, 0.0006)
+        # An L-shaped outline: eight vertices, closer to real footprints than a box.
+        ring = [
+            (lon, lat),
+            (lon + w, lat),
+            (lon + w, lat + h / 2),
+            (lon + w / 2, lat + h / 2),
+            (lon + w / 2, lat + h),
+            (lon, lat + h),
+            (lon, lat + h / 2),
+            (lon, lat),
+        ]
+        features.append({"type": "Polygon", "coordinates": [ring]})
+    return features
+
+
+def _per_geometry(
+    geometries: list[dict[str, Any]], transformer: Transformer, path: Path
+) -> float:
+    parsed = [shape(geometry) for geometry in geometries]
+    started = time.perf_counter()
+    projected = [shapely_transform(transformer.transform, geom) for geom in parsed]
+    project_seconds = time.perf_counter() - started
+    features = [
+        {"type": "Feature", "properties": {}, "geometry": mapping(geom)}
+        for geom in projected
+        if not geom.is_empty
+    ]
+    collection = {"type": "FeatureCollection", "features": features}
+    path.write_text(json.dumps(collection, indent=2, sort_keys=False))
+    return project_seconds
+
+
+def _batched(geometries: list[dict[str, Any]], transformer: Transformer, path: Path) -> float:
+    parsed = [shape(geometry) for geometry in geometries]
+    started = time.perf_counter()
+    projected = _project_geometries(parsed, transformer)
+    project_seconds = time.perf_counter() - started
+    features = [
+        {"type": "Feature", "properties": {}, "geometry": geom}
+        for geom in projected[~shapely.is_empty(projected)]
+    ]
+    _write_feature_collection(path, features)
+    return project_seconds
+
+
+def _max_difference(left: Path, right: Path) -> float:
+    def _coords(path: Path) -> np.ndarray:
+        features = json.loads(path.read_text())["features"]
+        return np.array([xy for f in features for xy in f["geometry"]["coordinates"][0]])
+
+    return float(np.abs(_coords(left) - _coords(right)).max())
+
+
+def run(*, sizes: list[int], repeats: int, seed: int) -> dict[str, Any]:
+    transformer = Transformer.from_crs(CRS.from_epsg(4326), CRS.from_epsg(3857), always_xy=True)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            geometries = _footprints(size, seed)
+            row: dict[str, Any] = {"footprints": size}
+            for name, fn in (("per_geometry", _per_geometry), ("batched", _batched)):
+                best_total = best_project = float("inf")
+                for _ in range(repeats):
+                    started = time.perf_counter()
+                    project_seconds = fn(geometries, transformer, Path(tmp) / f"{name}.geojson")
+                    best_total = min(best_total, time.perf_counter() - started)
+                    best_project = min(best_project, project_seconds)
+                row[f"project_{name}_ms"] = round(best_project * 1000, 1)
+                row[f"total_{name}_ms"] = round(best_total * 1000, 1)
+            row["project_speedup"] = round(
+                row["project_per_geometry_ms"] / row["project_batched_ms"], 1
+            )
+            row["total_speedup"] = round(row["total_per_geometry_ms"] / row["total_batched_ms"], 1)
+            row["max_abs_difference_m"] = _max_difference(
+                Path(tmp) / "per_geometry.geojson", Path(tmp) / "batched.geojson"
+            )
+            results.append(row)
+    return {"repeats": repeats, "results": results}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare per-geometry and batched footprint reprojection."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000, 100_000])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+    with warnings.catch_warnings():
+        # shapely.ops.transform is deprecated in Shapely 2.1+; it is the baseline here.
+        warnings.simplefilter("ignore", DeprecationWarning)
+        report = run(sizes=args.sizes, repeats=args.repeats, seed=args.seed)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Benchmark whole-buffer vs streamed JSONL parsing of parcel artifacts.
+
+Writes synthetic ``map.jsonl`` and borough feeds at 1x, 5x and 20x today's
+published size to a temp directory, then parses each one in a fresh child
+process so peak RSS is attributable to a single reader:
+
+- ``buffered``: read the object, hash it, ``decode().splitlines()``, stdlib
+  ``json.loads`` per line (the original registry path).
+- ``streamed``: 1 MiB chunks through ``VerifiedJsonlStream`` with incremental
+  SHA-256/size checks and ``loads_line`` (orjson/msgspec when installed).
+
+Both readers keep every parsed row, as the registry does. No network access.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import random
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+API_ROOT = ROOT / "api"
+if str(API_ROOT) not in sys.path:
+    sys.path.insert(0, str(API_ROOT))
+
+from app.services.jsonl_stream import (
+    DEFAULT_CHUNK_SIZE,
+    JSON_BACKEND,
+    VerifiedJsonlStream,
+    loads_line,
+)
+from benchmark_parcel_intel_registry import synthetic_row
+
+# Today's authenticated inventory: 5,000 map rows; the largest borough feed
+# carries roughly a fifth of that.
+BASE_ROWS = {"map.jsonl": 5_000, "brooklyn.jsonl": 1_000}
+SCALES = (1, 5, 20)
+
+
+def _max_rss_mb() -> float:
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def _write_artifact(path: Path, rows: int, seed: int) -> dict[str, Any]:
+    rng = random.Random(seed)
+    digest = hashlib.sha256()
+    size = 0
+    with path.open("wb") as handle:
+        for rank in range(1, rows + 1):
+            line = (json.dumps(synthetic_row("3", rank, rng)) + "\n").encode("utf-8")
+            digest.update(line)
+            size += len(line)
+            handle.write(line)
+    return {"size_bytes": size, "sha256": digest.hexdigest(), "row_count": rows}
+
+
+def _parse_buffered(path: Path, metadata: dict[str, Any]) -> int:
+    payload = path.read_bytes()
+    if (
+        len(payload) != metadata["size_bytes"]
+        or hashlib.sha256(payload).hexdigest() != metadata["sha256"]
+    ):
+        raise RuntimeError("integrity mismatch")
+    rows = []
+    for line in payload.decode("utf-8", errors="replace").splitlines():
+        if line.strip():
+            rows.append(json.loads(line))
+    return len(rows)
+
+
+def _parse_streamed(path: Path, metadata: dict[str, Any]) -> int:
+    def _chunks():
+        with path.open("rb") as handle:
+            while chunk := handle.read(DEFAULT_CHUNK_SIZE):
+                yield chunk
+
+    rows = []
+    for line in VerifiedJsonlStream(
+        _chunks(),
+        expected_size=metadata["size_bytes"],
+        expected_sha256=metadata["sha256"],
+    ):
+        if line.strip():
+            rows.append(loads_line(line))
+    return len(rows)
+
+
+def _child(reader: str, path: str, metadata: dict[str, Any], queue) -> None:
+    baseline = _max_rss_mb()
+    started = time.perf_counter()
+    parse = _parse_buffered if reader == "buffered" else _parse_streamed
+    rows = parse(Path(path), metadata)
+    queue.put(
+        {
+            "rows": rows,
+            "seconds": round(time.perf_counter() - started, 3),
+            "peak_rss_delta_mb": round(_max_rss_mb() - baseline, 1),
+        }
+    )
+
+
+def _measure(reader: str, path: Path, metadata: dict[str, Any]) -> dict[str, Any]:
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_child, args=(reader, str(path), metadata, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def run(*, scales: tuple[int, ...], seed: int) -> dict[str, Any]:
+    report: dict[str, Any] = {"json_backend": JSON_BACKEND, "artifacts": []}
+    with tempfile.TemporaryDirectory(prefix="parcel-parse-bench-") as tmp:
+        for leaf, base_rows in BASE_ROWS.items():
+            for scale in scales:
+                path = Path(tmp) / f"{scale}x-{leaf}"
+                metadata = _write_artifact(path, base_rows * scale, seed)
+                report["artifacts"].append(
+                    {
+                        "artifact": leaf,
+                        "scale": scale,
+                        "rows": metadata["row_count"],
+                        "size_mb": round(metadata["size_bytes"] / (1024 * 1024), 1),
+                        "buffered": _measure("buffered", path, metadata),
+                        "streamed": _measure("streamed", path, metadata),
+                    }
+                )
+                path.unlink()
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare peak RSS and parse time of buffered and streamed parcel "
+            "JSONL readers at several artifact sizes."
+        )
+    )
+    parser.add_argument(
+        "--scales",
+        default=",".join(str(scale) for scale in SCALES),
+        help="Comma-separated multiples of today's artifact size.",
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    scales = tuple(int(value) for value in args.scales.split(",") if value.strip())
+    print(json.dumps(run(scales=scales, seed=args.seed), indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Benchmark resident memory and lookup latency of official-dossier shards.
+
+Builds synthetic validated rows for one dossier shard (about 3,350 lots, the
+citywide ~858k lots over 256 shards) with realistic value cardinality:
+mostly unique addresses and owners, a small zoning/building-class vocabulary,
+and a mix of integer, float, boolean, and null scalars. Then compares the two
+in-memory shard representations:
+
+- ``dict``: the original ``{bbl: row_dict}`` produced by validation.
+- ``compact``: ``CompactDossierShard``, a sorted BBL array with
+  dictionary-encoded string columns and packed scalar columns.
+
+Reports retained heap per shard (tracemalloc), the extrapolation to all 256
+shards, and ``get()`` p50/p99 latency for random present BBLs. No network or
+GCS credentials are used.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+API_ROOT = ROOT / "api"
+if str(API_ROOT) not in sys.path:
+    sys.path.insert(0, str(API_ROOT))
+
+from app.services.parcel_official_dossier import ROW_FIELDS, CompactDossierShard
+from benchmark_parcel_intel_registry import _max_rss_mb, _percentiles, _retained_bytes
+
+SHARDS = 256
+STREETS = [
+    "OVINGTON AVENUE",
+    "BROADWAY",
+    "ATLANTIC AVENUE",
+    "GRAND CONCOURSE",
+    "QUEENS BOULEVARD",
+    "VICTORY BOULEVARD",
+    "FLATBUSH AVENUE",
+    "AMSTERDAM AVENUE",
+]
+ZONES = ["R6A", "R5", "R4-1", "C4-4", "M1-1", "R7A", "R3-2", "C1-9"]
+CLASSES = ["B3", "A1", "C0", "D4", "K1", "S2", "A5", "B1", "C2", "V0"]
+
+
+def _synthetic_rows(count: int, seed: int) -> dict[str, dict[str, Any]]:
+    rng = random.Random(seed)
+    rows: dict[str, dict[str, Any]] = {}
+    while len(rows) < count:
+        block, lot = rng.randint(1, 99_999), rng.randint(1, 9_999)
+        bbl = f"{rng.randint(1, 5)}{block:05d}{lot:04d}"
+        owner = f"OWNER {rng.randint(1, 2_000_000)} LLC"
+        sold = rng.random() < 0.7
+        rows[bbl] = {
+            "b": bbl,
+            "a": f"{rng.randint(1, 2_500)} {rng.choice(STREETS)}",
+            "po": owner,
+            "ao": owner if rng.random() < 0.8 else f"BUYER {rng.randint(1, 10**6)}",
+            "sd": f"20{rng.randint(0, 25):02d}-{rng.randint(1, 12):02d}-15T00:00:00"
+            if sold
+            else None,
+            "sp": float(rng.randint(100, 9_000) * 1_000) if sold else None,
+            "yh": rng.randint(0, 40),
+            "la": float(rng.randint(1_000, 20_000)),
+            "ba": float(rng.randint(800, 60_000)),
+            "u": rng.randint(1, 40),
+            "nf": float(rng.randint(1, 12)),
+            "yb": rng.randint(1880, 2024),
+            "lu": str(rng.randint(1, 11)),
+            "bc": rng.choice(CLASSES),
+            "z1": rng.choice(ZONES),
+            "z2": rng.choice(ZONES) if rng.random() < 0.1 else None,
+            "bf": round(rng.random() * 4, 2),
+            "rf": rng.choice([3.0, 2.0, 0.6, 6.02]),
+            "cf": rng.choice([0.0, 2.0, 4.0]),
+            "ff": rng.choice([0.0, 4.8]),
+            "al": float(rng.randint(10_000, 900_000)),
+            "ab": float(rng.randint(1_000, 300_000)),
+            "at": float(rng.randint(1_000, 300_000)),
+            "f07": rng.random() < 0.1,
+            "f15": rng.random() < 0.12,
+            "er": rng.random() < 0.05,
+            "ek": f"E-{rng.randint(1, 900)}" if rng.random() < 0.05 else None,
+            "en": None,
+        }
+    assert all(list(row) == ROW_FIELDS for row in rows.values())
+    return rows
+
+
+def _latency(shard: Any, bbls: list[str]) -> dict[str, float]:
+    samples = []
+    for bbl in bbls:
+        started = time.perf_counter()
+        shard.get(bbl)
+        samples.append(time.perf_counter() - started)
+    return _percentiles(samples)
+
+
+def run(*, rows_per_shard: int, lookups: int, seed: int) -> dict[str, Any]:
+    source = json.dumps(_synthetic_rows(rows_per_shard, seed))
+    as_dict, dict_bytes = _retained_bytes(lambda: json.loads(source))
+    compact, compact_bytes = _retained_bytes(
+        lambda: CompactDossierShard(json.loads(source))
+    )
+    assert dict(compact.items()) == as_dict, "compact shard does not round-trip"
+    rng = random.Random(seed + 1)
+    bbls = [rng.choice(list(as_dict)) for _ in range(lookups)]
+    mib = 1024 * 1024
+    return {
+        "rows_per_shard": rows_per_shard,
+        "lookups": lookups,
+        "dict": {
+            "retained_bytes_per_shard": dict_bytes,
+            "all_shards_mib": round(dict_bytes * SHARDS / mib, 1),
+            "get": _latency(as_dict, bbls),
+        },
+        "compact": {
+            "retained_bytes_per_shard": compact_bytes,
+            "all_shards_mib": round(compact_bytes * SHARDS / mib, 1),
+            "get": _latency(compact, bbls),
+        },
+        "memory_ratio": round(dict_bytes / compact_bytes, 1),
+        "max_rss_mb": _max_rss_mb(),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare per-shard memory and get() latency of dict and compact "
+            "official-dossier shards."
+        )
+    )
+    parser.add_argument("--rows-per-shard", type=int, default=3_350)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    report = run(
+        rows_per_shard=args.rows_per_shard,
+        lookups=args.lookups,
+        seed=args.seed,
+    )
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
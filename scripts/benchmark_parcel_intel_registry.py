@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""Benchmark Parcel Intelligence sweep/detail reads on a synthetic generation.
+
+Builds an in-memory 5-borough x 5,000-row atomic generation and compares the
+historical read path (re-validate every cached raw row on each request, then
+scan for a BBL) with the registry's validated-once, BBL-indexed row store.
+Reports p50/p99 latency per operation and the memory retained by each cache
+shape. No network or GCS credentials are used.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import hashlib
+import json
+import random
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+API_ROOT = ROOT / "api"
+if str(API_ROOT) not in sys.path:
+    sys.path.insert(0, str(API_ROOT))
+
+from app.models.schemas import ParcelIntelRow
+from app.routes.parcel_intel import ParcelIntelRegistry
+
+BOROUGHS = {
+    "manhattan": "1",
+    "bronx": "2",
+    "brooklyn": "3",
+    "queens": "4",
+    "staten_island": "5",
+}
+GENERATION = "20260723T230308737433Z-aaaaaaaaaaaa"
+PREFIX = f"parcel-intel/v1/generations/{GENERATION}"
+
+
+class _MemoryGcs:
+    def __init__(self, store: dict[str, bytes]) -> None:
+        self._store = store
+
+    def download_bytes(self, *, object_name: str) -> tuple[bytes, str | None]:
+        if object_name not in self._store:
+            raise FileNotFoundError(object_name)
+        return self._store[object_name], "application/json"
+
+
+def synthetic_row(borough_digit: str, rank: int, rng: random.Random) -> dict[str, Any]:
+    lat = 40.6 + rng.random() * 0.2
+    lng = -74.0 + rng.random() * 0.2
+    return {
+        "bbl": f"{borough_digit}{rank:09d}",
+        "address": f"{rank} SYNTHETIC STREET",
+        "address_source": "nyc_pluto",
+        "borough": borough_digit,
+        "score_calibrated": rng.random(),
+        "score_calibrated_p10": rng.random() * 0.5,
+        "score_calibrated_p90": 0.5 + rng.random() * 0.5,
+        "priority_rank": rank,
+        "priority_tier": "high",
+        "model_rank": rank,
+        "acquisition_rank": rank,
+        "citywide_rank": rank,
+        "acquisition_eligible": True,
+        "acquisition_status": "eligible",
+        "acquisition_exclusion_reasons": [],
+        "lot_area_sqft": 2500.0 + rank,
+        "allowed_far": 4.0,
+        "max_floor_area_sqft": 10000.0,
+        "unused_floor_area_sqft": 6000.0,
+        "far_utilization_pct": 40.0,
+        "zoning_district_1": "R6",
+        "land_use": "02",
+        "year_built": 1920,
+        "num_floors": 2.0,
+        "lat": lat,
+        "lng": lng,
+        "parcel_geometry": {
+            "type": "Polygon",
+            "coordinates": [
+                [
+                    [lng, lat],
+                    [lng + 0.0002, lat],
+                    [lng + 0.0002, lat + 0.0002],
+                    [lng, lat + 0.0002],
+                    [lng, lat],
+                ]
+            ],
+        },
+        "last_sale_price": 1_000_000.0,
+        "last_sale_year": 2019,
+        "years_held": 7,
+        "top_features": [
+            {
+                "name": "unused_floor_area_sqft",
+                "value": 6000.0,
+                "contribution_logit": 0.12,
+                "contribution_pct": 61.0,
+            },
+            {
+                "name": "years_held",
+                "value": 7,
+                "contribution_logit": 0.05,
+                "contribution_pct": 25.0,
+            },
+        ],
+    }
+
+
+def _synthetic_generation(rows_per_borough: int, seed: int) -> dict[str, bytes]:
+    rng = random.Random(seed)
+    store: dict[str, bytes] = {}
+    artifacts: dict[str, dict[str, Any]] = {}
+    boroughs = []
+    for slug, digit in BOROUGHS.items():
+        body = (
+            "\n".join(
+                json.dumps(synthetic_row(digit, rank, rng))
+                for rank in range(1, rows_per_borough + 1)
+            )
+            + "\n"
+        ).encode("utf-8")
+        leaf = f"{slug}.jsonl"
+        store[f"{PREFIX}/{leaf}"] = body
+        artifacts[leaf] = {
+            "object_name": f"{PREFIX}/{leaf}",
+            "sha256": hashlib.sha256(body).hexdigest(),
+            "size_bytes": len(body),
+            "row_count": rows_per_borough,
+        }
+        boroughs.append(
+            {"slug": slug, "display_name": slug.title(), "count": rows_per_borough}
+        )
+    map_body = b""
+    store[f"{PREFIX}/map.jsonl"] = map_body
+    artifacts["map.jsonl"] = {
+        "object_name": f"{PREFIX}/map.jsonl",
+        "sha256": hashlib.sha256(map_body).hexdigest(),
+        "size_bytes": 0,
+        "row_count": 0,
+    }
+    store["parcel-intel/v1/manifest.json"] = json.dumps(
+        {
+            "schema": "citylens-parcel-intel/published_sweep@v5",
+            "generated_at": "2026-07-23T23:03:08.737433+00:00",
+            "boroughs": boroughs,
+            "model_metadata": {},
+            "publication_schema": "citylens-parcel-intel/atomic-publication@v1",
+            "artifact_generation": GENERATION,
+            "artifact_prefix": PREFIX,
+            "artifacts": artifacts,
+        }
+    ).encode("utf-8")
+    return store
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    p99_index = min(len(ordered) - 1, round(0.99 * (len(ordered) - 1)))
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 4),
+        "p99_ms": round(ordered[p99_index] * 1000, 4),
+    }
+
+
+def _time(fn: Callable[[], object], iterations: int) -> dict[str, float]:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return _percentiles(samples)
+
+
+def _retained_bytes(build: Callable[[], object]) -> tuple[object, int]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    value = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, after - before
+
+
+def _max_rss_mb() -> float:
+    # Linux reports KiB; macOS reports bytes.
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale, 1)
+
+
+def run(*, rows_per_borough: int, iterations: int, seed: int) -> dict[str, Any]:
+    store = _synthetic_generation(rows_per_borough, seed)
+    gcs = _MemoryGcs(store)
+    rng = random.Random(seed)
+    lookups = [
+        f"{digit}{rng.randint(1, rows_per_borough):09d}"
+        for digit in rng.choices(list(BOROUGHS.values()), k=iterations)
+    ]
+
+    def _legacy_cache() -> dict[str, list[dict[str, Any]]]:
+        return {
+            slug: [
+                json.loads(line)
+                for line in store[f"{PREFIX}/{slug}.jsonl"].decode("utf-8").splitlines()
+            ]
+            for slug in BOROUGHS
+        }
+
+    legacy, legacy_bytes = _retained_bytes(_legacy_cache)
+    assert isinstance(legacy, dict)
+
+    def _legacy_sweep() -> None:
+        rows = [ParcelIntelRow(**raw) for raw in legacy["brooklyn"]]
+        rows[:25]
+
+    lookup_iter = iter(lookups * 2)
+
+    def _legacy_parcel() -> None:
+        bbl = next(lookup_iter)
+        slug = next(s for s, d in BOROUGHS.items() if d == bbl[0])
+        rows = [ParcelIntelRow(**raw) for raw in legacy[slug]]
+        next(row for row in rows if row.bbl == bbl)
+
+    legacy_results = {
+        "sweep": _time(_legacy_sweep, iterations),
+        "parcel": _time(_legacy_parcel, iterations),
+        "retained_mb": round(legacy_bytes / (1024 * 1024), 1),
+    }
+    legacy.clear()
+
+    registry = ParcelIntelRegistry()
+
+    def _warm() -> ParcelIntelRegistry:
+        for slug in BOROUGHS:
+            registry.borough(gcs, slug)
+        return registry
+
+    _, indexed_bytes = _retained_bytes(_warm)
+    lookup_iter = iter(lookups)
+
+    indexed_results = {
+        "sweep": _time(lambda: registry.borough(gcs, "brooklyn")[0].head(25), iterations),
+        "parcel": _time(lambda: registry.parcel(gcs, next(lookup_iter)), iterations),
+        "retained_mb": round(indexed_bytes / (1024 * 1024), 1),
+    }
+    return {
+        "rows_per_borough": rows_per_borough,
+        "iterations": iterations,
+        "legacy_revalidate_per_request": legacy_results,
+        "indexed_row_store": indexed_results,
+        "max_rss_mb": _max_rss_mb(),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare per-request row re-validation with the indexed Parcel "
+            "Intelligence row store on a synthetic generation."
+        )
+    )
+    parser.add_argument("--rows-per-borough", type=int, default=5_000)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    report = run(
+        rows_per_borough=args.rows_per_borough,
+        iterations=args.iterations,
+        seed=args.seed,
+    )
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
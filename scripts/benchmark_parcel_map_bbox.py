@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Benchmark viewport (bbox/tile) map queries against the full citywide feed.
+
+Builds a synthetic 5-borough citywide map, warms the registry's per-generation
+grid index, then for each zoom level queries XYZ tiles centred on random
+published rows. Reports p50/p99 query latency for the authenticated tier and
+the median/max serialized response size (raw JSON and gzip) next to the full
+authenticated feed a client would otherwise download. No network or GCS
+credentials are used.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import math
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+API_ROOT = ROOT / "api"
+if str(API_ROOT) not in sys.path:
+    sys.path.insert(0, str(API_ROOT))
+
+from app.routes import parcel_intel
+from app.services.parcel_spatial_index import tile_bbox
+from benchmark_parcel_intel_registry import _percentiles
+from benchmark_parcel_map_preview import _MemoryGcs, _synthetic_map
+
+ZOOMS = (11, 13, 15, 17)
+
+
+def _tile_for(lat: float, lng: float, zoom: int) -> tuple[int, int]:
+    n = 1 << zoom
+    x = int((lng + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n)
+    return x, y
+
+
+def _sizes(body: bytes) -> tuple[int, int]:
+    return len(body), len(gzip.compress(body, compresslevel=6))
+
+
+def run(*, rows_per_borough: int, queries: int, seed: int) -> dict[str, Any]:
+    gcs = _MemoryGcs(_synthetic_map(rows_per_borough, seed))
+    registry = parcel_intel.ParcelIntelRegistry()
+    started = time.perf_counter()
+    index, manifest = registry.map_index(gcs)
+    cold_ms = round((time.perf_counter() - started) * 1000, 2)
+    rows, _ = registry.citywide_map(gcs)
+    full_raw, full_gzip = _sizes(
+        parcel_intel._map_response(
+            list(rows),
+            manifest,
+            authenticated=True,
+            requested_top_per_borough=1000,
+            available_count=len(rows),
+        )
+        .model_dump_json(by_alias=True)
+        .encode("utf-8")
+    )
+
+    rng = random.Random(seed)
+    centres = [rng.choice(rows) for _ in range(queries)]
+    by_zoom: dict[str, Any] = {}
+    for zoom in ZOOMS:
+        windows = [tile_bbox(zoom, *_tile_for(row.lat, row.lng, zoom)) for row in centres]
+        samples = []
+        counts = []
+        raw_sizes = []
+        gzip_sizes = []
+        for window in windows:
+            t0 = time.perf_counter()
+            selected, available, _ = registry.map_window(
+                gcs, window, 1000, authenticated=True
+            )
+            samples.append(time.perf_counter() - t0)
+            counts.append(len(selected))
+            raw, packed = _sizes(
+                parcel_intel._map_response(
+                    selected,
+                    manifest,
+                    authenticated=True,
+                    requested_top_per_borough=1000,
+                    available_count=available,
+                    bbox=window,
+                )
+                .model_dump_json(by_alias=True)
+                .encode("utf-8")
+            )
+            raw_sizes.append(raw)
+            gzip_sizes.append(packed)
+        by_zoom[f"z{zoom}"] = {
+            "query": _percentiles(samples),
+            "rows_median": statistics.median(counts),
+            "rows_max": max(counts),
+            "raw_bytes_median": statistics.median(raw_sizes),
+            "gzip_bytes_median": statistics.median(gzip_sizes),
+            "gzip_bytes_max": max(gzip_sizes),
+            "gzip_fraction_of_full_feed": round(
+                statistics.median(gzip_sizes) / full_gzip, 4
+            ),
+        }
+    return {
+        "rows": len(index),
+        "queries_per_zoom": queries,
+        "cold_load_and_index_ms": cold_ms,
+        "full_feed": {"raw_bytes": full_raw, "gzip_bytes": full_gzip},
+        "by_zoom": by_zoom,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare bbox/tile map query latency and response size with the "
+            "full citywide feed on a synthetic generation."
+        )
+    )
+    parser.add_argument("--rows-per-borough", type=int, default=1_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    report = run(
+        rows_per_borough=args.rows_per_borough,
+        queries=args.queries,
+        seed=args.seed,
+    )
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Load-test ``/v1/parcel-intel/map`` in-process for both access tiers.
+
+Mounts the parcel-intel router on a bare FastAPI app (with the production
+GZipMiddleware settings) backed by a synthetic 5-borough citywide map, then
+drives gzip-accepting requests through the full ASGI stack and reports CPU
+time per request (``time.process_time``) for each tier:
+
+- ``per_request_projection``: the original route body. Every request
+  selects rows (capping and stripping premium fields with ``model_copy`` for
+  anonymous callers), lets FastAPI validate and serialize the response
+  model, and GZipMiddleware compresses it.
+- ``prepared``: the registry's per-generation body, serialized and
+  gzip-compressed once and returned as cached bytes with a strong ETag.
+- ``prepared_not_modified``: the same request with ``If-None-Match`` set to
+  that ETag, answered with a bodiless 304.
+
+The rate limiter is disabled for the run. No network or GCS credentials are
+used.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Annotated, Any
+
+ROOT = Path(__file__).resolve().parents[1]
+API_ROOT = ROOT / "api"
+if str(API_ROOT) not in sys.path:
+    sys.path.insert(0, str(API_ROOT))
+
+from app.models.schemas import ParcelIntelMapResponse
+from app.routes import parcel_intel
+from app.services.auth import maybe_parcel_read_auth
+from app.services.auth_context import AuthContext
+from app.services.rate_limit import demo_rate_limit
+from benchmark_parcel_intel_registry import BOROUGHS, synthetic_row
+from fastapi import Depends, FastAPI, Query, Response
+from fastapi.testclient import TestClient
+from starlette.middleware.gzip import GZipMiddleware
+
+
+class _MemoryGcs:
+    def __init__(self, store: dict[str, bytes]) -> None:
+        self._store = store
+
+    def download_bytes(self, *, object_name: str) -> tuple[bytes, str | None]:
+        if object_name not in self._store:
+            raise FileNotFoundError(object_name)
+        return self._store[object_name], "application/json"
+
+
+def _synthetic_map(rows_per_borough: int, seed: int) -> dict[str, bytes]:
+    rng = random.Random(seed)
+    lines = []
+    for slug, digit in BOROUGHS.items():
+        for rank in range(1, rows_per_borough + 1):
+            row = synthetic_row(digit, rank, rng)
+            row.update(
+                borough=slug,
+                owner_name="SYNTHETIC OWNER LLC",
+                owner_entity_type="llc",
+                recent_change=True,
+                nearest_transit_station_name="Atlantic Av-Barclays Ctr",
+                nearest_transit_routes=["2", "3", "4", "5"],
+            )
+            lines.append(json.dumps(row))
+    return {
+        "parcel-intel/v1/manifest.json": json.dumps(
+            {
+                "schema": "citylens-parcel-intel/published_sweep@v5",
+                "generated_at": "2026-07-23T23:03:08.737433+00:00",
+                "boroughs": [
+                    {"slug": slug, "display_name": slug.title(), "count": rows_per_borough}
+                    for slug in BOROUGHS
+                ],
+            }
+        ).encode("utf-8"),
+        "parcel-intel/v1/map.jsonl": ("\n".join(lines) + "\n").encode("utf-8"),
+    }
+
+
+_AUTH = AuthContext(
+    app_user_id="benchmark-user",
+    auth_provider="mock",
+    auth_subject="benchmark-user",
+    email="benchmark@example.com",
+    email_verified=True,
+    is_admin=False,
+    plan_type="free",
+)
+
+
+def _build_app(gcs: _MemoryGcs, *, authenticated: bool) -> FastAPI:
+    registry = parcel_intel.ParcelIntelRegistry()
+    app = FastAPI()
+    app.add_middleware(GZipMiddleware, minimum_size=1_000, compresslevel=6)
+    app.include_router(parcel_intel.router, prefix="/v1")
+
+    @app.get("/legacy/map", response_model=ParcelIntelMapResponse)
+    def legacy_map(
+        response: Response,
+        auth: Annotated[AuthContext | None, Depends(maybe_parcel_read_auth)],
+        top_per_borough: int = Query(1000, ge=1, le=1000),
+    ) -> ParcelIntelMapResponse:
+        rows, manifest = registry.citywide_map(gcs)
+        if auth is not None:
+            selected = list(rows)
+        else:
+            cap = min(top_per_borough, parcel_intel._ANON_TOP_CAP)
+            selected = [
+                parcel_intel._strip_map_premium_fields(row)
+                for row in parcel_intel._cap_per_borough(rows, cap)
+            ]
+        response.headers["Cache-Control"] = (
+            parcel_intel._MAP_CACHE_AUTHED if auth is not None else parcel_intel._MAP_CACHE
+        )
+        response.headers["X-CityLens-Inventory-Count"] = str(len(selected))
+        response.headers["X-CityLens-Inventory-Available"] = str(len(rows))
+        return parcel_intel._map_response(
+            selected,
+            manifest,
+            authenticated=auth is not None,
+            requested_top_per_borough=top_per_borough,
+            available_count=len(rows),
+        )
+
+    app.dependency_overrides[demo_rate_limit] = lambda: None
+    app.dependency_overrides[maybe_parcel_read_auth] = lambda: (
+        _AUTH if authenticated else None
+    )
+    app.dependency_overrides[parcel_intel.get_gcs] = lambda: gcs
+    app.dependency_overrides[parcel_intel.get_registry] = lambda: registry
+    return app
+
+
+def _cpu_per_request(
+    client: TestClient,
+    path: str,
+    requests: int,
+    headers: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    headers = {"Accept-Encoding": "gzip", **(headers or {})}
+    response = client.get(path, headers=headers)
+    status = response.status_code
+    wire_bytes = response.num_bytes_downloaded
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+    for _ in range(requests):
+        client.get(path, headers=headers)
+    cpu = time.process_time() - cpu_started
+    wall = time.perf_counter() - wall_started
+    return {
+        "status": status,
+        "wire_bytes": wire_bytes,
+        "cpu_ms_per_request": round(cpu / requests * 1000, 4),
+        "wall_ms_per_request": round(wall / requests * 1000, 4),
+    }
+
+
+def _tier(gcs: _MemoryGcs, requests: int, *, authenticated: bool) -> dict[str, Any]:
+    client = TestClient(_build_app(gcs, authenticated=authenticated))
+    etag = client.get(
+        "/v1/parcel-intel/map", headers={"Accept-Encoding": "gzip"}
+    ).headers["etag"]
+    results = {
+        "per_request_projection": _cpu_per_request(client, "/legacy/map", requests),
+        "prepared": _cpu_per_request(client, "/v1/parcel-intel/map", requests),
+        "prepared_not_modified": _cpu_per_request(
+            client,
+            "/v1/parcel-intel/map",
+            requests,
+            headers={"If-None-Match": etag},
+        ),
+    }
+    before = results["per_request_projection"]["cpu_ms_per_request"]
+    after = results["prepared"]["cpu_ms_per_request"]
+    return {
+        **results,
+        "cpu_speedup": round(before / after, 2) if after else None,
+    }
+
+
+def run(*, rows_per_borough: int, requests: int, seed: int) -> dict[str, Any]:
+    gcs = _MemoryGcs(_synthetic_map(rows_per_borough, seed))
+    return {
+        "rows_per_borough": rows_per_borough,
+        "requests": requests,
+        "public_preview": _tier(gcs, requests, authenticated=False),
+        "authenticated_full": _tier(gcs, requests, authenticated=True),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare per-request map serialization and compression with the "
+            "prepared, ETag-addressed body for each access tier."
+        )
+    )
+    parser.add_argument("--rows-per-borough", type=int, default=1_000)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    report = run(
+        rows_per_borough=args.rows_per_borough,
+        requests=args.requests,
+        seed=args.seed,
+    )
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Benchmark comparable-sale ranking of one subject against a ZIP window.
+
+Builds a synthetic full sales window (``MAX_SOURCE_ROWS`` priced records in
+one ZIP, with repeat sales, unit sales, and mixed building classes) and a
+subject lot, then times ranking the subject two ways:
+
+- ``scalar``: the original loop (``_sales_ranking_reference``), which parses
+  and scores every record with ``_candidate`` and sorts the survivors in
+  Python.
+- ``vectorized``: ``_ranked``, which scores the window's pre-parsed NumPy
+  columns at once and builds payloads for the top records only.
+
+The window is parsed before timing in both cases, as it is in the service,
+where parsing happens once per cached window. No network is used.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+API_ROOT = ROOT / "api"
+if str(API_ROOT) not in sys.path:
+    sys.path.insert(0, str(API_ROOT))
+
+from _sales_ranking_reference import ranked_scalar
+from app.services.parcel_sales_comparables import (
+    MAX_COMPARABLES,
+    MAX_SOURCE_ROWS,
+    ParcelSalesComparableService,
+    _SalesWindow,
+    _Subject,
+)
+from benchmark_parcel_intel_registry import _max_rss_mb, _time
+
+NOW = datetime(2026, 7, 30, 12, 0, tzinfo=timezone.utc)
+CLASSES = ["A1", "A5", "B1", "B2", "B3", "C0", "C2", "D4", "K1", "S2"]
+
+
+def _synthetic_window(rows: int, seed: int) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    window = []
+    for index in range(rows):
+        window.append(
+            {
+                "bbl": f"30589{rng.randint(0, rows // 2):05d}",
+                "address": f"{index} OVINGTON AVENUE",
+                "zip_code": "11209",
+                "building_class_category": "01 ONE FAMILY DWELLINGS",
+                "building_class_as_of_final": rng.choice(CLASSES),
+                "apartment_number": "" if rng.random() < 0.9 else "2F",
+                "land_square_feet": str(rng.randint(1_500, 20_000)),
+                "gross_square_feet": (
+                    str(rng.randint(1_000, 12_000)) if rng.random() < 0.9 else ""
+                ),
+                "residential_units": str(rng.randint(1, 6)),
+                "commercial_units": "0",
+                "total_units": str(rng.randint(1, 6)),
+                "year_built": str(rng.randint(1890, 2020)),
+                "sale_price": str(rng.randint(100, 6_000) * 1_000),
+                "sale_date": (
+                    f"{rng.randint(2023, 2026)}-{rng.randint(1, 6):02d}-"
+                    f"{rng.randint(1, 28):02d}T00:00:00.000"
+                ),
+                "latitude": f"{40.6368 + rng.uniform(-0.03, 0.03):.6f}",
+                "longitude": f"{-74.0312 + rng.uniform(-0.03, 0.03):.6f}",
+            }
+        )
+    return window
+
+
+def run(*, rows: int, iterations: int, seed: int) -> dict[str, Any]:
+    source = _synthetic_window(rows, seed)
+    window = _SalesWindow.parse(source, fetched_at=NOW, source_data_updated_at=None)
+    service = ParcelSalesComparableService(now=lambda: NOW)
+    subject = _Subject(
+        bbl="3058920038",
+        zip_code="11209",
+        latitude=40.6368,
+        longitude=-74.0312,
+        lot_area_sqft=9_260.0,
+        building_area_sqft=3_006.0,
+        building_class="B3",
+    )
+
+    def _scalar() -> list[Any]:
+        return ranked_scalar(service, source, subject=subject)[:MAX_COMPARABLES]
+
+    def _vectorized() -> list[Any]:
+        return service._ranked(window, subject=subject, limit=MAX_COMPARABLES)[0]
+
+    expected = ranked_scalar(service, source, subject=subject)
+    selected, eligible = service._ranked(
+        window, subject=subject, limit=MAX_COMPARABLES
+    )
+    assert eligible == len(expected), "eligible counts differ"
+    assert [item.payload for item in selected] == [
+        item.payload for item in expected[:MAX_COMPARABLES]
+    ], "rankings differ"
+    results = {
+        "scalar": _time(_scalar, iterations),
+        "vectorized": _time(_vectorized, iterations),
+    }
+    old_p50 = results["scalar"]["p50_ms"]
+    new_p50 = results["vectorized"]["p50_ms"]
+    return {
+        "window_rows": rows,
+        "eligible": eligible,
+        "iterations": iterations,
+        **results,
+        "p50_speedup": round(old_p50 / new_p50, 1) if new_p50 else None,
+        "max_rss_mb": _max_rss_mb(),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare scalar and vectorized comparable-sale ranking over one "
+            "synthetic ZIP sales window."
+        )
+    )
+    parser.add_argument("--rows", type=int, default=MAX_SOURCE_ROWS)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    report = run(rows=args.rows, iterations=args.iterations, seed=args.seed)
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
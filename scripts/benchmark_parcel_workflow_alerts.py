@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Benchmark ``/v1/parcel-intel/workflow/alerts`` input building.
+
+Builds a synthetic 5-borough atomic generation (1,000 rows per borough, so a
+5,000-row citywide map) and a 20-item watchlist of which a quarter also
+carries evidence reviews, then times one alerts request two ways:
+
+- ``per_request_inventory``: the original route body. Every request dumps
+  every citywide map row to a dict, scans the whole map for reviewed BBLs to
+  build their decision audits, and lets ``build_workflow_alerts`` index the
+  dumped rows by BBL.
+- ``per_generation_lookup``: the current route, which asks the registry's
+  per-generation BBL lookups for just the watchlist's rows and audit checks.
+
+Both paths run against a warm registry, so the artifact load and row
+validation are excluded. No network, Firestore, or GCS credentials are used.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+API_ROOT = ROOT / "api"
+if str(API_ROOT) not in sys.path:
+    sys.path.insert(0, str(API_ROOT))
+
+from app.routes import parcel_workflow
+from app.routes.parcel_intel import ParcelIntelRegistry
+from app.services.auth_context import AuthContext
+from app.services.parcel_decision_audit import build_parcel_decision_audit
+from app.services.parcel_workflow_alerts import build_workflow_alerts
+from benchmark_parcel_intel_registry import (
+    BOROUGHS,
+    PREFIX,
+    _MemoryGcs,
+    _synthetic_generation,
+    _time,
+)
+
+_AUTH = AuthContext(
+    app_user_id="benchmark-user",
+    auth_provider="mock",
+    auth_subject="benchmark-user",
+    email="benchmark@example.com",
+    email_verified=True,
+    is_admin=False,
+    plan_type="free",
+)
+
+
+def _generation_with_map(rows_per_borough: int, seed: int) -> dict[str, bytes]:
+    store = _synthetic_generation(rows_per_borough, seed)
+    map_lines = []
+    for slug in BOROUGHS:
+        for line in store[f"{PREFIX}/{slug}.jsonl"].splitlines():
+            row = json.loads(line)
+            row["borough"] = slug
+            map_lines.append(json.dumps(row))
+    map_body = ("\n".join(map_lines) + "\n").encode("utf-8")
+    store[f"{PREFIX}/map.jsonl"] = map_body
+    manifest = json.loads(store["parcel-intel/v1/manifest.json"])
+    manifest["artifacts"]["map.jsonl"].update(
+        sha256=hashlib.sha256(map_body).hexdigest(),
+        size_bytes=len(map_body),
+        row_count=len(map_lines),
+    )
+    store["parcel-intel/v1/manifest.json"] = json.dumps(manifest).encode("utf-8")
+    return store
+
+
+def _watchlist(
+    rows_per_borough: int, size: int, seed: int
+) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    items = []
+    for index in range(size):
+        slug, digit = rng.choice(list(BOROUGHS.items()))
+        rank = rng.randint(1, rows_per_borough)
+        item: dict[str, Any] = {
+            "bbl": f"{digit}{rank:09d}",
+            "borough": slug,
+            "watching": True,
+            "archived_at": None,
+            "snapshot": {
+                "feed_generated_at": "2026-06-23T00:00:00Z",
+                "owner_name": "PRIOR OWNER LLC",
+                "citywide_rank": rank + 250,
+            },
+        }
+        if index % 4 == 0:
+            item["evidence_reviews"] = {
+                "property_facts": {
+                    "check_key": "property_facts",
+                    "label": "Current property facts",
+                    "check_status": "verified",
+                    "source": "NYC PLUTO",
+                    "source_as_of": "2026-06-20",
+                    "feed_generated_at": "2026-06-23T00:00:00Z",
+                    "reviewed_at": datetime(2026, 6, 24, tzinfo=timezone.utc),
+                }
+            }
+        items.append(item)
+    return items
+
+
+class _MemoryStore:
+    def __init__(self, items: list[dict[str, Any]]) -> None:
+        self._items = items
+
+    def list_parcel_workflow(
+        self, *, app_user_id: str, include_archived: bool = False
+    ) -> list[dict[str, Any]]:
+        return self._items
+
+
+def _per_request_inventory(
+    registry: ParcelIntelRegistry,
+    gcs: _MemoryGcs,
+    items: list[dict[str, Any]],
+) -> dict[str, Any]:
+    rows, manifest = registry.citywide_map(gcs)
+    screening_rows, _ = registry.screening_ledger(gcs, manifest=manifest)
+    reviewed_bbls = {
+        str(item.get("bbl") or "")
+        for item in items
+        if item.get("archived_at") is None and item.get("evidence_reviews")
+    }
+    current_evidence_checks: dict[str, dict[str, dict]] = {}
+    for row in rows:
+        if row.bbl not in reviewed_bbls:
+            continue
+        # The full borough row carries the audit's source fields.
+        full_row, _ = registry.parcel(gcs, row.bbl)
+        audit = build_parcel_decision_audit(
+            full_row, manifest, premium_access=True
+        )
+        current_evidence_checks[row.bbl] = {
+            check.key: check.model_dump() for check in audit.checks
+        }
+    watched_bbls = {
+        str(item.get("bbl") or "")
+        for item in items
+        if item.get("watching") is True and item.get("archived_at") is None
+    }
+    return build_workflow_alerts(
+        items,
+        [row.model_dump() for row in rows],
+        screening_rows={
+            bbl: row.model_dump()
+            for bbl, row in screening_rows.items()
+            if bbl in watched_bbls
+        },
+        data_sources=(manifest or {}).get("data_sources") or {},
+        current_evidence_checks=current_evidence_checks,
+        feed_generated_at=(manifest or {}).get("generated_at"),
+    )
+
+
+def _comparable(result: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in result.items() if key != "generated_at"}
+
+
+def run(
+    *, rows_per_borough: int, watchlist: int, iterations: int, seed: int
+) -> dict[str, Any]:
+    gcs = _MemoryGcs(_generation_with_map(rows_per_borough, seed))
+    items = _watchlist(rows_per_borough, watchlist, seed)
+    store = _MemoryStore(items)
+    registry = ParcelIntelRegistry()
+    rows, _ = registry.citywide_map(gcs)
+
+    def _per_generation_lookup() -> dict[str, Any]:
+        return parcel_workflow.workflow_alerts(
+            auth=_AUTH, store=store, gcs=gcs, registry=registry
+        )
+
+    before = _per_request_inventory(registry, gcs, items)
+    after = _per_generation_lookup()
+    assert _comparable(before) == _comparable(after), "alert payloads differ"
+    results = {
+        "per_request_inventory": _time(
+            lambda: _per_request_inventory(registry, gcs, items), iterations
+        ),
+        "per_generation_lookup": _time(_per_generation_lookup, iterations),
+    }
+    old_p50 = results["per_request_inventory"]["p50_ms"]
+    new_p50 = results["per_generation_lookup"]["p50_ms"]
+    return {
+        "map_rows": len(rows),
+        "watchlist": len(items),
+        "reviewed": sum(1 for item in items if item.get("evidence_reviews")),
+        "alert_count": after["alert_count"],
+        "iterations": iterations,
+        **results,
+        "p50_speedup": round(old_p50 / new_p50, 1) if new_p50 else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare per-request alert input building over the whole citywide "
+            "map with the registry's per-generation BBL lookups."
+        )
+    )
+    parser.add_argument("--rows-per-borough", type=int, default=1_000)
+    parser.add_argument("--watchlist", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    report = run(
+        rows_per_borough=args.rows_per_borough,
+        watchlist=args.watchlist,
+        iterations=args.iterations,
+        seed=args.seed,
+    )
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Benchmark worker input staging against slow fake GCS/HTTP backends.
+
+Two measurements, each run sequentially (the previous behaviour) and
+concurrently:
+
+- ``county_restore``: the real ``ensure_nyc_county_footprints`` restoring
+  all five county GDB tarballs from a fake GCS client whose downloads sleep
+  for ``--gcs-latency`` seconds. The sequential run calls the per-county
+  helper in a loop, as the function did before.
+- ``stage_graph``: a ``StagingPlan`` with the same stages and dependencies
+  as ``ensure_work_dir_inputs``, where each stage sleeps for a typical
+  cold-start latency (scaled by ``--scale``). ``max_workers=1`` reproduces
+  the old one-after-another order.
+
+No network or GCP credentials are used.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import sys
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+WORKER_ROOT = ROOT / "worker"
+if str(WORKER_ROOT) not in sys.path:
+    sys.path.insert(0, str(WORKER_ROOT))
+
+from services import reference_data
+from services.reference_data import (
+    NYC_COUNTY_FOOTPRINT_ZIPS,
+    ensure_nyc_county_footprints,
+)
+from services.staging import StagingPlan, staging_workers_from_env
+
+# Cold-start seconds per stage, roughly what a cache-miss run spends.
+STAGE_SECONDS: dict[str, float] = {
+    "geocode": 0.4,
+    "county_footprints": 1.5,
+    "orthophoto": 1.2,
+    "lidar": 2.0,
+    "current_footprints": 0.8,
+    "baseline_footprints": 0.5,
+    "baseline": 0.2,
+}
+
+STAGE_AFTER: dict[str, tuple[str, ...]] = {
+    "geocode": (),
+    "county_footprints": ("geocode",),
+    "orthophoto": ("geocode",),
+    "lidar": ("geocode",),
+    "current_footprints": ("orthophoto",),
+    "baseline_footprints": ("orthophoto", "county_footprints"),
+    "baseline": ("orthophoto", "baseline_footprints"),
+}
+
+
+def _gdb_tarball(gdb_name: str) -> bytes:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tf:
+        data = b"fake-gdb-data"
+        info = tarfile.TarInfo(f"{gdb_name}/a00000001.gdbtable")
+        info.size = len(data)
+        tf.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+class _SlowBlob:
+    def __init__(self, storage: dict[str, bytes], name: str, latency: float) -> None:
+        self._storage = storage
+        self._name = name
+        self._latency = latency
+
+    def exists(self) -> bool:
+        return self._name in self._storage
+
+    def download_to_filename(self, path: str) -> None:
+        time.sleep(self._latency)
+        Path(path).write_bytes(self._storage[self._name])
+
+
+class _SlowGcsClient:
+    def __init__(self, latency: float) -> None:
+        self.storage: dict[str, bytes] = {}
+        self._latency = latency
+
+    def bucket(self, name: str) -> _SlowGcsClient:
+        return self
+
+    def blob(self, name: str) -> _SlowBlob:
+        return _SlowBlob(self.storage, name, self._latency)
+
+
+def _county_client(latency: float) -> _SlowGcsClient:
+    client = _SlowGcsClient(latency)
+    for county in NYC_COUNTY_FOOTPRINT_ZIPS:
+        object_name = reference_data._gcs_object_for(reference_data.DEFAULT_GCS_PREFIX, county)
+        slug = reference_data._safe_slug(county)
+        client.storage[object_name] = _gdb_tarball(f"{slug}_Building_Footprints.gdb")
+    return client
+
+
+def _county_restore(latency: float) -> dict[str, Any]:
+    def _no_http(url: str, dest_path: Path) -> None:
+        raise AssertionError(f"benchmark should restore from GCS, not fetch {url}")
+
+    reference_data._download = _no_http
+    timings: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        client = _county_client(latency)
+        started = time.perf_counter()
+        for county, url in NYC_COUNTY_FOOTPRINT_ZIPS.items():
+            reference_data._ensure_county(
+                county=county,
+                url=url,
+                data_dir=Path(tmp) / "sequential",
+                keep_zips=False,
+                gcs_client=client,
+                gcs_bucket="benchmark",
+                gcs_prefix=reference_data.DEFAULT_GCS_PREFIX,
+            )
+        timings["sequential_s"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        ensure_nyc_county_footprints(
+            data_dir=Path(tmp) / "concurrent",
+            gcs_client=client,
+            gcs_bucket="benchmark",
+        )
+        timings["concurrent_s"] = time.perf_counter() - started
+    return {
+        "counties": len(NYC_COUNTY_FOOTPRINT_ZIPS),
+        "gcs_latency_s": latency,
+        **{key: round(value, 3) for key, value in timings.items()},
+        "speedup": round(timings["sequential_s"] / timings["concurrent_s"], 2),
+    }
+
+
+def _stage_graph(max_workers: int, scale: float) -> dict[str, Any]:
+    plan = StagingPlan(max_workers=max_workers)
+    for name, after in STAGE_AFTER.items():
+        seconds = STAGE_SECONDS[name] * scale
+        plan.add(name, lambda *_deps, seconds=seconds: time.sleep(seconds), after=after)
+    plan.run()
+    return plan.report()
+
+
+def run(*, scale: float, gcs_latency: float) -> dict[str, Any]:
+    workers = staging_workers_from_env()
+    sequential = _stage_graph(1, scale)
+    concurrent = _stage_graph(workers, scale)
+    return {
+        "county_restore": _county_restore(gcs_latency),
+        "stage_graph": {
+            "scale": scale,
+            "sequential_s": sequential["wall_seconds"],
+            "concurrent_s": concurrent["wall_seconds"],
+            "max_workers": workers,
+            "speedup": round(sequential["wall_seconds"] / concurrent["wall_seconds"], 2),
+            "concurrent_stages": concurrent["stages"],
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare sequential and concurrent worker input staging."
+    )
+    parser.add_argument(
+        "--scale", type=float, default=0.25, help="multiplier on the per-stage latencies"
+    )
+    parser.add_argument(
+        "--gcs-latency", type=float, default=0.3, help="seconds per fake GCS download"
+    )
+    args = parser.parse_args()
+    print(json.dumps(run(scale=args.scale, gcs_latency=args.gcs_latency), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Build and publish the pre-tiled baseline footprint store.
+
+Restores (or downloads) the five NYC county footprint GDBs and converts
+them into EPSG:3857 FlatGeobuf tiles. It then uploads them under
+``gs://$CITYLENS_BUCKET/<prefix>/<digest>/`` and moves ``<prefix>/latest.json``
+to the new digest. Workers pick the store up on their next run.
+Re-running with unchanged GDBs produces the same digest. Use ``--dry-run``
+to build locally without uploading.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+WORKER_ROOT = ROOT / "worker"
+if str(WORKER_ROOT) not in sys.path:
+    sys.path.insert(0, str(WORKER_ROOT))
+
+from services.footprint_tiles import (
+    TILE_SIZE_M,
+    build_tile_store_from_gdbs,
+    footprint_tiles_prefix,
+    upload_tile_store,
+)
+from services.reference_data import DEFAULT_GCS_PREFIX, ensure_nyc_county_footprints
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bucket", default=os.getenv("CITYLENS_BUCKET", ""))
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        default=Path(os.getenv("CITYLENS_REFERENCE_DATA_DIR", "/tmp/reference-data")),
+    )
+    parser.add_argument("--out-dir", type=Path, default=Path("/tmp/footprint-tiles"))
+    parser.add_argument("--prefix", default=footprint_tiles_prefix())
+    parser.add_argument("--tile-size", type=float, default=TILE_SIZE_M)
+    parser.add_argument("--dry-run", action="store_true", help="build locally, do not upload")
+    args = parser.parse_args()
+
+    gcs_client = None
+    if args.bucket:
+        from google.cloud import storage
+
+        gcs_client = storage.Client()
+    elif not args.dry_run:
+        parser.error("--bucket (or CITYLENS_BUCKET) is required unless --dry-run is set")
+
+    started = time.perf_counter()
+    county_gdbs = ensure_nyc_county_footprints(
+        data_dir=args.data_dir,
+        gcs_client=gcs_client,
+        gcs_bucket=args.bucket or None,
+        gcs_prefix=os.getenv("CITYLENS_REFERENCE_GCS_PREFIX", DEFAULT_GCS_PREFIX),
+    )
+    index = build_tile_store_from_gdbs(county_gdbs, args.out_dir, tile_size=args.tile_size)
+    summary = {
+        "digest": index["digest"],
+        "tile_size": index["tile_size"],
+        "tiles": len(index["tiles"]),
+        "features": index["counties"],
+        "bytes": sum(tile["bytes"] for tile in index["tiles"].values()),
+        "out_dir": str(args.out_dir),
+        "published": None,
+    }
+    if not args.dry_run:
+        upload_tile_store(
+            args.out_dir, gcs_client=gcs_client, bucket=args.bucket, prefix=args.prefix
+        )
+        summary["published"] = f"gs://{args.bucket}/{args.prefix}/{index['digest']}"
+    summary["seconds"] = round(time.perf_counter() - started, 1)
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
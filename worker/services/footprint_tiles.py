@@ -0,0 +1,313 @@
+"""Pre-tiled baseline footprint store.
+
+The county FileGDBs are converted once into FlatGeobuf shards on a square
+EPSG:3857 grid. GDAL writes each shard with a packed Hilbert R-tree. The
+shards are uploaded under a prefix keyed by the digest of the source GDBs::
+
+    {prefix}/{digest}/index.json
+    {prefix}/{digest}/tiles/{col}_{row}.fgb
+    {prefix}/latest.json            -> {"digest": ...}
+
+``latest.json`` is written last, so readers never see a partial store. A
+run reads the pointer and the index, then downloads only the shards whose
+tiles intersect the AOI. Features are already projected to the ortho CRS
+and carry the same properties ``_features_for_bbox`` produces. A feature
+whose bounds span several tiles is written to each of them and
+de-duplicated on read.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import shutil
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from fiona import open as fiona_open
+from fiona.crs import CRS as FionaCRS
+from pyproj import CRS, Transformer
+from shapely.geometry import shape
+from shapely.geometry.base import BaseGeometry
+
+_LOG = logging.getLogger(__name__)
+
+STORE_SCHEMA = "footprint-tiles@v1"
+TILES_EPSG = 3857
+TILE_SIZE_M = 1024.0
+DEFAULT_GCS_PREFIX = "reference-data/footprint-tiles"
+POINTER_NAME = "latest.json"
+
+_SHARD_SCHEMA = {
+    "geometry": "Unknown",
+    "properties": {"footprint_id": "str", "properties": "str"},
+}
+
+
+def footprint_tiles_enabled() -> bool:
+    """``CITYLENS_FOOTPRINT_TILES``: read the tile store when published (default on)."""
+    return os.getenv("CITYLENS_FOOTPRINT_TILES", "1").strip() != "0"
+
+
+def footprint_tiles_prefix() -> str:
+    prefix = os.getenv("CITYLENS_FOOTPRINT_TILES_GCS_PREFIX", DEFAULT_GCS_PREFIX)
+    return prefix.strip().strip("/") or DEFAULT_GCS_PREFIX
+
+
+def tiles_for_bbox(
+    bbox: tuple[float, float, float, float], *, tile_size: float = TILE_SIZE_M
+) -> list[str]:
+    """Ids of the grid tiles that ``bbox`` (EPSG:3857) touches."""
+    minx, miny, maxx, maxy = (float(value) for value in bbox)
+    cols = range(math.floor(minx / tile_size), math.floor(maxx / tile_size) + 1)
+    rows = range(math.floor(miny / tile_size), math.floor(maxy / tile_size) + 1)
+    return [f"{col}_{row}" for col in cols for row in rows]
+
+
+def source_digest(county_gdbs: Mapping[str, Path], *, tile_size: float = TILE_SIZE_M) -> str:
+    """Content digest of the source GDBs and the tiling parameters."""
+    digest = hashlib.sha256()
+    digest.update(f"{STORE_SCHEMA}|{TILES_EPSG}|{float(tile_size)}".encode("utf-8"))
+    for county in sorted(county_gdbs):
+        gdb_path = Path(county_gdbs[county])
+        digest.update(f"|county:{county}".encode("utf-8"))
+        for path in sorted(p for p in gdb_path.rglob("*") if p.is_file()):
+            digest.update(f"|{path.relative_to(gdb_path).as_posix()}:".encode("utf-8"))
+            with path.open("rb") as handle:
+                for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                    digest.update(chunk)
+    return digest.hexdigest()[:32]
+
+
+def _layer_bbox_3857(gdb_path: Path) -> tuple[float, float, float, float]:
+    """The GDB layer's full extent in EPSG:3857, padded by a kilometre."""
+    from .imagery_inputs import _layer_name_from_gdb
+
+    with fiona_open(str(gdb_path), layer=_layer_name_from_gdb(gdb_path)) as src:
+        minx, miny, maxx, maxy = src.bounds
+        src_crs = CRS.from_user_input(src.crs) if src.crs else CRS.from_epsg(TILES_EPSG)
+    to_3857 = Transformer.from_crs(src_crs, CRS.from_epsg(TILES_EPSG), always_xy=True)
+    xs, ys = to_3857.transform([minx, minx, maxx, maxx], [miny, maxy, miny, maxy])
+    return min(xs) - 1000.0, min(ys) - 1000.0, max(xs) + 1000.0, max(ys) + 1000.0
+
+
+def write_tile_store(
+    features_by_county: Mapping[str, Iterable[dict[str, Any]]],
+    out_dir: Path,
+    *,
+    digest: str,
+    tile_size: float = TILE_SIZE_M,
+) -> dict[str, Any]:
+    """Shard EPSG:3857 features into ``out_dir`` and write the index.
+
+    ``footprint_id`` sorts in county order, then source order, so a reader
+    returns features in the order a GDB scan would.
+    """
+    out_dir = Path(out_dir)
+    tiles_dir = out_dir / "tiles"
+    if tiles_dir.exists():
+        shutil.rmtree(tiles_dir)
+    tiles_dir.mkdir(parents=True)
+
+    tiles: dict[str, list[dict[str, Any]]] = {}
+    counts: dict[str, int] = {}
+    for rank, (county, features) in enumerate(features_by_county.items()):
+        counts[county] = 0
+        for feature in features:
+            geometry = feature.get("geometry")
+            if geometry is None:
+                continue
+            if not isinstance(geometry, BaseGeometry):
+                geometry = shape(geometry)
+            if geometry.is_empty:
+                continue
+            record = {
+                "geometry": geometry,
+                "properties": {
+                    "footprint_id": f"{rank:02d}-{counts[county]:09d}",
+                    "properties": json.dumps(feature.get("properties") or {}, sort_keys=True),
+                },
+            }
+            counts[county] += 1
+            for tile in tiles_for_bbox(geometry.bounds, tile_size=tile_size):
+                tiles.setdefault(tile, []).append(record)
+
+    index_tiles: dict[str, dict[str, Any]] = {}
+    for tile, records in sorted(tiles.items()):
+        path = tiles_dir / f"{tile}.fgb"
+        with fiona_open(
+            str(path),
+            "w",
+            driver="FlatGeobuf",
+            crs=FionaCRS.from_epsg(TILES_EPSG),
+            schema=_SHARD_SCHEMA,
+        ) as dst:
+            dst.writerecords(records)
+        index_tiles[tile] = {"features": len(records), "bytes": path.stat().st_size}
+
+    index = {
+        "schema": STORE_SCHEMA,
+        "digest": digest,
+        "crs": f"EPSG:{TILES_EPSG}",
+        "tile_size": float(tile_size),
+        "counties": counts,
+        "tiles": index_tiles,
+    }
+    (out_dir / "index.json").write_text(json.dumps(index, indent=2, sort_keys=True))
+    return index
+
+
+def build_tile_store_from_gdbs(
+    county_gdbs: Mapping[str, Path],
+    out_dir: Path,
+    *,
+    tile_size: float = TILE_SIZE_M,
+) -> dict[str, Any]:
+    """Convert county GDBs into a local tile store; returns its index."""
+    from .imagery_inputs import _features_for_bbox
+
+    target_crs = CRS.from_epsg(TILES_EPSG)
+    features_by_county = {}
+    for county, gdb_path in county_gdbs.items():
+        gdb_path = Path(gdb_path)
+        features_by_county[county] = _features_for_bbox(
+            gdb_path=gdb_path, bbox=_layer_bbox_3857(gdb_path), target_crs=target_crs
+        )
+    return write_tile_store(
+        features_by_county,
+        out_dir,
+        digest=source_digest(county_gdbs, tile_size=tile_size),
+        tile_size=tile_size,
+    )
+
+
+def upload_tile_store(
+    out_dir: Path, *, gcs_client: Any, bucket: str, prefix: str = DEFAULT_GCS_PREFIX
+) -> str:
+    """Upload a local store, then point ``latest.json`` at it."""
+    out_dir = Path(out_dir)
+    index = json.loads((out_dir / "index.json").read_text())
+    digest = index["digest"]
+    gcs_bucket = gcs_client.bucket(bucket)
+    for tile in index["tiles"]:
+        blob = gcs_bucket.blob(f"{prefix}/{digest}/tiles/{tile}.fgb")
+        blob.upload_from_filename(str(out_dir / "tiles" / f"{tile}.fgb"))
+    gcs_bucket.blob(f"{prefix}/{digest}/index.json").upload_from_filename(
+        str(out_dir / "index.json")
+    )
+    pointer = out_dir / POINTER_NAME
+    pointer.write_text(json.dumps({"schema": STORE_SCHEMA, "digest": digest}))
+    gcs_bucket.blob(f"{prefix}/{POINTER_NAME}").upload_from_filename(str(pointer))
+    return digest
+
+
+class FootprintTileStore:
+    """Reads AOI footprints from a published tile store, caching shards locally."""
+
+    def __init__(
+        self,
+        *,
+        gcs_client: Any,
+        bucket: str,
+        prefix: str,
+        cache_dir: Path,
+        index: Mapping[str, Any],
+    ) -> None:
+        self._bucket = gcs_client.bucket(bucket)
+        self._uri = f"gs://{bucket}/{prefix}/{index['digest']}"
+        self._prefix = f"{prefix}/{index['digest']}"
+        self._cache_dir = Path(cache_dir) / str(index["digest"])
+        self._index = index
+        self.tiles_downloaded = 0
+        self.bytes_downloaded = 0
+
+    @classmethod
+    def open(
+        cls,
+        *,
+        gcs_client: Any,
+        bucket: str,
+        cache_dir: Path,
+        prefix: str = DEFAULT_GCS_PREFIX,
+    ) -> FootprintTileStore | None:
+        """The published store, or ``None`` when nothing has been published."""
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        pointer_blob = gcs_client.bucket(bucket).blob(f"{prefix}/{POINTER_NAME}")
+        if not pointer_blob.exists():
+            return None
+        pointer_path = cache_dir / POINTER_NAME
+        partial = pointer_path.with_suffix(".json.part")
+        pointer_blob.download_to_filename(str(partial))
+        os.replace(partial, pointer_path)
+        pointer = json.loads(pointer_path.read_text())
+        if pointer.get("schema") != STORE_SCHEMA:
+            _LOG.warning("footprint_tiles_schema_mismatch", extra={"pointer": pointer})
+            return None
+
+        digest = str(pointer["digest"])
+        index_path = cache_dir / digest / "index.json"
+        if not index_path.exists():
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            partial = index_path.with_suffix(".json.part")
+            gcs_client.bucket(bucket).blob(f"{prefix}/{digest}/index.json").download_to_filename(
+                str(partial)
+            )
+            os.replace(partial, index_path)
+        index = json.loads(index_path.read_text())
+        if index.get("schema") != STORE_SCHEMA or index.get("digest") != digest:
+            raise RuntimeError(f"footprint tile index does not match pointer {digest}")
+        return cls(
+            gcs_client=gcs_client, bucket=bucket, prefix=prefix, cache_dir=cache_dir, index=index
+        )
+
+    @property
+    def uri(self) -> str:
+        return self._uri
+
+    def _shard(self, tile: str) -> Path:
+        path = self._cache_dir / "tiles" / f"{tile}.fgb"
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            partial = path.with_suffix(".fgb.part")
+            self._bucket.blob(f"{self._prefix}/tiles/{tile}.fgb").download_to_filename(
+                str(partial)
+            )
+            os.replace(partial, path)
+            self.tiles_downloaded += 1
+            self.bytes_downloaded += path.stat().st_size
+        return path
+
+    def features_for_bbox(self, bbox: tuple[float, float, float, float]) -> list[dict[str, Any]]:
+        """Features whose bounds intersect ``bbox`` (EPSG:3857), as shapely geometries."""
+        query = tuple(float(value) for value in bbox)
+        tiles = [
+            tile
+            for tile in tiles_for_bbox(query, tile_size=float(self._index["tile_size"]))
+            if tile in self._index["tiles"]
+        ]
+        found: dict[str, dict[str, Any]] = {}
+        for tile in tiles:
+            with fiona_open(str(self._shard(tile))) as src:
+                for feat in src.filter(bbox=query):
+                    footprint_id = feat.properties["footprint_id"]
+                    if footprint_id in found:
+                        continue
+                    found[footprint_id] = {
+                        "type": "Feature",
+                        "properties": json.loads(feat.properties["properties"]),
+                        "geometry": shape(feat.geometry),
+                    }
+        return [found[footprint_id] for footprint_id in sorted(found)]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "uri": self._uri,
+            "tile_size": float(self._index["tile_size"]),
+            "tiles_downloaded": self.tiles_downloaded,
+            "bytes_downloaded": self.bytes_downloaded,
+        }
@@ -7,6 +7,7 @@ import math
 import os
 import shutil
 import zipfile
+from collections.abc import Mapping
 from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
@@ -14,6 +15,7 @@ from typing import Any
 
 import numpy as np
 import requests
+import shapely
 from fiona import listlayers
 from fiona import open as fiona_open
 from PIL import Image
@@ -22,9 +24,12 @@ from rasterio import open as rasterio_open
 from rasterio.features import rasterize
 from rasterio.transform import from_bounds
 from shapely.geometry import mapping, shape
-from shapely.ops import transform as shapely_transform
+from shapely.geometry.base import BaseGeometry
 
+from .footprint_tiles import FootprintTileStore, footprint_tiles_enabled, footprint_tiles_prefix
+from .lookup_cache import LookupCache, lookup_cache_enabled, lookup_cache_ttls
 from .nysgis import NYSGISAPI, AddressAssets
+from .staging import StagingPlan, staging_workers_from_env
 
 _LOG = logging.getLogger(__name__)
 
@@ -36,6 +41,9 @@ _COUNTY_FOOTPRINT_ZIPS: dict[str, str] = {
     "Richmond": "https://gisdata.ny.gov/GISData/State/Building_Footprints/Richmond_Building_Footprints.zip",
 }
 
+# Extra margin around the AOI when choosing which county GDBs to load.
+_COUNTY_SELECTION_PAD_M = 250.0
+
 _CURRENT_FOOTPRINTS_DATASET = "5zhs-2jue"
 _CURRENT_FOOTPRINTS_DEFAULT_URL = (
     f"https://data.cityofnewyork.us/resource/{_CURRENT_FOOTPRINTS_DATASET}.geojson"
@@ -116,6 +124,54 @@ def _bbox_in_wgs84(
     return min(xs), min(ys), max(xs), max(ys)
 
 
+def _project_geometries(
+    geometries: list[BaseGeometry], transformer: Transformer | None
+) -> np.ndarray:
+    """Reproject a batch of geometries with one pyproj call per dimensionality.
+
+    ``shapely.transform`` hands every coordinate of the batch to the
+    callback as a single ``(N, 2)`` or ``(N, 3)`` array, so pyproj runs once
+    over all vertices instead of once per geometry. Z values are kept.
+    """
+    array = np.empty(len(geometries), dtype=object)
+    array[:] = geometries
+    if transformer is None or not len(array):
+        return array
+
+    def _xy(coords: np.ndarray) -> np.ndarray:
+        return np.column_stack(transformer.transform(coords[:, 0], coords[:, 1]))
+
+    def _xyz(coords: np.ndarray) -> np.ndarray:
+        return np.column_stack(transformer.transform(coords[:, 0], coords[:, 1], coords[:, 2]))
+
+    has_z = shapely.has_z(array)
+    projected = np.empty_like(array)
+    projected[~has_z] = shapely.transform(array[~has_z], _xy)
+    if has_z.any():
+        projected[has_z] = shapely.transform(array[has_z], _xyz, include_z=True)
+    return projected
+
+
+def _write_feature_collection(path: Path, features: list[dict[str, Any]]) -> None:
+    """Write a FeatureCollection whose features may carry shapely geometries.
+
+    All geometries are serialized by one ``shapely.to_geojson`` call and
+    spliced into the document, so only the properties go through ``json``.
+    """
+    geometries = np.empty(len(features), dtype=object)
+    geometries[:] = [
+        geom if isinstance(geom, BaseGeometry) else shape(geom)
+        for geom in (feature["geometry"] for feature in features)
+    ]
+    encoded = shapely.to_geojson(geometries).tolist() if len(features) else []
+    body = ",\n".join(
+        '{"type": "Feature", "properties": %s, "geometry": %s}'
+        % (json.dumps(feature["properties"]), geometry)
+        for feature, geometry in zip(features, encoded)
+    )
+    path.write_text('{"type": "FeatureCollection", "features": [\n' + body + "\n]}\n")
+
+
 def _validate_feature_collection(payload: Any) -> list[dict[str, Any]]:
     if not isinstance(payload, dict) or payload.get("type") != "FeatureCollection":
         raise RuntimeError("NYC building-footprint response is not a FeatureCollection")
@@ -163,7 +219,8 @@ def _fetch_current_footprints(
     source_features = _validate_feature_collection(response.json())
 
     to_target = Transformer.from_crs(CRS.from_epsg(4326), target_crs, always_xy=True)
-    output_features: list[dict[str, Any]] = []
+    kept_properties: list[dict[str, Any]] = []
+    geometries: list[BaseGeometry] = []
     for feature in source_features:
         properties = feature.get("properties")
         geometry = feature.get("geometry")
@@ -179,29 +236,30 @@ def _fetch_current_footprints(
 
         try:
             parsed = shape(geometry)
-            if parsed.is_empty:
-                continue
-            projected = shapely_transform(to_target.transform, parsed)
         except Exception:
             continue
-        if projected.is_empty:
+        if parsed.is_empty:
             continue
 
-        output_features.append(
+        geometries.append(parsed)
+        kept_properties.append(
             {
-                "type": "Feature",
-                "properties": {
-                    "construction_year": construction_year,
-                    "last_status_type": status,
-                    "geom_source": properties.get("geom_source"),
-                    "base_bbl": properties.get("base_bbl"),
-                    "mappluto_bbl": properties.get("mappluto_bbl"),
-                    "source_dataset": _CURRENT_FOOTPRINTS_DATASET,
-                },
-                "geometry": mapping(projected),
+                "construction_year": construction_year,
+                "last_status_type": status,
+                "geom_source": properties.get("geom_source"),
+                "base_bbl": properties.get("base_bbl"),
+                "mappluto_bbl": properties.get("mappluto_bbl"),
+                "source_dataset": _CURRENT_FOOTPRINTS_DATASET,
             }
         )
 
+    projected = _project_geometries(geometries, to_target)
+    output_features = [
+        {"type": "Feature", "properties": props, "geometry": mapping(geom)}
+        for props, geom, empty in zip(kept_properties, projected, shapely.is_empty(projected))
+        if not empty
+    ]
+
     result: dict[str, Any] = {
         "type": "FeatureCollection",
         "features": output_features,
@@ -747,6 +805,7 @@ def _ensure_county_footprints_gdbs(
     keep_zips: bool = False,
     gcs_client: Any | None = None,
     gcs_bucket: str | None = None,
+    counties: list[str] | None = None,
 ) -> dict[str, Path]:
     from .reference_data import DEFAULT_GCS_PREFIX, ensure_nyc_county_footprints
 
@@ -757,6 +816,70 @@ def _ensure_county_footprints_gdbs(
         gcs_client=gcs_client,
         gcs_bucket=gcs_bucket,
         gcs_prefix=gcs_prefix,
+        counties=counties,
+    )
+
+
+def _counties_for_bbox(bbox: tuple[float, float, float, float], *, crs: CRS) -> list[str]:
+    """Counties whose footprints can intersect ``bbox`` (padded).
+
+    Falls back to every county when the bbox cannot be placed or matches
+    none of the bundled extents, which is what the worker did before it
+    selected counties at all.
+    """
+    from .reference_data import counties_for_bbox
+
+    all_counties = list(_COUNTY_FOOTPRINT_ZIPS)
+    try:
+        padded = _pad_bbox(bbox, pad=_COUNTY_SELECTION_PAD_M)
+        selected = counties_for_bbox(_bbox_in_wgs84(padded, source_crs=crs))
+    except Exception as exc:
+        _LOG.warning(
+            "county_selection_failed",
+            extra={"bbox": list(bbox), "error": f"{type(exc).__name__}: {exc}"},
+        )
+        return all_counties
+    if not selected:
+        _LOG.warning("county_selection_empty", extra={"bbox": list(bbox)})
+        return all_counties
+    return selected
+
+
+def _open_footprint_tiles(
+    *, gcs_client: Any, bucket: str, cache_dir: Path
+) -> FootprintTileStore | None:
+    """The published footprint tile store, or ``None`` to scan county GDBs."""
+    if not footprint_tiles_enabled():
+        return None
+    try:
+        return FootprintTileStore.open(
+            gcs_client=gcs_client,
+            bucket=bucket,
+            cache_dir=cache_dir,
+            prefix=footprint_tiles_prefix(),
+        )
+    except Exception as exc:
+        _LOG.warning(
+            "footprint_tiles_unavailable",
+            extra={"error": f"{type(exc).__name__}: {exc}"},
+        )
+        return None
+
+
+def _open_lookup_cache(
+    *, gcs_client: Any, bucket: str, cache_dir: Path, cache_prefix: str
+) -> LookupCache | None:
+    """Geocode/LAS lookup cache under ``{cache_prefix}/lookups``, or ``None``."""
+    if not lookup_cache_enabled():
+        return None
+    ttl_seconds, negative_ttl_seconds = lookup_cache_ttls()
+    return LookupCache(
+        cache_dir=cache_dir,
+        gcs_client=gcs_client,
+        bucket=bucket,
+        prefix=f"{cache_prefix}/lookups",
+        ttl_seconds=ttl_seconds,
+        negative_ttl_seconds=negative_ttl_seconds,
     )
 
 
@@ -774,7 +897,8 @@ def _features_for_bbox(
     target_crs: CRS,
 ) -> list[dict[str, Any]]:
     layer = _layer_name_from_gdb(gdb_path)
-    features: list[dict[str, Any]] = []
+    kept_properties: list[dict[str, Any]] = []
+    geometries: list[BaseGeometry] = []
     with fiona_open(str(gdb_path), layer=layer) as src:
         src_crs = CRS.from_user_input(src.crs) if src.crs else None
         src_bbox = bbox
@@ -807,24 +931,25 @@ def _features_for_bbox(
                 continue
             if parsed.is_empty:
                 continue
-            if to_target is not None:
-                parsed = shapely_transform(to_target.transform, parsed)
-            features.append(
+            geometries.append(parsed)
+            kept_properties.append(
                 {
-                    "type": "Feature",
-                    "properties": {
-                        "source_gdb": gdb_path.name,
-                        "source_layer": layer,
-                        **{
-                            k: v
-                            for k, v in (feat.get("properties") or {}).items()
-                            if k in {"NYSGeo_Source", "Source", "SourceDate"}
-                        },
+                    "source_gdb": gdb_path.name,
+                    "source_layer": layer,
+                    **{
+                        k: v
+                        for k, v in (feat.get("properties") or {}).items()
+                        if k in {"NYSGeo_Source", "Source", "SourceDate"}
                     },
-                    "geometry": mapping(parsed),
                 }
             )
-    return features
+
+    # Geometries stay shapely objects until _write_feature_collection.
+    projected = _project_geometries(geometries, to_target)
+    return [
+        {"type": "Feature", "properties": props, "geometry": geom}
+        for props, geom in zip(kept_properties, projected)
+    ]
 
 
 def _build_baseline_footprints(
@@ -836,32 +961,63 @@ def _build_baseline_footprints(
     keep_zips: bool,
     gcs_client: Any | None = None,
     gcs_bucket: str | None = None,
+    county_gdbs: Mapping[str, Path] | None = None,
+    tile_store: FootprintTileStore | None = None,
 ) -> dict[str, Any]:
-    county_gdbs = _ensure_county_footprints_gdbs(
-        reference_data_dir,
-        keep_zips=keep_zips,
-        gcs_client=gcs_client,
-        gcs_bucket=gcs_bucket,
-    )
+    counties = _counties_for_bbox(bbox, crs=target_crs)
     geojson_path = work_dir / "baseline_footprints.geojson"
     all_features: list[dict[str, Any]] = []
     county_sources: dict[str, str] = {}
 
-    for county, gdb_path in county_gdbs.items():
-        county_sources[county] = str(gdb_path)
-        all_features.extend(
-            _features_for_bbox(gdb_path=Path(gdb_path), bbox=bbox, target_crs=target_crs)
-        )
+    # Tiles are stored in EPSG:3857; any other ortho CRS scans the GDBs.
+    if tile_store is not None and CRS.from_user_input(target_crs).to_epsg() != 3857:
+        tile_store = None
+
+    if tile_store is not None:
+        try:
+            all_features = tile_store.features_for_bbox(bbox)
+        except Exception as exc:
+            # A shard that fails to download or read falls back to the GDBs.
+            _LOG.warning(
+                "footprint_tiles_unavailable",
+                extra={"error": f"{type(exc).__name__}: {exc}"},
+            )
+            tile_store = None
+        else:
+            county_sources = {county: tile_store.uri for county in counties}
+
+    if tile_store is None:
+        county_gdbs = dict(county_gdbs or {})
+        missing = [county for county in counties if county not in county_gdbs]
+        if missing:
+            # The staged GDBs were selected from the geocoded point; an
+            # explicit or cropped orthophoto can reach counties it missed.
+            county_gdbs.update(
+                _ensure_county_footprints_gdbs(
+                    reference_data_dir,
+                    keep_zips=keep_zips,
+                    gcs_client=gcs_client,
+                    gcs_bucket=gcs_bucket,
+                    counties=missing,
+                )
+            )
+        for county in counties:
+            gdb_path = county_gdbs[county]
+            county_sources[county] = str(gdb_path)
+            all_features.extend(
+                _features_for_bbox(gdb_path=Path(gdb_path), bbox=bbox, target_crs=target_crs)
+            )
 
-    feature_collection = {"type": "FeatureCollection", "features": all_features}
-    geojson_path.write_text(json.dumps(feature_collection, indent=2, sort_keys=False))
+    _write_feature_collection(geojson_path, all_features)
 
     return {
         "path": geojson_path,
         "sha256": _sha256_file(geojson_path),
         "feature_count": len(all_features),
         "county_sources": county_sources,
-        "source_urls": dict(_COUNTY_FOOTPRINT_ZIPS),
+        "counties_skipped": [c for c in _COUNTY_FOOTPRINT_ZIPS if c not in county_sources],
+        "source_urls": {county: _COUNTY_FOOTPRINT_ZIPS[county] for county in county_sources},
+        "footprint_tiles": tile_store.stats() if tile_store is not None else None,
     }
 
 
@@ -993,6 +1149,66 @@ def _prepare_manifest_asset(
     return payload
 
 
+def _stage_orthophoto(
+    *,
+    explicit_ortho: Any,
+    resolver: NYSGISAPI,
+    assets: AddressAssets,
+    work_dir: Path,
+    gcs_client: Any,
+    bucket: str,
+    cfg: OrthoFetchConfig,
+) -> dict[str, Any]:
+    """Fetch (or adopt) the orthophoto and read the CRS/bounds later stages need."""
+    if explicit_ortho:
+        ortho_canonical = Path(explicit_ortho)
+        if not ortho_canonical.exists():
+            raise FileNotFoundError(str(ortho_canonical))
+        ortho_compat = work_dir / "orthophoto.png"
+        if (
+            ortho_canonical.suffix.lower() == ".png"
+            and ortho_canonical.resolve() != ortho_compat.resolve()
+        ):
+            shutil.copy2(str(ortho_canonical), str(ortho_compat))
+        path = str(ortho_canonical)
+        png_path = str(ortho_compat if ortho_compat.exists() else ortho_canonical)
+        asset = _prepare_manifest_asset(
+            name="orthophoto",
+            canonical_path=ortho_canonical,
+            compat_path=ortho_compat if ortho_compat.exists() else None,
+            extra={"source_url": assets.ortho_zip_url},
+        )
+    else:
+        ortho = _download_orthophoto_tif(
+            resolver=resolver,
+            assets=assets,
+            work_dir=work_dir,
+            gcs_client=gcs_client,
+            bucket=bucket,
+            width=cfg.width,
+            height=cfg.height,
+            bbox_half_size_m=cfg.bbox_half_size_m,
+        )
+        path = ortho["canonical_path"]
+        png_path = ortho["compat_path"]
+        asset = {**ortho, "local_path": ortho["canonical_path"]}
+
+    with rasterio_open(path) as src:
+        crs = CRS.from_user_input(src.crs) if src.crs else CRS.from_epsg(3857)
+        bounds = tuple(src.bounds)
+        if len(bounds) != 4:
+            raise RuntimeError("Could not determine orthophoto bounds")
+
+    return {
+        "path": path,
+        "png_path": png_path,
+        "asset": asset,
+        "crs": crs,
+        "bounds": bounds,
+        "bbox": (float(bounds[0]), float(bounds[1]), float(bounds[2]), float(bounds[3])),
+    }
+
+
 def ensure_work_dir_inputs(
     *,
     request: Any,
@@ -1000,7 +1216,16 @@ def ensure_work_dir_inputs(
     gcs_client: Any,
     bucket: str,
 ) -> dict[str, Any]:
-    """Materialize orthophoto, footprint, and LiDAR inputs in work_dir."""
+    """Materialize orthophoto, footprint, and LiDAR inputs in work_dir.
+
+    Stages run on a ``StagingPlan`` as soon as their inputs exist: once the
+    point is geocoded, the orthophoto, the LiDAR tile, and the county
+    footprint GDBs the AOI can reach are fetched alongside each other; the
+    current footprints and baseline footprints follow once the orthophoto
+    bounds are known. Per-stage timings are recorded under ``staging``,
+    counties outside the AOI under ``assets.baseline_footprints``, and
+    geocode/LAS lookup cache hits under ``lookup_cache``.
+    """
 
     request_radius = getattr(request, "aoi_radius_m", None)
     cfg = _get_config(request_radius=request_radius)
@@ -1014,8 +1239,111 @@ def ensure_work_dir_inputs(
     if not isinstance(address, str) or not address.strip():
         raise RuntimeError("request.address is required to fetch imagery")
 
-    resolver = NYSGISAPI()
-    assets = resolver.get_assets_for_address(address)
+    reference_data_dir = Path(os.getenv("CITYLENS_REFERENCE_DATA_DIR", "/tmp/reference-data"))
+    lookup_cache = _open_lookup_cache(
+        gcs_client=gcs_client,
+        bucket=bucket,
+        cache_dir=reference_data_dir / "lookups",
+        cache_prefix=cfg.cache_prefix,
+    )
+    resolver = NYSGISAPI(cache=lookup_cache)
+    keep_zips = os.getenv("CITYLENS_REFERENCE_KEEP_ZIPS", "0") == "1"
+    imagery_year = int(getattr(request, "imagery_year", None) or 2024)
+    lidar_path = work_dir / "lidar.las"
+
+    plan = StagingPlan(max_workers=staging_workers_from_env())
+    plan.add("geocode", lambda: resolver.get_assets_for_address(address))
+    plan.add(
+        "footprint_tiles",
+        lambda: _open_footprint_tiles(
+            gcs_client=gcs_client,
+            bucket=bucket,
+            cache_dir=reference_data_dir / "footprint-tiles",
+        ),
+    )
+    plan.add(
+        "county_footprints",
+        lambda assets, tiles: {}
+        if tiles is not None
+        else _ensure_county_footprints_gdbs(
+            reference_data_dir,
+            keep_zips=keep_zips,
+            gcs_client=gcs_client,
+            gcs_bucket=bucket,
+            counties=_counties_for_bbox(
+                _pad_bbox((assets.x, assets.y, assets.x, assets.y), pad=cfg.bbox_half_size_m),
+                crs=CRS.from_epsg(3857),
+            ),
+        ),
+        after=("geocode", "footprint_tiles"),
+    )
+    plan.add(
+        "orthophoto",
+        lambda assets: _stage_orthophoto(
+            explicit_ortho=explicit_ortho,
+            resolver=resolver,
+            assets=assets,
+            work_dir=work_dir,
+            gcs_client=gcs_client,
+            bucket=bucket,
+            cfg=cfg,
+        ),
+        after=("geocode",),
+    )
+    plan.add(
+        "lidar",
+        lambda assets: _download_lidar_tile(
+            assets.lidar_tile.direct_url,
+            lidar_path,
+            gcs_client=gcs_client,
+            bucket=bucket,
+            cache_key=assets.lidar_tile.tile_id,
+        ),
+        after=("geocode",),
+    )
+    plan.add(
+        "current_footprints",
+        lambda ortho: _stage_current_footprints_optional(
+            bbox=ortho["bbox"],
+            target_crs=ortho["crs"],
+            imagery_year=imagery_year,
+            work_dir=work_dir,
+            gcs_client=gcs_client,
+            bucket=bucket,
+            cache_prefix=cfg.cache_prefix,
+            session=getattr(resolver, "session", None),
+        ),
+        after=("orthophoto",),
+    )
+    plan.add(
+        "baseline_footprints",
+        lambda ortho, county_gdbs, tiles: _build_baseline_footprints(
+            reference_data_dir=reference_data_dir,
+            bbox=ortho["bbox"],
+            target_crs=ortho["crs"],
+            work_dir=work_dir,
+            keep_zips=keep_zips,
+            gcs_client=gcs_client,
+            gcs_bucket=bucket,
+            county_gdbs=county_gdbs,
+            tile_store=tiles,
+        ),
+        after=("orthophoto", "county_footprints", "footprint_tiles"),
+    )
+    plan.add(
+        "baseline",
+        lambda ortho, baseline_footprints: _rasterize_baseline(
+            baseline_footprints=Path(baseline_footprints["path"]),
+            ortho_path=Path(ortho["path"]),
+            work_dir=work_dir,
+        ),
+        after=("orthophoto", "baseline_footprints"),
+    )
+    staged = plan.run()
+
+    assets: AddressAssets = staged["geocode"]
+    ortho = staged["orthophoto"]
+    county_gdbs = staged["county_footprints"]
     normalized_address = assets.normalized_address
     cache_key = hashlib.sha256(
         f"{normalized_address}|{assets.lidar_tile.tile_id}|{cfg.bbox_half_size_m}|{cfg.width}|{cfg.height}|{cfg.wms_url}".encode(
@@ -1033,86 +1361,20 @@ def ensure_work_dir_inputs(
             "ortho_zip_url": assets.ortho_zip_url,
         },
         "work_dir": str(work_dir),
-        "reference_data_dir": None,
-        "reference_county_footprints": {},
-        "orthophoto_path": None,
-        "orthophoto_png_path": None,
+        "reference_data_dir": str(reference_data_dir),
+        "reference_county_footprints": {k: str(v) for k, v in county_gdbs.items()},
+        "orthophoto_path": ortho["path"],
+        "orthophoto_png_path": ortho["png_path"],
         "baseline_path": None,
         "baseline_png_path": None,
         "baseline_footprints_path": None,
         "current_footprints_path": None,
         "lidar_path": None,
-        "assets": {},
+        "assets": {"orthophoto": ortho["asset"]},
         "warnings": [],
     }
 
-    if explicit_ortho:
-        ortho_canonical = Path(explicit_ortho)
-        if not ortho_canonical.exists():
-            raise FileNotFoundError(str(ortho_canonical))
-        ortho_compat = work_dir / "orthophoto.png"
-        if (
-            ortho_canonical.suffix.lower() == ".png"
-            and ortho_canonical.resolve() != ortho_compat.resolve()
-        ):
-            shutil.copy2(str(ortho_canonical), str(ortho_compat))
-        manifest["orthophoto_path"] = str(ortho_canonical)
-        manifest["orthophoto_png_path"] = str(
-            ortho_compat if ortho_compat.exists() else ortho_canonical
-        )
-        manifest["assets"]["orthophoto"] = _prepare_manifest_asset(
-            name="orthophoto",
-            canonical_path=ortho_canonical,
-            compat_path=ortho_compat if ortho_compat.exists() else None,
-            extra={"source_url": assets.ortho_zip_url},
-        )
-    else:
-        ortho = _download_orthophoto_tif(
-            resolver=resolver,
-            assets=assets,
-            work_dir=work_dir,
-            gcs_client=gcs_client,
-            bucket=bucket,
-            width=cfg.width,
-            height=cfg.height,
-            bbox_half_size_m=cfg.bbox_half_size_m,
-        )
-        manifest["orthophoto_path"] = ortho["canonical_path"]
-        manifest["orthophoto_png_path"] = ortho["compat_path"]
-        manifest["assets"]["orthophoto"] = {
-            **ortho,
-            "local_path": ortho["canonical_path"],
-        }
-
-    reference_data_dir = Path(os.getenv("CITYLENS_REFERENCE_DATA_DIR", "/tmp/reference-data"))
-    keep_zips = os.getenv("CITYLENS_REFERENCE_KEEP_ZIPS", "0") == "1"
-    county_gdbs = _ensure_county_footprints_gdbs(
-        reference_data_dir,
-        keep_zips=keep_zips,
-        gcs_client=gcs_client,
-        gcs_bucket=bucket,
-    )
-    manifest["reference_data_dir"] = str(reference_data_dir)
-    manifest["reference_county_footprints"] = {k: str(v) for k, v in county_gdbs.items()}
-
-    with rasterio_open(manifest["orthophoto_path"]) as src:
-        ortho_crs = CRS.from_user_input(src.crs) if src.crs else CRS.from_epsg(3857)
-        bbox = tuple(src.bounds)
-        if len(bbox) != 4:
-            raise RuntimeError("Could not determine orthophoto bounds")
-
-    ortho_bbox = (float(bbox[0]), float(bbox[1]), float(bbox[2]), float(bbox[3]))
-    imagery_year = int(getattr(request, "imagery_year", None) or 2024)
-    current_footprints, warning = _stage_current_footprints_optional(
-        bbox=ortho_bbox,
-        target_crs=ortho_crs,
-        imagery_year=imagery_year,
-        work_dir=work_dir,
-        gcs_client=gcs_client,
-        bucket=bucket,
-        cache_prefix=cfg.cache_prefix,
-        session=getattr(resolver, "session", None),
-    )
+    current_footprints, warning = staged["current_footprints"]
     if warning is not None:
         manifest["warnings"].append(warning)
         manifest["assets"]["current_footprints"] = {
@@ -1129,22 +1391,10 @@ def ensure_work_dir_inputs(
             "imagery_year": imagery_year,
         }
 
-    baseline_footprints = _build_baseline_footprints(
-        reference_data_dir=reference_data_dir,
-        bbox=ortho_bbox,
-        target_crs=ortho_crs,
-        work_dir=work_dir,
-        keep_zips=keep_zips,
-        gcs_client=gcs_client,
-        gcs_bucket=bucket,
-    )
+    baseline_footprints = staged["baseline_footprints"]
     manifest["baseline_footprints_path"] = str(baseline_footprints["path"])
 
-    baseline = _rasterize_baseline(
-        baseline_footprints=Path(baseline_footprints["path"]),
-        ortho_path=Path(manifest["orthophoto_path"]),
-        work_dir=work_dir,
-    )
+    baseline = staged["baseline"]
     manifest["baseline_path"] = (
         baseline["canonical_path"] if not explicit_base else str(Path(explicit_base))
     )
@@ -1155,6 +1405,9 @@ def ensure_work_dir_inputs(
         "sha256": baseline_footprints["sha256"],
         "source_urls": baseline_footprints["source_urls"],
         "feature_count": baseline_footprints["feature_count"],
+        "counties": list(baseline_footprints["county_sources"]),
+        "counties_skipped": baseline_footprints["counties_skipped"],
+        "footprint_tiles": baseline_footprints["footprint_tiles"],
     }
     manifest["assets"]["baseline"] = {
         **baseline,
@@ -1173,14 +1426,6 @@ def ensure_work_dir_inputs(
         ):
             shutil.copy2(str(baseline_path), manifest["baseline_png_path"])
 
-    lidar_path = work_dir / "lidar.las"
-    _download_lidar_tile(
-        assets.lidar_tile.direct_url,
-        lidar_path,
-        gcs_client=gcs_client,
-        bucket=bucket,
-        cache_key=assets.lidar_tile.tile_id,
-    )
     manifest["lidar_path"] = str(lidar_path)
     manifest["assets"]["lidar"] = _prepare_manifest_asset(
         name="lidar",
@@ -1194,13 +1439,15 @@ def ensure_work_dir_inputs(
             "size_gb": assets.lidar_tile.size_gb,
         },
     )
+    manifest["staging"] = plan.report()
+    manifest["lookup_cache"] = lookup_cache.stats() if lookup_cache is not None else None
 
     if os.getenv("CITYLENS_DOWNLOAD_REFERENCE_DATA", "0") == "1":
         manifest["reference_county_footprints"] = {k: str(v) for k, v in county_gdbs.items()}
 
     manifest["tile"]["cache_key"] = cache_key
-    manifest["tile"]["ortho_bounds"] = [float(b) for b in bbox]
-    manifest["tile"]["ortho_crs"] = str(ortho_crs)
+    manifest["tile"]["ortho_bounds"] = [float(b) for b in ortho["bounds"]]
+    manifest["tile"]["ortho_crs"] = str(ortho["crs"])
 
     manifest_path = work_dir / "input_manifest.json"
     manifest["input_manifest_path"] = str(manifest_path)
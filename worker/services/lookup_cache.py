@@ -0,0 +1,225 @@
+"""Persistent cache for geocode and LAS index lookups.
+
+Entries are small JSON documents addressed by the sha256 of their kind and
+inputs (for example the normalized address, or the snapped point and the
+LAS index layer URL)::
+
+    {cache_dir}/{kind}/{digest}.json
+    gs://{bucket}/{prefix}/{kind}/{digest}.json
+
+Reads try the local directory first, then GCS, and copy GCS hits into the
+local directory. Writes go to both. Each entry carries its own expiry:
+results live for ``ttl_seconds`` and recorded failures (``error`` entries,
+used for ``LidarCoverageError``) for the shorter ``negative_ttl_seconds``,
+so a newly published LAS tile is picked up within a day. GCS errors are
+logged and treated as misses; the cache never fails a run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+_LOG = logging.getLogger(__name__)
+
+CACHE_SCHEMA = "lookup-cache@v1"
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_NEGATIVE_TTL_SECONDS = 24 * 3600
+# LAS lookups are keyed by the query point snapped to this grid (in units of
+# the query wkid, metres for EPSG:3857). Repeat geocodes land on the same
+# cell; a point within a metre of a tile edge may reuse the neighbouring tile.
+POINT_SNAP = 1.0
+
+
+def lookup_cache_enabled() -> bool:
+    """``CITYLENS_LOOKUP_CACHE``: cache geocode and LAS lookups (default on)."""
+    return os.getenv("CITYLENS_LOOKUP_CACHE", "1").strip() != "0"
+
+
+def _env_seconds(name: str, default: int) -> int:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return default
+
+
+def lookup_cache_ttls() -> tuple[int, int]:
+    """``CITYLENS_LOOKUP_CACHE_TTL_SECONDS`` and ``..._NEGATIVE_TTL_SECONDS``."""
+    return (
+        _env_seconds("CITYLENS_LOOKUP_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS),
+        _env_seconds("CITYLENS_LOOKUP_CACHE_NEGATIVE_TTL_SECONDS", DEFAULT_NEGATIVE_TTL_SECONDS),
+    )
+
+
+def snap_point(x: float, y: float, *, cell: float = POINT_SNAP) -> tuple[int, int]:
+    return math.floor(x / cell), math.floor(y / cell)
+
+
+class LookupCache:
+    """Two-layer (local directory, GCS) cache of JSON lookup results."""
+
+    def __init__(
+        self,
+        *,
+        cache_dir: Path,
+        gcs_client: Any | None = None,
+        bucket: str | None = None,
+        prefix: str = "inputs/lookups",
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        negative_ttl_seconds: int = DEFAULT_NEGATIVE_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self._gcs_client = gcs_client
+        self._bucket = bucket
+        self.prefix = prefix.strip().strip("/") or "inputs/lookups"
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "negative_hits": 0, "gcs_hits": 0, "misses": 0, "writes": 0}
+
+    @staticmethod
+    def digest(kind: str, inputs: Mapping[str, Any]) -> str:
+        payload = json.dumps(
+            {"schema": CACHE_SCHEMA, "kind": kind, "inputs": inputs},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, kind: str, inputs: Mapping[str, Any]) -> dict[str, Any] | None:
+        """The live entry for ``inputs``: ``{"value": ...}`` or ``{"error": ...}``."""
+        digest = self.digest(kind, inputs)
+        local_path = self.cache_dir / kind / f"{digest}.json"
+        entry = self._read_local(local_path, kind, inputs)
+        from_gcs = False
+        if entry is None:
+            entry = self._read_gcs(kind, digest, local_path, inputs)
+            from_gcs = entry is not None
+        with self._lock:
+            if entry is None:
+                self._stats["misses"] += 1
+            else:
+                self._stats["negative_hits" if "error" in entry else "hits"] += 1
+                self._stats["gcs_hits"] += int(from_gcs)
+        return entry
+
+    def put(
+        self,
+        kind: str,
+        inputs: Mapping[str, Any],
+        *,
+        value: Any = None,
+        error: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Record a result, or with ``error`` a failure under the negative TTL."""
+        now = self._clock()
+        ttl = self.negative_ttl_seconds if error is not None else self.ttl_seconds
+        if ttl <= 0:
+            return
+        entry: dict[str, Any] = {
+            "schema": CACHE_SCHEMA,
+            "kind": kind,
+            "inputs": dict(inputs),
+            "created_at": now,
+            "expires_at": now + ttl,
+        }
+        if error is not None:
+            entry["error"] = dict(error)
+        else:
+            entry["value"] = value
+        digest = self.digest(kind, inputs)
+        local_path = self.cache_dir / kind / f"{digest}.json"
+        try:
+            self._write_local(local_path, entry)
+        except OSError as exc:
+            _LOG.warning("lookup_cache_local_write_failed", extra={"error": str(exc)})
+            return
+        with self._lock:
+            self._stats["writes"] += 1
+        if self._gcs_client is None or not self._bucket:
+            return
+        object_name = f"{self.prefix}/{kind}/{digest}.json"
+        try:
+            blob = self._gcs_client.bucket(self._bucket).blob(object_name)
+            blob.upload_from_filename(str(local_path))
+        except Exception as exc:
+            _LOG.warning(
+                "lookup_cache_write_failed",
+                extra={"cache_object": object_name, "error": str(exc)},
+            )
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def _live(self, entry: Any, kind: str, inputs: Mapping[str, Any]) -> bool:
+        return (
+            isinstance(entry, dict)
+            and entry.get("schema") == CACHE_SCHEMA
+            and entry.get("kind") == kind
+            and entry.get("inputs") == dict(inputs)
+            and float(entry.get("expires_at") or 0) > self._clock()
+            and ("value" in entry or "error" in entry)
+        )
+
+    def _read_local(
+        self, path: Path, kind: str, inputs: Mapping[str, Any]
+    ) -> dict[str, Any] | None:
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not self._live(entry, kind, inputs):
+            path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def _read_gcs(
+        self, kind: str, digest: str, local_path: Path, inputs: Mapping[str, Any]
+    ) -> dict[str, Any] | None:
+        if self._gcs_client is None or not self._bucket:
+            return None
+        object_name = f"{self.prefix}/{kind}/{digest}.json"
+        tmp_path = local_path.with_suffix(f".{threading.get_ident()}.part")
+        try:
+            blob = self._gcs_client.bucket(self._bucket).blob(object_name)
+            if not blob.exists():
+                return None
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            blob.download_to_filename(str(tmp_path))
+            entry = json.loads(tmp_path.read_text(encoding="utf-8"))
+            if not self._live(entry, kind, inputs):
+                return None
+            os.replace(tmp_path, local_path)
+            return entry
+        except Exception as exc:
+            _LOG.warning(
+                "lookup_cache_read_failed",
+                extra={"cache_object": object_name, "error": str(exc)},
+            )
+            return None
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _write_local(path: Path, entry: dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.part")
+        try:
+            tmp_path.write_text(json.dumps(entry, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Optional, Tuple
 from urllib.parse import urlencode
 
 import requests
 
+from .lookup_cache import POINT_SNAP, LookupCache, snap_point
 from .run_errors import LidarCoverageError
 
 GEOCODER_FIND_URL = (
@@ -57,7 +58,12 @@ class AddressAssets:
 
 
 class NYSGISAPI:
-    """Minimal helper for NYC LiDAR, ortho, and address resolution."""
+    """Minimal helper for NYC LiDAR, ortho, and address resolution.
+
+    With a ``LookupCache``, geocodes are cached by normalized address and LAS
+    index lookups by the snapped query point, including ``LidarCoverageError``
+    as a negative entry, so repeat addresses make no external requests.
+    """
 
     def __init__(
         self,
@@ -66,12 +72,14 @@ class NYSGISAPI:
         ortho_tile_base: str = ORTHO_TILE_BASE,
         ortho_wms_url: str = ORTHO_WMS_URL,
         session: Optional[requests.Session] = None,
+        cache: Optional[LookupCache] = None,
     ) -> None:
         self.las_index_layer_url = las_index_layer_url.rstrip("/")
         self.lidar_file_base = lidar_file_base.rstrip("/")
         self.ortho_tile_base = ortho_tile_base.rstrip("/")
         self.ortho_wms_url = ortho_wms_url.rstrip("?")
         self.session = session or requests.Session()
+        self.cache = cache
 
     def geocode_address(
         self, address: str, wkid: int = 3857, min_score: float = 80.0
@@ -80,6 +88,17 @@ class NYSGISAPI:
         if not address:
             raise ValueError("address is required for imagery fetch")
 
+        cache_inputs = {
+            "url": GEOCODER_FIND_URL,
+            "address": address,
+            "wkid": wkid,
+            "min_score": float(min_score),
+        }
+        if self.cache is not None:
+            cached = self.cache.get("geocode", cache_inputs)
+            if cached is not None and "value" in cached:
+                return float(cached["value"]["x"]), float(cached["value"]["y"])
+
         variants = [address]
         if "NY" not in address:
             variants.append(f"{address}, NY")
@@ -110,13 +129,49 @@ class NYSGISAPI:
                     raise ValueError(f"Low geocode score ({score}) for address={candidate!r}")
 
                 loc = best.get("location") or {}
-                return float(loc["x"]), float(loc["y"])
+                x, y = float(loc["x"]), float(loc["y"])
             except Exception as exc:
                 last_err = exc
+                continue
+            if self.cache is not None:
+                self.cache.put("geocode", cache_inputs, value={"x": x, "y": y})
+            return x, y
 
         raise last_err or ValueError(f"Geocoding failed for address={address!r}")
 
     def get_lidar_tile_by_point(self, x: float, y: float, wkid: int = 3857) -> LidarTile:
+        if self.cache is None:
+            return self._query_lidar_tile(x, y, wkid)
+
+        cell_x, cell_y = snap_point(x, y)
+        cache_inputs = {
+            "layer_url": self.las_index_layer_url,
+            "lidar_file_base": self.lidar_file_base,
+            "wkid": wkid,
+            "snap": POINT_SNAP,
+            "cell": [cell_x, cell_y],
+        }
+        cached = self.cache.get("las-tile", cache_inputs)
+        if cached is not None and "error" in cached:
+            raise LidarCoverageError(
+                str(cached["error"].get("message") or "No LAS tile found (cached)"),
+                x=x,
+                y=y,
+                wkid=wkid,
+                layer_url=self.las_index_layer_url,
+            )
+        if cached is not None:
+            return LidarTile(**cached["value"])
+
+        try:
+            tile = self._query_lidar_tile(x, y, wkid)
+        except LidarCoverageError as exc:
+            self.cache.put("las-tile", cache_inputs, error={"message": str(exc)})
+            raise
+        self.cache.put("las-tile", cache_inputs, value=asdict(tile))
+        return tile
+
+    def _query_lidar_tile(self, x: float, y: float, wkid: int) -> LidarTile:
         geometry = {"x": x, "y": y, "spatialReference": {"wkid": wkid}}
         params = {
             "f": "json",
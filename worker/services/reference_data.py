@@ -4,8 +4,9 @@ import logging
 import os
 import tarfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Mapping, Optional
+from typing import Any, Iterable, Mapping, Optional
 
 import requests
 
@@ -21,6 +22,18 @@ NYC_COUNTY_FOOTPRINT_ZIPS: dict[str, str] = {
 
 DEFAULT_GCS_PREFIX = "reference-data/nyc-footprints"
 
+# WGS84 (west, south, east, north) extents of each county's footprints,
+# padded by ~0.01 degrees (about 1 km) so shoreline and island buildings are
+# never missed. Neighbouring extents overlap; a match only means the county
+# GDB is loaded and queried, so overlap costs time, never features.
+NYC_COUNTY_EXTENTS_WGS84: dict[str, tuple[float, float, float, float]] = {
+    "Bronx": (-73.944, 40.775, -73.755, 40.928),
+    "Kings": (-74.052, 40.561, -73.823, 40.749),
+    "New York": (-74.058, 40.673, -73.897, 40.892),
+    "Queens": (-73.973, 40.532, -73.690, 40.811),
+    "Richmond": (-74.269, 40.467, -74.024, 40.659),
+}
+
 
 def _download(url: str, dest_path: Path) -> None:
     dest_path.parent.mkdir(parents=True, exist_ok=True)
@@ -75,6 +88,28 @@ def _gcs_object_for(prefix: str, county: str) -> str:
     return f"{prefix.rstrip('/')}/{_safe_slug(county)}.tar.gz"
 
 
+def counties_for_bbox(
+    bbox_wgs84: tuple[float, float, float, float],
+    *,
+    counties: Optional[Iterable[str]] = None,
+) -> list[str]:
+    """Counties whose bundled extent intersects ``bbox_wgs84``.
+
+    ``counties`` defaults to every county in ``NYC_COUNTY_FOOTPRINT_ZIPS``;
+    order is preserved. A county without a bundled extent always matches.
+    """
+
+    west, south, east, north = (float(value) for value in bbox_wgs84)
+    matched: list[str] = []
+    for county in counties if counties is not None else NYC_COUNTY_FOOTPRINT_ZIPS:
+        extent = NYC_COUNTY_EXTENTS_WGS84.get(county)
+        if extent is None or (
+            west <= extent[2] and east >= extent[0] and south <= extent[3] and north >= extent[1]
+        ):
+            matched.append(county)
+    return matched
+
+
 def _try_restore_from_gcs(
     *,
     gcs_client: Any,
@@ -132,6 +167,74 @@ def _upload_to_gcs(
             pass
 
 
+def _ensure_county(
+    *,
+    county: str,
+    url: str,
+    data_dir: Path,
+    keep_zips: bool,
+    gcs_client: Any | None,
+    gcs_bucket: str | None,
+    gcs_prefix: str,
+) -> Path:
+    use_gcs = gcs_client is not None and bool(gcs_bucket)
+    dest_dir = data_dir / f"{_safe_slug(county)}_Building_Footprints"
+    dest_dir.mkdir(parents=True, exist_ok=True)
+
+    existing = _discover_gdb_path(dest_dir)
+    if existing is not None:
+        return existing
+
+    object_name = _gcs_object_for(gcs_prefix, county)
+
+    # Attempt 2: GCS restore.
+    if use_gcs:
+        tar_path = dest_dir / f"{_safe_slug(county)}.tar.gz"
+        restored = _try_restore_from_gcs(
+            gcs_client=gcs_client,
+            bucket=str(gcs_bucket),
+            object_name=object_name,
+            tar_path=tar_path,
+            dest_dir=dest_dir,
+        )
+        if restored is not None:
+            logger.info(
+                "gcs_cache_hit",
+                extra={"county": county, "object": object_name, "gdb": str(restored)},
+            )
+            return restored
+
+    # Attempt 3: fresh HTTP download + extract.
+    zip_name = url.split("/")[-1]
+    zip_path = dest_dir / zip_name
+    if not zip_path.exists():
+        _download(url, zip_path)
+
+    _extract_zip(zip_path, dest_dir)
+    gdb_path = _discover_gdb_path(dest_dir) or (
+        dest_dir / f"{_safe_slug(county)}_Building_Footprints.gdb"
+    )
+
+    if (not keep_zips) and zip_path.exists():
+        try:
+            zip_path.unlink()
+        except OSError:
+            pass
+
+    # Best-effort push to GCS so the next cold-start is fast.
+    if use_gcs and gdb_path.exists():
+        staging = dest_dir / f"{_safe_slug(county)}.tar.gz"
+        _upload_to_gcs(
+            gcs_client=gcs_client,
+            bucket=str(gcs_bucket),
+            object_name=object_name,
+            gdb_path=gdb_path,
+            staging_path=staging,
+        )
+
+    return gdb_path
+
+
 def ensure_nyc_county_footprints(
     *,
     data_dir: Path,
@@ -140,6 +243,7 @@ def ensure_nyc_county_footprints(
     gcs_bucket: str | None = None,
     gcs_prefix: str = DEFAULT_GCS_PREFIX,
     urls: Optional[Mapping[str, str]] = None,
+    counties: Optional[Iterable[str]] = None,
 ) -> dict[str, Path]:
     """Ensure NYC county building footprints GDBs exist locally.
 
@@ -153,73 +257,38 @@ def ensure_nyc_county_footprints(
     Caching to GCS is an optimization: if it fails (missing perms, transient
     error), we still return the locally-extracted path.
 
-    Returns a map of county -> extracted .gdb path.
+    ``counties`` restricts the work to those counties (e.g. the ones
+    ``counties_for_bbox`` selects); the others are neither downloaded nor
+    restored. Counties are resolved concurrently. Returns a map of county ->
+    extracted .gdb path, in ``urls`` order.
     """
 
     data_dir = Path(data_dir)
     data_dir.mkdir(parents=True, exist_ok=True)
 
     source_urls = urls or NYC_COUNTY_FOOTPRINT_ZIPS
-    use_gcs = gcs_client is not None and bool(gcs_bucket)
-
-    out: dict[str, Path] = {}
-    for county, url in source_urls.items():
-        dest_dir = data_dir / f"{_safe_slug(county)}_Building_Footprints"
-        dest_dir.mkdir(parents=True, exist_ok=True)
-
-        existing = _discover_gdb_path(dest_dir)
-        if existing is not None:
-            out[county] = existing
-            continue
-
-        object_name = _gcs_object_for(gcs_prefix, county)
-
-        # Attempt 2: GCS restore.
-        if use_gcs:
-            tar_path = dest_dir / f"{_safe_slug(county)}.tar.gz"
-            restored = _try_restore_from_gcs(
+    if counties is not None:
+        wanted = set(counties)
+        source_urls = {county: url for county, url in source_urls.items() if county in wanted}
+    if not source_urls:
+        return {}
+
+    # Counties are independent downloads/restores into their own
+    # directories, so they are fetched concurrently.
+    with ThreadPoolExecutor(
+        max_workers=max(1, len(source_urls)), thread_name_prefix="county-footprints"
+    ) as pool:
+        futures = {
+            county: pool.submit(
+                _ensure_county,
+                county=county,
+                url=url,
+                data_dir=data_dir,
+                keep_zips=keep_zips,
                 gcs_client=gcs_client,
-                bucket=str(gcs_bucket),
-                object_name=object_name,
-                tar_path=tar_path,
-                dest_dir=dest_dir,
+                gcs_bucket=gcs_bucket,
+                gcs_prefix=gcs_prefix,
             )
-            if restored is not None:
-                logger.info(
-                    "gcs_cache_hit",
-                    extra={"county": county, "object": object_name, "gdb": str(restored)},
-                )
-                out[county] = restored
-                continue
-
-        # Attempt 3: fresh HTTP download + extract.
-        zip_name = url.split("/")[-1]
-        zip_path = dest_dir / zip_name
-        if not zip_path.exists():
-            _download(url, zip_path)
-
-        _extract_zip(zip_path, dest_dir)
-        gdb_path = _discover_gdb_path(dest_dir) or (
-            dest_dir / f"{_safe_slug(county)}_Building_Footprints.gdb"
-        )
-
-        if (not keep_zips) and zip_path.exists():
-            try:
-                zip_path.unlink()
-            except OSError:
-                pass
-
-        # Best-effort push to GCS so the next cold-start is fast.
-        if use_gcs and gdb_path.exists():
-            staging = dest_dir / f"{_safe_slug(county)}.tar.gz"
-            _upload_to_gcs(
-                gcs_client=gcs_client,
-                bucket=str(gcs_bucket),
-                object_name=object_name,
-                gdb_path=gdb_path,
-                staging_path=staging,
-            )
-
-        out[county] = gdb_path
-
-    return out
+            for county, url in source_urls.items()
+        }
+        return {county: future.result() for county, future in futures.items()}
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+_LOG = logging.getLogger(__name__)
+
+_DEFAULT_WORKERS = 4
+
+
+def staging_workers_from_env() -> int:
+    """``CITYLENS_STAGING_WORKERS``: concurrent input stages (1 = sequential)."""
+    raw = os.getenv("CITYLENS_STAGING_WORKERS", "").strip()
+    if not raw:
+        return _DEFAULT_WORKERS
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        return _DEFAULT_WORKERS
+
+
+@dataclass(frozen=True)
+class _Stage:
+    name: str
+    fn: Callable[..., Any]
+    after: tuple[str, ...]
+
+
+class StagingPlan:
+    """Run named input stages on a thread pool as their dependencies finish.
+
+    ``add(name, fn, after=(...))`` registers a stage; ``fn`` is called with
+    the results of the ``after`` stages, in that order. Ready stages start
+    in the order they were added, so ``max_workers=1`` reproduces a plain
+    sequential run. The first failing stage stops anything not yet started
+    and its exception is re-raised; stages already running are not waited
+    for. Stages that must not fail the run should catch their own errors,
+    as ``_stage_current_footprints_optional`` does.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = _DEFAULT_WORKERS,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._max_workers = max(1, max_workers)
+        self._clock = clock
+        self._stages: dict[str, _Stage] = {}
+        self.timings: dict[str, dict[str, float]] = {}
+        self.wall_seconds: float | None = None
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        *,
+        after: tuple[str, ...] = (),
+    ) -> None:
+        if name in self._stages:
+            raise ValueError(f"duplicate stage: {name}")
+        missing = [dep for dep in after if dep not in self._stages]
+        if missing:
+            raise ValueError(f"stage {name} depends on unknown stages: {missing}")
+        self._stages[name] = _Stage(name=name, fn=fn, after=tuple(after))
+
+    def report(self) -> dict[str, Any]:
+        """Per-stage start offset and duration, for the input manifest."""
+        return {
+            "max_workers": self._max_workers,
+            "wall_seconds": self.wall_seconds,
+            "stages": {name: dict(timing) for name, timing in self.timings.items()},
+        }
+
+    def run(self) -> dict[str, Any]:
+        results: dict[str, Any] = {}
+        pending = dict(self._stages)
+        started_at = self._clock()
+
+        def _timed(stage: _Stage, args: list[Any]) -> Any:
+            began = self._clock()
+            try:
+                return stage.fn(*args)
+            finally:
+                ended = self._clock()
+                self.timings[stage.name] = {
+                    "start_s": round(began - started_at, 3),
+                    "seconds": round(ended - began, 3),
+                }
+
+        pool = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="input-staging"
+        )
+        running: dict[Future[Any], str] = {}
+        try:
+            while pending or running:
+                for name, stage in list(pending.items()):
+                    if len(running) >= self._max_workers:
+                        break
+                    if all(dep in results for dep in stage.after):
+                        args = [results[dep] for dep in stage.after]
+                        running[pool.submit(_timed, stage, args)] = name
+                        del pending[name]
+                if not running:
+                    raise RuntimeError(f"unschedulable stages: {sorted(pending)}")
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    # Raises the stage's own exception.
+                    results[name] = future.result()
+        except BaseException:
+            for future in running:
+                future.cancel()
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        else:
+            pool.shutdown(wait=True)
+        finally:
+            self.wall_seconds = round(self._clock() - started_at, 3)
+        _LOG.info("inputs_staged", extra=self.report())
+        return results
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import fiona
+from fiona.crs import CRS as FionaCRS
+from pyproj import CRS, Transformer
+from shapely.geometry import shape
+
+from services.footprint_tiles import (
+    POINTER_NAME,
+    FootprintTileStore,
+    build_tile_store_from_gdbs,
+    tiles_for_bbox,
+    upload_tile_store,
+    write_tile_store,
+)
+from services.imagery_inputs import _features_for_bbox
+
+
+class _FakeBlob:
+    def __init__(self, client: "_FakeGcsClient", name: str) -> None:
+        self._client = client
+        self._name = name
+
+    def exists(self) -> bool:
+        return self._name in self._client.storage
+
+    def download_to_filename(self, path: str) -> None:
+        self._client.downloads.append(self._name)
+        Path(path).write_bytes(self._client.storage[self._name])
+
+    def upload_from_filename(self, path: str) -> None:
+        self._client.uploads.append(self._name)
+        self._client.storage[self._name] = Path(path).read_bytes()
+
+
+class _FakeGcsClient:
+    def __init__(self) -> None:
+        self.storage: dict[str, bytes] = {}
+        self.uploads: list[str] = []
+        self.downloads: list[str] = []
+
+    def bucket(self, name: str) -> "_FakeGcsClient":  # noqa: ARG002
+        return self
+
+    def blob(self, name: str) -> _FakeBlob:
+        return _FakeBlob(self, name)
+
+
+# Downtown Brooklyn in NY State Plane Long Island (ftUS).
+_ORIGIN = (985_000.0, 185_000.0)
+_SPACING_FT = 300.0
+_SIDE_FT = 60.0
+
+
+def _write_gdb(path: Path, *, rows: int = 12, cols: int = 12) -> Path:
+    schema = {"geometry": "Polygon", "properties": {"Source": "str", "Other": "str"}}
+    with fiona.open(
+        str(path),
+        "w",
+        driver="OpenFileGDB",
+        crs=FionaCRS.from_epsg(2263),
+        schema=schema,
+        layer="Kings_Building_Footprints",
+    ) as dst:
+        for row in range(rows):
+            for col in range(cols):
+                x = _ORIGIN[0] + col * _SPACING_FT
+                y = _ORIGIN[1] + row * _SPACING_FT
+                ring = [(x, y), (x + _SIDE_FT, y), (x + _SIDE_FT, y + _SIDE_FT), (x, y + _SIDE_FT)]
+                dst.write(
+                    {
+                        "geometry": {"type": "Polygon", "coordinates": [ring + [ring[0]]]},
+                        "properties": {"Source": f"b{row}-{col}", "Other": "dropped"},
+                    }
+                )
+    return path
+
+
+def _aoi_3857(col0: int, row0: int, col1: int, row1: int) -> tuple[float, float, float, float]:
+    """A query whose edges fall in the gaps between the synthetic buildings."""
+    to_3857 = Transformer.from_crs(CRS.from_epsg(2263), CRS.from_epsg(3857), always_xy=True)
+    gap = (_SPACING_FT + _SIDE_FT) / 2
+    xs, ys = to_3857.transform(
+        [_ORIGIN[0] + col0 * _SPACING_FT - gap / 2, _ORIGIN[0] + col1 * _SPACING_FT + gap],
+        [_ORIGIN[1] + row0 * _SPACING_FT - gap / 2, _ORIGIN[1] + row1 * _SPACING_FT + gap],
+    )
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _sources(features: list[dict]) -> list[str]:
+    return [feature["properties"]["Source"] for feature in features]
+
+
+def test_tiles_for_bbox_covers_every_touched_cell() -> None:
+    assert tiles_for_bbox((10.0, 10.0, 20.0, 20.0), tile_size=100.0) == ["0_0"]
+    assert tiles_for_bbox((-10.0, 90.0, 110.0, 110.0), tile_size=100.0) == [
+        "-1_0",
+        "-1_1",
+        "0_0",
+        "0_1",
+        "1_0",
+        "1_1",
+    ]
+
+
+def test_tile_store_matches_a_gdb_scan(tmp_path: Path) -> None:
+    gdb = _write_gdb(tmp_path / "Kings_Building_Footprints.gdb")
+    index = build_tile_store_from_gdbs({"Kings": gdb}, tmp_path / "store", tile_size=256.0)
+    client = _FakeGcsClient()
+    digest = upload_tile_store(tmp_path / "store", gcs_client=client, bucket="b", prefix="tiles")
+
+    assert digest == index["digest"]
+    assert index["counties"] == {"Kings": 144}
+    assert client.uploads[-1] == f"tiles/{POINTER_NAME}"
+
+    store = FootprintTileStore.open(
+        gcs_client=client, bucket="b", cache_dir=tmp_path / "cache", prefix="tiles"
+    )
+    assert store is not None
+    aoi = _aoi_3857(2, 3, 6, 7)
+    from_tiles = store.features_for_bbox(aoi)
+    from_gdb = _features_for_bbox(gdb_path=gdb, bbox=aoi, target_crs=CRS.from_epsg(3857))
+
+    assert len(from_tiles) == 25
+    assert _sources(from_tiles) == _sources(from_gdb)
+    assert [f["properties"] for f in from_tiles] == [f["properties"] for f in from_gdb]
+    for tiled, scanned in zip(from_tiles, from_gdb):
+        assert shape(tiled["geometry"]).equals_exact(shape(scanned["geometry"]), 1e-6)
+    assert store.stats()["tiles_downloaded"] < len(index["tiles"])
+
+
+def test_features_spanning_tiles_are_returned_once_and_shards_are_cached(
+    tmp_path: Path,
+) -> None:
+    wide = {
+        "type": "Feature",
+        "properties": {"Source": "wide"},
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [
+                [(90.0, 10.0), (110.0, 10.0), (110.0, 20.0), (90.0, 20.0), (90.0, 10.0)]
+            ],
+        },
+    }
+    index = write_tile_store({"Kings": [wide]}, tmp_path / "store", digest="d1", tile_size=100.0)
+    assert sorted(index["tiles"]) == ["0_0", "1_0"]
+    client = _FakeGcsClient()
+    upload_tile_store(tmp_path / "store", gcs_client=client, bucket="b", prefix="tiles")
+
+    store = FootprintTileStore.open(
+        gcs_client=client, bucket="b", cache_dir=tmp_path / "cache", prefix="tiles"
+    )
+    assert store is not None
+    assert _sources(store.features_for_bbox((0.0, 0.0, 199.0, 50.0))) == ["wide"]
+    assert _sources(store.features_for_bbox((0.0, 0.0, 199.0, 50.0))) == ["wide"]
+    assert store.stats()["tiles_downloaded"] == 2
+    assert store.features_for_bbox((500.0, 500.0, 600.0, 600.0)) == []
+    # Pointer, index and shards land via ``.part`` files and ``os.replace``.
+    assert (tmp_path / "cache" / POINTER_NAME).exists()
+    assert list((tmp_path / "cache").rglob("*.part")) == []
+
+
+def test_open_returns_none_until_a_store_is_published(tmp_path: Path) -> None:
+    assert (
+        FootprintTileStore.open(gcs_client=_FakeGcsClient(), bucket="b", cache_dir=tmp_path)
+        is None
+    )
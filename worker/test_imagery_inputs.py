@@ -42,7 +42,7 @@ def test_ensure_work_dir_inputs_writes_manifest_and_materializes_georef_inputs(
     monkeypatch, tmp_path: Path
 ) -> None:
     class FakeResolver:
-        def __init__(self) -> None:
+        def __init__(self, cache=None) -> None:
             self.session = SimpleNamespace()
 
         def get_assets_for_address(self, address: str):
@@ -103,7 +103,9 @@ def test_ensure_work_dir_inputs_writes_manifest_and_materializes_georef_inputs(
             "sha256": "feedface",
             "feature_count": 0,
             "county_sources": {"Kings": str(tmp_path / "Kings_Building_Footprints.gdb")},
+            "counties_skipped": ["Bronx", "New York", "Queens", "Richmond"],
             "source_urls": {"Kings": "https://example.test/kings.zip"},
+            "footprint_tiles": None,
         }
 
     def fake_rasterize_baseline(**kwargs):
@@ -186,10 +188,23 @@ def test_ensure_work_dir_inputs_writes_manifest_and_materializes_georef_inputs(
     assert data["geocode"]["x"] == 100.0
     assert data["tile"]["tile_id"] == "123456"
     assert data["assets"]["baseline_footprints"]["feature_count"] == 0
+    assert data["assets"]["baseline_footprints"]["counties"] == ["Kings"]
+    assert "Richmond" in data["assets"]["baseline_footprints"]["counties_skipped"]
     assert data["assets"]["current_footprints"]["source_dataset"] == "5zhs-2jue"
     assert captured_current["bbox"] == (100.0, 192.0, 108.0, 200.0)
     assert captured_current["target_crs"].to_epsg() == 3857
     assert captured_current["imagery_year"] == 2024
+    assert data["lookup_cache"]["writes"] == 0
+    assert set(data["staging"]["stages"]) == {
+        "geocode",
+        "footprint_tiles",
+        "county_footprints",
+        "orthophoto",
+        "lidar",
+        "current_footprints",
+        "baseline_footprints",
+        "baseline",
+    }
     assert (tmp_path / "orthophoto.tif").exists()
     assert (tmp_path / "orthophoto.png").exists()
     assert (tmp_path / "baseline.tif").exists()
@@ -466,10 +481,198 @@ def test_features_for_bbox_reprojects_output_to_target_crs(monkeypatch) -> None:
     )
 
     assert len(result) == 1
-    coords = result[0]["geometry"]["coordinates"][0]
+    # Geometries stay shapely objects until the collection is written.
+    coords = list(result[0]["geometry"].exterior.coords)
     xs = [pt[0] for pt in coords]
     ys = [pt[1] for pt in coords]
     # After reprojection, x should be near -8232536 (EPSG:3857) and NOT
     # near 996977 (EPSG:2263). A ~30m tolerance is plenty.
     assert -8232550 < min(xs) < -8232520, f"feature x not reprojected to EPSG:3857: xs={xs}"
     assert 4961400 < min(ys) < 4961440, f"feature y not reprojected to EPSG:3857: ys={ys}"
+
+
+def test_baseline_footprints_query_only_counties_the_bbox_reaches(
+    monkeypatch, tmp_path: Path
+) -> None:
+    """Staten Island AOI: the staged Kings GDB is ignored, Richmond is backfilled."""
+    from pyproj import CRS as ProjCRS
+
+    import services.imagery_inputs as mod
+
+    ensured: list[list[str] | None] = []
+    queried: list[str] = []
+
+    def fake_counties(data_dir, *, counties=None, **kwargs):  # noqa: ARG001
+        ensured.append(counties)
+        return {county: tmp_path / f"{county}.gdb" for county in counties or []}
+
+    def fake_features(*, gdb_path, bbox, target_crs):  # noqa: ARG001
+        queried.append(gdb_path.name)
+        return []
+
+    monkeypatch.setattr(mod, "_ensure_county_footprints_gdbs", fake_counties)
+    monkeypatch.setattr(mod, "_features_for_bbox", fake_features)
+
+    result = mod._build_baseline_footprints(
+        reference_data_dir=tmp_path,
+        bbox=(-8254590.0, 4950338.0, -8254090.0, 4950838.0),
+        target_crs=ProjCRS.from_epsg(3857),
+        work_dir=tmp_path,
+        keep_zips=False,
+        county_gdbs={"Kings": tmp_path / "Kings.gdb"},
+    )
+
+    assert ensured == [["Richmond"]]
+    assert queried == ["Richmond.gdb"]
+    assert list(result["county_sources"]) == ["Richmond"]
+    assert result["counties_skipped"] == ["Bronx", "Kings", "New York", "Queens"]
+
+
+def test_baseline_footprints_read_the_tile_store_without_touching_gdbs(
+    monkeypatch, tmp_path: Path
+) -> None:
+    from pyproj import CRS as ProjCRS
+
+    import services.imagery_inputs as mod
+
+    def fail_counties(*args, **kwargs):
+        raise AssertionError("a published tile store must not restore county GDBs")
+
+    class FakeTileStore:
+        uri = "gs://b/reference-data/footprint-tiles/abc"
+
+        def features_for_bbox(self, bbox):
+            return [
+                {
+                    "type": "Feature",
+                    "properties": {"Source": "tile"},
+                    "geometry": {"type": "Point", "coordinates": [bbox[0], bbox[1]]},
+                }
+            ]
+
+        def stats(self):
+            return {"uri": self.uri, "tiles_downloaded": 1}
+
+    monkeypatch.setattr(mod, "_ensure_county_footprints_gdbs", fail_counties)
+    monkeypatch.setattr(mod, "_features_for_bbox", fail_counties)
+
+    result = mod._build_baseline_footprints(
+        reference_data_dir=tmp_path,
+        bbox=(-8254590.0, 4950338.0, -8254090.0, 4950838.0),
+        target_crs=ProjCRS.from_epsg(3857),
+        work_dir=tmp_path,
+        keep_zips=False,
+        tile_store=FakeTileStore(),
+    )
+
+    assert result["feature_count"] == 1
+    assert result["county_sources"] == {"Richmond": FakeTileStore.uri}
+    assert result["footprint_tiles"]["tiles_downloaded"] == 1
+
+
+def test_baseline_footprints_fall_back_to_gdbs_when_a_tile_read_fails(
+    monkeypatch, tmp_path: Path, caplog
+) -> None:
+    from pyproj import CRS as ProjCRS
+
+    import services.imagery_inputs as mod
+
+    ensured: list[list[str] | None] = []
+    queried: list[str] = []
+
+    def fake_counties(data_dir, *, counties=None, **kwargs):  # noqa: ARG001
+        ensured.append(counties)
+        return {county: tmp_path / f"{county}.gdb" for county in counties or []}
+
+    def fake_features(*, gdb_path, bbox, target_crs):  # noqa: ARG001
+        queried.append(gdb_path.name)
+        return []
+
+    class BrokenTileStore:
+        uri = "gs://b/reference-data/footprint-tiles/abc"
+
+        def features_for_bbox(self, bbox):
+            raise OSError("shard download interrupted")
+
+    monkeypatch.setattr(mod, "_ensure_county_footprints_gdbs", fake_counties)
+    monkeypatch.setattr(mod, "_features_for_bbox", fake_features)
+
+    # The county_footprints stage skipped the GDBs because a store was open.
+    result = mod._build_baseline_footprints(
+        reference_data_dir=tmp_path,
+        bbox=(-8254590.0, 4950338.0, -8254090.0, 4950838.0),
+        target_crs=ProjCRS.from_epsg(3857),
+        work_dir=tmp_path,
+        keep_zips=False,
+        county_gdbs={},
+        tile_store=BrokenTileStore(),
+    )
+
+    assert "footprint_tiles_unavailable" in caplog.text
+    assert ensured == [["Richmond"]]
+    assert queried == ["Richmond.gdb"]
+    assert result["county_sources"] == {"Richmond": str(tmp_path / "Richmond.gdb")}
+    assert result["footprint_tiles"] is None
+
+
+def test_project_geometries_matches_per_geometry_reprojection_in_one_call() -> None:
+    from pyproj import CRS as ProjCRS
+    from pyproj import Transformer
+    from shapely.geometry import Point, Polygon
+
+    from services.imagery_inputs import _project_geometries
+
+    transformer = Transformer.from_crs(
+        ProjCRS.from_epsg(4326), ProjCRS.from_epsg(3857), always_xy=True
+    )
+    calls: list[int] = []
+
+    class CountingTransformer:
+        def transform(self, *coords):
+            calls.append(len(coords))
+            return transformer.transform(*coords)
+
+    ring = [(-73.99, 40.69), (-73.98, 40.69), (-73.98, 40.70), (-73.99, 40.69)]
+    geometries = [Polygon(ring), Point(-74.0, 40.7, 12.5), Polygon(), Point(-73.9, 40.8)]
+
+    projected = _project_geometries(geometries, CountingTransformer())
+
+    assert calls == [2, 3]
+    assert projected[0].equals_exact(
+        Polygon([transformer.transform(x, y) for x, y in ring]), 1e-6
+    )
+    assert projected[1].equals_exact(Point(*transformer.transform(-74.0, 40.7, 12.5)), 1e-6)
+    assert projected[2].is_empty
+    assert projected[3].equals_exact(Point(*transformer.transform(-73.9, 40.8)), 1e-6)
+    assert list(_project_geometries(geometries, None)) == geometries
+
+
+def test_write_feature_collection_matches_json_encoding(tmp_path: Path) -> None:
+    from shapely.geometry import Point, Polygon, mapping
+
+    from services.imagery_inputs import _write_feature_collection
+
+    polygon = Polygon([(0.5, 0.25), (2.0, 0.25), (2.0, 1.0), (0.5, 0.25)])
+    features = [
+        {"type": "Feature", "properties": {"Source": "a", "n": 1}, "geometry": polygon},
+        {"type": "Feature", "properties": {}, "geometry": {"type": "Point", "coordinates": [3, 4]}},
+    ]
+    path = tmp_path / "out.geojson"
+
+    _write_feature_collection(path, features)
+    written = json.loads(path.read_text())
+
+    expected = json.loads(
+        json.dumps(
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    {**features[0], "geometry": mapping(polygon)},
+                    {**features[1], "geometry": mapping(Point(3, 4))},
+                ],
+            }
+        )
+    )
+    assert written == expected
+    _write_feature_collection(path, [])
+    assert json.loads(path.read_text()) == {"type": "FeatureCollection", "features": []}
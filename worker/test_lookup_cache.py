@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from services.lookup_cache import LookupCache
+
+_INPUTS = {"address": "464 OVINGTON AVENUE BROOKLYN NY"}
+
+
+class _FakeBlob:
+    def __init__(self, client: _FakeGcsClient, name: str) -> None:
+        self._client = client
+        self._name = name
+
+    def exists(self) -> bool:
+        return self._name in self._client.storage
+
+    def download_to_filename(self, path: str) -> None:
+        self._client.downloads.append(self._name)
+        Path(path).write_bytes(self._client.storage[self._name])
+
+    def upload_from_filename(self, path: str) -> None:
+        if self._client.fail_uploads:
+            raise ConnectionError("upload reset")
+        self._client.uploads.append(self._name)
+        self._client.storage[self._name] = Path(path).read_bytes()
+
+
+class _FakeGcsClient:
+    def __init__(self, *, fail_uploads: bool = False) -> None:
+        self.storage: dict[str, bytes] = {}
+        self.uploads: list[str] = []
+        self.downloads: list[str] = []
+        self.fail_uploads = fail_uploads
+
+    def bucket(self, name: str) -> _FakeGcsClient:
+        return self
+
+    def blob(self, name: str) -> _FakeBlob:
+        return _FakeBlob(self, name)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _local_path(cache: LookupCache, kind: str) -> Path:
+    return cache.cache_dir / kind / f"{cache.digest(kind, _INPUTS)}.json"
+
+
+def test_gcs_hit_is_copied_into_the_local_directory(tmp_path: Path) -> None:
+    gcs = _FakeGcsClient()
+    writer = LookupCache(cache_dir=tmp_path / "worker-a", gcs_client=gcs, bucket="b")
+    writer.put("geocode", _INPUTS, value={"x": 1.0, "y": 2.0})
+    assert gcs.uploads == [f"inputs/lookups/geocode/{writer.digest('geocode', _INPUTS)}.json"]
+
+    reader = LookupCache(cache_dir=tmp_path / "worker-b", gcs_client=gcs, bucket="b")
+    assert reader.get("geocode", _INPUTS)["value"] == {"x": 1.0, "y": 2.0}
+    assert _local_path(reader, "geocode").exists()
+    assert list((tmp_path / "worker-b").rglob("*.part")) == []
+
+    assert reader.get("geocode", _INPUTS)["value"] == {"x": 1.0, "y": 2.0}
+    assert len(gcs.downloads) == 1
+    assert reader.stats() == {
+        "hits": 2,
+        "negative_hits": 0,
+        "gcs_hits": 1,
+        "misses": 0,
+        "writes": 0,
+    }
+
+
+def test_upload_failure_is_logged_and_the_local_entry_still_serves(
+    tmp_path: Path, caplog
+) -> None:
+    gcs = _FakeGcsClient(fail_uploads=True)
+    cache = LookupCache(cache_dir=tmp_path, gcs_client=gcs, bucket="b")
+
+    cache.put("geocode", _INPUTS, value={"x": 1.0})
+
+    assert "lookup_cache_write_failed" in caplog.text
+    assert gcs.storage == {}
+    assert cache.get("geocode", _INPUTS)["value"] == {"x": 1.0}
+    assert cache.stats()["writes"] == 1
+
+
+def test_entries_expire_after_their_ttl(tmp_path: Path) -> None:
+    clock = _Clock()
+    gcs = _FakeGcsClient()
+    cache = LookupCache(
+        cache_dir=tmp_path,
+        gcs_client=gcs,
+        bucket="b",
+        ttl_seconds=100,
+        negative_ttl_seconds=10,
+        clock=clock,
+    )
+    cache.put("las_index", _INPUTS, value={"tile": "u_123"})
+    cache.put("las_missing", _INPUTS, error={"type": "LidarCoverageError"})
+
+    clock.now += 11
+    assert cache.get("las_index", _INPUTS)["value"] == {"tile": "u_123"}
+    # The failure expires first, and its stale local file is removed.
+    assert cache.get("las_missing", _INPUTS) is None
+    assert not _local_path(cache, "las_missing").exists()
+
+    clock.now += 90
+    assert cache.get("las_index", _INPUTS) is None
+    # The GCS copy has expired too, so it is not brought back.
+    assert not _local_path(cache, "las_index").exists()
+    assert cache.stats()["misses"] == 2
+
+
+def test_entries_for_other_inputs_are_rejected(tmp_path: Path) -> None:
+    gcs = _FakeGcsClient()
+    cache = LookupCache(cache_dir=tmp_path / "local", gcs_client=gcs, bucket="b")
+    cache.put("geocode", _INPUTS, value={"x": 1.0})
+
+    # A local file whose recorded inputs do not match is a miss and is dropped.
+    local_path = _local_path(cache, "geocode")
+    entry = json.loads(local_path.read_text())
+    entry["inputs"] = {"address": "10 TEST STREET NEW YORK NY"}
+    local_path.write_text(json.dumps(entry))
+    object_name = f"inputs/lookups/geocode/{cache.digest('geocode', _INPUTS)}.json"
+    gcs.storage[object_name] = json.dumps(entry).encode("utf-8")
+
+    assert cache.get("geocode", _INPUTS) is None
+    # The GCS copy has the same mismatch, so it is not copied back in.
+    assert not local_path.exists()
+    assert gcs.downloads == [object_name]
+
+    local_path.parent.mkdir(parents=True, exist_ok=True)
+    local_path.write_text("{not json")
+    gcs.storage.clear()
+    assert cache.get("geocode", _INPUTS) is None
+    assert cache.stats()["misses"] == 2
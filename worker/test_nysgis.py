@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import importlib
+from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
 
+from services.lookup_cache import LookupCache
 from services.nysgis import LAS_INDEX_LAYER_URL, NYSGISAPI, ORTHO_WMS_URL
 from services.run_errors import LidarCoverageError
 
@@ -32,6 +34,51 @@ class _FakeSession:
         return _FakeResponse(self._payload)
 
 
+class _RoutingSession:
+    """Answers the geocoder and the LAS index layer, counting requests."""
+
+    def __init__(self, *, las_features: list[dict]) -> None:
+        self._las_features = las_features
+        self.urls: list[str] = []
+
+    def get(self, url, params=None, timeout=None):  # noqa: ARG002
+        self.urls.append(url)
+        if url.endswith("/query"):
+            return _FakeResponse({"features": self._las_features})
+        return _FakeResponse(
+            {"candidates": [{"score": 100, "location": {"x": -8235305.59, "y": 4976726.26}}]}
+        )
+
+
+class _FakeBlob:
+    def __init__(self, storage: dict[str, bytes], name: str) -> None:
+        self._storage = storage
+        self._name = name
+
+    def exists(self) -> bool:
+        return self._name in self._storage
+
+    def download_to_filename(self, path: str) -> None:
+        Path(path).write_bytes(self._storage[self._name])
+
+    def upload_from_filename(self, path: str) -> None:
+        self._storage[self._name] = Path(path).read_bytes()
+
+
+class _FakeGcsClient:
+    def __init__(self) -> None:
+        self.storage: dict[str, bytes] = {}
+
+    def bucket(self, name: str) -> "_FakeGcsClient":  # noqa: ARG002
+        return self
+
+    def blob(self, name: str) -> _FakeBlob:
+        return _FakeBlob(self.storage, name)
+
+
+_TILE_FEATURE = {"attributes": {"FILENAME": "987210.las", "COLLECTION": "NYC 2017"}}
+
+
 def test_default_las_index_is_nyc_topobathymetric_2017_layer() -> None:
     assert LAS_INDEX_LAYER_URL.endswith("/las_indexes/MapServer/10")
     assert NYSGISAPI().las_index_layer_url == LAS_INDEX_LAYER_URL
@@ -90,3 +137,52 @@ def test_get_lidar_tile_by_point_handles_missing_features_key() -> None:
 
     with pytest.raises(LidarCoverageError):
         api.get_lidar_tile_by_point(-8235305.59, 4976726.26, wkid=3857)
+
+
+def test_cached_lookups_skip_the_geocoder_and_las_index(tmp_path: Path) -> None:
+    gcs = _FakeGcsClient()
+    first = _RoutingSession(las_features=[_TILE_FEATURE])
+    api = NYSGISAPI(
+        session=first,
+        cache=LookupCache(cache_dir=tmp_path / "worker-a", gcs_client=gcs, bucket="b"),
+    )
+    assets = api.get_assets_for_address("1 Main St, Brooklyn NY")
+    assert len(first.urls) == 2
+
+    # Same worker, then a fresh worker that only shares the GCS layer.
+    for cache_dir in ("worker-a", "worker-b"):
+        repeat = _RoutingSession(las_features=[])
+        cache = LookupCache(cache_dir=tmp_path / cache_dir, gcs_client=gcs, bucket="b")
+        cached = NYSGISAPI(session=repeat, cache=cache).get_assets_for_address(
+            "1  Main St,  Brooklyn NY"
+        )
+        assert repeat.urls == []
+        assert cached == assets
+        assert cache.stats()["hits"] == 2
+    assert cache.stats()["gcs_hits"] == 2
+
+
+def test_lidar_coverage_errors_are_cached_until_the_negative_ttl_expires(
+    tmp_path: Path,
+) -> None:
+    now = [1_000.0]
+    cache = LookupCache(
+        cache_dir=tmp_path, ttl_seconds=3600, negative_ttl_seconds=60, clock=lambda: now[0]
+    )
+    session = _RoutingSession(las_features=[])
+    api = NYSGISAPI(session=session, cache=cache)
+    x, y = -8235305.59, 4976726.26
+
+    with pytest.raises(LidarCoverageError):
+        api.get_lidar_tile_by_point(x, y)
+    with pytest.raises(LidarCoverageError) as excinfo:
+        api.get_lidar_tile_by_point(x + 0.2, y + 0.2)
+    assert len(session.urls) == 1
+    assert excinfo.value.x == x + 0.2
+    assert excinfo.value.layer_url == api.las_index_layer_url
+    assert cache.stats()["negative_hits"] == 1
+
+    now[0] += 61
+    session._las_features = [_TILE_FEATURE]
+    assert api.get_lidar_tile_by_point(x, y).tile_id == "987210"
+    assert len(session.urls) == 2
@@ -176,3 +176,37 @@ def test_no_gcs_client_falls_back_to_original_http_path(tmp_path: Path, monkeypa
 
     assert download_calls == ["https://example.test/richmond.zip"]
     assert result["Richmond"].exists()
+
+
+def test_counties_for_bbox_selects_only_intersecting_boroughs() -> None:
+    from services.reference_data import counties_for_bbox
+
+    # Downtown Brooklyn: Kings, plus Lower Manhattan across the East River.
+    assert counties_for_bbox((-73.992, 40.690, -73.985, 40.695)) == ["Kings", "New York"]
+    # Central Staten Island is far from every other borough.
+    assert counties_for_bbox((-74.152, 40.580, -74.145, 40.585)) == ["Richmond"]
+    # Outside the city entirely.
+    assert counties_for_bbox((-73.60, 41.00, -73.59, 41.01)) == []
+
+
+def test_only_requested_counties_are_materialized(tmp_path: Path, monkeypatch) -> None:
+    client = _FakeGcsClient()
+    client.storage["reference-data/nyc-footprints/Kings.tar.gz"] = _build_tar_for_gdb(
+        tmp_path, "Kings_Building_Footprints.gdb"
+    )
+
+    def _fail_download(url: str, dest_path: Path) -> None:  # noqa: ARG001
+        raise AssertionError("skipped counties must not be downloaded: " + url)
+
+    monkeypatch.setattr(reference_data, "_download", _fail_download)
+
+    result = ensure_nyc_county_footprints(
+        data_dir=tmp_path / "ref",
+        gcs_client=client,
+        gcs_bucket="test-bucket",
+        counties=["Kings"],
+    )
+
+    assert list(result) == ["Kings"]
+    assert not (tmp_path / "ref" / "Bronx_Building_Footprints").exists()
+    assert ensure_nyc_county_footprints(data_dir=tmp_path / "ref", counties=[]) == {}
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from services.staging import StagingPlan, staging_workers_from_env
+
+
+def test_independent_stages_overlap_and_dependents_wait() -> None:
+    both_started = threading.Barrier(2, timeout=5)
+    order: list[str] = []
+
+    def _source(name: str):
+        def _run():
+            both_started.wait()
+            order.append(name)
+            return name
+
+        return _run
+
+    plan = StagingPlan(max_workers=4)
+    plan.add("a", _source("a"))
+    plan.add("b", _source("b"))
+    plan.add("joined", lambda a, b: order.append("joined") or f"{a}+{b}", after=("a", "b"))
+
+    results = plan.run()
+
+    assert results == {"a": "a", "b": "b", "joined": "a+b"}
+    assert order[-1] == "joined"
+    assert set(plan.report()["stages"]) == {"a", "b", "joined"}
+
+
+def test_single_worker_runs_in_insertion_order() -> None:
+    order: list[str] = []
+    plan = StagingPlan(max_workers=1)
+    for name in ("first", "second", "third"):
+        plan.add(name, lambda name=name: order.append(name))
+
+    plan.run()
+
+    assert order == ["first", "second", "third"]
+
+
+def test_failure_propagates_and_skips_unstarted_stages() -> None:
+    ran: list[str] = []
+
+    def _boom():
+        raise RuntimeError("orthophoto unavailable")
+
+    plan = StagingPlan(max_workers=2)
+    plan.add("orthophoto", _boom)
+    plan.add("baseline", lambda _ortho: ran.append("baseline"), after=("orthophoto",))
+
+    with pytest.raises(RuntimeError, match="orthophoto unavailable"):
+        plan.run()
+    assert ran == []
+    assert "orthophoto" in plan.report()["stages"]
+    assert plan.wall_seconds is not None
+
+
+def test_timings_record_start_offset_and_duration() -> None:
+    plan = StagingPlan(max_workers=2)
+    plan.add("slow", lambda: time.sleep(0.05))
+    plan.add("after_slow", lambda _slow: None, after=("slow",))
+
+    plan.run()
+    report = plan.report()
+
+    assert report["max_workers"] == 2
+    assert report["stages"]["slow"]["seconds"] >= 0.04
+    assert report["stages"]["after_slow"]["start_s"] >= report["stages"]["slow"]["seconds"]
+    assert report["wall_seconds"] >= report["stages"]["slow"]["seconds"]
+
+
+def test_add_rejects_unknown_dependencies_and_duplicates() -> None:
+    plan = StagingPlan()
+    plan.add("a", lambda: None)
+    with pytest.raises(ValueError, match="unknown"):
+        plan.add("b", lambda _x: None, after=("missing",))
+    with pytest.raises(ValueError, match="duplicate"):
+        plan.add("a", lambda: None)
+
+
+def test_workers_from_env(monkeypatch) -> None:
+    monkeypatch.delenv("CITYLENS_STAGING_WORKERS", raising=False)
+    assert staging_workers_from_env() == 4
+    monkeypatch.setenv("CITYLENS_STAGING_WORKERS", "0")
+    assert staging_workers_from_env() == 1
+    monkeypatch.setenv("CITYLENS_STAGING_WORKERS", "bogus")
+    assert staging_workers_from_env() == 4